@@ -7,6 +7,9 @@
 - 데이터베이스 연결 및 쿼리 실행
 - 쿼리 결과를 pandas DataFrame으로 변환
 - Streamlit 환경에서의 캐싱 지원
+- 쿼리별 소요시간 / 행 수 계측 (query_metrics)
+- 동일 쿼리 동시 실행 병합 (single_flight: 진행 중인 실행의 결과를 공유)
+- 벤치마크용 로컬 웨어하우스 백엔드 전환 (config.WAREHOUSE_BACKEND = "local")
 
 사용 예시:
     from db_client import get_client
@@ -36,7 +39,6 @@ from functools import wraps
 import pandas as pd
 import streamlit as st
 import sqlite3
-from sqlalchemy import create_engine, Engine
 from pathlib import Path
 import logging
 
@@ -50,6 +52,14 @@ env_path = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 from _05_commons import config
+from _05_commons.helper import lazy_import
+from _00_database import query_metrics
+from _00_database.single_flight import single_flight
+from _00_database.local_warehouse import LocalWarehouseClient
+
+# sqlalchemy(및 드라이버)는 원격 DB 클라이언트가 쿼리를 실행할 때만 로딩
+# (SQLite만 사용하는 배치/페이지의 기동 시간을 줄이기 위함)
+sqlalchemy = lazy_import("sqlalchemy")
 
 
 def cache_resource_safe(*args, **kwargs):
@@ -87,12 +97,12 @@ class SnowflakeClient:
             "schema": "KPPMES",
         }
 
-    def _create_engine(self) -> Engine:
+    def _create_engine(self) -> "sqlalchemy.Engine":
         """
         SQLAlchemy 엔진을 생성합니다. PrivateLink 환경에서 SSL 인증서 오류 방지를 위해
         ocsp_fail_open 옵션을 False로 설정합니다.
         """
-        return create_engine(
+        return sqlalchemy.create_engine(
             "snowflake://",
             connect_args={
                 "user": self.config["user"],
@@ -115,9 +125,12 @@ class SnowflakeClient:
         Returns:
             pd.DataFrame: 쿼리 결과
         """
+        return single_flight("snowflake", query, lambda: self._execute(query))
+
+    def _execute(self, query: str) -> pd.DataFrame:
         engine = self._create_engine()
         try:
-            return pd.read_sql(query, engine)
+            return query_metrics.read_sql("snowflake", query, engine)
         finally:
             engine.dispose()
 
@@ -135,10 +148,13 @@ class OracleClientBI:
         self.service_name = "DHKDSFT.hankooktech.com"
 
     def execute(self, query: str):
+        return single_flight("oracle_bi", query, lambda: self._execute(query))
+
+    def _execute(self, query: str):
         oracle_uri = f"oracle+cx_oracle://{self.user}:{self.password}@{self.host}:{self.port}/?service_name={self.service_name}"
-        engine = create_engine(oracle_uri)
+        engine = sqlalchemy.create_engine(oracle_uri)
         try:
-            return pd.read_sql(query, con=engine)
+            return query_metrics.read_sql("oracle_bi", query, engine)
         finally:
             engine.dispose()
 
@@ -156,10 +172,13 @@ class OracleClientMES:
         self.service_name = "DKPPODA.kppodad"
 
     def execute(self, query: str):
+        return single_flight("oracle_mes", query, lambda: self._execute(query))
+
+    def _execute(self, query: str):
         oracle_uri = f"oracle+cx_oracle://{self.user}:{self.password}@{self.host}:{self.port}/?service_name={self.service_name}"
-        engine = create_engine(oracle_uri)
+        engine = sqlalchemy.create_engine(oracle_uri)
         try:
-            return pd.read_sql(query, con=engine)
+            return query_metrics.read_sql("oracle_mes", query, engine)
         finally:
             engine.dispose()
 
@@ -185,7 +204,7 @@ class SQLiteClient:
         """
         conn = sqlite3.connect(self.db_path)
         try:
-            return pd.read_sql(query, conn)
+            return query_metrics.read_sql("sqlite", query, conn)
         finally:
             conn.close()
 
@@ -219,6 +238,9 @@ def get_client(db_type: str = "snowflake"):
     Parameters:
         db_type (str): 사용할 DB 종류 ("snowflake", "oracle_bi", "oracle_mes", "sqlite")
 
+    config.WAREHOUSE_BACKEND 가 "local" 이면 원격 DB(snowflake / oracle_bi / oracle_mes) 대신
+    로컬 웨어하우스 클라이언트(LocalWarehouseClient)를 반환합니다.
+
     Returns:
         BaseClient: 해당 DB에 연결 가능한 클라이언트 객체
 
@@ -227,6 +249,12 @@ def get_client(db_type: str = "snowflake"):
     """
     db_type = db_type.lower()
 
+    if config.WAREHOUSE_BACKEND == "local" and db_type in (
+        "snowflake",
+        "oracle_bi",
+        "oracle_mes",
+    ):
+        return LocalWarehouseClient(db_type)
     if db_type == "snowflake":
         return SnowflakeClient()
     elif db_type == "oracle_bi":
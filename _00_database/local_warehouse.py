@@ -0,0 +1,722 @@
+"""
+로컬 웨어하우스(Local Warehouse) 백엔드 모듈
+
+원격 Snowflake / Oracle 대신, HKT_DW.MES.*, HKT_DW.BI_DWUSER.*, CQMS 원본 테이블과 같은
+구조로 시딩된 로컬 SQLite DB에서 _01_query 빌더 쿼리를 실행하는 get_client 백엔드입니다.
+동시성 / 캐싱 / 연결 풀링 변경을 항상 같은 조건에서 벤치마크하기 위해 사용합니다.
+
+주요 기능:
+- 쿼리 변환: HKT_DW.<SCHEMA>.<TABLE> -> <SCHEMA>__<TABLE>, EXTRACT / LISTAGG / TRY_CAST /
+  PERCENTILE_CONT 치환, CTE 이중 괄호 제거
+- Snowflake 함수 호환 UDF: TO_DATE, TRY_TO_DATE, TO_CHAR, DECODE, NVL, REGEXP_SUBSTR,
+  SUBSTRING/SUBSTR(시작 위치 0 허용), LEAST, GREATEST, FLOOR
+- Snowflake 호환 집계: STDDEV_SAMP, PERCENTILE_CONT
+- 지연 주입: 쿼리당 지연(ms) ± 지터(ms) 는 실행 시간(EXEC_MS), 행당 지연(us)은
+  결과 수신 시간(FETCH_MS)으로 query_metrics 에 그대로 계측됨
+- 결과 컬럼명: Snowflake + SQLAlchemy 와 같이 따옴표 없는 식별자는 소문자로 반환
+
+환경 변수 WAREHOUSE_BACKEND=local 로 설정하면 db_client.get_client 가 snowflake /
+oracle_bi / oracle_mes 요청에 이 클라이언트를 반환합니다. (SQLite 앱 DB는 그대로 사용)
+로컬 DB는 _08_automation/local_warehouse_seed.py 로 생성합니다.
+
+사용 예시:
+    client = LocalWarehouseClient("snowflake", latency_ms=200, jitter_ms=50)
+    df = client.execute(q_uf.uf_product_assess("20250101", "20251231"))
+"""
+
+import math
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config
+from _00_database import query_metrics
+from _00_database.single_flight import single_flight
+
+# * region 테이블 스키마
+# 원본 테이블("<SCHEMA>.<TABLE>", 스키마 없는 Oracle 뷰는 이름만) -> 컬럼 타입
+LOCAL_WAREHOUSE_TABLES: Dict[str, Dict[str, str]] = {
+    # GMES 마스터 / 공통 코드
+    "MES.MAS_D_LMASTR101": {
+        "PLT_CD": "TEXT",
+        "PRD_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "SPEC_FG": "TEXT",
+        "STXC": "TEXT",
+    },
+    "MES.MST_D_LCOMTR107": {"CD_ID": "TEXT", "CD_ITEM": "TEXT", "CD_ITEM_NM": "TEXT"},
+    # GMES RR
+    "MES.QLT_D_LQLTTR309": {
+        "PLT_CD": "TEXT",
+        "SMPL_ID": "TEXT",
+        "MTL_CD": "TEXT",
+        "TEST_FG": "INTEGER",
+        "PGS_STS": "INTEGER",
+    },
+    "MES.QLT_F_LQLTTR316": {
+        "PLT_CD": "TEXT",
+        "SMPL_ID": "TEXT",
+        "ATCH_SEQ": "INTEGER",
+        "WARM_LOAD": "REAL",
+        "RSLT_RRC_CORR": "REAL",
+        "RSLT_RRC": "REAL",
+        "RSLT_RR": "REAL",
+        "STD_TEST_POS": "TEXT",
+        "JDG": "INTEGER",
+        "TEST_VAL": "REAL",
+        "TEST_SEQ": "INTEGER",
+    },
+    "MES.QLT_D_LQLTTR510": {
+        "PLT_CD": "TEXT",
+        "MTL_CD": "TEXT",
+        "CAR_MAKER_2": "TEXT",
+        "V_MODEL": "TEXT",
+        "USE_TROT": "TEXT",
+        "APV_RRC_MIN": "REAL",
+        "APV_RRC_MAX": "REAL",
+        "TEST_FG": "TEXT",
+        "START_DATE": "TEXT",
+        "END_DATE": "TEXT",
+        "SPEC_CHANGE": "TEXT",
+        "APP_DATE": "TEXT",
+        "RR_INDEX": "TEXT",
+        "SELANT_FLG": "TEXT",
+    },
+    # GMES UF
+    "MES.QLT_F_LQLTTR105": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "STXC": "TEXT",
+        "INS_FG": "TEXT",
+        "INS_DATE": "TEXT",
+        "JDG_GR": "INTEGER",
+        "RFV": "REAL",
+        "LFV": "REAL",
+        "CON": "REAL",
+        "RFV_1TH_HRM": "REAL",
+    },
+    "MES.QLT_D_LCOMTR201": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "RFV_3GR": "REAL",
+        "RFV_4GR": "REAL",
+        "LFV_3GR": "REAL",
+        "LFV_4GR": "REAL",
+        "CON_3GR": "REAL",
+        "CON_N3GR": "REAL",
+        "CON_4GR": "REAL",
+        "CON_N4GR": "REAL",
+        "RFV_1TH_HRM_3GR": "REAL",
+        "RFV_1TH_HRM_4GR": "REAL",
+    },
+    # GMES 부적합 / 중량 / 생산
+    "MES.QLT_F_LQLTTR107": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "DFT_CD": "TEXT",
+        "INS_DATE": "TEXT",
+        "DFT_QTY": "INTEGER",
+        "STXC": "TEXT",
+        "INS_TP_CD": "TEXT",
+    },
+    "MES.QLT_F_LQLTTR120": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "DFT_CD": "TEXT",
+        "INS_DATE": "TEXT",
+        "DFT_QTY": "INTEGER",
+        "DFT_OCCR_FG": "INTEGER",
+    },
+    "MES.QLT_F_LQLTTR127": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "INS_DATE": "TEXT",
+        "STD_WGT": "REAL",
+        "MRM_WGT": "REAL",
+        "UPM_STD_WGT": "REAL",
+        "LWM_STD_WGT": "REAL",
+    },
+    "MES.WRK_F_LWRKTS118": {
+        "PLT_CD": "TEXT",
+        "SPEC_CD": "TEXT",
+        "WRK_DATE": "TEXT",
+        "PRDT_QTY": "INTEGER",
+    },
+    # CTMS / SAP(HOPE, HGWS)
+    "BI_DWUSER.CTMS_RESULT_DATA": {
+        "MRM_RPT_NO": "TEXT",
+        "PLT_CD": "TEXT",
+        "MRM_DATE": "TEXT",
+        "MRM_OBJ_FG": "TEXT",
+        "CTL_ITEM_NM": "TEXT",
+        "STXC": "TEXT",
+        "MFG_CD": "TEXT",
+        "SPEC_SIZE": "TEXT",
+        "SPEC_PTRN": "TEXT",
+        "U_SPEC_VAL": "TEXT",
+        "L_SPEC_VAL": "TEXT",
+        "TOL_VAL": "TEXT",
+        "U_MRM_AVG": "REAL",
+        "L_MRM_AVG": "REAL",
+        "U_MRM_RST": "TEXT",
+        "L_MRM_RST": "TEXT",
+        "PRDT_DATE": "TEXT",
+    },
+    "BI_DWUSER.SAP_ZSTT70041": {
+        "MATNR": "TEXT",
+        "ZGUBUN": "TEXT",
+        "ZCARMAKER1": "TEXT",
+        "ZCARMAKER2": "TEXT",
+        "ZVEHICLE1": "TEXT",
+        "ZVEHICLE2": "TEXT",
+        "ZPROJECT": "TEXT",
+        "ZELECTRIC": "TEXT",
+        "ZSIZE": "TEXT",
+        "ZLOAD_INDEX": "TEXT",
+        "ZPLY": "TEXT",
+        "ZTYPE": "TEXT",
+        "ZL": "TEXT",
+        "ZW": "TEXT",
+        "ZUSE": "TEXT",
+        "ZBR": "TEXT",
+        "ZPRODUCT": "TEXT",
+        "LBTXT": "TEXT",
+        "ZOEPLANT": "TEXT",
+        "ZSOP": "TEXT",
+        "ZEOP": "TEXT",
+    },
+    "BI_DWUSER.SAP_ZSDT02068": {
+        "MATERIAL": "TEXT",
+        "BILMON": "TEXT",
+        "QUANTITY": "INTEGER",
+        "ZOERESEG": "TEXT",
+    },
+    "BI_DWUSER.SAP_ZSRT10000": {
+        "WERKS": "TEXT",
+        "ZMATNR": "TEXT",
+        "ZCLS3T": "TEXT",
+        "ZCLS4T": "TEXT",
+        "ZNAME": "TEXT",
+        "ZREASON": "TEXT",
+        "ZRULT": "TEXT",
+        "SPMON": "TEXT",
+    },
+    "BI_GERPUSER.ZHRT90041": {"PERNR": "TEXT", "NACHN": "TEXT"},
+    # CQMS
+    "EQMSUSER.CQMS_QUALITY_ISSUE": {
+        "CQMS_QUALITY_ISSUE_SEQ": "INTEGER",
+        "CQMS_ISSUE_DOCUMENT_NO": "TEXT",
+        "PLANT": "TEXT",
+        "STAGE": "TEXT",
+        "OEM": "TEXT",
+        "VEH_MODEL": "TEXT",
+        "PROJECT": "TEXT",
+        "ISSUE_ETC": "TEXT",
+        "DESCRIPTION": "TEXT",
+        "CAUSE_OF_DEFECT": "TEXT",
+        "ISSUE_CATEGORY_SEQ_1": "INTEGER",
+        "ISSUE_CATEGORY_SEQ_2": "INTEGER",
+        "ISSUE_CATEGORY_SEQ_3": "INTEGER",
+        "OWNER_NO": "TEXT",
+        "RESPONSIBLE_PERSON_NO": "TEXT",
+        "OCCURRENCE_DATE": "TEXT",
+        "CREATE_DATE": "TEXT",
+        "START_DATE": "TEXT",
+        "RETURN_TIRE_YN": "TEXT",
+        "RETURN_TIRE_RECEIVED_DATE": "TEXT",
+        "CQMS_ISSUE_ISSUE_ARENA_APPROVAL_DATE": "TEXT",
+        "IS_HK_FAULT": "TEXT",
+        "ISSUE_COMPLETE_DATE": "TEXT",
+        "OE_QUALITY_ISSUE_STATUS": "TEXT",
+        "ISSUE_AREA": "TEXT",
+        "ISSUE_REGION": "TEXT",
+    },
+    "EQMSUSER.CQMS_ISSUE_CATEGORY_DATA": {"SEQ": "INTEGER", "DATA_NM": "TEXT"},
+    "EQMSUSER.CQMS_QUALITY_ISSUE_MATERIAL": {
+        "CQMS_QUALITY_ISSUE_SEQ": "INTEGER",
+        "MATERIAL_NO": "TEXT",
+    },
+    "EQMSUSER.CQMS_CHANGE_M": {
+        "ID": "INTEGER",
+        "DOCUMENT_NO": "TEXT",
+        "DOC_CATEGORY": "TEXT",
+        "DOC_SUBJECT": "TEXT",
+        "DOC_STATUS": "TEXT",
+        "CREATE_USER_ID": "TEXT",
+        "CREATE_DT": "TEXT",
+        "DOC_END_ARENA_UPDATE_DT": "TEXT",
+        "DEL_YN": "TEXT",
+    },
+    "EQMSUSER.CQMS_SUB_MCODE_D": {
+        "ID": "INTEGER",
+        "M_SIZE": "TEXT",
+        "M_PATTERN": "TEXT",
+        "DOCUMENT_NO": "TEXT",
+        "M_CODE": "TEXT",
+    },
+    "EQMSUSER.CQMS_CUSTOMER_AUDIT": {
+        "CQMS_CUSTOMER_AUDIT_SEQ": "INTEGER",
+        "AUDIT_TYPE": "TEXT",
+        "AUDIT_SUBJECT": "TEXT",
+        "AUDIT_START_DATE": "TEXT",
+        "AUDIT_END_DATE": "TEXT",
+        "OWNER_ACC_NO": "TEXT",
+        "CREATE_DATE": "TEXT",
+        "UPDATE_DATE": "TEXT",
+        "AUDIT_STATUS": "TEXT",
+    },
+    "EQMSUSER.CQMS_CUSTOMER_AUDIT_MATERIAL": {
+        "CQMS_CUSTOMER_AUDIT_SEQ": "INTEGER",
+        "PLANT": "TEXT",
+        "CAR_MAKER": "TEXT",
+        "PROJECT": "TEXT",
+        "MATERIAL": "TEXT",
+    },
+    # Oracle(BI) HOPE 셀인 뷰
+    "VW_SF_HOPE_SELLIN_SUMMARY": {
+        "RE/OE": "TEXT",
+        "Prod.": "TEXT",
+        "Billing YYYYMM": "TEXT",
+        "Qty.": "INTEGER",
+        "Data Category": "TEXT",
+    },
+}
+
+# 조인 / 필터 키 인덱스
+LOCAL_WAREHOUSE_INDEXES: Dict[str, List[Tuple[str, ...]]] = {
+    "MES.MAS_D_LMASTR101": [("SPEC_CD", "PLT_CD"), ("PRD_CD",)],
+    "MES.QLT_D_LQLTTR309": [("PLT_CD", "SMPL_ID")],
+    "MES.QLT_F_LQLTTR316": [("PLT_CD", "SMPL_ID")],
+    "MES.QLT_F_LQLTTR105": [("INS_DATE",), ("SPEC_CD", "PLT_CD")],
+    "MES.QLT_F_LQLTTR107": [("SPEC_CD", "PLT_CD")],
+    "MES.QLT_F_LQLTTR120": [("SPEC_CD", "PLT_CD")],
+    "MES.QLT_F_LQLTTR127": [("SPEC_CD", "PLT_CD")],
+    "MES.WRK_F_LWRKTS118": [("SPEC_CD", "PLT_CD")],
+    "BI_DWUSER.CTMS_RESULT_DATA": [("MRM_DATE",)],
+    "EQMSUSER.CQMS_QUALITY_ISSUE_MATERIAL": [("CQMS_QUALITY_ISSUE_SEQ",)],
+}
+
+
+def local_table_name(source_table: str) -> str:
+    """
+    원본 테이블명("<SCHEMA>.<TABLE>")을 로컬 SQLite 테이블명("<SCHEMA>__<TABLE>")으로 바꿉니다.
+    """
+    return source_table.replace(".", "__")
+
+
+def create_local_warehouse_schema(conn: sqlite3.Connection) -> None:
+    """
+    로컬 웨어하우스 테이블과 인덱스를 (기존 테이블을 지우고) 새로 만듭니다.
+
+    Args:
+        conn: 로컬 웨어하우스 SQLite 연결
+    """
+    for source_table, columns in LOCAL_WAREHOUSE_TABLES.items():
+        table = local_table_name(source_table)
+        column_sql = ", ".join(
+            f'"{col}" {col_type}' for col, col_type in columns.items()
+        )
+        conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+        conn.execute(f'CREATE TABLE "{table}" ({column_sql})')
+    for source_table, indexes in LOCAL_WAREHOUSE_INDEXES.items():
+        table = local_table_name(source_table)
+        for index_cols in indexes:
+            index_name = f"idx_{table}_{'_'.join(index_cols)}".lower()
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS {index_name} ON "{table}" ({", ".join(index_cols)})'
+            )
+
+
+# * region Snowflake 쿼리 변환
+_QUALIFIED_TABLE_RE = re.compile(r"\bHKT_DW\.(\w+)\.(\w+)\b", re.IGNORECASE)
+_EXTRACT_RE = re.compile(
+    r"\bEXTRACT\(\s*(YEAR|MONTH|DAY)\s+FROM\s+([^()]+?)\s*\)", re.IGNORECASE
+)
+_LISTAGG_RE = re.compile(
+    r"\bLISTAGG\((.*?)\)\s*WITHIN\s+GROUP\s*\(\s*ORDER\s+BY[^)]*\)",
+    re.IGNORECASE | re.DOTALL,
+)
+_TRY_CAST_RE = re.compile(
+    r"\bTRY_CAST\((.*?)\s+AS\s+(?:FLOAT|DOUBLE|NUMBER|NUMERIC|DECIMAL|INTEGER|INT)"
+    r"(?:\(\s*\d+(?:\s*,\s*\d+)?\s*\))?\s*\)",
+    re.IGNORECASE | re.DOTALL,
+)
+# SUBSTRING 으로 만든 YYYY / MM 컬럼과 숫자 리터럴 비교 (Snowflake 는 암묵적으로 숫자 변환)
+_NUMERIC_PART_COMPARE_RE = re.compile(
+    r"((?:\b\w+\.)?\b(?:YYYY|MM)\b)(?=\s*(?:=|<>|!=|>=|<=|<|>|\bBETWEEN\b)\s*-?\d)",
+    re.IGNORECASE,
+)
+_PERCENTILE_CONT_RE = re.compile(
+    r"\bPERCENTILE_CONT\(\s*([0-9.]+)\s*\)\s*WITHIN\s+GROUP\s*"
+    r"\(\s*ORDER\s+BY\s+([^()]+?)\s*\)",
+    re.IGNORECASE,
+)
+_NESTED_CTE_RE = re.compile(r"\bAS\s*\(\s*\(", re.IGNORECASE)
+_EXTRACT_FORMATS = {"YEAR": "%Y", "MONTH": "%m", "DAY": "%d"}
+
+
+def translate_query(query: str) -> str:
+    """
+    _01_query 빌더가 생성한 Snowflake / Oracle 쿼리를 로컬 SQLite 에서 실행 가능한 형태로 변환합니다.
+    함수 호환(TO_DATE, DECODE 등)은 연결 시 등록하는 UDF 로 처리합니다.
+
+    Args:
+        query: 원본 쿼리
+
+    Returns:
+        str: 로컬 웨어하우스용 쿼리
+    """
+    query = _QUALIFIED_TABLE_RE.sub(
+        lambda m: local_table_name(f"{m.group(1)}.{m.group(2)}".upper()), query
+    )
+    query = _EXTRACT_RE.sub(
+        lambda m: f"CAST(strftime('{_EXTRACT_FORMATS[m.group(1).upper()]}', {m.group(2)}) AS INTEGER)",
+        query,
+    )
+    query = _LISTAGG_RE.sub(r"group_concat(\1)", query)
+    query = _TRY_CAST_RE.sub(r"TRY_TO_NUMBER(\1)", query)
+    query = _PERCENTILE_CONT_RE.sub(r"PERCENTILE_CONT(\2, \1)", query)
+    query = _NUMERIC_PART_COMPARE_RE.sub(r"CAST(\1 AS INTEGER)", query)
+    return _strip_nested_cte_parens(query)
+
+
+def _strip_nested_cte_parens(query: str) -> str:
+    """CTE 본문의 이중 괄호 "X AS ((SELECT ...))" 를 "X AS (SELECT ...)" 로 변환 (SQLite 미지원)"""
+    for match in reversed(list(_NESTED_CTE_RE.finditer(query))):
+        inner_open = match.end() - 1
+        depth = 0
+        for pos in range(inner_open, len(query)):
+            if query[pos] == "(":
+                depth += 1
+            elif query[pos] == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            continue
+        if query[pos + 1 :].lstrip().startswith(")"):
+            query = query[:inner_open] + query[inner_open + 1 : pos] + query[pos + 1 :]
+    return query
+
+
+# * region Snowflake 함수 호환 UDF
+_DATE_TOKEN_RE = re.compile(r"YYYY|YY|MM|DD|HH24|MI|SS")
+_DATE_TOKENS = {
+    "YYYY": "%Y",
+    "YY": "%y",
+    "MM": "%m",
+    "DD": "%d",
+    "HH24": "%H",
+    "MI": "%M",
+    "SS": "%S",
+}
+
+
+def _strftime_format(fmt: str) -> str:
+    """Snowflake 날짜 형식('YYYYMMDD' 등)을 strftime 형식으로 변환"""
+    return _DATE_TOKEN_RE.sub(lambda m: _DATE_TOKENS[m.group(0)], fmt.upper())
+
+
+def _parse_datetime(value, fmt: Optional[str] = None) -> datetime:
+    text = str(value).strip()
+    if fmt:
+        return datetime.strptime(text, _strftime_format(fmt))
+    return datetime.fromisoformat(text[:19])
+
+
+def _to_date(value, fmt: Optional[str] = None) -> Optional[str]:
+    if value is None:
+        return None
+    return _parse_datetime(value, fmt).strftime("%Y-%m-%d")
+
+
+def _try_to_date(value, fmt: Optional[str] = None) -> Optional[str]:
+    try:
+        return _to_date(value, fmt)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_char(value, fmt: Optional[str] = None) -> Optional[str]:
+    if value is None:
+        return None
+    if fmt is None:
+        return str(value)
+    try:
+        return _parse_datetime(value).strftime(_strftime_format(fmt))
+    except ValueError:
+        return str(value)
+
+
+def _decode(*args):
+    """DECODE(expr, search1, result1, ..., [default]) - NULL 은 NULL 과 일치"""
+    expr, pairs = args[0], args[1:]
+    for i in range(0, len(pairs) - 1, 2):
+        if pairs[i] == expr or (pairs[i] is None and expr is None):
+            return pairs[i + 1]
+    return pairs[-1] if len(pairs) % 2 == 1 else None
+
+
+def _nvl(value, default):
+    return default if value is None else value
+
+
+def _regexp_substr(value, pattern) -> Optional[str]:
+    if value is None or pattern is None:
+        return None
+    match = re.search(pattern, str(value))
+    return match.group(0) if match else None
+
+
+def _try_to_number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _substring(value, start, length=None) -> Optional[str]:
+    """Snowflake SUBSTRING - 시작 위치 0 이하는 1 과 같음 (음수는 뒤에서부터)"""
+    if value is None or start is None:
+        return None
+    text = str(value)
+    start = int(start)
+    begin = start - 1 if start > 0 else (0 if start == 0 else max(len(text) + start, 0))
+    if length is None:
+        return text[begin:]
+    return text[begin : begin + max(int(length), 0)]
+
+
+def _least(*args):
+    """Snowflake LEAST - 인자 중 하나라도 NULL 이면 NULL"""
+    return None if any(arg is None for arg in args) else min(args)
+
+
+def _greatest(*args):
+    """Snowflake GREATEST - 인자 중 하나라도 NULL 이면 NULL"""
+    return None if any(arg is None for arg in args) else max(args)
+
+
+def _floor(value) -> Optional[int]:
+    return None if value is None else math.floor(value)
+
+
+class _StddevSamp:
+    """Snowflake STDDEV_SAMP 집계 (표본 표준편차, 2건 미만이면 NULL)"""
+
+    def __init__(self) -> None:
+        self.values: List[float] = []
+
+    def step(self, value) -> None:
+        if value is not None:
+            self.values.append(float(value))
+
+    def finalize(self) -> Optional[float]:
+        if len(self.values) < 2:
+            return None
+        return statistics.stdev(self.values)
+
+
+class _PercentileCont:
+    """Snowflake PERCENTILE_CONT(p) WITHIN GROUP (ORDER BY x) 집계 (선형 보간)"""
+
+    def __init__(self) -> None:
+        self.values: List[float] = []
+        self.fraction = 0.5
+
+    def step(self, value, fraction) -> None:
+        self.fraction = float(fraction)
+        if value is not None:
+            self.values.append(float(value))
+
+    def finalize(self) -> Optional[float]:
+        if not self.values:
+            return None
+        values = sorted(self.values)
+        position = (len(values) - 1) * self.fraction
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+_UDFS = [
+    ("TO_DATE", 1, _to_date),
+    ("TO_DATE", 2, _to_date),
+    ("TRY_TO_DATE", 1, _try_to_date),
+    ("TRY_TO_DATE", 2, _try_to_date),
+    ("TO_CHAR", 1, _to_char),
+    ("TO_CHAR", 2, _to_char),
+    ("DECODE", -1, _decode),
+    ("NVL", 2, _nvl),
+    ("REGEXP_SUBSTR", 2, _regexp_substr),
+    ("TRY_TO_NUMBER", 1, _try_to_number),
+    ("SUBSTRING", 2, _substring),
+    ("SUBSTRING", 3, _substring),
+    ("SUBSTR", 2, _substring),
+    ("SUBSTR", 3, _substring),
+    ("LEAST", -1, _least),
+    ("GREATEST", -1, _greatest),
+    ("FLOOR", 1, _floor),
+]
+_AGGREGATES = [
+    ("STDDEV_SAMP", 1, _StddevSamp),
+    ("PERCENTILE_CONT", 2, _PercentileCont),
+]
+
+
+def register_udfs(conn: sqlite3.Connection) -> None:
+    """Snowflake 함수 호환 UDF 를 연결에 등록합니다. (LIKE 는 Snowflake 와 같이 대소문자 구분)"""
+    for name, n_args, func in _UDFS:
+        conn.create_function(name, n_args, func, deterministic=True)
+    for name, n_args, aggregate in _AGGREGATES:
+        conn.create_aggregate(name, n_args, aggregate)
+    conn.execute("PRAGMA case_sensitive_like = ON")
+
+
+# * region 지연 주입 연결
+class _LatencyCursor(sqlite3.Cursor):
+    """execute 시 쿼리당 지연, fetch 시 행당 지연을 주입하는 커서"""
+
+    def execute(self, sql, parameters=()):
+        delay = self.connection.latency_sec
+        if self.connection.jitter_sec:
+            delay += random.uniform(
+                -self.connection.jitter_sec, self.connection.jitter_sec
+            )
+        if delay > 0:
+            time.sleep(delay)
+        return super().execute(sql, parameters)
+
+    def fetchall(self):
+        rows = super().fetchall()
+        if rows and self.connection.row_latency_sec:
+            time.sleep(len(rows) * self.connection.row_latency_sec)
+        return rows
+
+
+class _LatencyConnection(sqlite3.Connection):
+    """query_metrics / pd.read_sql 이 사용하는 execute / cursor 경로에 지연을 주입하는 연결"""
+
+    latency_sec = 0.0
+    jitter_sec = 0.0
+    row_latency_sec = 0.0
+
+    def cursor(self, factory=_LatencyCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+_QUOTED_IDENT_RE = re.compile(r'"([^"]+)"')
+_UPPER_IDENT_RE = re.compile(r"[A-Z_][A-Z0-9_$]*")
+
+
+def normalize_columns(df: pd.DataFrame, query: str) -> pd.DataFrame:
+    """
+    Snowflake + SQLAlchemy 와 같은 결과 컬럼명으로 바꿉니다.
+    따옴표 없는 식별자(Snowflake 에서 대문자로 저장)와 따옴표 안의 대문자 식별자는 소문자로,
+    따옴표 안의 대소문자 혼합 / 특수문자 식별자("OEQ Group", "RE/OE")는 그대로 둡니다.
+
+    Args:
+        df: 쿼리 결과
+        query: 원본 쿼리
+
+    Returns:
+        pd.DataFrame: 컬럼명을 바꾼 결과
+    """
+    quoted = set(_QUOTED_IDENT_RE.findall(query))
+
+    def _normalize(name: str) -> str:
+        if name in quoted and not _UPPER_IDENT_RE.fullmatch(name):
+            return name
+        return name.lower()
+
+    return df.rename(columns=_normalize)
+
+
+# * region 클라이언트
+class LocalWarehouseClient:
+    """
+    로컬 SQLite 웨어하우스에서 원격 DB용 쿼리를 실행하는 클라이언트 클래스입니다.
+    """
+
+    def __init__(
+        self,
+        db_type: str = "snowflake",
+        db_path: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        jitter_ms: Optional[float] = None,
+        row_latency_us: Optional[float] = None,
+    ):
+        """
+        Args:
+            db_type: 대체하는 원격 DB 종류 ("snowflake", "oracle_bi", "oracle_mes")
+            db_path: 로컬 웨어하우스 DB 경로 (기본값: config.LOCAL_WAREHOUSE_PATH)
+            latency_ms: 쿼리당 주입 지연(ms) (기본값: config.LOCAL_WAREHOUSE_LATENCY_MS)
+            jitter_ms: 지연 편차(ms), 균등분포 ± (기본값: config.LOCAL_WAREHOUSE_JITTER_MS)
+            row_latency_us: 결과 행당 주입 지연(us) (기본값: config.LOCAL_WAREHOUSE_ROW_LATENCY_US)
+        """
+        self.db_type = db_type
+        self.db_path = db_path or config.LOCAL_WAREHOUSE_PATH
+        self.latency_ms = (
+            config.LOCAL_WAREHOUSE_LATENCY_MS if latency_ms is None else latency_ms
+        )
+        self.jitter_ms = (
+            config.LOCAL_WAREHOUSE_JITTER_MS if jitter_ms is None else jitter_ms
+        )
+        self.row_latency_us = (
+            config.LOCAL_WAREHOUSE_ROW_LATENCY_US
+            if row_latency_us is None
+            else row_latency_us
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if not os.path.exists(self.db_path):
+            raise FileNotFoundError(
+                f"로컬 웨어하우스 DB가 없습니다: {self.db_path} "
+                "(_08_automation/local_warehouse_seed.py 로 생성)"
+            )
+        conn = sqlite3.connect(self.db_path, factory=_LatencyConnection)
+        conn.latency_sec = self.latency_ms / 1000
+        conn.jitter_sec = self.jitter_ms / 1000
+        conn.row_latency_sec = self.row_latency_us / 1_000_000
+        register_udfs(conn)
+        return conn
+
+    def execute(self, query: str) -> pd.DataFrame:
+        """
+        쿼리를 로컬 웨어하우스용으로 변환하여 실행한 결과를 DataFrame으로 반환합니다.
+
+        Args:
+            query (str): 실행할 SQL 쿼리 (_01_query 빌더 쿼리)
+
+        Returns:
+            pd.DataFrame: 쿼리 결과 (따옴표 없는 컬럼명은 소문자)
+        """
+        return single_flight(
+            f"local_{self.db_type}", query, lambda: self._execute(query)
+        )
+
+    def _execute(self, query: str) -> pd.DataFrame:
+        conn = self._connect()
+        try:
+            df = query_metrics.read_sql(
+                f"local_{self.db_type}", translate_query(query), conn
+            )
+        finally:
+            conn.close()
+        return normalize_columns(df, query)
@@ -0,0 +1,333 @@
+"""
+쿼리 계측(Query Metrics) 모듈
+
+db_client 의 각 클라이언트 execute 경로에서 쿼리별 실행/조회 시간, 행 수, 메모리 크기를
+측정하여 버퍼링 이벤트 로거(_05_commons/event_logger)로 SQLite query_metrics 테이블에 저장합니다.
+주요 기능:
+- 쿼리 정규화 / 지문(fingerprint): 리터럴·공백·주석 차이를 무시하고 같은 쿼리 형태를 묶음
+- 호출 함수 추적: 쿼리를 실행한 _02_preprocessing 함수명 기록
+- 실행 시간(EXEC_MS)과 결과 수신 시간(FETCH_MS) 분리 측정
+- 캐시 적중/미적중 기록 (helper_pandas.cache_data_safe 연동)
+- 관리자 페이지용 느린 쿼리 / 빈번한 쿼리 집계
+
+환경 변수 QUERY_METRICS_ENABLED=0 으로 계측을 끌 수 있습니다.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config, event_logger
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "1") != "0"
+QUERY_METRICS_TABLE = "query_metrics"
+
+# 메모리 크기 추정 시 deep 측정할 최대 행 수 (초과 시 표본 비율로 환산)
+BYTES_SAMPLE_ROWS = 10_000
+
+event_logger.register_event_table(
+    QUERY_METRICS_TABLE,
+    f"""CREATE TABLE IF NOT EXISTS {QUERY_METRICS_TABLE} (
+        EXECUTED_AT TEXT,
+        BACKEND TEXT,
+        FINGERPRINT TEXT,
+        CALLER TEXT,
+        WALL_MS REAL,
+        EXEC_MS REAL,
+        FETCH_MS REAL,
+        ROWS INTEGER,
+        BYTES INTEGER,
+        CACHE_HIT INTEGER,
+        QUERY TEXT
+    )""",
+    [
+        f"CREATE INDEX IF NOT EXISTS idx_{QUERY_METRICS_TABLE}_time "
+        f"ON {QUERY_METRICS_TABLE} (EXECUTED_AT)",
+        f"CREATE INDEX IF NOT EXISTS idx_{QUERY_METRICS_TABLE}_fingerprint "
+        f"ON {QUERY_METRICS_TABLE} (FINGERPRINT)",
+    ],
+)
+
+# 스레드(Streamlit 세션)별 실행된 쿼리 수 (캐시 적중 판별용)
+_local = threading.local()
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([(),=<>!+*/-]+)\s*")
+_IN_LIST_RE = re.compile(r"\(\?(?:,\?)+\)")
+
+
+# * region 쿼리 지문
+def normalize_query(query: str) -> str:
+    """주석 / 문자열·숫자 리터럴 / IN 목록 길이 / 공백 / 대소문자 차이를 제거한 쿼리"""
+    text = _COMMENT_RE.sub(" ", query)
+    text = _STRING_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _PUNCT_RE.sub(r"\1", _SPACE_RE.sub(" ", text))
+    return _IN_LIST_RE.sub("(?)", text).strip().upper()
+
+
+def fingerprint_query(query: str) -> str:
+    """정규화된 쿼리의 12자리 지문"""
+    return hashlib.md5(normalize_query(query).encode("utf-8")).hexdigest()[:12]
+
+
+def find_caller() -> str:
+    """
+    쿼리를 실행한 함수명을 찾습니다.
+    _02_preprocessing 함수를 우선하고, 없으면 _00_database 밖의 첫 호출 위치를 사용합니다.
+    """
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if f"{os.sep}_02_preprocessing{os.sep}" in filename:
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}"
+        if fallback is None and f"{os.sep}_00_database{os.sep}" not in filename:
+            fallback = f"{os.path.basename(filename)}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+def estimate_bytes(df: pd.DataFrame) -> int:
+    """DataFrame 메모리 크기 추정 (큰 결과는 앞쪽 표본의 deep 크기로 환산)"""
+    if len(df) <= BYTES_SAMPLE_ROWS:
+        return int(df.memory_usage(index=False, deep=True).sum())
+    sample = df.iloc[:BYTES_SAMPLE_ROWS].memory_usage(index=False, deep=True).sum()
+    return int(sample * len(df) / BYTES_SAMPLE_ROWS)
+
+
+# * region 계측 실행
+def _fetch(query: str, con) -> Tuple[pd.DataFrame, float]:
+    """
+    쿼리를 실행하고 결과를 받아 DataFrame 으로 만듭니다. (pd.read_sql 과 같은 변환)
+
+    Returns:
+        tuple[pd.DataFrame, float]: (결과, 실행 완료 시점 perf_counter)
+    """
+    if isinstance(con, sqlite3.Connection):
+        cursor = con.execute(query)
+        executed = time.perf_counter()
+        columns = [col[0] for col in cursor.description or []]
+        rows = cursor.fetchall()
+    else:
+        with con.connect() as conn, conn.begin():
+            result = conn.exec_driver_sql(query)
+            executed = time.perf_counter()
+            columns = list(result.keys())
+            rows = result.fetchall()
+    df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    return df, executed
+
+
+def read_sql(backend: str, query: str, con) -> pd.DataFrame:
+    """
+    계측을 포함하여 쿼리를 실행합니다. (계측 비활성화 시 pd.read_sql 과 동일)
+
+    Args:
+        backend: 클라이언트 종류 ('snowflake', 'oracle_bi', 'oracle_mes', 'sqlite')
+        query: 실행할 SQL 쿼리
+        con: SQLAlchemy 엔진 또는 sqlite3 연결
+
+    Returns:
+        pd.DataFrame: 쿼리 결과
+    """
+    if not METRICS_ENABLED:
+        return pd.read_sql(query, con)
+
+    _local.query_count = getattr(_local, "query_count", 0) + 1
+    started = time.perf_counter()
+    df, executed = _fetch(query, con)
+    finished = time.perf_counter()
+
+    try:
+        record_query(
+            backend=backend,
+            query=query,
+            wall_ms=(finished - started) * 1000,
+            exec_ms=(executed - started) * 1000,
+            fetch_ms=(finished - executed) * 1000,
+            rows=len(df),
+            nbytes=estimate_bytes(df),
+            caller=find_caller(),
+        )
+    except Exception as e:
+        logger.warning(f"쿼리 계측 기록 실패: {str(e)}")
+    return df
+
+
+def record_query(
+    backend: str,
+    query: str,
+    wall_ms: float,
+    exec_ms: Optional[float] = None,
+    fetch_ms: Optional[float] = None,
+    rows: Optional[int] = None,
+    nbytes: Optional[int] = None,
+    caller: Optional[str] = None,
+    cache_hit: bool = False,
+    fingerprint: Optional[str] = None,
+) -> None:
+    """계측 결과 한 건을 이벤트 로거 큐에 넣습니다."""
+    event_logger.get_event_logger().log(
+        QUERY_METRICS_TABLE,
+        {
+            "EXECUTED_AT": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "BACKEND": backend,
+            "FINGERPRINT": fingerprint or fingerprint_query(query),
+            "CALLER": caller,
+            "WALL_MS": round(wall_ms, 2),
+            "EXEC_MS": None if exec_ms is None else round(exec_ms, 2),
+            "FETCH_MS": None if fetch_ms is None else round(fetch_ms, 2),
+            "ROWS": rows,
+            "BYTES": nbytes,
+            "CACHE_HIT": int(cache_hit),
+            "QUERY": query,
+        },
+    )
+
+
+def query_count() -> int:
+    """현재 스레드에서 계측된 쿼리 수"""
+    return getattr(_local, "query_count", 0)
+
+
+def record_cache_lookup(func_name: str, wall_ms: float, result: Any, hit: bool) -> None:
+    """
+    캐시 데코레이터 호출 결과를 BACKEND='cache' 행으로 기록합니다.
+    (미적중 호출의 내부 쿼리는 각각 별도 행으로도 기록됨)
+
+    Args:
+        func_name: 캐시된 함수명 (모듈.함수)
+        wall_ms: 호출 소요시간
+        result: 함수 반환값 (DataFrame 이면 행 수 기록)
+        hit: 캐시 적중 여부
+    """
+    if not METRICS_ENABLED:
+        return
+    rows = len(result) if isinstance(result, pd.DataFrame) else None
+    record_query(
+        backend="cache",
+        query=func_name,
+        wall_ms=wall_ms,
+        rows=rows,
+        caller=func_name,
+        cache_hit=hit,
+        fingerprint=f"cache:{func_name}",
+    )
+
+
+# * region 집계 (관리자 페이지)
+def load_query_metrics(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    쿼리 계측 기록을 조회합니다. (큐에 남은 기록을 먼저 저장)
+
+    Args:
+        start_date: 시작일자 YYYY-MM-DD (선택사항)
+        end_date: 종료일자 YYYY-MM-DD, 해당 일자 포함 (선택사항)
+        db_path: SQLite DB 파일 경로
+
+    Returns:
+        pd.DataFrame: 쿼리 계측 기록
+    """
+    event_logger.get_event_logger().flush(timeout=event_logger.FLUSH_INTERVAL_SEC)
+
+    conditions, params = [], []
+    if start_date:
+        conditions.append("EXECUTED_AT >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append("EXECUTED_AT < date(?, '+1 day')")
+        params.append(end_date)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    try:
+        with sqlite3.connect(db_path) as conn:
+            df = pd.read_sql_query(
+                f"SELECT * FROM {QUERY_METRICS_TABLE} {where}", conn, params=params
+            )
+    except Exception as e:
+        logger.warning(f"쿼리 계측 테이블 조회 실패: {str(e)}")
+        return pd.DataFrame()
+
+    df["EXECUTED_AT"] = pd.to_datetime(df["EXECUTED_AT"])
+    return df
+
+
+def summarize_query_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    쿼리 지문별 호출 수, 소요시간 통계, 행 수, 캐시 적중률을 집계합니다.
+
+    Args:
+        df: load_query_metrics 결과
+
+    Returns:
+        pd.DataFrame: FINGERPRINT 단위 집계 (TOTAL_MS 내림차순)
+            - CALLS, CACHE_HIT_RATE, AVG_MS, P95_MS, MAX_MS, TOTAL_MS
+            - AVG_EXEC_MS, AVG_FETCH_MS, AVG_ROWS, AVG_MB, BACKEND, CALLER, QUERY
+    """
+    columns = [
+        "FINGERPRINT",
+        "BACKEND",
+        "CALLER",
+        "CALLS",
+        "CACHE_HIT_RATE",
+        "AVG_MS",
+        "P95_MS",
+        "MAX_MS",
+        "TOTAL_MS",
+        "AVG_EXEC_MS",
+        "AVG_FETCH_MS",
+        "AVG_ROWS",
+        "AVG_MB",
+        "QUERY",
+    ]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    summary = (
+        df.groupby("FINGERPRINT")
+        .agg(
+            BACKEND=("BACKEND", "last"),
+            CALLER=("CALLER", lambda x: ", ".join(sorted(set(x.dropna())))),
+            CALLS=("WALL_MS", "size"),
+            CACHE_HIT_RATE=("CACHE_HIT", "mean"),
+            AVG_MS=("WALL_MS", "mean"),
+            P95_MS=("WALL_MS", lambda x: np.percentile(x, 95)),
+            MAX_MS=("WALL_MS", "max"),
+            TOTAL_MS=("WALL_MS", "sum"),
+            AVG_EXEC_MS=("EXEC_MS", "mean"),
+            AVG_FETCH_MS=("FETCH_MS", "mean"),
+            AVG_ROWS=("ROWS", "mean"),
+            AVG_MB=("BYTES", lambda x: x.mean() / 1024**2),
+            QUERY=("QUERY", "last"),
+        )
+        .reset_index()
+        .sort_values("TOTAL_MS", ascending=False)
+        .reset_index(drop=True)
+    )
+    return summary[columns]
@@ -0,0 +1,174 @@
+"""
+동일 쿼리 동시 실행 병합(single-flight) 모듈
+
+캐시 만료 직후 여러 Streamlit 세션이 같은 대시보드를 열면, 세션마다 같은 Snowflake 쿼리를
+동시에 실행하여 웨어하우스(SMALL_WH) 부하와 대기열이 급증합니다. 이 모듈은 같은 백엔드에서
+정규화한 쿼리 문자열이 같은 실행이 이미 진행 중이면, 새 호출이 쿼리를 다시 실행하지 않고
+진행 중인 실행의 결과를 기다렸다가 공유하도록 합니다.
+
+- 정규화: 문자열 리터럴 밖의 공백/줄바꿈 차이만 무시 (리터럴 값이 다르면 다른 쿼리)
+- 진행 중인 실행이 실패하면 기다리던 호출에도 같은 예외를 전달
+- 결과를 공유한 호출은 각자 DataFrame 복사본을 받음
+- 공유된 호출은 query_metrics 에 CACHE_HIT=1 행으로 기록
+
+환경 변수 SINGLE_FLIGHT_ENABLED=0 으로 끌 수 있습니다.
+
+사용 예시:
+>>> from _00_database.single_flight import single_flight
+>>> df = single_flight("snowflake", query, lambda: self._execute(query))
+"""
+
+import logging
+import re
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _00_database import query_metrics
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "1") != "0"
+
+_LITERAL_SPLIT_RE = re.compile(r"('(?:[^']|'')*')")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query_text(query: str) -> str:
+    """
+    문자열 리터럴 밖의 연속 공백을 하나로 줄인 쿼리 (리터럴 값은 그대로 유지)
+
+    Args:
+        query: SQL 쿼리
+
+    Returns:
+        str: 정규화된 쿼리
+    """
+    parts = _LITERAL_SPLIT_RE.split(query)
+    # 홀수 위치는 문자열 리터럴
+    parts[::2] = [_SPACE_RE.sub(" ", part) for part in parts[::2]]
+    return "".join(parts).strip()
+
+
+class _Call:
+    """진행 중인 실행 한 건"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[pd.DataFrame] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 실행을 하나로 합치는 실행기
+
+    - calls: {(백엔드, 정규화 쿼리): 진행 중인 실행}
+    - stats: executions(실제 실행 수) / shared(결과를 공유받은 호출 수)
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[Tuple[str, str], _Call] = {}
+        self.stats = {"executions": 0, "shared": 0}
+        self._lock = threading.Lock()
+
+    def do(
+        self, backend: str, query: str, execute: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        같은 쿼리가 실행 중이면 그 결과를 기다리고, 아니면 직접 실행합니다.
+
+        Args:
+            backend: 클라이언트 종류 (키 구분용)
+            query: 실행할 SQL 쿼리
+            execute: 실제 쿼리 실행 함수
+
+        Returns:
+            pd.DataFrame: 쿼리 결과
+        """
+        key = (backend, normalize_query_text(query))
+        with self._lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = _Call()
+                leader = True
+                self.stats["executions"] += 1
+            else:
+                call.waiters += 1
+                leader = False
+                self.stats["shared"] += 1
+
+        if not leader:
+            return self._wait(backend, query, call)
+
+        try:
+            call.result = execute()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # 키를 먼저 제거해야 이후 호출이 끝난 실행에 합류하지 않음
+            with self._lock:
+                self.calls.pop(key, None)
+                shared = call.waiters > 0
+            call.done.set()
+        # 기다린 호출이 복사하는 동안 원본이 수정되지 않도록 실행한 쪽도 복사본 반환
+        return call.result.copy() if shared else call.result
+
+    def _wait(self, backend: str, query: str, call: _Call) -> pd.DataFrame:
+        started = time.perf_counter()
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        result = call.result.copy()
+        if query_metrics.METRICS_ENABLED:
+            try:
+                query_metrics.record_query(
+                    backend=backend,
+                    query=query,
+                    wall_ms=(time.perf_counter() - started) * 1000,
+                    rows=len(result),
+                    caller=query_metrics.find_caller(),
+                    cache_hit=True,
+                )
+            except Exception as e:
+                logger.warning(f"쿼리 계측 기록 실패: {str(e)}")
+        return result
+
+
+_single_flight = SingleFlight()
+
+
+def single_flight(
+    backend: str, query: str, execute: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    프로세스 공용 SingleFlight 로 쿼리를 실행합니다. (비활성화 시 바로 실행)
+
+    Args:
+        backend: 클라이언트 종류 (키 구분용)
+        query: 실행할 SQL 쿼리
+        execute: 실제 쿼리 실행 함수
+
+    Returns:
+        pd.DataFrame: 쿼리 결과
+    """
+    if not SINGLE_FLIGHT_ENABLED:
+        return execute()
+    return _single_flight.do(backend, query, execute)
+
+
+def single_flight_stats() -> Dict[str, int]:
+    """프로세스 공용 SingleFlight 의 실제 실행 수 / 결과 공유 수"""
+    with _single_flight._lock:
+        return {**_single_flight.stats, "in_flight": len(_single_flight.calls)}
@@ -185,6 +185,49 @@ def get_ctl_raw_query(
     """
 
 
+def get_ctl_extract_query(start_date: str, end_date: str) -> str:
+    """CTL 로컬 저장소 적재용 CTMS 측정 데이터 추출 쿼리를 생성합니다.
+
+    get_ctl_raw_query 와 달리 상한/하한을 UNION ALL 로 나누지 않고 한 번만 스캔하며,
+    TOL/SPEC 문자열 파싱(LL/UL 계산)은 적재 단계(pandas)에서 한 번 수행합니다.
+
+    Args:
+        start_date (str): 시작일자 (YYYYMMDD)
+        end_date (str): 종료일자 (YYYYMMDD)
+
+    Returns:
+        str: 상한/하한 원본 컬럼을 포함한 CTMS 측정 데이터 추출 쿼리
+    """
+    return f"""--sql
+    SELECT
+        MRM_RPT_NO DOC_NO,                                -- 레포트넘버
+        PLT_CD PLANT,                                     -- 공장
+        TO_DATE(MRM_DATE, 'YYYYMMDD') MRM_DATE,           -- 생산일
+        MRM_OBJ_FG MRM_PURPOSE,                           -- 측정 목적
+        CTL_ITEM_NM MRM_ITEM,                             -- 측정 항목
+        STXC,                                             -- 시방 구분
+        SUBSTR(MFG_CD, 5, 7) M_CODE,                      -- 제품 코드
+        SPEC_SIZE,                                        -- SIZE
+        SPEC_PTRN,                                        -- 패턴
+        U_SPEC_VAL,                                       -- 상한 스펙
+        L_SPEC_VAL,                                       -- 하한 스펙
+        TOL_VAL TOL,                                      -- 허용치
+        U_MRM_AVG,                                        -- 상한 측정값
+        L_MRM_AVG,                                        -- 하한 측정값
+        U_MRM_RST,                                        -- 상한 판정결과
+        L_MRM_RST,                                        -- 하한 판정결과
+        TO_DATE(PRDT_DATE, 'YYYYMMDD') PRDT_DATE          -- 생산일
+    FROM
+        HKT_DW.BI_DWUSER.CTMS_RESULT_DATA CTL
+    WHERE
+        1=1
+        AND MRM_DATE BETWEEN '{start_date}' AND '{end_date}'
+        AND STXC IN ('S', 'M', 'V')
+        AND MRM_PURPOSE IN {CTMS_PURPOSE}
+        AND MRM_ITEM IN {CTMS_MRM_ITEM}
+    """
+
+
 def main():
     """CTMS 측정 데이터를 조회하고 처리합니다.
 
@@ -116,6 +116,8 @@ def curing_prdt_monthly_by_ym(
     mcode_list: Optional[List[str]] = None,
     yyyy: Optional[int] = None,
     mm: Optional[int] = None,
+    start_yyyy: Optional[int] = None,
+    end_yyyy: Optional[int] = None,
 ) -> str:
     """
     연도와 월 기준으로 월별 생산 현황을 조회하는 SQL 쿼리를 생성합니다.
@@ -128,6 +130,10 @@ def curing_prdt_monthly_by_ym(
         조회할 연도. 기본값은 None
     mm : Optional[int], optional
         조회할 월. 기본값은 None
+    start_yyyy : Optional[int], optional
+        조회 시작 연도 (여러 연도를 한 번에 조회할 때 사용). 기본값은 None
+    end_yyyy : Optional[int], optional
+        조회 종료 연도 (여러 연도를 한 번에 조회할 때 사용). 기본값은 None
 
     Returns
     -------
@@ -154,6 +160,8 @@ def curing_prdt_monthly_by_ym(
         {f'AND MAS.M_CODE IN ({",".join(f"\'{m}\'" for m in mcode_list)})' if mcode_list else ""}
         {f'AND PRDT.YYYY = {yyyy}' if yyyy else ""}
         {f'AND PRDT.MM = {mm}' if mm else ""}
+        {f'AND PRDT.YYYY >= {start_yyyy}' if start_yyyy else ""}
+        {f'AND PRDT.YYYY <= {end_yyyy}' if end_yyyy else ""}
     """
     return query
 
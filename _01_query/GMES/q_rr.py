@@ -95,6 +95,8 @@ def rr(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     test_fg: str = "OE",
+    min_smpl_id: Optional[str] = None,
+    include_smpl_id: bool = False,
 ) -> str:
     """
     롤링 저항 테스트 데이터를 조회하는 SQL 쿼리를 생성합니다.
@@ -107,6 +109,11 @@ def rr(
         조회 종료일 (YYYY-MM-DD 형식). 기본값은 None
     test_fg : str, optional
         테스트 구분 ("OE" 또는 "일반"). 기본값은 "OE"
+    min_smpl_id : Optional[str], optional
+        이 값 이상인 SMPL_ID(YYMMDD + 순번)만 조회 (증분 적재 워터마크). 기본값은 None
+    include_smpl_id : bool, optional
+        SMPL_ID / TEST_SEQ / ATCH_SEQ 컬럼 포함 여부 (로컬 RR 샘플 저장소 적재용,
+        같은 샘플의 시험(TEST_SEQ)별 행 구분). 기본값은 False
 
     Returns
     -------
@@ -124,6 +131,11 @@ def rr(
                 BETWEEN TO_DATE('{start_date}', 'YYYY-MM-DD')
                 AND TO_DATE('{end_date}', 'YYYY-MM-DD')
         """
+    if min_smpl_id:
+        date_filter += f"""
+            AND SPL.SMPL_ID >= '{min_smpl_id}'
+        """
+    smpl_id_col = "SPL.SMPL_ID, LST.TEST_SEQ, LST.ATCH_SEQ," if include_smpl_id else ""
 
     # 3. 전체 쿼리 생성
     query = f"""--sql
@@ -134,6 +146,7 @@ def rr(
             CD AS ({CTE_MES_CODE_RR_TEST_METHOD})
         SELECT
             SPL.PLANT,
+            {smpl_id_col}
             TO_DATE(SUBSTRING(SPL.SMPL_ID, 1, 6), 'YYMMDD') SMPL_DATE,
             SPL.M_CODE,
             LST.WARM_LOAD,
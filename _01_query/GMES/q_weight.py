@@ -24,6 +24,12 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 from _00_database.db_client import get_client
 
+# 중량 히스토그램 구간: 표준 중량(STD_WGT) 대비 편차(%) 고정 폭 구간
+# 구간 번호 k 는 [k * WT_HIST_BIN_PCT, (k + 1) * WT_HIST_BIN_PCT) %,
+# ±WT_HIST_MAX_PCT 를 벗어나는 값은 양 끝 구간에 포함
+WT_HIST_BIN_PCT = 0.2
+WT_HIST_MAX_PCT = 3.0
+
 # --- SQL 쿼리 템플릿 정의 ---
 CTE_MES_MASTER_HX = """--sql
     SELECT DISTINCT
@@ -44,6 +50,8 @@ CTE_MES_GT_WT = """--sql
         INS_DATE,
         STD_WGT,
         MRM_WGT,
+        UPM_STD_WGT,
+        LWM_STD_WGT,
         CASE
             WHEN MRM_WGT <= UPM_STD_WGT AND MRM_WGT >= LWM_STD_WGT THEN 1 -- 판정
             ELSE 0 
@@ -206,6 +214,195 @@ def gt_wt_individual(
     return query
 
 
+def _ins_date_filter(
+    start_date: Optional[str], end_date: Optional[str], end_before: Optional[str]
+) -> str:
+    """검사일시(INS_DATE) 조건절을 생성합니다. end_before 는 미만(<) 조건입니다."""
+    return f"""
+        {f"AND WT.INS_DATE >= '{start_date}'" if start_date else ""}
+        {f"AND WT.INS_DATE <= '{end_date}'" if end_date else ""}
+        {f"AND WT.INS_DATE < '{end_before}'" if end_before else ""}
+    """
+
+
+def gt_wt_summary(
+    mcode: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    end_before: Optional[str] = None,
+) -> str:
+    """
+    중량 테스트 결과를 공장 / 월별 통계값으로 집계하는 SQL 쿼리를 생성합니다.
+    개별 측정값을 내려받지 않고 서버에서 건수, 평균, 표준편차, 사분위수를 계산합니다.
+    BOX_* 는 그룹별 IQR 1.5배 울타리 밖 측정값(아웃라이어)을 제외한 박스플롯용 통계입니다.
+
+    Parameters
+    ----------
+    mcode : Optional[str], optional
+        조회할 제품 코드. 기본값은 None
+    start_date : Optional[str], optional
+        조회 시작일자 (YYYYMMDD 형식, 이상). 기본값은 None
+    end_date : Optional[str], optional
+        조회 종료일자 (YYYYMMDD 형식, 이하). 기본값은 None
+    end_before : Optional[str], optional
+        조회 종료일자 (YYYYMMDD 형식, 미만). 월 단위 조회에 사용. 기본값은 None
+
+    Returns
+    -------
+    str
+        PLANT, M_CODE, INS_DATE_YM 별 WT_INS_QTY, WT_PASS_QTY, WT_MEAN, WT_STD,
+        WT_MIN, WT_Q1, WT_MEDIAN, WT_Q3, WT_MAX, BOX_MEAN, BOX_MIN, BOX_Q1,
+        BOX_MEDIAN, BOX_Q3, BOX_MAX, STD_WGT, UPM_STD_WGT, LWM_STD_WGT
+    """
+    ym = "TO_CHAR(TO_DATE(SUBSTRING(WT.INS_DATE, 0, 8), 'YYYYMMDD'), 'YYYYMM')"
+    keys = "PLANT, M_CODE, INS_DATE_YM"
+    query = f"""--sql
+    WITH 
+        MAS AS ({CTE_MES_MASTER_HX}),
+        WT AS ({CTE_MES_GT_WT}),
+        SMP AS (
+            SELECT
+                MAS.PLANT,
+                MAS.M_CODE,
+                {ym} AS INS_DATE_YM,
+                WT.MRM_WGT,
+                WT.JDG,
+                WT.STD_WGT,
+                WT.UPM_STD_WGT,
+                WT.LWM_STD_WGT
+            FROM MAS
+            INNER JOIN WT
+                ON MAS.SPEC_CD_HX = WT.SPEC_CD 
+                    AND MAS.PLANT = WT.PLANT
+            WHERE 
+                1=1
+                {_ins_date_filter(start_date, end_date, end_before)}
+                {f"AND MAS.M_CODE = '{mcode}'" if mcode else ""}
+        ),
+        -- 그룹별 IQR 울타리 (ui_oeassessment_result_viewer.remove_outliers 와 같은 기준)
+        QRT AS (
+            SELECT
+                {keys},
+                PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY MRM_WGT) AS Q1,
+                PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY MRM_WGT) AS Q3
+            FROM SMP
+            GROUP BY {keys}
+        ),
+        FENCE AS (
+            SELECT
+                {keys},
+                Q1 - 1.5 * (Q3 - Q1) AS LOWER_FENCE,
+                Q3 + 1.5 * (Q3 - Q1) AS UPPER_FENCE
+            FROM QRT
+        ),
+        -- 울타리 밖 측정값은 BOX_WGT 를 NULL 로 두어 박스 통계에서 제외
+        BOX AS (
+            SELECT
+                SMP.*,
+                CASE
+                    WHEN SMP.MRM_WGT BETWEEN FENCE.LOWER_FENCE AND FENCE.UPPER_FENCE
+                    THEN SMP.MRM_WGT
+                END AS BOX_WGT
+            FROM SMP
+            INNER JOIN FENCE
+                ON SMP.PLANT = FENCE.PLANT
+                    AND SMP.M_CODE = FENCE.M_CODE
+                    AND SMP.INS_DATE_YM = FENCE.INS_DATE_YM
+        )
+    SELECT
+        {keys},
+        COUNT(MRM_WGT) AS WT_INS_QTY,
+        SUM(JDG) AS WT_PASS_QTY,
+        AVG(MRM_WGT) AS WT_MEAN,
+        STDDEV_SAMP(MRM_WGT) AS WT_STD,
+        MIN(MRM_WGT) AS WT_MIN,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY MRM_WGT) AS WT_Q1,
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY MRM_WGT) AS WT_MEDIAN,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY MRM_WGT) AS WT_Q3,
+        MAX(MRM_WGT) AS WT_MAX,
+        AVG(BOX_WGT) AS BOX_MEAN,
+        MIN(BOX_WGT) AS BOX_MIN,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY BOX_WGT) AS BOX_Q1,
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY BOX_WGT) AS BOX_MEDIAN,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY BOX_WGT) AS BOX_Q3,
+        MAX(BOX_WGT) AS BOX_MAX,
+        AVG(STD_WGT) AS STD_WGT,
+        AVG(UPM_STD_WGT) AS UPM_STD_WGT,
+        AVG(LWM_STD_WGT) AS LWM_STD_WGT
+    FROM BOX
+    GROUP BY {keys}
+    ORDER BY
+        INS_DATE_YM,
+        PLANT
+    """
+    return query
+
+
+def gt_wt_histogram(
+    mcode: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    end_before: Optional[str] = None,
+) -> str:
+    """
+    중량 측정값을 표준 중량 대비 편차(%) 고정 폭 구간으로 집계하는 SQL 쿼리를 생성합니다.
+    구간 폭과 범위는 WT_HIST_BIN_PCT / WT_HIST_MAX_PCT 를 따릅니다.
+
+    Parameters
+    ----------
+    mcode : Optional[str], optional
+        조회할 제품 코드. 기본값은 None
+    start_date : Optional[str], optional
+        조회 시작일자 (YYYYMMDD 형식, 이상). 기본값은 None
+    end_date : Optional[str], optional
+        조회 종료일자 (YYYYMMDD 형식, 이하). 기본값은 None
+    end_before : Optional[str], optional
+        조회 종료일자 (YYYYMMDD 형식, 미만). 월 단위 조회에 사용. 기본값은 None
+
+    Returns
+    -------
+    str
+        PLANT, M_CODE, INS_DATE_YM, BIN_IDX 별 WT_QTY, WT_PASS_QTY
+    """
+    ym = "TO_CHAR(TO_DATE(SUBSTRING(WT.INS_DATE, 0, 8), 'YYYYMMDD'), 'YYYYMM')"
+    n_bins = round(WT_HIST_MAX_PCT / WT_HIST_BIN_PCT)
+    bin_idx = f"""LEAST(GREATEST(
+            FLOOR((WT.MRM_WGT / NULLIF(WT.STD_WGT, 0) - 1) * 100 / {WT_HIST_BIN_PCT}),
+            {-n_bins}
+        ), {n_bins - 1})"""
+    query = f"""--sql
+    WITH 
+        MAS AS ({CTE_MES_MASTER_HX}),
+        WT AS ({CTE_MES_GT_WT})
+    SELECT
+        MAS.PLANT,
+        MAS.M_CODE,
+        {ym} AS INS_DATE_YM,
+        {bin_idx} AS BIN_IDX,
+        COUNT(WT.MRM_WGT) AS WT_QTY,
+        SUM(WT.JDG) AS WT_PASS_QTY
+    FROM MAS
+    INNER JOIN WT
+        ON MAS.SPEC_CD_HX = WT.SPEC_CD 
+            AND MAS.PLANT = WT.PLANT
+    WHERE 
+        1=1
+        AND WT.STD_WGT > 0
+        {_ins_date_filter(start_date, end_date, end_before)}
+        {f"AND MAS.M_CODE = '{mcode}'" if mcode else ""}
+    GROUP BY
+        MAS.PLANT,
+        MAS.M_CODE,
+        {ym},
+        {bin_idx}
+    ORDER BY
+        INS_DATE_YM,
+        MAS.PLANT,
+        BIN_IDX
+    """
+    return query
+
+
 def main() -> pd.DataFrame:
     """
     중량 테스트 데이터의 합격률을 계산하는 메인 함수입니다.
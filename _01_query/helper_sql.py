@@ -34,9 +34,12 @@ project_root = os.getenv(
 )
 sys.path.append(project_root)
 
-from IPython.display import display
 import pandas as pd
 import _00_database.db_client as db_client
+from _05_commons.helper import lazy_import
+
+# 노트북 전용 의존성은 test_query_from_ipynb 호출 시점에만 로딩
+ipython_display = lazy_import("IPython.display")
 
 
 # decode
@@ -72,7 +75,7 @@ def test_query_from_ipynb(
         print(
             f"Testing [{query_func.__name__}] rows : {df.shape[0]} columns : {df.shape[1]}"
         )
-        display(df.head(max_rows))
+        ipython_display.display(df.head(max_rows))
         print("-" * 40)
 
     except Exception as e:
@@ -5,6 +5,7 @@
 주요 기능:
 - 4M 변경 데이터 로드 및 기본 전처리
 - 주간/연간 기준 데이터 필터링
+- 연간 주차별 상태 건수 일괄 집계
 - 피벗 테이블 생성
 - 진행중인 변경사항 분석
 """
@@ -33,7 +34,24 @@ ALL_STATUS = ["Open", "Open & Close", "Close", "On-going"]
 EXCLUDED_STATUS = ["Reject(Request)", "Reject(Final Approval)", "Complete", "Saved"]
 
 
-@helper_pandas.cache_data_safe(ttl=600)
+@helper_pandas.cache_data_safe(ttl=600, stale_while_revalidate=True, shared=True)
+def _fetch_4m() -> pd.DataFrame:
+    """4M 변경 데이터를 조회하고 기본 전처리를 수행합니다. (조회 오류는 그대로 발생)
+
+    만료 후 갱신이 실패하면 캐시된 기존 데이터를 계속 반환합니다.
+
+    Returns:
+        pd.DataFrame: 전처리된 4M 변경 데이터프레임
+    """
+    df = get_client("snowflake").execute(q_4m_change.query_4m_change())
+    df = helper_pandas.standardize_columns_uppercase(df).pipe(
+        helper_pandas.convert_date_columns, ["REG_DATE", "COMP_DATE"]
+    )
+    df["URL"] = config_pandas.URL_CHANGE_4M + df["DOC_NO"]
+    df["DOC_NO"] = df["DOC_NO"].str.replace("MANA-DOC-", "4M-", regex=False)
+    return df
+
+
 def load_4m() -> pd.DataFrame:
     """4M 변경 데이터를 로드하고 기본 전처리를 수행합니다.
 
@@ -41,13 +59,7 @@ def load_4m() -> pd.DataFrame:
         pd.DataFrame: 전처리된 4M 변경 데이터프레임
     """
     try:
-        df = get_client("snowflake").execute(q_4m_change.query_4m_change())
-        df = helper_pandas.standardize_columns_uppercase(df).pipe(
-            helper_pandas.convert_date_columns, ["REG_DATE", "COMP_DATE"]
-        )
-        df["URL"] = config_pandas.URL_CHANGE_4M + df["DOC_NO"]
-        df["DOC_NO"] = df["DOC_NO"].str.replace("MANA-DOC-", "4M-", regex=False)
-        return df
+        return _fetch_4m()
     except Exception as e:
         st.error(f"4M 데이터 로드 중 오류 발생: {str(e)}")
         return pd.DataFrame()
@@ -69,11 +81,37 @@ def get_4m_change_detail_df(mcode_list: list) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@helper_pandas.cache_data_safe(ttl=600, shared=True)
+def load_4m_weekly_base() -> pd.DataFrame:
+    """주간 집계용 4M 변경 데이터를 DOC_NO, PLANT, SUBJECT 기준으로 그룹화합니다.
+
+    Returns:
+        pd.DataFrame: 문서(DOC_NO, PLANT, SUBJECT)당 1행의 4M 변경 데이터프레임
+    """
+    df = load_4m().assign(
+        PLANT=lambda x: pd.Categorical(
+            x["PLANT"], categories=config.plant_codes[:-1], ordered=True
+        )
+    )
+
+    return (
+        df.groupby(["DOC_NO", "PLANT", "SUBJECT"], observed=True)
+        .agg(
+            {
+                "REG_DATE": "first",
+                "COMP_DATE": "first",
+                "URL": "first",
+            }
+        )
+        .reset_index()
+    )
+
+
 @helper_pandas.cache_data_safe(ttl=600)
 def filtered_4m_by_weekly(
     start_date: pd.Timestamp, end_date: pd.Timestamp
 ) -> pd.DataFrame:
-    """주간 기준으로 4M 변경 데이터를 필터링하고 DOC_NO, PLANT, SUBJECT 기준으로 그룹화합니다.
+    """주간 기준으로 4M 변경 데이터의 상태를 분류합니다.
 
     Args:
         start_date: 시작일
@@ -82,7 +120,7 @@ def filtered_4m_by_weekly(
     Returns:
         pd.DataFrame: DOC_NO, PLANT, SUBJECT 기준으로 그룹화된 4M 변경 데이터프레임
     """
-    df = load_4m()
+    df = load_4m_weekly_base().copy()
 
     # 주간 조건 계산
     bool_open, bool_close, bool_ongoing1, bool_ongoing2 = (
@@ -100,25 +138,24 @@ def filtered_4m_by_weekly(
     # 상태 카테고리 설정
     df["STATUS"] = np.select(conditions, ALL_STATUS, default=None)
     df["STATUS"] = pd.Categorical(df["STATUS"], categories=ALL_STATUS, ordered=True)
-    df["PLANT"] = pd.Categorical(
-        df["PLANT"], categories=config.plant_codes[:-1], ordered=True
-    )
 
-    # DOC_NO, PLANT, SUBJECT 기준으로 그룹화
-    df_grouped = (
-        df.groupby(["DOC_NO", "PLANT", "SUBJECT"])
-        .agg(
-            {
-                "STATUS": "first",
-                "REG_DATE": "first",
-                "COMP_DATE": "first",
-                "URL": "first",
-            }
-        )
-        .reset_index()
-    )
+    return df[["DOC_NO", "PLANT", "SUBJECT", "STATUS", "REG_DATE", "COMP_DATE", "URL"]]
+
+
+@helper_pandas.cache_data_safe(ttl=600)
+def weekly_status_counts_4m(year: int) -> pd.DataFrame:
+    """해당 연도 모든 주의 공장별 4M 변경 상태 건수를 한 번에 집계합니다.
 
-    return df_grouped
+    Args:
+        year: 집계 연도
+
+    Returns:
+        pd.DataFrame: WEEK_START, PLANT, STATUS, COUNT 컬럼의 long 포맷 집계
+    """
+    df = load_4m_weekly_base()
+    return helper_pandas.count_weekly_status(
+        df, helper_pandas.get_year_week_starts(year)
+    )
 
 
 @helper_pandas.cache_data_safe(ttl=600)
@@ -132,6 +169,11 @@ def df_pivot_4m(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFram
     Returns:
         pd.DataFrame: 공장별, 상태별 집계된 피벗 테이블
     """
+    # 월~일 단위 조회는 연간 일괄 집계 결과에서 해당 주만 꺼내 사용
+    if helper_pandas.is_calendar_week(start_date, end_date):
+        df_counts = weekly_status_counts_4m(pd.Timestamp(start_date).year)
+        return helper_pandas.pivot_weekly_status_counts(df_counts, start_date)
+
     df = filtered_4m_by_weekly(start_date, end_date)
     return (
         df.pivot_table(
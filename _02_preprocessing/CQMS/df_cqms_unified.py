@@ -3,7 +3,8 @@ import sys
 import pandas as pd
 
 from _00_database.db_client import get_client
-from _01_query.CQMS import q_4m_change, q_quality_issue, q_customer_audit
+from _01_query.CQMS import q_4m_change, q_customer_audit
+from _02_preprocessing.CQMS import df_quality_issue
 
 project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
@@ -27,13 +28,11 @@ def get_cqms_unified_df(m_code):
     else:
         raise ValueError("m_code는 문자열 또는 리스트여야 합니다.")
 
-    # Quality Issue 데이터 로드 및 전처리
-    q_issue = get_client("snowflake").execute(q_quality_issue.query_quality_issue())
-    q_issue.columns = q_issue.columns.str.upper()
-    q_issue = q_issue[q_issue["M_CODE"].isin(m_code_list)]
+    # Quality Issue 데이터 로드 및 전처리 (공통 품질이슈 데이터에서 M-Code 만 추출)
+    q_issue = df_quality_issue.load_qi_store().by_mcodes(m_code_list).reset_index()
 
-    # NaN 값을 빈 문자열로 처리하여 안전한 문자열 연결
-    q_issue["TYPE"] = q_issue["TYPE"].fillna("")
+    # NaN 값을 빈 문자열로 처리하여 안전한 문자열 연결 (TYPE 은 카테고리 타입)
+    q_issue["TYPE"] = q_issue["TYPE"].astype(object).fillna("")
     q_issue["CAT"] = q_issue["CAT"].fillna("")
     q_issue["SUB_CAT"] = q_issue["SUB_CAT"].fillna("")
 
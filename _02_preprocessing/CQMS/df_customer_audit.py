@@ -23,14 +23,14 @@ sys.path.append(project_root)
 from _00_database.db_client import get_client
 from _01_query.CQMS import q_customer_audit
 from _02_preprocessing import config_pandas
-from _02_preprocessing.helper_pandas import test_dataframe_by_itself
+from _02_preprocessing.helper_pandas import cache_data_safe, test_dataframe_by_itself
 from _05_commons import config
 
 # 감사 상태 정의
 AUDIT_STATUS = ["NEW", "Upcoming", "CLOSE", "Need Update"]
 
 
-@st.cache_data(ttl=600)
+@cache_data_safe(ttl=600, stale_while_revalidate=True)
 def df_audit_weekly(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFrame:
     """
     주간 감사 현황 데이터를 생성합니다.
@@ -119,6 +119,32 @@ def df_pivot_audit(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataF
     )
 
 
+def load_ongoing_audits() -> pd.DataFrame:
+    """
+    종료일이 지났지만 OPEN 상태인 System/Project 감사를 조회합니다.
+    (오류 발생 시 예외를 그대로 전달합니다)
+
+    Returns:
+        pd.DataFrame: ELAPSED_PERIOD(종료일 경과일수)가 추가된 진행중 감사 데이터
+    """
+    df = get_client("snowflake").execute(q_customer_audit.query_customer_audit())
+    df.columns = df.columns.str.upper()
+    df["URL"] = config_pandas.URL_AUDIT + df["URL"]
+
+    # 필터링 조건
+    valid_types = ["System", "Project"]
+    today = config.today
+
+    # 데이터 필터링
+    return (
+        df[df["TYPE"].isin(valid_types)]
+        .query("STATUS == 'OPEN'")
+        .assign(END_DT=lambda x: pd.to_datetime(x["END_DT"]))
+        .query("END_DT <= @today")
+        .assign(ELAPSED_PERIOD=lambda x: (today - x["END_DT"]).dt.days)
+    )
+
+
 @st.cache_data(ttl=600)
 def get_audit_ongoing_df(
     plants: Optional[List[str]] = None,
@@ -136,23 +162,8 @@ def get_audit_ongoing_df(
             - 월별 집계 데이터
     """
     try:
-        # 데이터 로드 및 기본 전처리
-        df = get_client("snowflake").execute(q_customer_audit.query_customer_audit())
-        df.columns = df.columns.str.upper()
-        df["URL"] = config_pandas.URL_AUDIT + df["URL"]
-
-        # 필터링 조건
-        valid_types = ["System", "Project"]
-        today = config.today
-
-        # 데이터 필터링
-        df = (
-            df[df["TYPE"].isin(valid_types)]
-            .query("STATUS == 'OPEN'")
-            .assign(END_DT=lambda x: pd.to_datetime(x["END_DT"]))
-            .query("END_DT <= @today")
-            .assign(ELAPSED_PERIOD=lambda x: (today - x["END_DT"]).dt.days)
-        )
+        # 데이터 로드 및 필터링
+        df = load_ongoing_audits()
 
         # 공장별 필터링
         filtered_df = df[df["PLANT"].isin(plants)] if plants else df
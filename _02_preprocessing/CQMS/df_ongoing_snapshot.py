@@ -0,0 +1,246 @@
+"""
+진행중 현황(On-going) 스냅샷 데이터 모듈
+
+Ongoing Status Tracker 가 매 호출마다 CQMS 원본 테이블 전체를 조회하지 않도록,
+스케줄 작업(_08_automation/ongoing_status_snapshot.py)이 저장한 SQLite 스냅샷을 읽습니다.
+주요 기능:
+- 소스별(품질이슈/4M/감사) 진행중 항목 스냅샷 생성 (경과일 구간, 공장, 월 포함)
+- 스냅샷 조회 및 공장별/월별 집계
+- 일자별 미결(backlog) 건수 이력 조회
+"""
+
+import sys
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database.db_client import get_client
+from _02_preprocessing import helper_pandas
+from _02_preprocessing.CQMS import df_quality_issue, df_4m_change, df_customer_audit
+
+# 스냅샷 테이블 정의
+SNAPSHOT_TABLES: Dict[str, str] = {
+    "qi": "ongoing_snapshot_qi",
+    "4m": "ongoing_snapshot_4m",
+    "audit": "ongoing_snapshot_audit",
+}
+HISTORY_TABLE = "ongoing_backlog_history"
+
+# 경과일 기준 컬럼 (품질이슈/4M: 등록일, 감사: 감사 종료일)
+REF_DATE_COLS: Dict[str, str] = {"qi": "REG_DATE", "4m": "REG_DATE", "audit": "END_DT"}
+
+# 경과일 구간
+ELAPSED_BINS = [-np.inf, 30, 60, 90, 180, np.inf]
+ELAPSED_LABELS = ["~30D", "31~60D", "61~90D", "91~180D", "180D~"]
+
+
+# * region 스냅샷 생성
+def add_snapshot_columns(
+    df: pd.DataFrame, ref_col: str, snapshot_at: pd.Timestamp
+) -> pd.DataFrame:
+    """
+    진행중 항목에 경과일, 경과일 구간, 월(월말 일자), 스냅샷 시각 컬럼을 추가합니다.
+
+    Args:
+        df: 진행중 항목 데이터프레임
+        ref_col: 경과일 기준 날짜 컬럼명
+        snapshot_at: 스냅샷 기준 시각
+
+    Returns:
+        pd.DataFrame: ELAPSED_DAYS, ELAPSED_BUCKET, MONTH, SNAPSHOT_AT 컬럼이 추가된 데이터프레임
+    """
+    ref_date = pd.to_datetime(df[ref_col])
+    df = df.copy()
+    df["ELAPSED_DAYS"] = (snapshot_at - ref_date).dt.days
+    df["ELAPSED_BUCKET"] = pd.cut(
+        df["ELAPSED_DAYS"], bins=ELAPSED_BINS, labels=ELAPSED_LABELS
+    ).astype(str)
+    df["MONTH"] = ref_date.dt.normalize() + pd.offsets.MonthEnd(0)
+    df["SNAPSHOT_AT"] = snapshot_at
+    return df
+
+
+def build_ongoing_snapshot(
+    source: str, snapshot_at: Optional[pd.Timestamp] = None
+) -> pd.DataFrame:
+    """
+    CQMS 원본에서 소스별 진행중 항목 스냅샷을 생성합니다.
+    (원본 조회 오류는 예외로 전달하여 스냅샷이 빈 데이터로 덮어써지지 않도록 합니다)
+
+    Args:
+        source: 'qi', '4m', 'audit' 중 하나
+        snapshot_at: 스냅샷 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        pd.DataFrame: 진행중 항목 스냅샷
+    """
+    snapshot_at = snapshot_at or pd.Timestamp.now()
+
+    if source == "qi":
+        df = df_quality_issue.load_ongoing_quality_issues()
+    elif source == "4m":
+        # 공장 미등록(PLANT 결측) 건은 그룹화 없이 원본 그대로 함께 저장
+        df_na, grouped, _, _ = df_4m_change.filtered_4m_ongoing_by_yearly()
+        grouped = grouped.assign(M_CODE=grouped["M_CODE"].str.join(", "))
+        df = pd.concat([grouped, df_na], ignore_index=True).drop(
+            columns="Elapsed_period"
+        )
+    elif source == "audit":
+        df = df_customer_audit.load_ongoing_audits().drop(columns="ELAPSED_PERIOD")
+    else:
+        raise ValueError(f"지원하지 않는 스냅샷 소스입니다: {source}")
+
+    return add_snapshot_columns(df, REF_DATE_COLS[source], snapshot_at)
+
+
+def summarize_backlog(
+    snapshots: Dict[str, pd.DataFrame], snapshot_at: pd.Timestamp
+) -> pd.DataFrame:
+    """
+    소스별 스냅샷을 일자/소스/공장/경과일 구간 단위 미결 건수로 요약합니다.
+
+    Args:
+        snapshots: {소스: 스냅샷 데이터프레임}
+        snapshot_at: 스냅샷 기준 시각
+
+    Returns:
+        pd.DataFrame: SNAPSHOT_DATE, SOURCE, PLANT, ELAPSED_BUCKET, COUNT 컬럼의 이력 행
+    """
+    frames = [
+        df.assign(SOURCE=source, PLANT=df["PLANT"].astype(object).fillna("N/A"))
+        .groupby(["SOURCE", "PLANT", "ELAPSED_BUCKET"])
+        .size()
+        .rename("COUNT")
+        .reset_index()
+        for source, df in snapshots.items()
+    ]
+    history = pd.concat(frames, ignore_index=True)
+    history.insert(0, "SNAPSHOT_DATE", snapshot_at.strftime("%Y-%m-%d"))
+    return history
+
+
+# * region 스냅샷 조회
+@helper_pandas.cache_data_safe(ttl=600)
+def load_snapshot_table(source: str) -> pd.DataFrame:
+    """
+    SQLite 스냅샷 테이블을 조회합니다.
+    스냅샷이 아직 생성되지 않은 경우에만 CQMS 원본에서 직접 생성합니다.
+
+    Args:
+        source: 'qi', '4m', 'audit' 중 하나
+
+    Returns:
+        pd.DataFrame: 진행중 항목 스냅샷
+    """
+    try:
+        df = get_client("sqlite").execute(f"SELECT * FROM {SNAPSHOT_TABLES[source]}")
+    except Exception as e:
+        print(f"스냅샷 테이블 조회 실패, 원본에서 생성합니다: {str(e)}")
+        return build_ongoing_snapshot(source)
+
+    date_cols = [REF_DATE_COLS[source], "MONTH", "SNAPSHOT_AT", "START_DT", "END_DT"]
+    return helper_pandas.convert_date_columns(df, date_cols)
+
+
+def load_ongoing_snapshot(
+    source: str, plants: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    진행중 항목 스냅샷을 조회합니다. (4M 공장 미등록 건 제외)
+
+    Args:
+        source: 'qi', '4m', 'audit' 중 하나
+        plants: 공장 코드 리스트 (선택사항)
+
+    Returns:
+        pd.DataFrame: 공장 필터가 적용된 진행중 항목
+    """
+    df = load_snapshot_table(source)
+    df = df[df["PLANT"].notna()]
+    if plants:
+        df = df[df["PLANT"].isin(plants)]
+
+    if source == "4m":
+        df = df.assign(Elapsed_period=pd.to_timedelta(df["ELAPSED_DAYS"], unit="D"))
+    elif source == "audit":
+        df = df.assign(ELAPSED_PERIOD=df["ELAPSED_DAYS"])
+    return df
+
+
+def load_unregistered_4m_snapshot() -> pd.DataFrame:
+    """OE Application에 등록되지 않은 M-Code(PLANT 결측)의 진행중 4M 항목을 조회합니다."""
+    df = load_snapshot_table("4m")
+    df = df[df["PLANT"].isna()]
+    return df.assign(Elapsed_period=pd.to_timedelta(df["ELAPSED_DAYS"], unit="D"))
+
+
+def summarize_snapshot_by_plant(
+    source: str, plants: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """공장별 진행중 항목 수 (COUNT 내림차순)"""
+    df = load_ongoing_snapshot(source, plants)
+    return (
+        df.groupby("PLANT")
+        .agg(COUNT=("PLANT", "size"))
+        .sort_values("COUNT", ascending=False)
+    )
+
+
+def summarize_snapshot_by_month(
+    source: str, plants: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """월별 진행중 항목 수 (월말 일자 인덱스, 빈 월은 0)"""
+    df = load_ongoing_snapshot(source, plants)
+    counts = df.groupby("MONTH").size().rename("COUNT").to_frame()
+    if counts.empty:
+        return counts
+    months = pd.date_range(counts.index.min(), counts.index.max(), freq="ME")
+    return counts.reindex(months, fill_value=0)
+
+
+@helper_pandas.cache_data_safe(ttl=600)
+def load_backlog_history(plants: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    일자별/소스별 미결 건수 이력을 조회합니다.
+
+    Args:
+        plants: 공장 코드 리스트 (선택사항)
+
+    Returns:
+        pd.DataFrame: SNAPSHOT_DATE 인덱스, 소스(qi/4m/audit) 컬럼의 건수 테이블
+    """
+    try:
+        df = get_client("sqlite").execute(f"SELECT * FROM {HISTORY_TABLE}")
+    except Exception as e:
+        print(f"미결 이력 테이블 조회 실패: {str(e)}")
+        return pd.DataFrame(columns=list(SNAPSHOT_TABLES))
+
+    if plants:
+        df = df[df["PLANT"].isin(plants)]
+
+    df["SNAPSHOT_DATE"] = pd.to_datetime(df["SNAPSHOT_DATE"])
+    return df.pivot_table(
+        index="SNAPSHOT_DATE",
+        columns="SOURCE",
+        values="COUNT",
+        aggfunc="sum",
+        fill_value=0,
+    ).reindex(columns=list(SNAPSHOT_TABLES), fill_value=0)
+
+
+def main():
+    """테스트 실행 함수"""
+    for source in SNAPSHOT_TABLES:
+        helper_pandas.test_dataframe_by_itself(load_ongoing_snapshot, source)
+        helper_pandas.test_dataframe_by_itself(summarize_snapshot_by_plant, source)
+        helper_pandas.test_dataframe_by_itself(summarize_snapshot_by_month, source)
+    helper_pandas.test_dataframe_by_itself(load_backlog_history)
+
+
+if __name__ == "__main__":
+    main()
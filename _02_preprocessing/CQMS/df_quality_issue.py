@@ -3,7 +3,9 @@ df_201_weekly_cqms_monitor.py
 """
 
 import sys
+import threading
 from datetime import datetime, timedelta
+from typing import Optional
 import numpy as np
 import pandas as pd
 import streamlit as st
@@ -15,7 +17,7 @@ sys.path.append(project_root)
 
 from _05_commons import config
 
-from _00_database.db_client import get_client
+from _00_database.db_client import get_client, cache_resource_safe
 from _01_query.CQMS import q_quality_issue
 from _01_query.HOPE import q_sellin, q_hope
 from _02_preprocessing import config_pandas, helper_pandas
@@ -71,30 +73,99 @@ def prepare_qi_base(df: pd.DataFrame, exclude_ot=False) -> pd.DataFrame:
     )
 
 
+# * region 품질이슈 공통 데이터 (1회 조회 / 정규화)
+MTTC_COLUMNS = ["REG_PRD", "RTN_PRD", "CTM_PRD", "COMP_PRD", "MTTC"]
+
+
+class QualityIssueStore:
+    """
+    전체 기간 품질이슈를 한 번 조회하여 prepare_qi_base 로 정규화한 공통 데이터
+
+    - df: DOC_NO 인덱스, 날짜 / 카테고리 변환과 URL 이 적용된 전체 데이터 (직접 수정 금지)
+    - 소비 함수는 view() 얕은 복사본 또는 필터링된 부분만 받으므로 컬럼을 추가해도
+      공통 데이터에는 영향이 없음
+    - MTTC 기간 컬럼(행 단위 근무일 계산)은 처음 필요할 때 한 번만 계산
+    - raw_plant: 카테고리 변환 전 PLANT 값 (df 와 같은 행 순서, config.plant_codes 에 없는
+      공장은 df 에서 NaN 이 되므로 원래 값이 필요한 경우 사용)
+    """
+
+    def __init__(self, raw_df: pd.DataFrame) -> None:
+        raw_df = helper_pandas.standardize_columns_uppercase(raw_df)
+        self.raw_plant = raw_df["PLANT"].to_numpy(dtype=object, copy=True)
+        self.df = prepare_qi_base(raw_df)
+        self._mttc: Optional[pd.DataFrame] = None
+        self._lock = threading.Lock()
+
+    def view(self) -> pd.DataFrame:
+        """전체 데이터의 얕은 복사본"""
+        return self.df.copy(deep=False)
+
+    def by_mcodes(self, mcode_list: list) -> pd.DataFrame:
+        """M-Code 목록에 해당하는 품질이슈"""
+        return self.df[self.df["M_CODE"].isin(mcode_list)]
+
+    def mttc_columns(self) -> pd.DataFrame:
+        """MTTC 기간 컬럼과 등록 연도 / 월 (df 와 같은 행 순서)"""
+        with self._lock:
+            if self._mttc is None:
+                mttc = calculate_mttc_columns(
+                    self.df[
+                        ["OCC_DATE", "REG_DATE", "RTN_DATE", "CTM_DATE", "COMP_DATE"]
+                        + ["RETURN_YN"]
+                    ].copy()
+                )[MTTC_COLUMNS]
+                mttc["YYYY"] = self.df["REG_DATE"].dt.year
+                mttc["MM"] = self.df["REG_DATE"].dt.month
+                self._mttc = mttc
+        return self._mttc
+
+    def with_mttc(self, mask: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        MTTC 기간 컬럼과 YYYY / MM 이 추가된 품질이슈
+
+        Args:
+            mask: 행 선택 불리언 배열 (None 이면 전체)
+
+        Returns:
+            pd.DataFrame: MTTC 컬럼이 추가된 새 데이터프레임
+        """
+        mttc = self.mttc_columns()
+        df = self.df if mask is None else self.df[mask]
+        mttc = mttc if mask is None else mttc[mask]
+        # DOC_NO 인덱스는 중복될 수 있으므로 위치 기준으로 결합
+        return df.assign(**{col: mttc[col].array for col in mttc.columns})
+
+
+@cache_resource_safe(ttl=600)
+def load_qi_store() -> QualityIssueStore:
+    """
+    전체 기간 품질이슈 공통 데이터를 조회합니다. (캐시 갱신 주기마다 쿼리 / 정규화 1회)
+
+    Returns:
+        QualityIssueStore: 정규화된 품질이슈 공통 데이터
+    """
+    df = get_client("snowflake").execute(q_quality_issue.query_quality_issue())
+    return QualityIssueStore(df)
+
+
 # #############################################
 @helper_pandas.cache_data_safe(ttl=600)
 def get_quality_issue_df_detail(mcode_list=None) -> pd.DataFrame:
-    df = get_client("snowflake").execute(q_quality_issue.query_quality_issue())
-    df = prepare_qi_base(df)
+    store = load_qi_store()
     if mcode_list:
-        df = df[df["M_CODE"].isin(mcode_list)]
-
-    return df
+        return store.by_mcodes(mcode_list)
+    return store.view()
 
 
-@helper_pandas.cache_data_safe(ttl=600)
+@helper_pandas.cache_data_safe(ttl=600, stale_while_revalidate=True, shared=True)
 def load_quality_issues_for_3_years(year) -> pd.DataFrame:
-    df = get_client("snowflake").execute(q_quality_issue.query_quality_issue(year))
-    df = prepare_qi_base(df)
-    df = calculate_mttc_columns(df)
-
-    df = df[~df["LOCATION"].isin(["Internal", "Non-official(In-line)"])]
-    df = df.drop(columns=["TYPE_CD", "CAT_CD", "SUB_CAT_CD"], errors="ignore")
-
-    df["YYYY"] = df["REG_DATE"].dt.year
-    df["MM"] = df["REG_DATE"].dt.month
-
-    return df
+    store = load_qi_store()
+    reg_year = store.df["REG_DATE"].dt.year
+    mask = reg_year.between(year - 2, year) & ~store.df["LOCATION"].isin(
+        ["Internal", "Non-official(In-line)"]
+    )
+    df = store.with_mttc(mask.to_numpy())
+    return df.drop(columns=["TYPE_CD", "CAT_CD", "SUB_CAT_CD"], errors="ignore")
 
 
 @helper_pandas.cache_data_safe(ttl=600)
@@ -111,9 +182,7 @@ def load_sellin_data_for_3_years(year) -> pd.DataFrame:
     ]
     df_sellin[["YYYY", "MM"]] = df_sellin[["YYYY", "MM"]].astype("int")
 
-    df_app = df_oeapp.load_oeapp_df()
-    df_app = helper_pandas.standardize_columns_uppercase(df_app)
-    df_app = df_app[["PLANT", "M_CODE"]].drop_duplicates()
+    df_app = df_oeapp.load_plant_mcode_pairs()
 
     merge_df = pd.merge(df_sellin, df_app[["PLANT", "M_CODE"]], how="left", on="M_CODE")
     merge_df = (
@@ -137,16 +206,17 @@ def load_sellin_by_ev(year) -> pd.DataFrame:
     return df
 
 
-@helper_pandas.cache_data_safe(ttl=600)
-def load_quality_issues_by_week(start_date, end_date) -> pd.DataFrame:
-    df = get_client("snowflake").execute(q_quality_issue.query_quality_issue())
-    df = prepare_qi_base(df, exclude_ot=True)
-    df = calculate_mttc_columns(df)
+@helper_pandas.cache_data_safe(ttl=600, shared=True)
+def load_quality_issues_weekly_base() -> pd.DataFrame:
+    """주간 모니터링용 품질이슈 기본 데이터 (주차와 무관한 전처리까지 1회 수행)"""
+    df = load_qi_store().with_mttc()
+    df = helper_pandas.convert_plant_category(df, config.plant_codes, exclude_ot=True)
+    return df.drop(columns=["TYPE_CD", "CAT_CD", "SUB_CAT_CD"], errors="ignore")
 
-    df["YYYY"] = df["REG_DATE"].dt.year
-    df["MM"] = df["REG_DATE"].dt.month
 
-    df = df.drop(columns=["TYPE_CD", "CAT_CD", "SUB_CAT_CD"], errors="ignore")
+@helper_pandas.cache_data_safe(ttl=600)
+def load_quality_issues_by_week(start_date, end_date) -> pd.DataFrame:
+    df = load_quality_issues_weekly_base().copy()
 
     bool_open, bool_close, bool_ongoing1, bool_ongoing2 = get_weekly_conditions(
         df, start_date, end_date
@@ -165,21 +235,34 @@ def load_quality_issues_by_week(start_date, end_date) -> pd.DataFrame:
 
 
 @helper_pandas.cache_data_safe(ttl=600)
-def load_ongoing_quality_issues(plants=None) -> pd.DataFrame:
-    df = get_client("snowflake").execute(q_quality_issue.query_quality_issue())
+def weekly_status_counts_qi(year: int) -> pd.DataFrame:
+    """
+    해당 연도 모든 주의 공장별 품질이슈 상태 건수를 한 번에 집계합니다.
 
-    df = (
-        helper_pandas.standardize_columns_uppercase(df)
-        .pipe(helper_pandas.convert_date_columns, ["REG_DATE"])
-        .pipe(helper_pandas.add_url_column, "SEQ", config_pandas.URL_QUALITY_ISSUE)
+    Returns:
+        pd.DataFrame: WEEK_START, PLANT, STATUS, COUNT 컬럼의 long 포맷 집계
+    """
+    df = load_quality_issues_weekly_base()
+    return helper_pandas.count_weekly_status(
+        df, helper_pandas.get_year_week_starts(year)
     )
 
-    df = df[df["STATUS"] == "On-going"].sort_values(by="REG_DATE")
 
+@helper_pandas.cache_data_safe(ttl=600)
+def load_ongoing_quality_issues(plants=None) -> pd.DataFrame:
+    store = load_qi_store()
+    raw_plant = pd.Series(store.raw_plant)
+    mask = (store.df["STATUS"] == "On-going").to_numpy()
     if plants:
-        df = df[df["PLANT"].isin(plants)]
+        mask &= raw_plant.isin(plants).to_numpy()
 
-    return df
+    # DOC_NO 컬럼 / 카테고리가 아닌 원래 값으로 반환 (공장별 건수 집계 / 스냅샷 저장용)
+    # PLANT 는 config.plant_codes 에 없는 공장도 집계되도록 카테고리 변환 전 값 사용
+    df = store.df[mask].reset_index()
+    category_cols = df.select_dtypes("category").columns
+    df[category_cols] = df[category_cols].astype(object)
+    df["PLANT"] = raw_plant[mask].to_numpy()
+    return df.sort_values(by="REG_DATE")
 
 
 @helper_pandas.cache_data_safe(ttl=600)
@@ -439,6 +522,11 @@ def pivot_quality_by_week_and_status(
 ) -> pd.DataFrame:
     """주간 품질이슈를 PLANT별 상태별로 피벗하여 집계합니다."""
 
+    # 월~일 단위 조회는 연간 일괄 집계 결과에서 해당 주만 꺼내 사용
+    if helper_pandas.is_calendar_week(start_date, end_date):
+        df_counts = weekly_status_counts_qi(pd.Timestamp(start_date).year)
+        return helper_pandas.pivot_weekly_status_counts(df_counts, start_date)
+
     # 주간 데이터 로드 및 초기 정리
     df = load_quality_issues_by_week(start_date, end_date).reset_index()
 
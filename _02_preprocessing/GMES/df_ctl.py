@@ -1,6 +1,18 @@
+"""
+df_ctl.py
+
+CTL(CTMS) 측정 데이터 전처리 모듈
+- TOL/SPEC 문자열에서 LL/UL 숫자 한계값 파싱
+- 로컬 CTL 저장소(Parquet, MRM_DATE 월 파티션) 조회
+- 문서/제품 단위 판정 결과 집계
+"""
+
+import numpy as np
 import pandas as pd
 import sys
 import os
+from pathlib import Path
+from typing import List, Optional
 
 from _00_database.db_client import get_client
 from _01_query.GMES.q_ctl import get_ctl_raw_query
@@ -9,12 +21,184 @@ from _01_query.GMES.q_ctl import get_ctl_raw_query
 project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
+from _05_commons import config
+from _05_commons.helper import lazy_import
+from _02_preprocessing import helper_pandas
+
+# pyarrow 는 로컬 CTL 저장소를 읽고 쓸 때만 로딩
+pa = lazy_import("pyarrow")
+pa_dataset = lazy_import("pyarrow.dataset")
+
+# CTMS 판정 결과 (합격 / 불합격 / 판정 제외)
+CTL_JDG_OUTCOMES = ["OK", "NO", "NI"]
+
+# get_ctl_raw_query 결과와 같은 컬럼 순서
+CTL_COLUMNS = [
+    "DOC_NO",
+    "PLANT",
+    "MRM_DATE",
+    "MRM_PURPOSE",
+    "MRM_ITEM",
+    "STXC",
+    "M_CODE",
+    "SPEC_SIZE",
+    "SPEC_PTRN",
+    "SIDE",
+    "SPEC",
+    "TOL",
+    "LL",
+    "UL",
+    "ACTUAL",
+    "JDG",
+    "PRDT_DATE",
+]
+CTL_PARTITION_COL = "MRM_MONTH"  # MRM_DATE 월 파티션 (YYYY-MM)
+LOWER_SIDE_STXC = ["S", "M"]  # 하한(LOWER) 측정이 있는 시방 구분
+
+
+# * region 스펙 한계값 파싱 (적재 단계에서 1회 수행)
+def parse_spec_number(values: pd.Series) -> pd.Series:
+    """
+    문자열에서 첫 번째 숫자([0-9.]+)를 float으로 추출합니다.
+    (REGEXP_SUBSTR + TRY_CAST 와 동일, 변환 불가 시 NaN)
+    고유값 단위로 파싱하여 같은 문자열을 반복 처리하지 않습니다.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_numeric(
+        pd.Series(uniques, dtype="object")
+        .astype(str)
+        .str.extract(r"([0-9.]+)", expand=False),
+        errors="coerce",
+    ).to_numpy(dtype="float64")
+    return pd.Series(
+        np.where(codes >= 0, parsed[codes], np.nan), index=values.index, dtype="float64"
+    )
+
+
+def calculate_spec_limits(
+    spec: pd.Series, tol: pd.Series
+) -> tuple[pd.Series, pd.Series]:
+    """
+    스펙/허용치 문자열로 하한(LL), 상한(UL)을 계산합니다.
+    - 허용치에 'min' 포함: LL = 허용치 값, UL = 없음
+    - 그 외: LL = 스펙 - 허용치, UL = 스펙 + 허용치
+
+    Returns:
+        tuple[pd.Series, pd.Series]: (LL, UL)
+    """
+    tol_num = parse_spec_number(tol)
+    spec_num = parse_spec_number(spec)
+    is_min = tol.str.lower().str.contains("min", regex=False, na=False).astype(bool)
+
+    ll = tol_num.where(is_min, spec_num - tol_num)
+    ul = (spec_num + tol_num).mask(is_min)
+    return ll, ul
+
+
+def expand_ctl_sides(df_extract: pd.DataFrame) -> pd.DataFrame:
+    """
+    get_ctl_extract_query 결과(행당 상한/하한 원본 컬럼)를 get_ctl_raw_query 와 같은
+    SIDE(UPPER/LOWER)별 long 포맷으로 변환하고 LL/UL 을 숫자 컬럼으로 계산합니다.
+
+    Args:
+        df_extract: 컬럼명이 대문자인 CTMS 추출 데이터
+
+    Returns:
+        pd.DataFrame: CTL_COLUMNS 컬럼의 측정 데이터
+    """
+    common_cols = [
+        "DOC_NO",
+        "PLANT",
+        "MRM_DATE",
+        "MRM_PURPOSE",
+        "MRM_ITEM",
+        "STXC",
+        "M_CODE",
+        "SPEC_SIZE",
+        "SPEC_PTRN",
+        "TOL",
+        "PRDT_DATE",
+    ]
+    sides = []
+    for side, prefix, mask in [
+        ("UPPER", "U", np.ones(len(df_extract), dtype=bool)),
+        ("LOWER", "L", df_extract["STXC"].isin(LOWER_SIDE_STXC).to_numpy()),
+    ]:
+        df_side = df_extract.loc[mask, common_cols].assign(
+            SIDE=side,
+            SPEC=df_extract.loc[mask, f"{prefix}_SPEC_VAL"],
+            ACTUAL=df_extract.loc[mask, f"{prefix}_MRM_AVG"],
+            JDG=df_extract.loc[mask, f"{prefix}_MRM_RST"],
+        )
+        df_side["LL"], df_side["UL"] = calculate_spec_limits(
+            df_side["SPEC"], df_side["TOL"]
+        )
+        sides.append(df_side)
+
+    return pd.concat(sides, ignore_index=True)[CTL_COLUMNS]
+
+
+# * region 로컬 CTL 저장소 (Parquet, MRM_DATE 월 파티션)
+def _ctl_partitioning():
+    return pa_dataset.partitioning(
+        pa.schema([(CTL_PARTITION_COL, pa.string())]), flavor="hive"
+    )
+
+
+def get_store_months(store_path: str = config.CTL_STORE_PATH) -> List[str]:
+    """로컬 CTL 저장소에 적재된 월(YYYY-MM) 파티션 목록을 반환합니다."""
+    prefix = f"{CTL_PARTITION_COL}="
+    path = Path(store_path)
+    if not path.exists():
+        return []
+    return sorted(
+        child.name[len(prefix) :]
+        for child in path.iterdir()
+        if child.is_dir() and child.name.startswith(prefix)
+    )
+
+
+def read_ctl_store(
+    mcode: str,
+    start_date: str,
+    end_date: str,
+    store_path: str = config.CTL_STORE_PATH,
+) -> Optional[pd.DataFrame]:
+    """
+    로컬 CTL 저장소에서 M-Code / 기간의 측정 데이터를 조회합니다.
+    월 파티션과 M_CODE 통계로 필요한 파일/행 그룹만 읽습니다.
+
+    Returns:
+        Optional[pd.DataFrame]: 측정 데이터 (요청 기간의 파티션이 모두 적재되지 않았으면 None)
+    """
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    months = pd.period_range(start, end, freq="M").strftime("%Y-%m").tolist()
+    if not months or not set(months).issubset(get_store_months(store_path)):
+        return None
+
+    dataset = pa_dataset.dataset(
+        store_path, format="parquet", partitioning=_ctl_partitioning()
+    )
+    field = pa_dataset.field
+    table = dataset.to_table(
+        columns=CTL_COLUMNS,
+        filter=(field(CTL_PARTITION_COL) >= months[0])
+        & (field(CTL_PARTITION_COL) <= months[-1])
+        & (field("M_CODE") == mcode)
+        & (field("MRM_DATE") >= start.to_pydatetime())
+        & (field("MRM_DATE") <= end.to_pydatetime()),
+    )
+    return table.to_pandas()
+
 
 def get_ctl_raw_individual_df(
     mcode: str, start_date: str, end_date: str
 ) -> pd.DataFrame:
     """CTMS 측정 데이터를 조회하여 DataFrame으로 반환합니다.
 
+    로컬 CTL 저장소(_08_automation/ctl_measurement_etl.py 적재)에 요청 기간이 모두
+    적재되어 있으면 저장소에서 읽고, 그렇지 않으면 Snowflake에서 조회합니다.
+
     Args:
         mcode (str): 제품코드
         start_date (str): 시작일자
@@ -23,6 +207,14 @@ def get_ctl_raw_individual_df(
     Returns:
         pd.DataFrame: CTMS 측정 데이터
     """
+    if start_date and end_date:
+        try:
+            df = read_ctl_store(mcode, start_date, end_date)
+            if df is not None:
+                return df
+        except Exception as e:
+            print(f"CTL 로컬 저장소 조회 실패, Snowflake에서 조회합니다: {str(e)}")
+
     query = get_ctl_raw_query(mcode=mcode, start_date=start_date, end_date=end_date)
     df = get_client("snowflake").execute(query)
     df.columns = df.columns.str.upper()
@@ -43,15 +235,8 @@ def get_groupby_doc_ctl_df(mcode: str, start_date: str, end_date: str) -> pd.Dat
     raw_df = get_ctl_raw_individual_df(
         mcode=mcode, start_date=start_date, end_date=end_date
     )
-    groupby_df = (
-        raw_df.groupby(["DOC_NO", "MRM_DATE"])
-        .agg(
-            COUNT=("JDG", "count"),
-            OK=("JDG", lambda x: (x == "OK").sum()),
-            NO=("JDG", lambda x: (x == "NO").sum()),
-            NI=("JDG", lambda x: (x == "NI").sum()),
-        )
-        .reset_index()
+    groupby_df = helper_pandas.tally_outcomes(
+        raw_df, ["DOC_NO", "MRM_DATE"], "JDG", CTL_JDG_OUTCOMES
     )
 
     groupby_df["ctl_pass_rate"] = groupby_df["OK"] / (
@@ -66,15 +251,9 @@ def get_groupby_mcode_ctl_df(
     raw_df = get_ctl_raw_individual_df(
         mcode=mcode, start_date=start_date, end_date=end_date
     )
-    groupby_df = raw_df.groupby(["M_CODE"]).agg(
-        COUNT=("JDG", "count"),
-        OK=("JDG", lambda x: (x == "OK").sum()),
-        NO=("JDG", lambda x: (x == "NO").sum()),
-        NI=("JDG", lambda x: (x == "NI").sum()),
-    )
+    groupby_df = helper_pandas.tally_outcomes(raw_df, "M_CODE", "JDG", CTL_JDG_OUTCOMES)
     groupby_df["CTL_PASS_RATE"] = groupby_df["OK"] / (
         groupby_df["OK"] + groupby_df["NI"]
     )
-    groupby_df = groupby_df.reset_index()
     groupby_df.columns = groupby_df.columns.str.lower()
     return groupby_df
@@ -12,6 +12,7 @@ FM(Final Manufacturing) 부적합 데이터 전처리 모듈
 """
 
 import sys
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
@@ -25,9 +26,8 @@ from _05_commons import config
 project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
-from _00_database.db_client import get_client
+from _00_database.db_client import get_client, cache_resource_safe
 from _01_query.GMES import q_production, q_ncf
-from _02_preprocessing.GMES import df_production
 from _02_preprocessing import config_pandas
 from _05_commons import config
 from _02_preprocessing.helper_pandas import CountWorkingDays, test_dataframe_by_itself
@@ -72,36 +72,135 @@ fm_ncf_list = [
 ]
 
 
-@st.cache_data(ttl=600)
-def get_global_ncf_monthly_df(yyyy: int) -> pd.DataFrame:
-    """전체 공장의 연간 FM 부적합 수량을 집계합니다.
+# * region 연도 범위 FM 데이터셋
+class FMDataset:
+    """
+    선택 연도와 전년도의 FM 부적합 / 생산 수량 데이터셋
+
+    부적합 쿼리 1회 + 생산 쿼리 1회로 두 연도를 함께 조회한 뒤
+    연도 / 월 / 공장 단위로 미리 합계를 내어 두고, 화면에 필요한
+    모든 집계(전체 월별 / 공장별 연간 / 공장별 월별 / 불량 유형별)를 메모리에서 계산합니다.
+
+    - ncf: YYYY(int), MM, PLANT, DFT_CD, NCF_QTY
+    - prdt: YYYY(int), MM, PLANT, PRDT_QTY
+    """
+
+    def __init__(self, yyyy: int, df_ncf: pd.DataFrame, df_prdt: pd.DataFrame) -> None:
+        self.yyyy = yyyy
+        self.ncf = self._sum_by(df_ncf, ["YYYY", "MM", "PLANT", "DFT_CD"], "NCF_QTY")
+        self.prdt = self._sum_by(df_prdt, ["YYYY", "MM", "PLANT"], "PRDT_QTY")
+
+    @staticmethod
+    def _sum_by(df: pd.DataFrame, keys: list, value: str) -> pd.DataFrame:
+        df = df.assign(YYYY=pd.to_numeric(df["YYYY"]).astype("Int64"))
+        return df.groupby(keys, as_index=False)[value].sum()
+
+    def _filter(
+        self, df: pd.DataFrame, yyyy: int, plant: Optional[str] = None
+    ) -> pd.DataFrame:
+        mask = df["YYYY"] == yyyy
+        if plant is not None:
+            mask &= df["PLANT"] == plant
+        return df[mask]
+
+    @staticmethod
+    def _monthly_ppm(df_ncf: pd.DataFrame, df_prdt: pd.DataFrame) -> pd.DataFrame:
+        df_ncf = df_ncf.groupby("MM", as_index=False)["NCF_QTY"].sum()
+        df_ncf = df_ncf.sort_values(by="MM")
+        df_prdt = df_prdt.groupby("MM", as_index=False)["PRDT_QTY"].sum()
+        df_prdt = df_prdt.sort_values(by="MM")
+        df = pd.merge(df_ncf, df_prdt, on="MM", how="left")
+        df["PPM"] = df["NCF_QTY"] / df["PRDT_QTY"] * 1_000_000
+        return df
+
+    @staticmethod
+    def _by_plant(df: pd.DataFrame, value: str) -> pd.DataFrame:
+        df = df.groupby("PLANT", as_index=False)[value].sum()
+        df = df.sort_values(by=value, ascending=False)
+        return df.assign(
+            PLANT=pd.Categorical(
+                df["PLANT"], categories=config.plant_codes, ordered=True
+            )
+        ).sort_values(by="PLANT")
+
+    def global_monthly(self, yyyy: int) -> pd.DataFrame:
+        """전체 공장의 월별 부적합 수량 / 생산 수량 / PPM (MM, NCF_QTY, PRDT_QTY, PPM)"""
+        return self._monthly_ppm(
+            self._filter(self.ncf, yyyy), self._filter(self.prdt, yyyy)
+        )
+
+    def yearly_ncf_by_plant(self, yyyy: int) -> pd.DataFrame:
+        """공장별 연간 부적합 수량 (PLANT, NCF_QTY)"""
+        return self._by_plant(self._filter(self.ncf, yyyy), "NCF_QTY")
+
+    def yearly_ppm_by_plant(self, yyyy: int) -> pd.DataFrame:
+        """공장별 연간 부적합 PPM (PLANT, NCF_QTY, PRDT_QTY, PPM)"""
+        df_prdt = self._by_plant(self._filter(self.prdt, yyyy), "PRDT_QTY")
+        df = pd.merge(self.yearly_ncf_by_plant(yyyy), df_prdt, on="PLANT", how="left")
+        df["PPM"] = df["NCF_QTY"] / df["PRDT_QTY"] * 1_000_000
+        return df
+
+    def monthly_ppm_by_plant(self, yyyy: int, plant: str) -> pd.DataFrame:
+        """특정 공장의 월별 부적합 PPM (MM, NCF_QTY, PRDT_QTY, PPM)"""
+        return self._monthly_ppm(
+            self._filter(self.ncf, yyyy, plant), self._filter(self.prdt, yyyy, plant)
+        )
+
+    def ncf_detail_by_plant(self, yyyy: int, plant: str) -> pd.DataFrame:
+        """특정 공장의 불량 유형별 부적합 수량 (DFT_CD, NCF_QTY)"""
+        df = self._filter(self.ncf, yyyy, plant)
+        df = df.groupby("DFT_CD", as_index=False)["NCF_QTY"].sum()
+        return df.sort_values(by="NCF_QTY", ascending=False)
+
+
+@cache_resource_safe(ttl=600)
+def load_fm_dataset(
+    yyyy: int, ncf_list: Tuple[str, ...] = tuple(fm_ncf_list)
+) -> FMDataset:
+    """
+    선택 연도와 전년도의 FM 데이터셋을 부적합 / 생산 쿼리 각 1회로 조회합니다.
+
+    공장 선택이 바뀌어도 같은 연도의 데이터셋을 그대로 사용하므로 추가 쿼리가 없습니다.
 
     Args:
-        yyyy (int): 분석 대상 연도
+        yyyy (int): 분석 대상 연도 (전년도 데이터를 함께 조회)
+        ncf_list (Tuple[str, ...]): 부적합 코드 목록 (기본값: fm_ncf_list)
 
     Returns:
-        pd.DataFrame: 전체 공장의 부적합 수량 데이터
-            - NCF_QTY: 부적합 수량
+        FMDataset: 두 연도의 FM 부적합 / 생산 데이터셋
     """
     df_ncf = get_client("snowflake").execute(
-        q_ncf.ncf_monthly(yyyy=yyyy, ncf_list=fm_ncf_list)
+        q_ncf.ncf_monthly(
+            ncf_list=list(ncf_list),
+            start_date=f"{yyyy - 1}0101",
+            end_date=f"{yyyy}1231",
+        )
     )
     df_ncf.columns = df_ncf.columns.str.upper()
     df_prdt = get_client("snowflake").execute(
-        q_production.curing_prdt_monthly_by_ym(yyyy=yyyy)
+        q_production.curing_prdt_monthly_by_ym(start_yyyy=yyyy - 1, end_yyyy=yyyy)
     )
     df_prdt.columns = df_prdt.columns.str.upper()
+    return FMDataset(yyyy, df_ncf, df_prdt)
+
 
-    df_ncf = df_ncf.groupby("MM", as_index=False)["NCF_QTY"].sum()
-    df_ncf = df_ncf.sort_values(by="MM")
-    df_prdt = df_prdt.groupby("MM", as_index=False)["PRDT_QTY"].sum()
-    df_prdt = df_prdt.sort_values(by="MM")
-    df_ncf = pd.merge(df_ncf, df_prdt, on="MM", how="left")
-    df_ncf["PPM"] = df_ncf["NCF_QTY"] / df_ncf["PRDT_QTY"] * 1_000_000
-    return df_ncf
+# * region 조회 함수
+def get_global_ncf_monthly_df(yyyy: int) -> pd.DataFrame:
+    """전체 공장의 월별 FM 부적합 수량과 PPM을 집계합니다.
+
+    Args:
+        yyyy (int): 분석 대상 연도
+
+    Returns:
+        pd.DataFrame: 전체 공장의 월별 부적합 데이터
+            - MM: 월
+            - NCF_QTY: 부적합 수량
+            - PRDT_QTY: 생산 수량
+            - PPM: 부적합 PPM
+    """
+    return load_fm_dataset(yyyy).global_monthly(yyyy)
 
 
-@st.cache_data(ttl=600)
 def get_yearly_ncf_by_plant_df(yyyy: int, ncf_list: list = fm_ncf_list) -> pd.DataFrame:
     """공장별 연간 FM 부적합 수량을 집계합니다.
 
@@ -114,19 +213,9 @@ def get_yearly_ncf_by_plant_df(yyyy: int, ncf_list: list = fm_ncf_list) -> pd.Da
             - PLANT: 공장 코드
             - NCF_QTY: 부적합 수량
     """
-    df = get_client("snowflake").execute(
-        q_ncf.ncf_monthly(yyyy=yyyy, ncf_list=ncf_list)
-    )
-    df.columns = df.columns.str.upper()
-    df = df.groupby("PLANT", as_index=False)["NCF_QTY"].sum()
-    df = df.sort_values(by="NCF_QTY", ascending=False)
-    df = df.assign(
-        PLANT=pd.Categorical(df["PLANT"], categories=config.plant_codes, ordered=True)
-    ).sort_values(by="PLANT")
-    return df
+    return load_fm_dataset(yyyy, tuple(ncf_list)).yearly_ncf_by_plant(yyyy)
 
 
-@st.cache_data(ttl=600)
 def get_yearly_ncf_ppm_by_plant_df(yyyy: int) -> pd.DataFrame:
     """공장별 연간 FM 부적합 PPM을 계산합니다.
 
@@ -140,14 +229,9 @@ def get_yearly_ncf_ppm_by_plant_df(yyyy: int) -> pd.DataFrame:
             - PRDT_QTY: 생산 수량
             - PPM: 부적합 PPM
     """
-    df_ncf = get_yearly_ncf_by_plant_df(yyyy)
-    df_prdt = df_production.get_yearly_production_df(yyyy)
-    df_ncf_ppm = pd.merge(df_ncf, df_prdt, on="PLANT", how="left")
-    df_ncf_ppm["PPM"] = df_ncf_ppm["NCF_QTY"] / df_ncf_ppm["PRDT_QTY"] * 1_000_000
-    return df_ncf_ppm
+    return load_fm_dataset(yyyy).yearly_ppm_by_plant(yyyy)
 
 
-@st.cache_data(ttl=600)
 def get_monthly_ncf_ppm_by_plant_df(yyyy: int, plant: str) -> pd.DataFrame:
     """특정 공장의 월별 FM 부적합 PPM 추이를 분석합니다.
 
@@ -162,34 +246,9 @@ def get_monthly_ncf_ppm_by_plant_df(yyyy: int, plant: str) -> pd.DataFrame:
             - PRDT_QTY: 생산 수량
             - PPM: 부적합 PPM
     """
-    # 부적합 데이터 조회 및 전처리
-    df_ncf = get_client("snowflake").execute(
-        q_ncf.ncf_monthly(yyyy=yyyy, ncf_list=fm_ncf_list)
-    )
-    df_ncf.columns = df_ncf.columns.str.upper()
-
-    # 생산 데이터 조회 및 전처리
-    df_prdt = get_client("snowflake").execute(
-        q_production.curing_prdt_monthly_by_ym(yyyy=yyyy)
-    )
-    df_prdt.columns = df_prdt.columns.str.upper()
-
-    # 특정 공장 데이터 필터링 및 집계
-    df_ncf = df_ncf[df_ncf["PLANT"] == plant]
-    df_ncf = df_ncf.groupby("MM", as_index=False)["NCF_QTY"].sum()
-    df_ncf = df_ncf.sort_values(by="MM")
-
-    df_prdt = df_prdt[df_prdt["PLANT"] == plant]
-    df_prdt = df_prdt.groupby("MM", as_index=False)["PRDT_QTY"].sum()
-    df_prdt = df_prdt.sort_values(by="MM")
-
-    # PPM 계산
-    groupby_df = pd.merge(df_ncf, df_prdt, on="MM", how="left")
-    groupby_df["PPM"] = groupby_df["NCF_QTY"] / groupby_df["PRDT_QTY"] * 1_000_000
-    return groupby_df
+    return load_fm_dataset(yyyy).monthly_ppm_by_plant(yyyy, plant)
 
 
-@st.cache_data(ttl=600)
 def get_ncf_detail_by_plant(yyyy: int, plant: str) -> pd.DataFrame:
     """특정 공장의 불량 유형별 FM 부적합 현황을 분석합니다.
 
@@ -202,14 +261,7 @@ def get_ncf_detail_by_plant(yyyy: int, plant: str) -> pd.DataFrame:
             - DFT_CD: 불량 코드
             - NCF_QTY: 부적합 수량
     """
-    df = get_client("snowflake").execute(
-        q_ncf.ncf_monthly(yyyy=yyyy, ncf_list=fm_ncf_list)
-    )
-    df.columns = df.columns.str.upper()
-    df = df[df["PLANT"] == plant]
-    df = df.groupby("DFT_CD", as_index=False)["NCF_QTY"].sum()
-    df = df.sort_values(by="NCF_QTY", ascending=False)
-    return df
+    return load_fm_dataset(yyyy).ncf_detail_by_plant(yyyy, plant)
 
 
 @st.cache_data(ttl=600)
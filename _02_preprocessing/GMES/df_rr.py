@@ -2,14 +2,18 @@
 df_402_fm_monitoring.py
 """
 
+import json
 import sys
+import threading
+import time
 import os
+from pathlib import Path
+from typing import Optional
 
 # from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 import streamlit as st
-from scipy.stats import norm
 
 
 from _05_commons import config
@@ -22,8 +26,15 @@ from _01_query.GMES import q_rr
 from _00_database.db_client import get_client
 
 # from _02_preprocessing import config
-from _02_preprocessing.helper_pandas import test_dataframe_by_itself
+from _02_preprocessing.helper_pandas import cache_data_safe, test_dataframe_by_itself
 from _05_commons import config
+from _05_commons.helper import lazy_import
+
+# scipy는 EPass 계산 시점에만 로딩
+scipy_stats = lazy_import("scipy.stats")
+# pyarrow 는 로컬 RR 샘플 저장소를 읽고 쓸 때만 로딩
+pa = lazy_import("pyarrow")
+pa_dataset = lazy_import("pyarrow.dataset")
 
 ## MES RR
 ISO_LST = [
@@ -57,87 +68,597 @@ cat_color_map = {
 }
 
 # 전처리
+# 제품별 RR 보정 계수 (M-Code 단위, 보정식 적용 후 곱함)
+PRODUCT_FACTORS = {
+    "1020898": 0.9055,
+    "1017808": 0.9400,
+    "1021593": 0.9732,
+    "1018940": 0.9055,
+}
+# SVP (HKMC) 결과 변환식 (RR 계수 → 하중 기준 환산 후 선형 보정)
+HKMC_METHOD = "SVP (HKMC)"
+HKMC_SLOPE = 0.9035
+HKMC_INTERCEPT = -3.4652
+KGF_TO_N = 9.80665
+
+
+class RRCorrection:
+    """
+    RR 보정식 계산기
+
+    보정 계수 CSV 를 (OE_TEST_METHOD, PLANT, POSITION) 키의 계수 테이블로 한 번 변환해 두고,
+    샘플마다 계수를 한 번에 조회하여 Result_new 를 계산합니다.
+
+    - ISO: A, B = 공장/측정 위치별 HK Global 보정, C, D = 시험법별 Ref. Lab 보정
+    - SVP: A, B = 공장/측정 위치(대문자)/시험법별 보정, C, D = 1, 0
+    - SAE: 보정 없음 (TEST_RESULT_OLD 그대로)
+    - Result_new = ((RRC × A + B) × C + D) × 제품별 계수, SVP (HKMC) 는 HKMC 변환식 추가 적용
+    - 계수가 없는 샘플은 NaN, 세 시험법 목록에 없는 샘플은 제외
+    """
+
+    def __init__(
+        self, corr_df: pd.DataFrame, product_factors: dict = PRODUCT_FACTORS
+    ) -> None:
+        self.coef = self.build_coefficients(corr_df)
+        self.product_factors = pd.Series(product_factors, dtype="float64")
+
+    @staticmethod
+    def build_coefficients(corr_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        보정 계수 CSV 를 (OE_TEST_METHOD, PLANT, POSITION) 인덱스의 A, B, C, D 테이블로 변환합니다.
+
+        Args:
+            corr_df: 보정 계수 CSV (q_rr.rr_corr_csv)
+
+        Returns:
+            pd.DataFrame: 시험법 / 공장 / 측정 위치별 보정 계수
+        """
+        iso = corr_df[corr_df["METHOD"] == "ISO"]
+        iso_local = iso[iso["OE_RR_TEST_METHOD"] == "-"][
+            ["PLANT", "POSITION", "Slope", "Intercept"]
+        ].rename(columns={"Slope": "A", "Intercept": "B"})
+        iso_ref = iso[iso["POSITION"] == "-"][
+            ["OE_RR_TEST_METHOD", "Slope", "Intercept"]
+        ].rename(
+            columns={
+                "OE_RR_TEST_METHOD": "OE_TEST_METHOD",
+                "Slope": "C",
+                "Intercept": "D",
+            }
+        )
+        iso_coef = iso_local.merge(
+            pd.DataFrame({"OE_TEST_METHOD": ISO_LST}), how="cross"
+        ).merge(iso_ref, on="OE_TEST_METHOD", how="left")
+
+        svp_coef = (
+            corr_df[corr_df["METHOD"] == "SVP"][
+                ["PLANT", "POSITION", "OE_RR_TEST_METHOD", "Slope", "Intercept"]
+            ]
+            .rename(
+                columns={
+                    "OE_RR_TEST_METHOD": "OE_TEST_METHOD",
+                    "Slope": "A",
+                    "Intercept": "B",
+                }
+            )
+            .assign(POSITION=lambda x: x["POSITION"].str.upper(), C=1.0, D=0.0)
+        )
 
+        coef = pd.concat([iso_coef, svp_coef], ignore_index=True).set_index(
+            ["OE_TEST_METHOD", "PLANT", "POSITION"]
+        )[["A", "B", "C", "D"]]
+        if coef.index.has_duplicates:
+            duplicated = coef.index[coef.index.duplicated()].unique().tolist()
+            raise ValueError(f"RR 보정 계수 키가 중복되었습니다: {duplicated}")
+        return coef.astype("float64")
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        RR 샘플에 보정식을 적용합니다.
+
+        Args:
+            df: 컬럼명이 대문자인 q_rr.rr 조회 결과
+
+        Returns:
+            pd.DataFrame: ISO / SVP / SAE 순으로 정렬되고 Result_new 가 추가된 샘플
+                (SVP 샘플의 POSITION 은 대문자)
+        """
+        method = df["OE_TEST_METHOD"]
+        group = np.select(
+            [method.isin(ISO_LST), method.isin(SVP_LST), method.isin(SAE_LST)],
+            [0, 1, 2],
+            default=-1,
+        )
+        order = np.flatnonzero(group >= 0)
+        order = order[np.argsort(group[order], kind="stable")]
+        df = df.iloc[order].reset_index(drop=True)
+        group = group[order]
+        is_svp, is_sae = group == 1, group == 2
+
+        # SVP 측정 위치는 대문자로 비교 (고유값 단위로 변환, 결측 코드 -1 은 NaN)
+        codes, uniques = pd.factorize(df["POSITION"])
+        upper = pd.Series(uniques, dtype="object").str.upper().to_numpy()
+        position = df["POSITION"].where(~is_svp, np.append(upper, np.nan)[codes])
+        loc = self.coef.index.get_indexer(
+            pd.MultiIndex.from_arrays([df["OE_TEST_METHOD"], df["PLANT"], position])
+        )
+        coef = self.coef.to_numpy()
+        coef = np.vstack([coef, np.full(4, np.nan)])[loc]  # 키가 없으면(-1) NaN 행
+        a, b, c, d = coef.T
+
+        rrc = df["RRC"].to_numpy(dtype="float64")
+        load = df["WARM_LOAD"].to_numpy(dtype="float64")
+        factor = df["M_CODE"].map(self.product_factors).fillna(1.0).to_numpy("float64")
+        is_hkmc = (df["OE_TEST_METHOD"] == HKMC_METHOD).to_numpy()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = (
+                np.where(
+                    is_sae, df["TEST_RESULT_OLD"].to_numpy(), (rrc * a + b) * c + d
+                )
+                * factor
+            )
+            result = np.where(
+                is_hkmc,
+                (
+                    ((result * load * KGF_TO_N / 1000) * HKMC_SLOPE + HKMC_INTERCEPT)
+                    * 1000
+                )
+                / (load * KGF_TO_N),
+                result,
+            )
+        return df.assign(POSITION=position, Result_new=result)
+
+
+_rr_correction: RRCorrection | None = None
+
+
+def get_rr_correction() -> RRCorrection:
+    """q_rr.rr_corr_csv 로 만든 프로세스 공용 RRCorrection"""
+    global _rr_correction
+    if _rr_correction is None:
+        _rr_correction = RRCorrection(q_rr.rr_corr_csv)
+    return _rr_correction
+
+
+# * region 로컬 RR 샘플 저장소 (Parquet, SMPL_DATE 월 파티션, 증분 추가)
+RR_PARTITION_COL = "SMPL_MONTH"
+# 적재 시작일 / 마지막 동기화 시각 ('_' 로 시작하는 파일은 데이터셋 탐색에서 제외됨)
+RR_STORE_META = "_rr_store.json"
+# 마지막 동기화 후 이 시간이 지나면 최근 기간 조회는 웨어하우스에서 직접 조회
+RR_STORE_MAX_AGE_HOURS = 2
+# 저장 형식 버전 (다르면 조회하지 않고 rr_sample_etl 이 전체 재적재)
+RR_STORE_VERSION = 2
+# 저장 컬럼(q_rr.rr(include_smpl_id=True) 결과) 별 타입, 보정 전 원본 값을 저장
+RR_STORE_TYPES = {
+    "PLANT": "string",
+    "SMPL_ID": "string",
+    "TEST_SEQ": "int",
+    "ATCH_SEQ": "int",
+    "SMPL_DATE": "timestamp",
+    "M_CODE": "string",
+    "WARM_LOAD": "float",
+    "RRC": "float",
+    "HK_GLOBAL": "float",
+    "POSITION": "string",
+    "JDG": "string",
+    "TEST_RESULT_OLD": "float",
+    "OE_TEST_METHOD": "string",
+    "MASS_YN": "string",
+    "START_DT": "timestamp",
+    "END_DT": "timestamp",
+}
+# 시험 1건(q_rr.rr 결과 1행)을 구분하는 키
+# (같은 키가 여러 번 적재되면 마지막 첨부(ATCH_SEQ 최대) 행만 사용)
+RR_SAMPLE_KEYS = ["PLANT", "SMPL_ID", "TEST_SEQ"]
+# q_rr.rr() 와 같은 컬럼 (load_rr_raw 입력)
+RR_QUERY_COLUMNS = [
+    col for col in RR_STORE_TYPES if col not in ["SMPL_ID", "TEST_SEQ", "ATCH_SEQ"]
+]
 
-@st.cache_data(ttl=600)
-def preprocess_iso_data(df, corr_df):
-
-    iso_df = df[df["OE_TEST_METHOD"].isin(ISO_LST)]
-    remain_cols = ["PLANT", "POSITION", "Slope", "Intercept"]
-    corr_local = corr_df[
-        (corr_df["OE_RR_TEST_METHOD"] == "-") & (corr_df["METHOD"] == "ISO")
-    ][remain_cols]
-    iso_df = iso_df.merge(
-        corr_local.rename(columns={"Slope": "A", "Intercept": "B"}),
-        on=["PLANT", "POSITION"],
-        how="left",
+
+def rr_store_schema():
+    """로컬 RR 샘플 저장소의 Arrow 스키마 (파티션 컬럼 포함)"""
+    types = {
+        "string": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "timestamp": pa.timestamp("ns"),
+    }
+    return pa.schema(
+        [(col, types[kind]) for col, kind in RR_STORE_TYPES.items()]
+        + [(RR_PARTITION_COL, pa.string())]
     )
 
-    corr_rnd = corr_df[(corr_df["POSITION"] == "-") & (corr_df["METHOD"] == "ISO")][
-        ["OE_RR_TEST_METHOD", "Slope", "Intercept"]
-    ]
-    corr_rnd = corr_rnd.rename(columns={"Slope": "C", "Intercept": "D"})
-    iso_df = iso_df.merge(
-        corr_rnd, how="left", left_on="OE_TEST_METHOD", right_on="OE_RR_TEST_METHOD"
-    ).drop(columns="OE_RR_TEST_METHOD")
-    return iso_df
+
+def open_rr_store(store_path: str = config.RR_STORE_PATH):
+    """로컬 RR 샘플 저장소 데이터셋 (파일이 없어도 스키마가 고정된 빈 데이터셋)"""
+    Path(store_path).mkdir(parents=True, exist_ok=True)
+    return pa_dataset.dataset(
+        store_path,
+        schema=rr_store_schema(),
+        format="parquet",
+        partitioning=pa_dataset.partitioning(
+            pa.schema([(RR_PARTITION_COL, pa.string())]), flavor="hive"
+        ),
+    )
 
 
-@st.cache_data(ttl=600)
-def preprocess_svp_data(df, corr_df):
-    svp_df = df[df["OE_TEST_METHOD"].isin(SVP_LST)].copy()
-    svp_df["POSITION"] = svp_df["POSITION"].str.upper()
+def read_rr_store_meta(store_path: str = config.RR_STORE_PATH) -> Optional[dict]:
+    """
+    로컬 RR 샘플 저장소의 적재 정보를 반환합니다.
 
-    remain_cols = ["PLANT", "POSITION", "OE_RR_TEST_METHOD", "Slope", "Intercept"]
+    Returns:
+        Optional[dict]: {"version": 저장 형식 버전,
+                         "covered_from": 적재 시작일 (None 이면 전체 이력),
+                         "synced_at": 마지막 동기화 시각, "watermark": 최신 SMPL_ID,
+                         "superseded": 나중 첨부로 대체된 행 수}
+                        (한 번도 적재하지 않았으면 None)
+    """
+    path = Path(store_path) / RR_STORE_META
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
 
-    corr_svp = corr_df[corr_df["METHOD"] == "SVP"][remain_cols].copy()
-    corr_svp["POSITION"] = corr_svp["POSITION"].str.upper()
-    corr_svp = corr_svp.rename(
-        columns={"Slope": "A", "Intercept": "B", "OE_RR_TEST_METHOD": "OE_TEST_METHOD"}
-    )
 
-    svp_df = svp_df.merge(
-        corr_svp, on=["PLANT", "POSITION", "OE_TEST_METHOD"], how="left"
+def read_rr_store(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    columns: list[str] | None = None,
+    store_path: str = config.RR_STORE_PATH,
+) -> Optional[pd.DataFrame]:
+    """
+    로컬 RR 샘플 저장소(_08_automation/rr_sample_etl.py 적재)에서 기간 내 OE 샘플을 조회합니다.
+    월 파티션으로 필요한 파일만 읽습니다.
+
+    Args:
+        start_date: 조회 시작일 (start_date / end_date 중 하나라도 없으면 전체 기간)
+        end_date: 조회 종료일
+        columns: 조회할 컬럼 (기본값: 전체 저장 컬럼)
+        store_path: 로컬 RR 샘플 저장소 경로
+
+    Returns:
+        Optional[pd.DataFrame]: 보정 전 RR 샘플 데이터 (시험별 마지막 첨부 행)
+            (요청 기간이 적재 범위 밖이거나, 최근 기간인데 동기화가 오래되었거나,
+             저장 형식 버전이 다르면 None)
+    """
+    meta = read_rr_store_meta(store_path)
+    if meta is None or meta.get("version") != RR_STORE_VERSION:
+        return None
+
+    has_range = bool(start_date and end_date)
+    covered_from = meta.get("covered_from")
+    if covered_from and (
+        not has_range or pd.Timestamp(start_date) < pd.Timestamp(covered_from)
+    ):
+        return None
+
+    synced_at = pd.Timestamp(meta["synced_at"])
+    is_stale = pd.Timestamp.now() - synced_at > pd.Timedelta(
+        hours=RR_STORE_MAX_AGE_HOURS
+    )
+    if is_stale and (not has_range or pd.Timestamp(end_date) >= synced_at.normalize()):
+        return None
+
+    data_filter = None
+    if has_range:
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        field = pa_dataset.field
+        data_filter = (
+            (field(RR_PARTITION_COL) >= start.strftime("%Y-%m"))
+            & (field(RR_PARTITION_COL) <= end.strftime("%Y-%m"))
+            & (field("SMPL_DATE") >= start.to_pydatetime())
+            & (field("SMPL_DATE") <= end.to_pydatetime())
+        )
+    columns = columns or list(RR_STORE_TYPES)
+    if not meta.get("superseded"):
+        table = open_rr_store(store_path).to_table(columns=columns, filter=data_filter)
+        return table.to_pandas()
+
+    # 이미 적재된 시험의 첨부가 나중에 다시 적재된 경우 마지막 첨부 행만 사용
+    key_columns = RR_SAMPLE_KEYS + ["ATCH_SEQ"]
+    table = open_rr_store(store_path).to_table(
+        columns=list(dict.fromkeys(columns + key_columns)), filter=data_filter
+    )
+    df = table.to_pandas()
+    latest = df.groupby(RR_SAMPLE_KEYS, sort=False, dropna=False)["ATCH_SEQ"].transform(
+        "max"
     )
+    return df.loc[df["ATCH_SEQ"] == latest, columns].reset_index(drop=True)
+
+
+# * region 병합 가능한 RR 부분 통계 (PLANT, M_CODE, 일 / 월)
+RR_STATS_KEYS = ["PLANT", "M_CODE"]
+# 부분 통계를 만들 전체 이력 시작일 (q_rr.rr 은 2021년 이후 샘플만 조회)
+RR_HISTORY_START = "2021-01-01"
+# 부분 통계 갱신 주기 / 갱신 시 다시 집계할 최근 일수 (늦게 등록되는 샘플 반영)
+RR_STATS_TTL_SEC = 600
+RR_STATS_REFRESH_DAYS = 31
+# 합계 / 나눗셈 반올림 오차로 생기는 0 근처 표준편차는 0 으로 간주 (std / |avg| 기준)
+RR_STD_REL_TOL = 1e-12
+
+
+class RRStats:
+    """
+    RR 결과(Result_new)의 병합 가능한 부분 통계 (count, mean, M2: 평균 편차 제곱합)
+
+    - keys: 정렬된 (PLANT, M_CODE) 목록 (부분 통계의 KEY 는 이 목록의 위치)
+    - daily: (KEY, SMPL_DATE) 별 부분 통계 (MONTH: 해당 월 1일), SMPL_DATE 순 정렬
+    - monthly: daily 를 (KEY, MONTH) 별로 병합한 부분 통계, MONTH 순 정렬
+    - window(): 기간에 완전히 포함되는 월은 monthly, 양 끝의 일부 월은 daily 를 병합하여
+      원본 샘플 없이 get_rr_df 와 같은 (PLANT, M_CODE) 별 avg / std / count 를 계산
+    """
+
+    def __init__(
+        self,
+        keys: pd.MultiIndex,
+        daily: pd.DataFrame,
+        monthly: Optional[pd.DataFrame] = None,
+    ) -> None:
+        self.keys = keys
+        self.daily = daily.sort_values("SMPL_DATE", kind="stable").reset_index(
+            drop=True
+        )
+        if monthly is None:
+            monthly = self.merge_monthly(self.daily)
+        self.monthly = monthly.sort_values("MONTH", kind="stable").reset_index(
+            drop=True
+        )
+        # window() 에서 사용할 정렬된 날짜 / 부분 통계 배열
+        self._days = self.daily["SMPL_DATE"].to_numpy()
+        self._months = self.monthly["MONTH"].to_numpy()
+        self._arrays = {
+            name: {col: df[col].to_numpy() for col in ["KEY", "count", "mean", "M2"]}
+            for name, df in [("daily", self.daily), ("monthly", self.monthly)]
+        }
+        self.built_at = time.monotonic()
+
+    # * region 부분 통계 병합
+    @staticmethod
+    def combine(
+        codes: np.ndarray,
+        size: int,
+        count: np.ndarray,
+        mean: np.ndarray,
+        m2: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        같은 그룹 번호의 부분 통계를 병합합니다. (Chan 병렬 분산 병합)
+        M2 = Σ M2_i + Σ n_i × (mean_i - mean)²
+
+        Args:
+            codes: 각 부분 통계의 그룹 번호 (0 ~ size-1)
+            size: 그룹 수
+            count / mean / M2: 부분 통계 (count 가 0 인 항목은 mean 이 NaN 이어도 무시)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: 그룹별 (count, mean, M2)
+        """
+        count = count.astype(float)
+        valid = count > 0
+        merged_count = np.bincount(codes, weights=count, minlength=size)
+        weighted = np.where(valid, mean * count, 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            merged_mean = np.bincount(codes, weights=weighted, minlength=size) / (
+                merged_count
+            )
+        shift = np.where(valid, count * (mean - merged_mean[codes]) ** 2, 0)
+        merged_m2 = np.bincount(codes, weights=m2 + shift, minlength=size)
+        return merged_count, merged_mean, merged_m2
+
+    @staticmethod
+    def _group(
+        key: np.ndarray, period: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(KEY, 기간 정수) 쌍의 그룹 번호와 그룹별 KEY / 기간 정수"""
+        if len(period) == 0:
+            return np.zeros(0, dtype="int64"), key[:0], period[:0]
+        low = period.min()
+        span = period.max() - low + 1
+        codes, uniques = pd.factorize(key * span + (period - low))
+        return codes, uniques // span, uniques % span + low
+
+    @classmethod
+    def partials(cls, rr_raw: pd.DataFrame, key: np.ndarray) -> pd.DataFrame:
+        """
+        RR 샘플을 (KEY, SMPL_DATE) 별 부분 통계로 집계합니다.
+
+        Args:
+            rr_raw: load_rr_raw 결과
+            key: 각 샘플의 KEY (keys 에서의 위치)
+
+        Returns:
+            pd.DataFrame: KEY, SMPL_DATE, MONTH, count, mean, M2
+        """
+        day = rr_raw["SMPL_DATE"].to_numpy().astype("datetime64[D]").astype("int64")
+        codes, group_key, group_day = cls._group(key, day)
+        # 샘플 1건 = (count 1, mean 값, M2 0) 인 부분 통계
+        values = rr_raw["Result_new"].to_numpy(dtype=float)
+        count, mean, m2 = cls.combine(
+            codes, len(group_key), (~np.isnan(values)).astype(float), values, 0.0
+        )
+        group_day = group_day.astype("datetime64[D]")
+        return pd.DataFrame(
+            {
+                "KEY": group_key,
+                "SMPL_DATE": group_day.astype("datetime64[ns]"),
+                "MONTH": group_day.astype("datetime64[M]").astype("datetime64[ns]"),
+                "count": count.astype("int64"),
+                "mean": mean,
+                "M2": m2,
+            }
+        )
 
-    svp_df[["C", "D"]] = [1, 0]  # 임의 값
-    return svp_df
+    @classmethod
+    def merge_monthly(cls, daily: pd.DataFrame) -> pd.DataFrame:
+        """일 부분 통계를 (KEY, MONTH) 별로 병합합니다."""
+        month = daily["MONTH"].to_numpy().astype("datetime64[M]").astype("int64")
+        codes, group_key, group_month = cls._group(daily["KEY"].to_numpy(), month)
+        count, mean, m2 = cls.combine(
+            codes,
+            len(group_key),
+            daily["count"].to_numpy(),
+            daily["mean"].to_numpy(),
+            daily["M2"].to_numpy(),
+        )
+        return pd.DataFrame(
+            {
+                "KEY": group_key,
+                "MONTH": group_month.astype("datetime64[M]").astype("datetime64[ns]"),
+                "count": count.astype("int64"),
+                "mean": mean,
+                "M2": m2,
+            }
+        )
 
+    # * region 생성 / 갱신
+    @staticmethod
+    def encode_keys(
+        rr_raw: pd.DataFrame, keys: Optional[pd.MultiIndex] = None
+    ) -> tuple[pd.MultiIndex, np.ndarray]:
+        """
+        샘플의 (PLANT, M_CODE) 를 기존 keys 에 추가한 정렬된 목록과 각 샘플의 KEY 를 반환합니다.
+        """
+        sample_keys = pd.MultiIndex.from_frame(rr_raw[RR_STATS_KEYS])
+        unique_keys = sample_keys.unique()
+        if keys is not None:
+            unique_keys = keys.union(unique_keys)
+        unique_keys = unique_keys.sort_values()
+        return unique_keys, unique_keys.get_indexer(sample_keys)
+
+    @classmethod
+    def from_samples(cls, rr_raw: pd.DataFrame) -> "RRStats":
+        """RR 샘플 전체로 부분 통계를 만듭니다."""
+        rr_raw = rr_raw.dropna(subset=RR_STATS_KEYS + ["SMPL_DATE"])
+        keys, key = cls.encode_keys(rr_raw)
+        return cls(keys, cls.partials(rr_raw, key))
+
+    def update(self, rr_raw: pd.DataFrame, since) -> "RRStats":
+        """
+        since 이후 부분 통계만 새 샘플로 다시 집계한 RRStats 를 반환합니다.
+        (월 통계도 since 가 속한 월부터만 다시 병합)
+
+        Args:
+            rr_raw: since 이후 RR 샘플 (load_rr_raw 결과)
+            since: 다시 집계할 시작일
+
+        Returns:
+            RRStats: 갱신된 부분 통계
+        """
+        since = pd.Timestamp(since).normalize()
+        month = since.to_period("M").start_time
+        rr_raw = rr_raw.dropna(subset=RR_STATS_KEYS + ["SMPL_DATE"])
+        rr_raw = rr_raw[rr_raw["SMPL_DATE"] >= since]
+
+        # 새 (PLANT, M_CODE) 가 추가되면 기존 KEY 를 새 목록의 위치로 변환
+        keys, key = self.encode_keys(rr_raw, self.keys)
+        remap = keys.get_indexer(self.keys)
+        daily = self.daily[self.daily["SMPL_DATE"] < since]
+        daily = pd.concat(
+            [
+                daily.assign(KEY=remap[daily["KEY"].to_numpy()]),
+                self.partials(rr_raw, key),
+            ],
+            ignore_index=True,
+        )
+        monthly = self.monthly[self.monthly["MONTH"] < month]
+        monthly = pd.concat(
+            [
+                monthly.assign(KEY=remap[monthly["KEY"].to_numpy()]),
+                self.merge_monthly(daily[daily["MONTH"] >= month]),
+            ],
+            ignore_index=True,
+        )
+        return RRStats(keys, daily, monthly)
+
+    # * region 기간 집계
+    def window(self, start_date=None, end_date=None) -> pd.DataFrame:
+        """
+        기간 내 (PLANT, M_CODE) 별 RR 통계를 부분 통계 병합으로 계산합니다.
+
+        Args:
+            start_date: 시작일 (start_date / end_date 중 하나라도 없으면 전체 기간)
+            end_date: 종료일
+
+        Returns:
+            pd.DataFrame: PLANT, M_CODE, avg, std, count (get_rr_df 집계 결과와 같은 형태)
+        """
+        if start_date and end_date:
+            start = pd.Timestamp(start_date).normalize()
+            end = pd.Timestamp(end_date).normalize()
+            # 기간에 완전히 포함되는 월 [first_month, end_month)
+            first_month = start.to_period("M").start_time
+            if first_month < start:
+                first_month = (start.to_period("M") + 1).start_time
+            end_month = (end + pd.Timedelta(days=1)).to_period("M").start_time
+            if end_month <= first_month:
+                first_month = end_month = start
+
+            bounds = [start, first_month, end_month]
+            day_lo, day_mid, day_hi = np.searchsorted(
+                self._days, [b.to_datetime64() for b in bounds]
+            )
+            day_end = np.searchsorted(self._days, end.to_datetime64(), side="right")
+            month_lo, month_hi = np.searchsorted(
+                self._months, [first_month.to_datetime64(), end_month.to_datetime64()]
+            )
+            slices = [
+                ("monthly", slice(month_lo, month_hi)),
+                ("daily", slice(day_lo, day_mid)),
+                ("daily", slice(day_hi, day_end)),
+            ]
+        else:
+            slices = [("monthly", slice(None))]
+
+        parts = {
+            col: np.concatenate([self._arrays[name][col][s] for name, s in slices])
+            for col in ["KEY", "count", "mean", "M2"]
+        }
+        size = len(self.keys)
+        count, mean, m2 = self.combine(
+            parts["KEY"], size, parts["count"], parts["mean"], parts["M2"]
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        std = np.where(std <= np.abs(mean) * RR_STD_REL_TOL, 0, std)
+
+        # 기간 내 샘플이 있는 (PLANT, M_CODE) 만 반환 (Result_new 가 모두 결측이면 count 0)
+        present = np.bincount(parts["KEY"], minlength=size) > 0
+        return (
+            self.keys[present]
+            .to_frame(index=False)
+            .assign(
+                avg=mean[present],
+                std=std[present],
+                count=count[present].astype("int64"),
+            )
+        )
 
-@st.cache_data(ttl=600)
-def preprocess_sae_data(df):
-    sae_df = df[df["OE_TEST_METHOD"].isin(SAE_LST)].copy()
-    sae_df["Result_new"] = sae_df["TEST_RESULT_OLD"]
-    return sae_df
 
+_rr_stats: RRStats | None = None
+_rr_stats_lock = threading.Lock()
 
-@st.cache_data(ttl=600)
-def apply_product_specific_factors(df):
-    factors = {
-        "1020898": 0.9055,
-        "1017808": 0.9400,
-        "1021593": 0.9732,
-        "1018940": 0.9055,
-    }
-    for mcode, factor in factors.items():
-        df.loc[df["M_CODE"] == mcode, "Result_new"] *= factor
-    return df
 
+def get_rr_stats() -> RRStats:
+    """
+    OE RR 샘플의 프로세스 공용 부분 통계
+    (최초 1회 전체 이력으로 만들고, 이후 RR_STATS_TTL_SEC 마다 최근 RR_STATS_REFRESH_DAYS 일만 다시 집계)
 
-@st.cache_data(ttl=600)
-def apply_hkmc_formula(df):
-    slope = 0.9035
-    intercept = -3.4652
-    kgf_to_n = 9.80665
-
-    mask = df["OE_TEST_METHOD"] == "SVP (HKMC)"
-    result = df.loc[mask, "Result_new"]
-    load = df.loc[mask, "WARM_LOAD"]
-
-    df.loc[mask, "Result_new"] = (
-        ((result * load * kgf_to_n / 1000) * slope + intercept) * 1000
-    ) / (load * kgf_to_n)
-    return df
+    원본 샘플은 집계 후 버리므로 캐시하지 않는 read_rr_samples 로 조회합니다.
+    """
+    global _rr_stats
+    with _rr_stats_lock:
+        today = pd.Timestamp.now().normalize()
+        if _rr_stats is None:
+            rr_raw = read_rr_samples(RR_HISTORY_START, today.strftime("%Y-%m-%d"))
+            _rr_stats = RRStats.from_samples(rr_raw)
+        elif time.monotonic() - _rr_stats.built_at > RR_STATS_TTL_SEC:
+            since = today - pd.Timedelta(days=RR_STATS_REFRESH_DAYS)
+            rr_raw = read_rr_samples(
+                since.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+            )
+            _rr_stats = _rr_stats.update(rr_raw, since)
+        return _rr_stats
 
 
 # 집계
@@ -154,9 +675,9 @@ def calc_epass(df: pd.DataFrame, merge_source: pd.DataFrame) -> pd.DataFrame:
         EPass=np.nan,  # 초기화
     )
 
-    df.loc[valid, "EPass"] = norm.cdf(
+    df.loc[valid, "EPass"] = scipy_stats.norm.cdf(
         df.loc[valid, "e_max"], loc=df.loc[valid, "avg"], scale=df.loc[valid, "std"]
-    ) - norm.cdf(
+    ) - scipy_stats.norm.cdf(
         df.loc[valid, "e_min"], loc=df.loc[valid, "avg"], scale=df.loc[valid, "std"]
     )
 
@@ -174,38 +695,75 @@ def calc_epass(df: pd.DataFrame, merge_source: pd.DataFrame) -> pd.DataFrame:
 
 
 # main 함수
-@st.cache_data(ttl=600)
-def get_rr_df(
+def read_rr_samples(
     start_date: str | None = None,
     end_date: str | None = None,
     test_fg: str = "OE",
-    break_date: str | None = None,
-    mcode_list: list[str] | str | int | None = None,
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame | None]:
-    df = get_client("snowflake").execute(q_rr.rr(start_date, end_date, test_fg))
-    df.columns = df.columns.str.upper()
+) -> pd.DataFrame:
+    """
+    기간 내 RR 개별 샘플에 보정식 / 제품별 계수 / HKMC 식을 적용한 전체 샘플 데이터 (캐시 없음)
+
+    get_rr_stats 처럼 결과를 집계한 뒤 버리는 경우에 사용합니다.
+    (load_rr_raw 로 조회하면 전체 이력이 공유 저장소에 캐시되어 남음)
+
+    Args:
+        start_date: 조회 시작일
+        end_date: 조회 종료일
+        test_fg: 시험 구분
+
+    Returns:
+        pd.DataFrame: Result_new 가 계산된 RR 샘플 데이터
+    """
+    # OE 샘플은 로컬 RR 샘플 저장소에 적재된 범위면 저장소에서 읽음 (웨어하우스 조회 없음)
+    df = None
+    if test_fg == "OE":
+        try:
+            df = read_rr_store(start_date, end_date, columns=RR_QUERY_COLUMNS)
+        except Exception as e:
+            print(f"RR 로컬 저장소 조회 실패, Snowflake에서 조회합니다: {str(e)}")
+    if df is None:
+        df = get_client("snowflake").execute(q_rr.rr(start_date, end_date, test_fg))
+        df.columns = df.columns.str.upper()
+
+    # 보정식: Result_new = ((RRC × A + B) × C + D) × 제품별 계수 (+ HKMC 변환식)
+    rr_raw = (
+        get_rr_correction().apply(df).drop(columns=["RRC", "HK_GLOBAL", "WARM_LOAD"])
+    )
+    rr_raw[["SMPL_DATE", "START_DT", "END_DT"]] = rr_raw[
+        ["SMPL_DATE", "START_DT", "END_DT"]
+    ].apply(pd.to_datetime)
+    return rr_raw.reset_index(drop=True)
 
-    iso = preprocess_iso_data(df, q_rr.rr_corr_csv)
-    svp = preprocess_svp_data(df, q_rr.rr_corr_csv)
-    sae = preprocess_sae_data(df)
 
-    # 결과 병합 및 계산
-    rr_concat = pd.concat([iso, svp])
-    # 보정식: Result_new = ((RRC × A + B) × C + D)
-    rr_concat["Result_new"] = (
-        rr_concat["RRC"] * rr_concat["A"] + rr_concat["B"]
-    ) * rr_concat["C"] + rr_concat["D"]
-    rr_concat = rr_concat.drop(columns=["A", "B", "C", "D"])
-    rr_concat = pd.concat([rr_concat, sae])
+@cache_data_safe(ttl=600, shared=True)
+def load_rr_raw(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    test_fg: str = "OE",
+) -> pd.DataFrame:
+    """
+    read_rr_samples 결과를 캐시하여 반환합니다.
+    (세션 / 워커 프로세스가 공유 저장소의 사본 하나를 읽기 전용으로 공유)
 
-    rr_concat = apply_product_specific_factors(rr_concat)
-    rr_concat = apply_hkmc_formula(rr_concat)
+    Args:
+        start_date: 조회 시작일
+        end_date: 조회 종료일
+        test_fg: 시험 구분
 
-    rr_raw = rr_concat.drop(columns=["RRC", "HK_GLOBAL", "WARM_LOAD"])
-    rr_raw[["SMPL_DATE", "START_DT", "END_DT"]] = rr_raw[
-        ["SMPL_DATE", "START_DT", "END_DT"]
-    ].apply(pd.to_datetime)
-    rr_raw = rr_raw.reset_index(drop=True)
+    Returns:
+        pd.DataFrame: Result_new 가 계산된 RR 샘플 데이터
+    """
+    return read_rr_samples(start_date, end_date, test_fg)
+
+
+def get_rr_df(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    test_fg: str = "OE",
+    break_date: str | None = None,
+    mcode_list: list[str] | str | int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame | None]:
+    rr_raw = load_rr_raw(start_date, end_date, test_fg)
 
     # 비교 집계
     rr_raw_compare = None
@@ -296,9 +854,10 @@ def get_rr_oe_list_df():
 
 
 # @st.cache_data(show_spinner=True, ttl=600)  # 10분마다 캐시 갱신
-@st.cache_data(ttl=600)
+@cache_data_safe(ttl=600, stale_while_revalidate=True)
 def get_processed_agg_rr_data(start_date=None, end_date=None):
-    _, rr_raw_agg, _ = get_rr_df(start_date, end_date)
+    # 원본 샘플 대신 월 / 일 부분 통계를 병합하여 기간별 avg / std / count 계산
+    rr_raw_agg = get_rr_stats().window(start_date, end_date)
     rr_oe_list = get_rr_oe_list_df()
     df = calc_epass(rr_raw_agg, rr_oe_list).reset_index(drop=True)
     return df
@@ -307,7 +866,7 @@ def get_processed_agg_rr_data(start_date=None, end_date=None):
 # @st.cache_data(show_spinner=True)
 @st.cache_data(ttl=600)
 def get_processed_raw_rr_data(start_date, end_date, mcode):
-    rr_raw, _, _ = get_rr_df(start_date=start_date, end_date=end_date)
+    rr_raw = load_rr_raw(start_date=start_date, end_date=end_date)
     rr_oe_list = get_rr_oe_list_df()
     rr_individual = rr_raw[rr_raw["M_CODE"] == mcode]
     rr_individual = rr_individual.merge(rr_oe_list, how="left", on="M_CODE")
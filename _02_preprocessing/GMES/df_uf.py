@@ -21,6 +21,58 @@ from _01_query.GMES.q_uf import uf_product_assess_monthly
 from _01_query.GMES.q_uf import uf_standard as uf_standard_query
 from _01_query.GMES.q_uf import uf_individual as uf_individual_query
 
+# 공장별 UF 합격 등급 (JDG_1 ~ JDG_8 중 합격으로 인정하는 등급)
+UF_PASS_GRADES = {
+    "KP": (1, 2, 3, 4),
+    "IP": (1, 2, 3, 4),
+    "MP": (1, 2, 3, 4),
+    "TP": (1, 2, 3, 4),
+    "DP": (1, 2, 3, 4),
+    "HP": (1, 2, 3),
+    "JP": (1, 2, 3),
+    "CP": (1, 2, 3),
+}
+
+
+def compute_uf_pass_qty(
+    plants: pd.Series, df_jdg: pd.DataFrame
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    JDG_1 ~ JDG_n 등급별 수량에서 검사수량과 공장별 합격수량을 한 번에 계산합니다.
+
+    UF_PASS_GRADES 로 (공장 x 등급) 합격 마스크 행렬을 만들고, 각 행의 공장에 해당하는
+    마스크를 등급 수량 행렬에 곱해 합산합니다. 기준에 없는 공장의 합격수량은 0입니다.
+
+    Args:
+        plants: 행별 공장 코드
+        df_jdg: JDG_<등급> 컬럼들 (대소문자 무관, 결측값은 0으로 처리)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (검사수량, 합격수량)
+    """
+    grades = np.array([int(col.rsplit("_", 1)[1]) for col in df_jdg.columns])
+    qty = df_jdg.to_numpy(dtype="float64", na_value=0)
+
+    # (공장 x 등급) 합격 마스크, 마지막 행은 기준에 없는 공장용
+    criteria_plants = list(UF_PASS_GRADES)
+    criteria = np.zeros((len(criteria_plants) + 1, len(grades)), dtype=bool)
+    for idx, plant in enumerate(criteria_plants):
+        criteria[idx] = np.isin(grades, UF_PASS_GRADES[plant])
+
+    plant_idx = pd.Categorical(plants, categories=criteria_plants).codes
+    plant_idx = np.where(plant_idx < 0, len(criteria_plants), plant_idx)
+
+    # 등급별 수량은 건수이므로 정수로 반환
+    ins_qty = qty.sum(axis=1).round().astype("int64")
+    pass_qty = (qty * criteria[plant_idx]).sum(axis=1).round().astype("int64")
+    return ins_qty, pass_qty
+
+
+def calculate_pass_rate(pass_qty: np.ndarray, ins_qty: np.ndarray) -> np.ndarray:
+    """합격률 계산 (검사수량 0이면 0)"""
+    rate = np.zeros(len(ins_qty), dtype="float64")
+    return np.divide(pass_qty, ins_qty, out=rate, where=ins_qty > 0)
+
 
 def calculate_uf_pass_rate(mcode: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
@@ -51,26 +103,12 @@ def calculate_uf_pass_rate(mcode: str, start_date: str, end_date: str) -> pd.Dat
 
         # JDG 컬럼 리스트 (소문자)
         jdg_cols = [col for col in df.columns if col.startswith("jdg_")]
-        # 검사수량 계산
-        df["uf_ins_qty"] = df[jdg_cols].sum(axis=1)
-
-        # 공장별 합격 기준 정의 (소문자)
-        pass_criteria = {
-            "KP|IP|MP|TP|DP": ["jdg_1", "jdg_2", "jdg_3", "jdg_4"],
-            "HP|JP|CP": ["jdg_1", "jdg_2", "jdg_3"],
-        }
-
-        # 합격수량 계산
-        df["uf_pass_qty"] = 0
-        for plant_pattern, cols in pass_criteria.items():
-            mask = df["plant"].str.contains(plant_pattern, regex=True)
-            df.loc[mask, "uf_pass_qty"] = df.loc[mask, cols].sum(axis=1)
-
-        # 합격률 계산 (0으로 나누기 방지)
-        df["uf_pass_rate"] = df.apply(
-            lambda x: x["uf_pass_qty"] / x["uf_ins_qty"] if x["uf_ins_qty"] > 0 else 0,
-            axis=1,
-        )
+
+        # 검사수량 / 합격수량 / 합격률 계산
+        ins_qty, pass_qty = compute_uf_pass_qty(df["plant"], df[jdg_cols])
+        df["uf_ins_qty"] = ins_qty
+        df["uf_pass_qty"] = pass_qty
+        df["uf_pass_rate"] = calculate_pass_rate(pass_qty, ins_qty)
 
         # 결과 컬럼만 반환
         return (
@@ -126,30 +164,14 @@ def calculate_uf_pass_rate_monthly(
         df.columns = [col.upper() for col in df.columns]
         df["YYYYMM"] = pd.to_datetime(df["YYYYMM"], format="%Y%m").dt.strftime("%Y-%m")
 
-        # JDG 컬럼 리스트 (소문자)
+        # JDG 컬럼 리스트 (대문자)
         jdg_cols = [col for col in df.columns if col.startswith("JDG_")]
-        # # 검사수량 계산
-        df["UF_INS_QTY"] = df[jdg_cols].sum(axis=1)
-
-        # 공장별 합격 기준 정의 (소문자)
-        pass_criteria = {
-            "KP|IP|MP|TP|DP": ["JDG_1", "JDG_2", "JDG_3", "JDG_4"],
-            "HP|JP|CP": ["JDG_1", "JDG_2", "JDG_3"],
-        }
-
-        # 합격수량 계산
-        df["UF_PASS_QTY"] = 0
-        for plant_pattern, cols in pass_criteria.items():
-            mask = df["PLANT"].str.contains(plant_pattern, regex=True)
-            df.loc[mask, "UF_PASS_QTY"] = df.loc[mask, cols].sum(axis=1)
-
-        # 합격률 계산 (0으로 나누기 방지)
-        df["PASS_RATE"] = df.apply(
-            lambda x: (
-                x["UF_PASS_QTY"] / x["UF_INS_QTY"] if x["UF_INS_QTY"] > 0 else 0
-            ),
-            axis=1,
-        )
+
+        # 검사수량 / 합격수량 / 합격률 계산
+        ins_qty, pass_qty = compute_uf_pass_qty(df["PLANT"], df[jdg_cols])
+        df["UF_INS_QTY"] = ins_qty
+        df["UF_PASS_QTY"] = pass_qty
+        df["PASS_RATE"] = calculate_pass_rate(pass_qty, ins_qty)
         df = df.sort_values(by="YYYYMM", ascending=True)
         # 결과 컬럼만 반환
         return df
@@ -1,6 +1,60 @@
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple
 import pandas as pd
 from _00_database.db_client import get_client
-from _01_query.GMES.q_weight import gt_wt_gruopby_ym, gt_wt_individual
+from _01_query.GMES.q_weight import (
+    WT_HIST_BIN_PCT,
+    gt_wt_gruopby_ym,
+    gt_wt_histogram,
+    gt_wt_individual,
+    gt_wt_summary,
+)
+from _05_commons import config
+
+# 월별 중량 통계 로컬 캐시 (SQLite)
+# 통계 컬럼이 바뀌면 테이블 이름을 바꿔 이전 캐시를 사용하지 않도록 함
+WT_SUMMARY_CACHE_TABLE = "gt_wt_summary_box_cache"
+WT_HISTOGRAM_CACHE_TABLE = "gt_wt_histogram_cache"
+WT_CACHED_MONTHS_TABLE = "gt_wt_cached_months"  # 캐시된 (캐시 테이블, M-Code, 월) 목록
+
+WT_SUMMARY_COLUMNS = [
+    "PLANT",
+    "M_CODE",
+    "INS_DATE_YM",
+    "WT_INS_QTY",
+    "WT_PASS_QTY",
+    "WT_MEAN",
+    "WT_STD",
+    "WT_MIN",
+    "WT_Q1",
+    "WT_MEDIAN",
+    "WT_Q3",
+    "WT_MAX",
+    "BOX_MEAN",
+    "BOX_MIN",
+    "BOX_Q1",
+    "BOX_MEDIAN",
+    "BOX_Q3",
+    "BOX_MAX",
+    "STD_WGT",
+    "UPM_STD_WGT",
+    "LWM_STD_WGT",
+]
+WT_HISTOGRAM_COLUMNS = [
+    "PLANT",
+    "M_CODE",
+    "INS_DATE_YM",
+    "BIN_IDX",
+    "WT_QTY",
+    "WT_PASS_QTY",
+]
+
+# 종류별 (쿼리 빌더, 캐시 테이블, 컬럼)
+_WT_AGGREGATES = {
+    "summary": (gt_wt_summary, WT_SUMMARY_CACHE_TABLE, WT_SUMMARY_COLUMNS),
+    "histogram": (gt_wt_histogram, WT_HISTOGRAM_CACHE_TABLE, WT_HISTOGRAM_COLUMNS),
+}
 
 
 def get_groupby_weight_ym_df(
@@ -23,3 +77,224 @@ def get_weight_individual_df(
     df["INS_DATE"] = pd.to_datetime(df["INS_DATE"])
     df["INS_DATE_YM"] = df["INS_DATE"].dt.strftime("%Y-%m")
     return df
+
+
+# * region 월별 중량 통계 (서버 집계 + 로컬 캐시)
+def split_cacheable_months(
+    start_date: str, end_date: str, today: Optional[pd.Timestamp] = None
+) -> Tuple[List[str], List[Tuple[Optional[str], Optional[str], Optional[str]]]]:
+    """
+    조회 기간을 캐시 가능한 월과 매번 조회할 구간으로 나눕니다.
+
+    조회 조건(INS_DATE >= start_date, INS_DATE <= end_date)이 한 달 전체를 포함하고
+    이미 마감된(이번 달 이전) 월만 캐시합니다. 기간 양 끝의 일부 월과 이번 달은
+    원래 조건 그대로 매번 조회합니다.
+
+    Args:
+        start_date: 조회 시작일자 (YYYYMMDD)
+        end_date: 조회 종료일자 (YYYYMMDD)
+        today: 기준일 (기본값: 현재 시각)
+
+    Returns:
+        Tuple: (캐시 가능 월 목록(YYYYMM), [(start_date, end_date, end_before), ...])
+    """
+    today = pd.Timestamp.now() if today is None else pd.Timestamp(today)
+    start = pd.Timestamp(start_date[:8])
+    first_full = start.to_period("M")
+    if start.day != 1 or len(start_date) > 8:
+        first_full += 1
+    last_full = pd.Timestamp(end_date[:8]).to_period("M") - 1
+    last_cacheable = min(last_full, today.to_period("M") - 1)
+
+    if first_full > last_cacheable:
+        return [], [(start_date, end_date, None)]
+
+    months = [p.strftime("%Y%m") for p in pd.period_range(first_full, last_cacheable)]
+    live_ranges = []
+    if first_full.start_time > start:
+        live_ranges.append((start_date, None, f"{months[0]}01"))
+    live_ranges.append(((last_cacheable + 1).strftime("%Y%m01"), end_date, None))
+    return months, live_ranges
+
+
+def _execute_aggregate(kind: str, mcode: str, **dates) -> pd.DataFrame:
+    builder, _, columns = _WT_AGGREGATES[kind]
+    df = get_client("snowflake").execute(builder(mcode=mcode, **dates))
+    df.columns = df.columns.str.upper()
+    return df[columns]
+
+
+def _read_cached_months(
+    kind: str, mcode: str, months: List[str], db_path: str
+) -> Tuple[pd.DataFrame, List[str]]:
+    """캐시된 월의 통계와 캐시에 없는 월 목록을 반환합니다."""
+    _, table, columns = _WT_AGGREGATES[kind]
+    placeholders = ", ".join("?" * len(months))
+    try:
+        with sqlite3.connect(db_path) as conn:
+            cached_months = pd.read_sql(
+                f"SELECT INS_DATE_YM FROM {WT_CACHED_MONTHS_TABLE} "
+                f"WHERE KIND = ? AND M_CODE = ? AND INS_DATE_YM IN ({placeholders})",
+                conn,
+                params=[table, mcode, *months],
+            )["INS_DATE_YM"].tolist()
+            cached = pd.read_sql(
+                f"SELECT * FROM {table} "
+                f"WHERE M_CODE = ? AND INS_DATE_YM IN ({placeholders})",
+                conn,
+                params=[mcode, *cached_months],
+            )
+    except Exception:
+        # 캐시 테이블이 아직 없음
+        return pd.DataFrame(columns=columns), months
+
+    missing = [month for month in months if month not in set(cached_months)]
+    return cached[columns], missing
+
+
+def _save_cached_months(
+    kind: str, mcode: str, months: List[str], df: pd.DataFrame, db_path: str
+) -> None:
+    """마감된 월의 통계를 캐시에 저장하고 캐시된 월 목록에 기록합니다."""
+    _, table, _ = _WT_AGGREGATES[kind]
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        # KIND 에는 캐시 테이블 이름을 기록 (테이블 이름이 바뀌면 이전 기록은 무시됨)
+        conn.execute(f"""CREATE TABLE IF NOT EXISTS {WT_CACHED_MONTHS_TABLE} (
+                KIND TEXT,
+                M_CODE TEXT,
+                INS_DATE_YM TEXT,
+                CACHED_AT TEXT,
+                PRIMARY KEY (KIND, M_CODE, INS_DATE_YM)
+            )""")
+        if not df.empty:
+            df.to_sql(table, conn, if_exists="append", index=False)
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_mcode "
+                f"ON {table} (M_CODE, INS_DATE_YM)"
+            )
+        cached_at = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {WT_CACHED_MONTHS_TABLE} VALUES (?, ?, ?, ?)",
+            [(table, mcode, month, cached_at) for month in months],
+        )
+
+
+def _load_monthly_aggregate(
+    kind: str,
+    mcode: str,
+    start_date: str,
+    end_date: str,
+    db_path: str = config.SQLITE_DB_PATH,
+    today: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    월별 중량 통계를 조회합니다. 마감된 월은 로컬 캐시에서 읽고,
+    캐시에 없는 월만 Snowflake 에서 집계하여 캐시에 저장합니다.
+    """
+    _, _, columns = _WT_AGGREGATES[kind]
+    months, live_ranges = split_cacheable_months(start_date, end_date, today)
+    frames = []
+
+    if months:
+        cached, missing = _read_cached_months(kind, mcode, months, db_path)
+        frames.append(cached)
+        if missing:
+            end_before = (pd.Period(missing[-1], "M") + 1).strftime("%Y%m01")
+            fetched = _execute_aggregate(
+                kind, mcode, start_date=f"{missing[0]}01", end_before=end_before
+            )
+            fetched = fetched[fetched["INS_DATE_YM"].isin(missing)]
+            try:
+                _save_cached_months(kind, mcode, missing, fetched, db_path)
+            except Exception as e:
+                print(f"중량 통계 캐시 저장 실패: {str(e)}")
+            frames.append(fetched)
+
+    for live_start, live_end, live_before in live_ranges:
+        frames.append(
+            _execute_aggregate(
+                kind,
+                mcode,
+                start_date=live_start,
+                end_date=live_end,
+                end_before=live_before,
+            )
+        )
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = pd.concat(frames, ignore_index=True)
+    numeric_cols = columns[3:]
+    df[numeric_cols] = df[numeric_cols].astype(float)
+    qty_cols = [col for col in numeric_cols if col.endswith("_QTY")]
+    df[qty_cols] = df[qty_cols].astype(int)
+    return df.sort_values(["INS_DATE_YM", "PLANT"]).reset_index(drop=True)
+
+
+def get_weight_summary_df(
+    mcode: str,
+    start_date: str,
+    end_date: str,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    공장 / 월별 중량 통계(건수, 합격 수, 평균, 표준편차, 사분위수, 규격)를 조회합니다.
+    BOX_* 컬럼은 IQR 1.5배 울타리 밖 측정값을 제외한 박스플롯용 통계입니다.
+
+    Args:
+        mcode: 제품 코드
+        start_date: 조회 시작일자 (YYYYMMDD)
+        end_date: 조회 종료일자 (YYYYMMDD)
+        db_path: 로컬 캐시 SQLite DB 경로
+
+    Returns:
+        pd.DataFrame: WT_SUMMARY_COLUMNS + PASS_PCT, UPM_PCT, LWM_PCT
+            (INS_DATE_YM 은 YYYY-MM, *_PCT 규격은 표준 중량 대비 편차 %)
+    """
+    df = _load_monthly_aggregate("summary", mcode, start_date, end_date, db_path)
+    df["INS_DATE_YM"] = df["INS_DATE_YM"].str[:4] + "-" + df["INS_DATE_YM"].str[4:6]
+    df["PASS_PCT"] = df["WT_PASS_QTY"] / df["WT_INS_QTY"]
+    df["UPM_PCT"] = (df["UPM_STD_WGT"] / df["STD_WGT"] - 1) * 100
+    df["LWM_PCT"] = (df["LWM_STD_WGT"] / df["STD_WGT"] - 1) * 100
+    return df
+
+
+def get_weight_histogram_df(
+    mcode: str,
+    start_date: str,
+    end_date: str,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    공장 / 월별 중량 편차(표준 중량 대비 %) 고정 폭 구간 건수를 조회합니다.
+
+    Args:
+        mcode: 제품 코드
+        start_date: 조회 시작일자 (YYYYMMDD)
+        end_date: 조회 종료일자 (YYYYMMDD)
+        db_path: 로컬 캐시 SQLite DB 경로
+
+    Returns:
+        pd.DataFrame: WT_HISTOGRAM_COLUMNS + BIN_START_PCT, BIN_END_PCT
+            (INS_DATE_YM 은 YYYY-MM, 양 끝 구간은 범위를 벗어난 값 포함)
+    """
+    df = _load_monthly_aggregate("histogram", mcode, start_date, end_date, db_path)
+    df["INS_DATE_YM"] = df["INS_DATE_YM"].str[:4] + "-" + df["INS_DATE_YM"].str[4:6]
+    df["BIN_IDX"] = df["BIN_IDX"].astype(int)
+    df["BIN_START_PCT"] = df["BIN_IDX"] * WT_HIST_BIN_PCT
+    df["BIN_END_PCT"] = df["BIN_START_PCT"] + WT_HIST_BIN_PCT
+    return df
+
+
+def summarize_weight_by_month(summary_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    공장 / 월별 중량 통계를 월별 검사 / 합격 수량과 합격률로 합칩니다.
+    (viz.draw_weight_distribution 입력 형식)
+    """
+    df = summary_df.groupby("INS_DATE_YM", as_index=False)[
+        ["WT_INS_QTY", "WT_PASS_QTY"]
+    ].sum()
+    df["PASS_PCT"] = df["WT_PASS_QTY"] / df["WT_INS_QTY"]
+    return df
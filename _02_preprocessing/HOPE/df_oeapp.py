@@ -1,9 +1,19 @@
 """
-df_402_fm_monitoring.py
+HOPE OE 어플리케이션 참조 데이터 모듈
+
+HOPE OE 어플리케이션(SAP_ZSTT70041) 전체 테이블을 매 호출마다 Snowflake에서 조회하지 않도록,
+스케줄 작업(_08_automation/oeapp_reference_cache.py)이 SQLite에 저장한 참조 테이블을
+프로세스당 한 번 읽어 M-Code / 공장 인덱스와 함께 공유합니다.
+주요 기능:
+- OE 어플리케이션 참조 테이블 갱신 (Snowflake → SQLite)
+- M-Code / 공장별 조회 (인덱스 딕셔너리 조회)
+- 공장-M_CODE 매핑, 공장별 양산 SKU 집계
 """
 
 import sys
-from datetime import datetime, timedelta
+import sqlite3
+from pathlib import Path
+from typing import Dict
 import numpy as np
 import pandas as pd
 import os
@@ -14,26 +24,130 @@ sys.path.append(project_root)
 
 from _05_commons import config
 
-from _00_database.db_client import get_client
-from _01_query.GMES import q_production
+from _00_database.db_client import get_client, cache_resource_safe
 from _01_query.HOPE import q_hope
 from _02_preprocessing import helper_pandas
 
+# SQLite 참조 테이블명
+OEAPP_REF_TABLE = "hope_oeapp_ref"
+
+
+# * region 참조 테이블 갱신
+def fetch_oeapp_from_source() -> pd.DataFrame:
+    """Snowflake에서 HOPE OE 어플리케이션 전체 데이터를 조회합니다."""
+    return get_client("snowflake").execute(q_hope.CTE_HOPE_OE_APP_ALL)
+
+
+def save_oeapp_reference(
+    df: pd.DataFrame, db_path: str = config.SQLITE_DB_PATH
+) -> None:
+    """
+    OE 어플리케이션 데이터를 SQLite 참조 테이블로 교체 저장하고 M_CODE / PLANT 인덱스를 생성합니다.
+
+    Args:
+        df: fetch_oeapp_from_source 결과 (원본 컬럼명 유지)
+        db_path: SQLite DB 파일 경로
+    """
+    if df is None or df.empty:
+        raise ValueError("저장할 OE 어플리케이션 데이터가 없습니다.")
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    columns = {col.upper(): col for col in df.columns}
+
+    with sqlite3.connect(db_path) as conn:
+        df.to_sql(OEAPP_REF_TABLE, conn, if_exists="replace", index=False)
+        for key in ["M_CODE", "PLANT"]:
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{OEAPP_REF_TABLE}_{key.lower()} '
+                f'ON {OEAPP_REF_TABLE} ("{columns[key]}")'
+            )
+
+
+# * region 참조 데이터 (인덱스)
+class OEAppReference:
+    """
+    HOPE OE 어플리케이션 참조 데이터와 M-Code / 공장 인덱스
+
+    - df: 원본 컬럼명(load_oeapp_df 와 동일)의 전체 데이터
+    - mcode_index / plant_index: {키: 행 위치 배열}
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df.reset_index(drop=True)
+        self.columns = {col.upper(): col for col in self.df.columns}
+        self.mcode_index: Dict[str, np.ndarray] = self._build_index("M_CODE")
+        self.plant_index: Dict[str, np.ndarray] = self._build_index("PLANT")
+        self.plant_mcode = (
+            helper_pandas.standardize_columns_uppercase(
+                self.df[[self.columns["PLANT"], self.columns["M_CODE"]]].copy()
+            )
+            .drop_duplicates()
+            .reset_index(drop=True)
+        )
+
+    def _build_index(self, key: str) -> Dict[str, np.ndarray]:
+        return self.df.groupby(self.columns[key], sort=False).indices
+
+    def _take(self, index: Dict[str, np.ndarray], key: str) -> pd.DataFrame:
+        positions = index.get(key, np.array([], dtype="int64"))
+        return self.df.take(positions)
 
+    def by_mcode(self, m_code: str) -> pd.DataFrame:
+        """M-Code 의 OE 어플리케이션 (컬럼명 대문자)"""
+        return helper_pandas.standardize_columns_uppercase(
+            self._take(self.mcode_index, m_code)
+        )
+
+    def by_plant(self, plant: str) -> pd.DataFrame:
+        """공장의 OE 어플리케이션 (원본 컬럼명)"""
+        return self._take(self.plant_index, plant)
+
+
+@cache_resource_safe(ttl=600)
+def load_oeapp_reference() -> OEAppReference:
+    """
+    SQLite 참조 테이블에서 OE 어플리케이션 참조 데이터를 로드합니다.
+    참조 테이블이 없거나 비어 있으면 Snowflake에서 조회 후 저장합니다.
+
+    Returns:
+        OEAppReference: M-Code / 공장 인덱스가 포함된 참조 데이터
+    """
+    try:
+        df = get_client("sqlite").execute(f"SELECT * FROM {OEAPP_REF_TABLE}")
+    except Exception as e:
+        print(f"OE 어플리케이션 참조 테이블 조회 실패, 원본에서 갱신합니다: {str(e)}")
+        df = pd.DataFrame()
+
+    if df.empty:
+        df = fetch_oeapp_from_source()
+        try:
+            save_oeapp_reference(df)
+        except Exception as e:
+            print(f"OE 어플리케이션 참조 테이블 저장 실패: {str(e)}")
+
+    return OEAppReference(df)
+
+
+# * region 조회 함수
 def load_oeapp_df():
-    df = get_client("snowflake").execute(q_hope.CTE_HOPE_OE_APP_ALL)
-    return df
+    return load_oeapp_reference().df.copy()
 
 
 def load_oeapp_df_by_mcode(m_code):
-    df = get_client("snowflake").execute(q_hope.CTE_HOPE_OE_APP_ALL)
-    df.columns = df.columns.str.upper()
-    df = df[df["M_CODE"] == m_code]
-    return df
+    return load_oeapp_reference().by_mcode(m_code)
+
+
+def load_oeapp_df_by_plant(plant):
+    return load_oeapp_reference().by_plant(plant)
+
+
+def load_plant_mcode_pairs() -> pd.DataFrame:
+    """중복 제거된 PLANT, M_CODE 매핑"""
+    return load_oeapp_reference().plant_mcode.copy()
 
 
 def oe_sku():
-    df = load_oeapp_df()
+    df = load_oeapp_reference().df
     df = df[df["Status"] == "Supplying"][["plant", "m_code"]]
     df = (
         df.groupby("plant")
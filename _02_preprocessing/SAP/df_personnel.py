@@ -0,0 +1,165 @@
+"""
+인사정보(사원번호 → 사원명) 디렉터리 모듈
+
+로그인 시마다 Snowflake 인사정보 테이블(ZHRT90041)을 조회하지 않도록,
+스케줄 작업(_08_automation/personnel_directory_cache.py)이 SQLite에 저장한 참조 테이블을
+프로세스당 한 번 읽어 사원번호 딕셔너리로 공유합니다.
+주요 기능:
+- 인사정보 참조 테이블 갱신 (Snowflake → SQLite, 수동 등록 인원 포함)
+- 사원번호 → 사원명 조회 (딕셔너리 조회)
+"""
+
+import sys
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import config
+
+from _00_database.db_client import get_client, cache_resource_safe
+from _01_query.SAP.q_hk_personnel import CTE_HR_PERSONAL
+
+logger = logging.getLogger(__name__)
+
+# SQLite 참조 테이블명
+PERSONNEL_REF_TABLE = "hr_personnel_ref"
+
+# 인사정보 테이블에 없는 수동 등록 인원
+MANUAL_PERSONNEL: List[Dict] = [
+    {"PNL_NO": 21300315, "PNL_NM": "KIM JEE WOONG"},
+    {"PNL_NO": 21000075, "PNL_NM": "SOUNG HYUN JUN"},
+    {"PNL_NO": 21100293, "PNL_NM": "KIM SEUNG JAE"},
+    {"PNL_NO": 21200424, "PNL_NM": "OH JIN TAEK"},
+    {"PNL_NO": 21604756, "PNL_NM": "RYU JE WOOK"},
+]
+
+
+# * region 참조 테이블 갱신
+def prepare_personnel_df(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    인사정보에 수동 등록 인원을 추가하고 사원번호를 정수로 변환합니다.
+
+    Args:
+        df: PNL_NO, PNL_NM 컬럼의 인사정보 (None 이면 수동 등록 인원만 사용)
+
+    Returns:
+        pd.DataFrame: PNL_NO(int), PNL_NM 컬럼의 인사정보
+    """
+    frames = [pd.DataFrame(MANUAL_PERSONNEL)]
+    if df is not None and not df.empty:
+        df = df.copy()
+        df.columns = df.columns.str.upper()
+        frames.insert(0, df[["PNL_NO", "PNL_NM"]])
+
+    df = pd.concat(frames, ignore_index=True)
+    df["PNL_NO"] = pd.to_numeric(df["PNL_NO"], errors="coerce").fillna(0).astype(int)
+    return df
+
+
+def fetch_personnel_from_source() -> pd.DataFrame:
+    """Snowflake에서 인사정보를 조회하여 수동 등록 인원과 합칩니다."""
+    df = get_client("snowflake").execute(CTE_HR_PERSONAL)
+    if df is None or df.empty:
+        raise ValueError("Snowflake에서 인사정보를 가져오지 못했습니다.")
+    return prepare_personnel_df(df)
+
+
+def save_personnel_reference(
+    df: pd.DataFrame, db_path: str = config.SQLITE_DB_PATH
+) -> None:
+    """
+    인사정보를 SQLite 참조 테이블로 교체 저장하고 PNL_NO 인덱스를 생성합니다.
+
+    Args:
+        df: prepare_personnel_df 결과
+        db_path: SQLite DB 파일 경로
+    """
+    if df is None or df.empty:
+        raise ValueError("저장할 인사정보가 없습니다.")
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        df.to_sql(PERSONNEL_REF_TABLE, conn, if_exists="replace", index=False)
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{PERSONNEL_REF_TABLE}_pnl_no "
+            f"ON {PERSONNEL_REF_TABLE} (PNL_NO)"
+        )
+
+
+# * region 인사정보 디렉터리
+class PersonnelDirectory:
+    """
+    사원번호 → 사원명 디렉터리
+
+    - df: PNL_NO, PNL_NM 전체 인사정보
+    - names: {사원번호: 사원명} (중복 사원번호는 첫 번째 행 사용)
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df.reset_index(drop=True)
+        first = self.df.drop_duplicates(subset="PNL_NO", keep="first")
+        self.names: Dict[int, str] = dict(
+            zip(first["PNL_NO"].tolist(), first["PNL_NM"].tolist())
+        )
+        self.duplicates: List[int] = sorted(
+            self.df.loc[self.df["PNL_NO"].duplicated(), "PNL_NO"].unique().tolist()
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, pnl_no) -> Optional[str]:
+        """사원번호의 사원명 (없거나 형식이 잘못된 경우 None)"""
+        try:
+            return self.names.get(int(pnl_no))
+        except (ValueError, TypeError):
+            return None
+
+
+@cache_resource_safe(ttl=600)
+def load_personnel_directory() -> PersonnelDirectory:
+    """
+    SQLite 참조 테이블에서 인사정보 디렉터리를 로드합니다.
+    참조 테이블이 없거나 비어 있을 때만 Snowflake에서 조회 후 저장하며,
+    Snowflake도 실패하면 수동 등록 인원만으로 디렉터리를 구성합니다.
+
+    Returns:
+        PersonnelDirectory: 사원번호 인덱스가 포함된 인사정보 디렉터리
+    """
+    try:
+        df = get_client("sqlite").execute(f"SELECT * FROM {PERSONNEL_REF_TABLE}")
+    except Exception as e:
+        logger.warning(f"인사정보 참조 테이블 조회 실패, 원본에서 갱신합니다: {str(e)}")
+        df = pd.DataFrame()
+
+    if df.empty:
+        try:
+            df = fetch_personnel_from_source()
+            save_personnel_reference(df)
+        except Exception as e:
+            logger.error(f"인사정보 원본 조회/저장 실패: {str(e)}")
+            if df.empty:
+                df = prepare_personnel_df(None)
+
+    directory = PersonnelDirectory(df)
+    if directory.duplicates:
+        logger.warning(f"Found duplicate PNL_NO entries: {directory.duplicates}")
+    return directory
+
+
+def main():
+    """테스트 실행 함수"""
+    directory = load_personnel_directory()
+    print(f"인사정보 {len(directory)}명")
+    print(directory.lookup(MANUAL_PERSONNEL[0]["PNL_NO"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,10 @@ Pandas 기반 전처리 및 MTTC 계산 유틸
 포함된 항목:
 - CountWorkingDays 클래스: MTTC 및 각종 경과일 계산
 - 전처리 함수들: 컬럼명 표준화, 날짜/카테고리 변환
+- 주간 상태(Open/Close/On-going) 분류 및 연간 일괄 집계
+- 그룹별 판정 결과(OK/NO/NI 등) 건수 집계
 - 테스트 도우미 함수: DataFrame 반환 결과 미리보기
-- Streamlit 안전 캐시 데코레이터
+- Streamlit 안전 캐시 데코레이터 (만료 후 기존 값을 반환하며 백그라운드 갱신하는 모드 포함)
 
 사용처 예시:
 - Streamlit 대시보드에서 품질 이슈 테이블 처리
@@ -25,12 +27,23 @@ project_root = os.getenv(
 )
 sys.path.append(project_root)
 
+import copy
+import inspect
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 import numpy as np
 import pandas as pd
 import streamlit as st
-from IPython.display import display
+
+from _00_database import query_metrics
+from _05_commons import config
+from _05_commons.helper import lazy_import
+
+# 노트북 전용 의존성은 test_dataframe_by_ipynb 호출 시점에만 로딩
+ipython_display = lazy_import("IPython.display")
 
 
 # MTTC 계산 class
@@ -191,7 +204,7 @@ def test_dataframe_by_itself(func, *args, **kwargs):
 def test_dataframe_by_ipynb(func, *args, **kwargs):
     df = func(*args, **kwargs)
     print(f"Testing [{func.__name__}] rows : {df.shape[0]} columns : {df.shape[1]}")
-    display(df.head())
+    ipython_display.display(df.head())
 
 
 # Status return 함수
@@ -210,6 +223,176 @@ def get_weekly_conditions(df, local_start_of_week, local_end_of_week):
     return bool_open, bool_close, bool_ongoing1, bool_ongoing2
 
 
+# * region 주간 상태 일괄 집계 (REG_DATE ~ COMP_DATE 구간 인덱스)
+WEEKLY_STATUS = ["Open", "Open & Close", "Close", "On-going"]
+WEEK_ORIGIN = pd.Timestamp("2000-01-03")  # 주차 번호 기준일 (월요일)
+
+
+def get_year_week_starts(year: int) -> pd.DatetimeIndex:
+    """해당 연도의 날짜를 포함하는 모든 주(월~일)의 시작일(월요일)을 반환합니다."""
+    first_monday = pd.Timestamp(year, 1, 1) - pd.Timedelta(
+        days=pd.Timestamp(year, 1, 1).weekday()
+    )
+    return pd.date_range(first_monday, pd.Timestamp(year, 12, 31), freq="7D")
+
+
+def is_calendar_week(start_date, end_date) -> bool:
+    """시작일이 월요일이고 종료일이 같은 주 일요일인지 확인합니다."""
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    return (
+        start == start.normalize()
+        and start.weekday() == 0
+        and end.normalize() - start == pd.Timedelta(days=6)
+    )
+
+
+def _week_position(dates: pd.Series) -> np.ndarray:
+    """날짜를 WEEK_ORIGIN 기준 주차 번호로 변환합니다. (결측값은 NaN)"""
+    days = (pd.to_datetime(dates).dt.normalize() - WEEK_ORIGIN).dt.days
+    return np.floor_divide(days.to_numpy(dtype="float64"), 7)
+
+
+def count_weekly_status(
+    df: pd.DataFrame,
+    week_starts: pd.DatetimeIndex,
+    group_col: str = "PLANT",
+    reg_col: str = "REG_DATE",
+    comp_col: str = "COMP_DATE",
+) -> pd.DataFrame:
+    """
+    여러 주에 대한 Open/Close/On-going 건수를 한 번의 스윕으로 집계합니다.
+
+    get_weekly_conditions + np.select 분류를 주마다 반복하는 대신, 각 행의
+    REG_DATE/COMP_DATE를 주차 번호 구간으로 바꿔 한 번에 누적합니다.
+    - Open / Open & Close / Close: 등록/완료 주차에 1건씩 가산
+    - On-going: (등록 주차, 완료 주차) 사이의 주에 차분 배열 누적합으로 가산
+
+    Args:
+        df: REG_DATE, COMP_DATE, group_col 을 포함한 데이터프레임
+        week_starts: 연속된 주 시작일(월요일) 목록 (예: get_year_week_starts(2025))
+        group_col: 집계 기준 컬럼 (category 타입이면 전체 카테고리를 유지)
+        reg_col: 등록일 컬럼명
+        comp_col: 완료일 컬럼명
+
+    Returns:
+        pd.DataFrame: WEEK_START, group_col, STATUS, COUNT 컬럼의 long 포맷 집계
+    """
+    groups = df[group_col]
+    if not isinstance(groups.dtype, pd.CategoricalDtype):
+        groups = groups.astype("category")
+    group_codes = groups.cat.codes.to_numpy()
+    categories = groups.cat.categories
+
+    n_weeks, n_groups = len(week_starts), len(categories)
+    first_week = (week_starts[0] - WEEK_ORIGIN).days // 7
+
+    reg_week = _week_position(df[reg_col]) - first_week
+    comp_week = _week_position(df[comp_col]) - first_week
+    comp_week[np.isnan(comp_week)] = np.inf  # 미완료 건은 계속 진행 중
+
+    valid = group_codes >= 0
+    has_reg = valid & ~np.isnan(reg_week)
+    reg_in = has_reg & (reg_week >= 0) & (reg_week < n_weeks)
+    comp_in = valid & (comp_week >= 0) & (comp_week < n_weeks)
+    same_week = reg_in & (reg_week == comp_week)
+
+    counts = np.zeros((len(WEEKLY_STATUS), n_groups, n_weeks), dtype="int64")
+    for status_idx, mask, week in [
+        (0, reg_in & ~same_week, reg_week),
+        (1, same_week, reg_week),
+        (2, comp_in & ~same_week, comp_week),
+    ]:
+        np.add.at(counts[status_idx], (group_codes[mask], week[mask].astype(int)), 1)
+
+    # On-going: reg_week < w < comp_week 인 주에 +1 (차분 배열)
+    lo = np.clip(reg_week + 1, 0, n_weeks)
+    hi = np.clip(comp_week, 0, n_weeks)
+    ongoing = has_reg & (lo < hi)
+    diff = np.zeros((n_groups, n_weeks + 1), dtype="int64")
+    np.add.at(diff, (group_codes[ongoing], lo[ongoing].astype(int)), 1)
+    np.add.at(diff, (group_codes[ongoing], hi[ongoing].astype(int)), -1)
+    counts[3] = np.cumsum(diff[:, :n_weeks], axis=1)
+
+    index = pd.MultiIndex.from_product(
+        [WEEKLY_STATUS, categories, week_starts],
+        names=["STATUS", group_col, "WEEK_START"],
+    )
+    result = pd.DataFrame({"COUNT": counts.ravel()}, index=index).reset_index()
+    result[group_col] = pd.Categorical(
+        result[group_col], categories=categories, ordered=groups.cat.ordered
+    )
+    result["STATUS"] = pd.Categorical(
+        result["STATUS"], categories=WEEKLY_STATUS, ordered=True
+    )
+    return result[["WEEK_START", group_col, "STATUS", "COUNT"]]
+
+
+def pivot_weekly_status_counts(
+    df_counts: pd.DataFrame, week_start, group_col: str = "PLANT"
+) -> pd.DataFrame:
+    """
+    count_weekly_status 결과에서 한 주를 꺼내 공장별 상태 피벗(Global 합계 행 포함)으로 변환합니다.
+    """
+    df_week = df_counts[df_counts["WEEK_START"] == pd.Timestamp(week_start)]
+    pivot_df = df_week.pivot_table(
+        index=group_col,
+        columns="STATUS",
+        values="COUNT",
+        aggfunc="sum",
+        fill_value=0,
+        observed=False,
+    )
+    pivot_df.index = pivot_df.index.astype(str)
+    pivot_df.loc["Global"] = pivot_df.sum()
+    pivot_df = pivot_df.reset_index()
+    pivot_df.columns.name = None
+    return pivot_df[[group_col] + WEEKLY_STATUS]
+
+
+def tally_outcomes(
+    df: pd.DataFrame,
+    by,
+    outcome_col: str,
+    outcomes: list,
+    count_col: str = "COUNT",
+) -> pd.DataFrame:
+    """
+    그룹 x 판정 결과(범주) 건수를 한 번의 bincount 로 집계합니다.
+
+    groupby().agg(OK=("JDG", lambda x: (x == "OK").sum()), ...) 처럼 그룹마다 판정별
+    파이썬 함수를 호출하는 대신, 그룹 번호와 판정 카테고리 코드를 하나의 정수로 묶어 셉니다.
+
+    Args:
+        df: 집계 대상 데이터프레임
+        by: 그룹 기준 컬럼명 또는 컬럼명 리스트 (키가 결측인 행은 제외)
+        outcome_col: 판정 결과 컬럼명 (예: JDG, JDG_GR)
+        outcomes: 건수 컬럼으로 만들 판정 값 목록 (목록 밖의 값은 count_col 에만 포함)
+        count_col: 판정 결과가 결측이 아닌 전체 건수 컬럼명
+
+    Returns:
+        pd.DataFrame: by 컬럼, count_col, 판정 값별 건수 컬럼 (그룹 키 정렬 순)
+    """
+    grouped = df.groupby(by, sort=True, observed=True)
+    group_codes = grouped.ngroup().fillna(-1).to_numpy(dtype="int64")
+    keys = grouped.size().index
+    n_groups, n_slots = len(keys), len(outcomes) + 1
+
+    # 목록 밖의 값은 마지막 '기타' 칸에 모아 count_col 에만 반영
+    values = df[outcome_col]
+    outcome_codes = pd.Categorical(values, categories=outcomes).codes.astype("int64")
+    outcome_codes[outcome_codes < 0] = len(outcomes)
+    valid = (group_codes >= 0) & values.notna().to_numpy()
+
+    counts = np.bincount(
+        group_codes[valid] * n_slots + outcome_codes[valid],
+        minlength=n_groups * n_slots,
+    ).reshape(n_groups, n_slots)
+
+    result = pd.DataFrame(counts[:, :-1], index=keys, columns=list(outcomes))
+    result.insert(0, count_col, counts.sum(axis=1))
+    return result.reset_index()
+
+
 # * region 공통 전처리 함수
 def standardize_columns_uppercase(df: pd.DataFrame) -> pd.DataFrame:
     """DataFrame 컬럼명을 모두 대문자로 변환합니다."""
@@ -258,14 +441,221 @@ except:
     _is_streamlit = False
 
 
+# * Stale-While-Revalidate 캐시 설정
+SWR_MAX_ENTRIES = 256  # 함수별 최대 캐시 항목 수 (LRU)
+SWR_RETRY_SEC = 60  # 갱신 실패 시 재시도 간격 (초)
+
+# 함수별 캐시 상태 ("모듈.함수" 기준)
+# DEV_MODE 에서 페이지 모듈을 reload 해도 helper_pandas 는 다시 로드되지 않으므로,
+# 새로 데코레이트된 함수가 기존 캐시 항목을 그대로 이어서 사용합니다.
+_swr_registry: dict = {}
+_swr_registry_lock = threading.Lock()
+
+
+def _swr_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """
+    함수 인자로 캐시 키를 생성합니다. (위치 / 키워드 인자 호출을 같은 키로 취급)
+
+    Args:
+        signature: 캐시 대상 함수의 시그니처
+        args: 위치 인자
+        kwargs: 키워드 인자
+
+    Returns:
+        str: 캐시 키
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    parts = []
+    for name, value in bound.arguments.items():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            value = int(pd.util.hash_pandas_object(value).sum())
+        parts.append(f"{name}={value!r}")
+    return ", ".join(parts)
+
+
+def _swr_state(func) -> dict:
+    """
+    함수의 SWR 캐시 상태를 모듈 수준 레지스트리에서 가져옵니다. (없으면 생성)
+
+    함수 내부에서 정의된 함수(<locals>)는 정의할 때마다 다른 함수이므로 등록하지 않습니다.
+
+    Args:
+        func: 캐시 대상 함수
+
+    Returns:
+        dict: entries / key_locks / lock / stats
+    """
+    state = {
+        "entries": OrderedDict(),
+        "key_locks": {},
+        "lock": threading.Lock(),
+        "stats": {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0},
+    }
+    if "<locals>" in func.__qualname__:
+        return state
+    with _swr_registry_lock:
+        return _swr_registry.setdefault(f"{func.__module__}.{func.__qualname__}", state)
+
+
+def stale_while_revalidate_cache(ttl=600, max_entries=SWR_MAX_ENTRIES):
+    """
+    만료(ttl) 후에도 마지막 정상 값을 즉시 반환하고, 백그라운드에서 한 번만 갱신하는 캐시 데코레이터
+
+    - 최초 조회(캐시 없음)만 호출 측에서 계산하며, 같은 키의 동시 최초 조회는 1회만 계산
+    - 만료된 키는 기존 값을 반환하고 갱신 스레드 1개만 실행 (같은 키의 중복 갱신 없음)
+    - 갱신 중 오류가 나면 기존 값을 유지하고 SWR_RETRY_SEC 후 다시 갱신
+    - 반환값은 복사본이므로 호출 측에서 수정해도 캐시에 영향 없음
+    - 캐시 상태는 모듈 수준 레지스트리에 보관하므로 모듈을 reload 해도 유지
+
+    Args:
+        ttl: 값이 최신으로 간주되는 시간(초)
+        max_entries: 최대 캐시 항목 수 (초과 시 오래 사용하지 않은 항목부터 제거)
+
+    Returns:
+        Callable: 데코레이터 (wrapper.clear() / wrapper.cache_info() 제공)
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        state = _swr_state(func)
+        entries: "OrderedDict[str, dict]" = state["entries"]
+        key_locks: dict = state["key_locks"]
+        lock = state["lock"]
+        stats = state["stats"]
+
+        def _store(key, value):
+            with lock:
+                entries[key] = {
+                    "value": value,
+                    "expires_at": time.monotonic() + ttl,
+                    "refreshing": False,
+                }
+                entries.move_to_end(key)
+                while len(entries) > max_entries:
+                    evicted, _ = entries.popitem(last=False)
+                    key_locks.pop(evicted, None)
+
+        def _refresh(key, args, kwargs):
+            try:
+                value = func(*args, **kwargs)
+            except Exception as e:
+                print(
+                    f"[{func.__name__}] 캐시 갱신 실패, 기존 값을 계속 사용합니다: {str(e)}"
+                )
+                with lock:
+                    stats["errors"] += 1
+                    entry = entries.get(key)
+                    if entry is not None:
+                        entry["expires_at"] = time.monotonic() + min(ttl, SWR_RETRY_SEC)
+                        entry["refreshing"] = False
+                return
+            with lock:
+                stats["refreshes"] += 1
+            _store(key, value)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _swr_key(signature, args, kwargs)
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    entries.move_to_end(key)
+                    if time.monotonic() < entry["expires_at"]:
+                        stats["hits"] += 1
+                    else:
+                        stats["stale_hits"] += 1
+                        if not entry["refreshing"]:
+                            entry["refreshing"] = True
+                            threading.Thread(
+                                target=_refresh,
+                                args=(key, args, kwargs),
+                                name=f"swr-{func.__name__}",
+                                daemon=True,
+                            ).start()
+                    return copy.deepcopy(entry["value"])
+                key_lock = key_locks.setdefault(key, threading.Lock())
+
+            # 최초 조회: 같은 키는 한 스레드만 계산하고 나머지는 결과를 기다림
+            with key_lock:
+                with lock:
+                    entry = entries.get(key)
+                if entry is None:
+                    value = func(*args, **kwargs)
+                    with lock:
+                        stats["misses"] += 1
+                    _store(key, value)
+                    return copy.deepcopy(value)
+            with lock:
+                stats["hits"] += 1
+            return copy.deepcopy(entry["value"])
+
+        def clear():
+            with lock:
+                entries.clear()
+                key_locks.clear()
+
+        def cache_info():
+            with lock:
+                return {**stats, "entries": len(entries)}
+
+        wrapper.clear = clear
+        wrapper.cache_info = cache_info
+        return wrapper
+
+    return decorator
+
+
 # * Sremlit 실행 중일 때만 st.cache_data가 적용되도록 하는 데코레이션 보완 함수
-def cache_data_safe(ttl=600):
-    """Streamlit이 실행 중일 때만 cache_data를 적용"""
+def cache_data_safe(ttl=600, stale_while_revalidate=False, shared=False):
+    """
+    Streamlit이 실행 중일 때만 cache_data를 적용
+    (호출마다 캐시 적중 여부와 소요시간을 query_metrics 에 기록)
+
+    stale_while_revalidate=True 이면 st.cache_data 대신 stale_while_revalidate_cache 를 사용하여
+    만료 후에도 기존 값을 즉시 반환하고 백그라운드에서 갱신합니다.
+
+    shared=True 이면 DataFrame 결과를 shared_frame_store 에 저장하여 세션 / 워커 프로세스가
+    호스트당 하나의 사본을 읽기 전용 view 로 공유합니다. (config.SHARED_FRAME_STORE_ENABLED)
+    """
 
     def decorator(func):
-        if _is_streamlit:
-            return st.cache_data(ttl=ttl)(func)
-        else:
+        if not _is_streamlit:
             return func  # 캐시 없이 원본 함수 반환
 
+        func_name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        computed = threading.local()
+
+        @wraps(func)
+        def compute(*args, **kwargs):
+            computed.flag = True  # 캐시 미적중 시에만 실행됨
+            return func(*args, **kwargs)
+
+        if shared and config.SHARED_FRAME_STORE_ENABLED:
+            from _02_preprocessing.shared_frame_store import shared_frame_cache
+
+            cached = shared_frame_cache(
+                ttl=ttl, stale_while_revalidate=stale_while_revalidate
+            )(compute)
+        elif stale_while_revalidate:
+            cached = stale_while_revalidate_cache(ttl=ttl)(compute)
+        else:
+            cached = st.cache_data(ttl=ttl)(compute)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            computed.flag = False
+            started = time.perf_counter()
+            result = cached(*args, **kwargs)
+            query_metrics.record_cache_lookup(
+                func_name,
+                (time.perf_counter() - started) * 1000,
+                result,
+                hit=not computed.flag,
+            )
+            return result
+
+        wrapper.clear = cached.clear
+        return wrapper
+
     return decorator
@@ -0,0 +1,396 @@
+"""
+프로세스 간 공유 DataFrame 저장소(shared frame store) 모듈
+
+st.cache_data 는 값을 pickle 로 저장하고 호출마다 복원하므로, 3개년 품질이슈 / RR 전체 샘플 /
+CQMS 주간 기본 데이터 같은 큰 데이터가 세션 수와 워커 프로세스 수만큼 메모리에 복제됩니다.
+이 모듈은 로더 결과를 호스트당 하나의 Arrow IPC 파일(기본: /dev/shm 공유 메모리)로 저장하고,
+각 프로세스는 파일을 메모리 매핑하여 읽습니다.
+
+- 숫자 / 날짜 / 카테고리 코드 컬럼은 메모리 매핑된 버퍼를 복사 없이 참조 (읽기 전용)
+  → 같은 호스트의 모든 워커가 하나의 물리 사본(페이지 캐시)을 공유
+- 문자열 컬럼은 프로세스당 한 번만 변환하여 읽기 전용으로 설정하고, 세션에는 얕은 복사본(view)을 반환
+- 파일은 임시 파일에 쓴 뒤 os.replace 로 교체하므로 읽는 쪽은 항상 완성된 파일만 봄
+- 만료된 키는 파일 잠금(fcntl.flock)으로 호스트 전체에서 한 프로세스만 다시 계산
+- stale_while_revalidate=True 이면 만료된 파일을 즉시 반환하고 백그라운드에서 갱신
+- 파일을 쓸 때 같은 네임스페이스에서 SHARED_FRAME_MAX_AGE_SEC 이 지난 파일과
+  SHARED_FRAME_MAX_FILES 를 넘는 오래 읽지 않은 파일을 삭제 (공유 메모리 사용량 제한)
+
+반환된 DataFrame 은 읽기 전용 view 입니다. 컬럼 추가 / 필터링은 자유롭지만 기존 컬럼 값을
+제자리에서 수정하려면 먼저 .copy() 해야 합니다.
+
+환경 변수 SHARED_FRAME_STORE_ENABLED=0 으로 끄면 기존 프로세스별 캐시를 사용합니다.
+
+사용 예시:
+>>> from _02_preprocessing import helper_pandas
+>>> @helper_pandas.cache_data_safe(ttl=600, shared=True)
+... def load_something(year) -> pd.DataFrame: ...
+"""
+
+import hashlib
+import inspect
+import logging
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+import pandas as pd
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 잠금만 사용
+    fcntl = None
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config
+from _05_commons.helper import lazy_import
+from _02_preprocessing import helper_pandas
+
+# pyarrow 는 공유 저장소를 읽고 쓸 때만 로딩
+pa = lazy_import("pyarrow")
+
+logger = logging.getLogger(__name__)
+
+SHARED_FRAME_MAX_VIEWS = 64  # 프로세스당 변환해 둘 최대 파일 수 (LRU)
+SHARED_FRAME_MAX_FILES = (
+    32  # 네임스페이스(로더)당 최대 파일 수 (LRU, 마지막 조회 시각 기준)
+)
+SHARED_FRAME_MAX_AGE_SEC = 24 * 3600  # 마지막으로 쓴 뒤 이 시간이 지난 파일은 삭제
+SHARED_FRAME_TOUCH_SEC = 60  # 조회 시 파일 접근 시각(LRU 기준) 갱신 간격
+
+
+class SharedFrameStore:
+    """
+    Arrow IPC 파일 기반 공유 DataFrame 저장소
+
+    - 파일 경로: {root}/{namespace}/{sha1(key)}.arrow
+    - views: {파일 경로: ((mtime_ns, inode), DataFrame)} 프로세스 내 변환 결과 (LRU)
+    - 파일 mtime 은 마지막으로 쓴 시각(만료 판단), atime 은 마지막으로 조회한 시각(정리 순서)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_views: int = SHARED_FRAME_MAX_VIEWS,
+        max_files: int = SHARED_FRAME_MAX_FILES,
+        max_age: float = SHARED_FRAME_MAX_AGE_SEC,
+    ) -> None:
+        self.root = Path(root)
+        self.max_views = max_views
+        self.max_files = max_files
+        self.max_age = max_age
+        self.views: "OrderedDict[Path, tuple]" = OrderedDict()
+        self.stats = {"reads": 0, "maps": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._path_locks: Dict[Path, threading.Lock] = {}
+
+    def path(self, namespace: str, key: str) -> Path:
+        """네임스페이스 / 캐시 키에 해당하는 파일 경로"""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / namespace / f"{digest}.arrow"
+
+    def age(self, path: Path) -> Optional[float]:
+        """파일을 마지막으로 쓴 뒤 지난 시간(초) (파일이 없으면 None)"""
+        try:
+            return time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    # * region 읽기 / 쓰기
+    def write(self, path: Path, df: pd.DataFrame) -> None:
+        """
+        DataFrame 을 Arrow IPC 파일로 저장합니다. (임시 파일에 쓴 뒤 원자적으로 교체)
+
+        Args:
+            path: 저장할 파일 경로
+            df: 저장할 데이터
+        """
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        with self._lock:
+            self.stats["writes"] += 1
+        self.evict(path.parent, keep=path)
+
+    def read(self, path: Path) -> pd.DataFrame:
+        """
+        파일을 메모리 매핑하여 DataFrame view 로 반환합니다.
+        (같은 파일은 프로세스당 한 번만 변환하고 이후에는 얕은 복사본 반환)
+
+        Args:
+            path: 읽을 파일 경로
+
+        Returns:
+            pd.DataFrame: 읽기 전용 view
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_ino)
+        if time.time() - stat.st_atime > SHARED_FRAME_TOUCH_SEC:
+            # 정리 순서(LRU)용 접근 시각만 갱신 (mtime 은 유지하여 만료 판단에 영향 없음)
+            try:
+                os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+            except OSError:
+                pass
+        with self._lock:
+            self.stats["reads"] += 1
+            cached = self.views.get(path)
+            if cached is not None and cached[0] == version:
+                self.views.move_to_end(path)
+                return cached[1].copy(deep=False)
+
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        df = table.to_pandas(split_blocks=True)
+        # 문자열(object) 컬럼은 프로세스 메모리에 새로 만든 배열이므로 직접 읽기 전용으로 설정
+        # (세션 간에 공유되는 배열이므로 한 세션의 값 수정이 다른 세션에 보이지 않도록 함)
+        # (컬럼의 to_numpy() 는 블록 배열의 view 이므로 블록 배열 자체에 설정)
+        for block in df._mgr.blocks:
+            if block.dtype == object:
+                block.values.flags.writeable = False
+        with self._lock:
+            self.stats["maps"] += 1
+            self.views[path] = (version, df)
+            self.views.move_to_end(path)
+            while len(self.views) > self.max_views:
+                self.views.popitem(last=False)
+        return df.copy(deep=False)
+
+    # * region 잠금 / 정리
+    @contextmanager
+    def lock(self, path: Path, blocking: bool = True) -> Iterator[bool]:
+        """
+        파일별 호스트 전체 잠금 (프로세스 내 스레드 잠금 + fcntl.flock)
+
+        Args:
+            path: 잠글 파일 경로
+            blocking: False 이면 이미 잠겨 있을 때 기다리지 않음
+
+        Yields:
+            bool: 잠금 획득 여부
+        """
+        with self._lock:
+            thread_lock = self._path_locks.setdefault(path, threading.Lock())
+        if not thread_lock.acquire(blocking):
+            yield False
+            return
+        try:
+            if fcntl is None:
+                yield True
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path.with_name(f"{path.name}.lock"), "a+b") as lock_file:
+                flags = fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+                try:
+                    fcntl.flock(lock_file, flags)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            thread_lock.release()
+
+    def evict(self, namespace_dir: Path, keep: Optional[Path] = None) -> int:
+        """
+        네임스페이스의 오래된 파일을 삭제합니다.
+
+        - 마지막으로 쓴 뒤 max_age 초가 지난 파일 / 비정상 종료로 남은 임시 파일
+        - 파일 수가 max_files 를 넘으면 가장 오래 조회하지 않은 파일부터 삭제
+        - 다른 프로세스가 계산 중(잠금)인 파일은 건너뜀
+        (다른 프로세스가 메모리 매핑 중인 파일은 삭제해도 매핑이 해제될 때까지 유지됨)
+
+        Args:
+            namespace_dir: 정리할 네임스페이스 디렉토리
+            keep: 삭제하지 않을 파일 (방금 쓴 파일)
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        now = time.time()
+        files = []
+        for path in namespace_dir.glob("*.*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.suffix == ".tmp":
+                if now - stat.st_mtime >= self.max_age:
+                    path.unlink(missing_ok=True)
+            elif path.suffix == ".arrow" and path != keep:
+                files.append((stat.st_atime, stat.st_mtime, path))
+
+        # 만료된 파일을 제외하고 남은 파일 중 최근 조회 순으로 max_files 개만 유지
+        targets = [path for _, mtime, path in files if now - mtime >= self.max_age]
+        files = sorted(
+            (f for f in files if f[2] not in targets), key=lambda f: f[0], reverse=True
+        )
+        keep_count = self.max_files - (1 if keep is not None else 0)
+        targets += [path for _, _, path in files[max(keep_count, 0) :]]
+
+        removed = []
+        for path in targets:
+            with self.lock(path, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                path.unlink(missing_ok=True)
+                # 잠금 파일도 삭제 (삭제 직전 잠금을 기다리던 프로세스는 중복 계산만 할 수 있음)
+                path.with_name(f"{path.name}.lock").unlink(missing_ok=True)
+            removed.append(path)
+
+        with self._lock:
+            for path in removed:
+                self.views.pop(path, None)
+            self.stats["evictions"] += len(removed)
+        return len(removed)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """저장된 파일과 프로세스 내 view 를 삭제합니다. (namespace 지정 시 해당 로더만)"""
+        target = self.root / namespace if namespace else self.root
+        with self._lock:
+            for path in [p for p in self.views if target in p.parents]:
+                del self.views[path]
+        shutil.rmtree(target, ignore_errors=True)
+
+
+_stores: Dict[str, SharedFrameStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_shared_frame_store() -> SharedFrameStore:
+    """config.SHARED_FRAME_STORE_PATH 경로의 프로세스 공용 SharedFrameStore"""
+    root = config.SHARED_FRAME_STORE_PATH
+    with _stores_lock:
+        if root not in _stores:
+            _stores[root] = SharedFrameStore(root)
+        return _stores[root]
+
+
+# * region 캐시 데코레이터
+def shared_frame_cache(ttl=600, stale_while_revalidate=False):
+    """
+    DataFrame 을 반환하는 로더의 결과를 공유 저장소에 캐시하는 데코레이터
+
+    - 만료(ttl) 전에는 공유 파일의 view 를 반환 (다른 프로세스가 계산한 결과 포함)
+    - 만료 / 미존재 시 호스트 전체에서 한 프로세스만 계산하고 나머지는 결과를 기다림
+    - stale_while_revalidate=True 이면 만료된 파일을 반환하고 백그라운드에서 1회 갱신
+      (갱신 실패 시 helper_pandas.SWR_RETRY_SEC 후 재시도)
+    - Arrow 로 변환할 수 없는 결과는 경고 후 프로세스 내에만 ttl 동안 보관
+
+    Args:
+        ttl: 값이 최신으로 간주되는 시간(초)
+        stale_while_revalidate: 만료된 값을 반환하며 백그라운드 갱신할지 여부
+
+    Returns:
+        Callable: 데코레이터 (wrapper.clear() 제공)
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        namespace = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        lock = threading.Lock()
+        refreshing: set = set()
+        retry_at: Dict[Path, float] = {}
+        fallback: Dict[Path, tuple] = {}
+
+        def _is_fresh(store: SharedFrameStore, path: Path) -> bool:
+            age = store.age(path)
+            return age is not None and age < ttl
+
+        def _compute(store: SharedFrameStore, path: Path, args, kwargs):
+            """계산 후 저장하고, 저장하지 못한 경우에만 결과를 반환합니다."""
+            df = func(*args, **kwargs)
+            if not isinstance(df, pd.DataFrame):
+                raise TypeError(
+                    f"{namespace}: shared 캐시는 DataFrame 반환 함수에만 사용할 수 있습니다."
+                )
+            try:
+                store.write(path, df)
+                return None
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.warning(f"{namespace}: 공유 저장소 저장 실패 ({str(e)})")
+                with lock:
+                    fallback[path] = (time.monotonic() + ttl, df)
+                return df
+
+        def _refresh(store: SharedFrameStore, path: Path, args, kwargs) -> None:
+            try:
+                with store.lock(path, blocking=False) as acquired:
+                    # 다른 프로세스가 갱신 중이거나 이미 갱신했으면 건너뜀
+                    if acquired and not _is_fresh(store, path):
+                        _compute(store, path, args, kwargs)
+            except Exception as e:
+                logger.warning(f"{namespace}: 캐시 갱신 실패, 기존 값 사용 ({str(e)})")
+                with lock:
+                    retry_at[path] = time.monotonic() + helper_pandas.SWR_RETRY_SEC
+            finally:
+                with lock:
+                    refreshing.discard(path)
+
+        def _start_refresh(store: SharedFrameStore, path: Path, args, kwargs) -> None:
+            with lock:
+                if path in refreshing or time.monotonic() < retry_at.get(path, 0):
+                    return
+                refreshing.add(path)
+                retry_at.pop(path, None)
+            threading.Thread(
+                target=_refresh,
+                args=(store, path, args, kwargs),
+                name=f"shared-{func.__name__}",
+                daemon=True,
+            ).start()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            store = get_shared_frame_store()
+            path = store.path(
+                namespace, helper_pandas._swr_key(signature, args, kwargs)
+            )
+            with lock:
+                entry = fallback.get(path)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1].copy()
+
+            age = store.age(path)
+            if age is not None and (age < ttl or stale_while_revalidate):
+                if age >= ttl:
+                    _start_refresh(store, path, args, kwargs)
+                return store.read(path)
+
+            # 최초 조회 / 만료: 호스트 전체에서 한 프로세스만 계산
+            with store.lock(path):
+                if not _is_fresh(store, path):
+                    df = _compute(store, path, args, kwargs)
+                    if df is not None:
+                        return df.copy()
+            return store.read(path)
+
+        def clear():
+            with lock:
+                fallback.clear()
+                retry_at.clear()
+            get_shared_frame_store().clear(namespace)
+
+        wrapper.clear = clear
+        return wrapper
+
+    return decorator
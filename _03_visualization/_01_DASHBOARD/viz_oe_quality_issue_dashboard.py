@@ -7,7 +7,6 @@ from datetime import datetime as dt
 import numpy as np
 import pandas as pd
 import streamlit as st
-from scipy.stats import norm
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
@@ -6,7 +6,6 @@ import sys
 from datetime import datetime as dt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scipy.stats import norm
 import numpy as np
 import os
 
@@ -20,8 +19,13 @@ from _02_preprocessing.GMES.df_rr import (
     get_processed_agg_rr_data,
     get_processed_raw_rr_data,
 )
-from _03_visualization import config_plotly
+from _03_visualization import config_plotly, downsample
+from _03_visualization.figure_cache import cache_figure
 from _05_commons import config
+from _05_commons.helper import lazy_import
+
+# scipy는 PDF 차트를 그릴 때만 로딩
+scipy_stats = lazy_import("scipy.stats")
 
 # 범주-색상 매핑
 cat_color_map = {
@@ -51,6 +55,7 @@ def get_spec_limits(df):
     return usl, lsl, ucl, lcl
 
 
+@cache_figure
 def hbar_expected_pass_rate_by_plant(df):
 
     df = (
@@ -81,6 +86,7 @@ def hbar_expected_pass_rate_by_plant(df):
     return fig
 
 
+@cache_figure
 def histogram_expected_pass_rate_by_plant(df):
     df = df.dropna(subset=["EPass"])
     categories = (
@@ -122,6 +128,7 @@ def histogram_expected_pass_rate_by_plant(df):
     return fig
 
 
+@cache_figure
 def scatter_expected_pass_rate_by_project(df):
     fig = go.Figure()
     for category, color in cat_color_map.items():
@@ -189,12 +196,17 @@ def scatter_expected_pass_rate_by_project(df):
     return fig
 
 
+@cache_figure
 def scatter_rr_trend_individual(df):
+    # 대용량이면 trace 별로 LTTB 다운샘플링
+    new_df = downsample.downsample_trend(df, "SMPL_DATE", "Result_new")
+    old_df = downsample.downsample_trend(df, "SMPL_DATE", "TEST_RESULT_OLD")
+
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=df["SMPL_DATE"],
-            y=df["Result_new"],
+            x=new_df["SMPL_DATE"],
+            y=new_df["Result_new"],
             mode="markers",
             name="Corrected",
             marker=dict(color=config_plotly.ORANGE_CLR),
@@ -202,8 +214,8 @@ def scatter_rr_trend_individual(df):
     )
     fig.add_trace(
         go.Scatter(
-            x=df["SMPL_DATE"],
-            y=df["TEST_RESULT_OLD"],
+            x=old_df["SMPL_DATE"],
+            y=old_df["TEST_RESULT_OLD"],
             mode="markers",
             name="Original",
             marker=dict(color=config_plotly.GRAY_CLR),
@@ -222,15 +234,18 @@ def scatter_rr_trend_individual(df):
     fig.update_layout(
         title="Control Chart", xaxis_title="Sample Date", yaxis_title="Result"
     )
+    downsample.add_downsample_note(fig, len(new_df), len(df))
     return fig
 
 
+@cache_figure
 def box_rr_individual(df):
     usl, lsl, _, _ = get_spec_limits(df)
     fig = go.Figure()
     fig.add_trace(
-        go.Box(
-            y=df["Result_new"],
+        downsample.box_trace(
+            None,
+            df["Result_new"],
             boxpoints="all",
             jitter=0.3,
             pointpos=-1.8,
@@ -255,16 +270,17 @@ def box_rr_individual(df):
     return fig
 
 
+@cache_figure
 def pdf_rr_individual(df):
     usl, lsl, ucl, lcl = get_spec_limits(df)
     mu, sigma = np.mean(df["Result_new"]), np.std(df["Result_new"])
     x = np.linspace(mu - 4 * sigma, mu + 4 * sigma, 100)
-    y = norm.pdf(x, mu, sigma)
+    y = scipy_stats.norm.pdf(x, mu, sigma)
 
     fig = go.Figure()
     fig.add_trace(
-        go.Histogram(
-            x=df["Result_new"],
+        downsample.histogram_trace(
+            df["Result_new"],
             histnorm="probability density",
             opacity=0.6,
             marker=dict(color=config_plotly.LIGHT_GRAY_CLR),
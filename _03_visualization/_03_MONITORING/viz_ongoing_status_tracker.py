@@ -12,7 +12,7 @@ project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file_
 sys.path.append(project_root)
 
 
-from _02_preprocessing.CQMS import df_quality_issue, df_4m_change, df_customer_audit
+from _02_preprocessing.CQMS import df_ongoing_snapshot
 from _03_visualization import config_plotly, helper_plotly
 
 
@@ -115,24 +115,24 @@ def create_bar_chart(df, value_col, title):
 # 품질 이슈 관련 차트 생성 함수들
 def ongoing_qi_pie_by_plant(plants=None):
     """공장별 품질 이슈 현황을 파이 차트로 표시"""
-    df = df_quality_issue.summarize_ongoing_quality_by_plant(plants=plants)
+    df = df_ongoing_snapshot.summarize_snapshot_by_plant("qi", plants=plants)
     return create_pie_chart(
-        df, "count", config_plotly.CHART_TITLES["ongoing_qi"]["pie"]
+        df, "COUNT", config_plotly.CHART_TITLES["ongoing_qi"]["pie"]
     )
 
 
 def ongoing_qi_bar_by_month(plants=None):
     """월별 품질 이슈 현황을 바 차트로 표시"""
-    df = df_quality_issue.summarize_ongoing_quality_by_month(plants=plants)
+    df = df_ongoing_snapshot.summarize_snapshot_by_month("qi", plants=plants)
     return create_bar_chart(
-        df, "count", config_plotly.CHART_TITLES["ongoing_qi"]["bar"]
+        df, "COUNT", config_plotly.CHART_TITLES["ongoing_qi"]["bar"]
     )
 
 
 # 4M 변경 관련 차트 생성 함수들
 def ongoing_4m_pie_by_plant(plants=None):
     """공장별 4M 변경 현황을 파이 차트로 표시"""
-    _, _, df_by_plant, _ = df_4m_change.filtered_4m_ongoing_by_yearly(plants=plants)
+    df_by_plant = df_ongoing_snapshot.summarize_snapshot_by_plant("4m", plants=plants)
     return create_pie_chart(
         df_by_plant, "COUNT", config_plotly.CHART_TITLES["ongoing_4m"]["pie"]
     )
@@ -140,7 +140,7 @@ def ongoing_4m_pie_by_plant(plants=None):
 
 def ongoing_4m_bar_by_month(plants=None):
     """월별 4M 변경 현황을 바 차트로 표시"""
-    _, _, _, df_by_month = df_4m_change.filtered_4m_ongoing_by_yearly(plants=plants)
+    df_by_month = df_ongoing_snapshot.summarize_snapshot_by_month("4m", plants=plants)
     return create_bar_chart(
         df_by_month, "COUNT", config_plotly.CHART_TITLES["ongoing_4m"]["bar"]
     )
@@ -149,7 +149,9 @@ def ongoing_4m_bar_by_month(plants=None):
 # 고객 감사 관련 차트 생성 함수들
 def ongoing_audit_pie_by_plant(plants=None):
     """공장별 고객 감사 현황을 파이 차트로 표시"""
-    _, df_by_plant, _ = df_customer_audit.get_audit_ongoing_df(plants=plants)
+    df_by_plant = df_ongoing_snapshot.summarize_snapshot_by_plant(
+        "audit", plants=plants
+    )
     return create_pie_chart(
         df_by_plant, "COUNT", config_plotly.CHART_TITLES["ongoing_audit"]["pie"]
     )
@@ -157,12 +159,40 @@ def ongoing_audit_pie_by_plant(plants=None):
 
 def ongoing_audit_bar_by_month(plants=None):
     """월별 고객 감사 현황을 바 차트로 표시"""
-    _, _, df_by_month = df_customer_audit.get_audit_ongoing_df(plants=plants)
+    df_by_month = df_ongoing_snapshot.summarize_snapshot_by_month(
+        "audit", plants=plants
+    )
     return create_bar_chart(
         df_by_month, "COUNT", config_plotly.CHART_TITLES["ongoing_audit"]["bar"]
     )
 
 
+# 미결 건수 이력 차트
+def backlog_history_line(plants=None):
+    """일자별 소스별 미결(진행중) 건수 추이를 라인 차트로 표시"""
+    df = df_ongoing_snapshot.load_backlog_history(plants=plants)
+    if df.empty:
+        raise ValueError("미결 이력 데이터가 없습니다.")
+
+    fig = go.Figure()
+    for source, color in zip(df.columns, config_plotly.multi_color_lst):
+        fig.add_trace(
+            go.Scatter(
+                x=df.index,
+                y=df[source],
+                mode="lines+markers",
+                name=config_plotly.CHART_TITLES["backlog_history"]["names"][source],
+                line=dict(color=color),
+                hovertemplate="<b>Date</b>: %{x|%Y-%m-%d}<br><b>Count</b>: %{y}<extra></extra>",
+            )
+        )
+    fig.update_layout(
+        title_text=config_plotly.CHART_TITLES["backlog_history"]["line"],
+        legend=dict(orientation="h", y=1.1),
+    )
+    return fig
+
+
 def main():
     """모든 차트를 생성하고 표시"""
     ongoing_qi_pie_by_plant().show()
@@ -171,6 +201,7 @@ def main():
     ongoing_4m_bar_by_month().show()
     ongoing_audit_pie_by_plant().show()
     ongoing_audit_bar_by_month().show()
+    backlog_history_line().show()
 
 
 if __name__ == "__main__":
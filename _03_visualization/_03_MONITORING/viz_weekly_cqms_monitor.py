@@ -130,6 +130,97 @@ def heatmap_audit_weekly(start_date: pd.Timestamp, end_date: pd.Timestamp) -> go
         return go.Figure()
 
 
+def create_weekly_trend_heatmap(
+    df_counts: pd.DataFrame, status: str, title: str
+) -> go.Figure:
+    """
+    연간 주차별 상태 건수 추이 히트맵을 생성하는 공통 함수입니다.
+
+    Args:
+        df_counts (pd.DataFrame): count_weekly_status 결과 (WEEK_START, PLANT, STATUS, COUNT)
+        status (str): 표시할 상태 (Open, Open & Close, Close, On-going)
+        title (str): 히트맵 제목
+
+    Returns:
+        go.Figure: 생성된 히트맵 figure 객체
+    """
+    try:
+        df = df_counts[df_counts["STATUS"] == status].pivot_table(
+            index="PLANT",
+            columns="WEEK_START",
+            values="COUNT",
+            aggfunc="sum",
+            fill_value=0,
+            observed=False,
+        )
+        week_labels = [week.strftime("%Y-%m-%d") for week in df.columns]
+
+        fig = go.Figure()
+        fig.add_trace(
+            go.Heatmap(
+                x=week_labels,
+                y=df.index.astype(str),
+                z=df.values,
+                colorscale=[[0, config_plotly.GRAY_CLR], [1, config_plotly.ORANGE_CLR]],
+                colorbar=dict(title="Count"),
+                hovertemplate="""<b>Week</b>: %{x}<br><b>PLANT</b>: %{y}<br><b>Count</b>: %{z}<extra></extra>""",
+            )
+        )
+
+        fig.update_layout(
+            margin=dict(t=80, b=50, l=25, r=25),
+            title_text=title,
+            xaxis=dict(type="category", tickangle=-45),
+            yaxis=dict(autorange="reversed"),
+        )
+
+        return fig
+
+    except Exception as e:
+        print(f"주간 추이 히트맵 생성 중 오류 발생: {str(e)}")
+        return go.Figure()
+
+
+def heatmap_qi_yearly_trend(year: int, status: str) -> go.Figure:
+    """
+    품질 이슈의 연간 주차별 상태 건수 히트맵을 생성합니다.
+
+    Args:
+        year (int): 조회 연도
+        status (str): 표시할 상태
+
+    Returns:
+        go.Figure: 품질 이슈 주간 추이 히트맵 figure 객체
+    """
+    try:
+        df_counts = df_quality_issue.weekly_status_counts_qi(year)
+        title = f"Weekly Quality Issue Trend ({status}, {year})"
+        return create_weekly_trend_heatmap(df_counts, status, title)
+    except Exception as e:
+        print(f"품질 이슈 주간 추이 히트맵 생성 중 오류 발생: {str(e)}")
+        return go.Figure()
+
+
+def heatmap_4m_yearly_trend(year: int, status: str) -> go.Figure:
+    """
+    4M 변경의 연간 주차별 상태 건수 히트맵을 생성합니다.
+
+    Args:
+        year (int): 조회 연도
+        status (str): 표시할 상태
+
+    Returns:
+        go.Figure: 4M 변경 주간 추이 히트맵 figure 객체
+    """
+    try:
+        df_counts = df_4m_change.weekly_status_counts_4m(year)
+        title = f"Weekly 4M Change Trend ({status}, {year})"
+        return create_weekly_trend_heatmap(df_counts, status, title)
+    except Exception as e:
+        print(f"4M 변경 주간 추이 히트맵 생성 중 오류 발생: {str(e)}")
+        return go.Figure()
+
+
 def main():
     """테스트 실행 함수"""
     today = config.today
@@ -26,11 +26,13 @@ project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file_
 sys.path.append(project_root)
 
 from _03_visualization import config_plotly
+from _03_visualization.figure_cache import cache_figure
 
 if config.DEV_MODE:
     import importlib
 
 
+@cache_figure
 def plot_global_ncf_monthly(df, prev_df, current_year, prev_year):
     """전체 공장의 월별 FM 부적합 수량을 선 그래프로 시각화합니다.
 
@@ -103,6 +105,7 @@ def plot_global_ncf_monthly(df, prev_df, current_year, prev_year):
     return fig
 
 
+@cache_figure
 def plot_global_ncf_ppm_monthly(df, prev_df, current_year, prev_year):
     """전체 공장의 월별 FM 부적합 PPM을 선 그래프로 시각화합니다.
 
@@ -178,6 +181,7 @@ def plot_global_ncf_ppm_monthly(df, prev_df, current_year, prev_year):
     return fig
 
 
+@cache_figure
 def plot_fm_ncf_qty_by_plant(df):
     """공장별 FM 부적합 수량을 막대 그래프로 시각화합니다.
 
@@ -228,6 +232,7 @@ def plot_fm_ncf_qty_by_plant(df):
     return fig
 
 
+@cache_figure
 def plot_fm_ppm_by_plant(df, prev_df=None):
     """공장별 FM 부적합 PPM(Parts Per Million)을 막대 그래프로 시각화합니다.
 
@@ -305,6 +310,7 @@ def plot_fm_ppm_by_plant(df, prev_df=None):
     return fig
 
 
+@cache_figure
 def plot_monthly_fm_ppm_for_plant(df, plant, prev_df=None):
     """특정 공장의 월별 FM 부적합 PPM 추이를 선 그래프로 시각화합니다.
 
@@ -391,6 +397,7 @@ def plot_monthly_fm_ppm_for_plant(df, plant, prev_df=None):
     return fig
 
 
+@cache_figure
 def plot_fm_ncf_by_defect_type_for_plant(df, plant, show_all_defects=False):
     """특정 공장의 불량 유형별 FM 부적합 현황을 파레토 차트로 시각화합니다.
 
@@ -17,13 +17,15 @@ Plotly Graph Objects를 사용하여 인터랙티브한 차트를 생성합니
 """
 
 import plotly.graph_objects as go
-from _03_visualization import config_plotly
+from _03_visualization import config_plotly, downsample
+from _03_visualization.figure_cache import cache_figure
 from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
 
 
 # 생산량
+@cache_figure
 def draw_barplot_production(df):
     """
     생산량 월별 바 차트를 생성합니다.
@@ -63,6 +65,7 @@ def draw_barplot_production(df):
 
 
 # 부적합
+@cache_figure
 def draw_barplot_ncf(df):
     """
     NCF (부적합) 월별 바 차트를 생성합니다.
@@ -96,6 +99,7 @@ def draw_barplot_ncf(df):
     return fig
 
 
+@cache_figure
 def draw_barplot_ncf_pareto(df):
     """
     NCF 부적합코드별 파레토 차트를 생성합니다.
@@ -150,6 +154,7 @@ def draw_barplot_ncf_pareto(df):
 
 
 # UF
+@cache_figure
 def draw_barplot_uf(df):
     """
     UF (Uniformity) 월별 합격률 차트를 생성합니다.
@@ -236,6 +241,7 @@ def draw_barplot_uf(df):
     return fig
 
 
+@cache_figure
 def draw_barplot_uf_individual(df_raw, df_standard):
     """
     UF 개별 항목별 히스토그램을 생성합니다.
@@ -260,6 +266,7 @@ def draw_barplot_uf_individual(df_raw, df_standard):
         - RFV, LFV: 오렌지색 히스토그램
         - CON: 음수값을 양수로 변환하여 빨간색 히스토그램
         - HAR: 오렌지색 히스토그램
+        - 샘플이 많으면 NumPy 로 미리 집계한 막대로 전송
     """
     rfv_std = df_standard["RFV_STD"].values[0]
     lfv_std = df_standard["LFV_STD"].values[0]
@@ -281,8 +288,8 @@ def draw_barplot_uf_individual(df_raw, df_standard):
 
     # RFV 히스토그램 추가
     fig.add_trace(
-        go.Histogram(
-            x=df_raw["RFV"],
+        downsample.histogram_trace(
+            df_raw["RFV"],
             marker=dict(color=config_plotly.ORANGE_CLR),
             name="RFV",
         ),
@@ -292,8 +299,8 @@ def draw_barplot_uf_individual(df_raw, df_standard):
 
     # LFV 히스토그램 추가
     fig.add_trace(
-        go.Histogram(
-            x=df_raw["LFV"],
+        downsample.histogram_trace(
+            df_raw["LFV"],
             marker=dict(color=config_plotly.ORANGE_CLR),
             name="LFV",
         ),
@@ -303,8 +310,8 @@ def draw_barplot_uf_individual(df_raw, df_standard):
 
     # CON 히스토그램 추가
     fig.add_trace(
-        go.Histogram(
-            x=negative_con["CON"],
+        downsample.histogram_trace(
+            negative_con["CON"],
             marker=dict(color=config_plotly.NEGATIVE_CLR, opacity=0.5),
             name="CON",
         ),
@@ -312,8 +319,8 @@ def draw_barplot_uf_individual(df_raw, df_standard):
         col=1,
     )
     fig.add_trace(
-        go.Histogram(
-            x=positive_con["CON"],
+        downsample.histogram_trace(
+            positive_con["CON"],
             marker=dict(color=config_plotly.POSITIVE_CLR, opacity=0.5),
             name="CON",
         ),
@@ -323,8 +330,8 @@ def draw_barplot_uf_individual(df_raw, df_standard):
 
     # HAR 히스토그램 추가
     fig.add_trace(
-        go.Histogram(
-            x=df_raw["HAR"],
+        downsample.histogram_trace(
+            df_raw["HAR"],
             marker=dict(color=config_plotly.ORANGE_CLR),
             name="HAR",
         ),
@@ -421,6 +428,7 @@ def draw_barplot_uf_individual(df_raw, df_standard):
 
 
 # weight
+@cache_figure
 def draw_weight_distribution(df):
     """
     중량 합격률 월별 차트를 생성합니다.
@@ -502,6 +510,7 @@ def draw_weight_distribution(df):
     return fig
 
 
+@cache_figure
 def draw_weight_distribution_individual(df, wt_spec):
     """
     개별 중량 분포 박스플롯을 생성합니다.
@@ -520,13 +529,14 @@ def draw_weight_distribution_individual(df, wt_spec):
         - 평균값 표시
         - 아웃라이어 제거된 데이터 사용
         - 표준 중량값 수평선 표시
+        - 샘플이 많으면 월별 사분위수 등 통계값만 전송
     """
     fig = go.Figure()
 
     # 박스플롯 생성
-    trace = go.Box(
-        x=df["INS_DATE_YM"],
-        y=df["MRM_WGT"],
+    trace = downsample.box_trace(
+        df["INS_DATE_YM"],
+        df["MRM_WGT"],
         name="Weight Distribution",
         marker=dict(color=config_plotly.ORANGE_CLR, opacity=0.5),
         boxmean=True,  # 평균값 표시
@@ -552,6 +562,131 @@ def draw_weight_distribution_individual(df, wt_spec):
     return fig
 
 
+@cache_figure
+def draw_weight_summary_box(summary_df):
+    """
+    공장 / 월별 중량 통계값으로 박스플롯을 생성합니다. (개별 측정값 불필요)
+    개별 측정값 박스플롯(draw_weight_distribution_individual)과 같이
+    IQR 1.5배 울타리 밖 측정값을 제외한 BOX_* 통계를 사용합니다.
+
+    Args:
+        summary_df (pd.DataFrame): df_weight.get_weight_summary_df 결과
+            - PLANT: 공장 코드 (str)
+            - INS_DATE_YM: 검사 년월 (str)
+            - BOX_MIN / BOX_Q1 / BOX_MEDIAN / BOX_Q3 / BOX_MAX / BOX_MEAN:
+              아웃라이어 제외 중량 통계값 (float)
+            - STD_WGT: 표준 중량 (float)
+
+    Returns:
+        go.Figure: 중량 분포 박스플롯
+
+    시각화 특징:
+        - 공장별 월별 박스플롯 (공장이 여러 곳이면 그룹 표시)
+        - 아웃라이어 제거된 통계값 사용
+        - 수염은 사분위 범위(IQR) 1.5배 울타리와 최소 / 최대값 중 안쪽 값
+        - 평균값 표시
+        - 최근 표준 중량값 수평선 표시
+    """
+    plants = summary_df["PLANT"].unique()
+    traces = []
+    for plant in plants:
+        df = summary_df[summary_df["PLANT"] == plant]
+        iqr = df["BOX_Q3"] - df["BOX_Q1"]
+        traces.append(
+            go.Box(
+                x=df["INS_DATE_YM"],
+                q1=df["BOX_Q1"],
+                median=df["BOX_MEDIAN"],
+                q3=df["BOX_Q3"],
+                lowerfence=np.maximum(df["BOX_MIN"], df["BOX_Q1"] - 1.5 * iqr),
+                upperfence=np.minimum(df["BOX_MAX"], df["BOX_Q3"] + 1.5 * iqr),
+                mean=df["BOX_MEAN"],
+                name=plant,
+                marker=dict(color=config_plotly.ORANGE_CLR, opacity=0.5),
+                boxpoints=False,
+            )
+        )
+
+    layout = go.Layout(
+        title="Monthly Weight Distribution (Outliers Removed)",
+        xaxis_title="Month",
+        yaxis_title="Weight",
+        boxmode="group",
+        showlegend=len(plants) > 1,
+    )
+    fig = go.Figure(traces, layout)
+    fig.update_xaxes(type="category", categoryorder="category ascending")
+    if not summary_df.empty:
+        fig.add_hline(
+            y=summary_df["STD_WGT"].iloc[-1],
+            line=dict(color=config_plotly.GRAY_CLR, width=1, dash="dash"),
+        )
+    return fig
+
+
+@cache_figure
+def draw_weight_histogram(histogram_df, summary_df):
+    """
+    표준 중량 대비 편차(%) 구간별 건수 히스토그램을 생성합니다.
+
+    Args:
+        histogram_df (pd.DataFrame): df_weight.get_weight_histogram_df 결과
+            - BIN_START_PCT / BIN_END_PCT: 구간 시작 / 끝 편차 % (float)
+            - WT_QTY: 구간 측정 수량 (int/float)
+            - WT_PASS_QTY: 구간 합격 수량 (int/float)
+        summary_df (pd.DataFrame): df_weight.get_weight_summary_df 결과
+            - UPM_PCT / LWM_PCT: 상한 / 하한 규격 편차 % (float)
+            - WT_INS_QTY: 검사 수량 (int/float)
+
+    Returns:
+        go.Figure: 중량 편차 히스토그램
+
+    시각화 특징:
+        - 조회 기간 전체를 합친 구간별 합격 / 불합격 누적 막대
+        - 표준 중량(0%) 및 상한 / 하한 규격(검사 수량 가중 평균) 수직선 표시
+    """
+    bins = histogram_df.groupby(["BIN_START_PCT", "BIN_END_PCT"], as_index=False)[
+        ["WT_QTY", "WT_PASS_QTY"]
+    ].sum()
+    bins["WT_FAIL_QTY"] = bins["WT_QTY"] - bins["WT_PASS_QTY"]
+    width = bins["BIN_END_PCT"] - bins["BIN_START_PCT"]
+
+    traces = [
+        go.Bar(
+            x=bins["BIN_START_PCT"],
+            y=bins[col],
+            width=width,
+            offset=0,
+            name=name,
+            marker=dict(color=color),
+        )
+        for col, name, color in [
+            ("WT_PASS_QTY", "PASS", config_plotly.ORANGE_CLR),
+            ("WT_FAIL_QTY", "FAIL", config_plotly.GRAY_CLR),
+        ]
+    ]
+    layout = go.Layout(
+        title="Weight Deviation from Standard",
+        xaxis_title="Deviation (%)",
+        yaxis_title="Count",
+        barmode="stack",
+        legend=dict(orientation="h", y=1, yanchor="top"),
+    )
+    fig = go.Figure(traces, layout)
+
+    fig.add_vline(x=0, line=dict(color=config_plotly.GRAY_CLR, width=1, dash="dash"))
+    if not summary_df.empty:
+        weights = summary_df["WT_INS_QTY"]
+        for col in ["UPM_PCT", "LWM_PCT"]:
+            spec_pct = np.average(summary_df[col], weights=weights)
+            fig.add_vline(
+                x=spec_pct,
+                line=dict(color=config_plotly.NEGATIVE_CLR, width=1, dash="dot"),
+            )
+    return fig
+
+
+@cache_figure
 def draw_rr_trend(rr_raw_df, rr_standard_df):
     """
     RR (Reliability) 트렌드 차트를 생성합니다.
@@ -571,16 +706,18 @@ def draw_rr_trend(rr_raw_df, rr_standard_df):
         - 산점도 형태의 트렌드 차트
         - 최대/최소 허용값 수평선 표시
         - Y축 범위는 표준값 기준으로 설정
+        - 샘플이 많으면 LTTB 로 다운샘플링하고 표시 점 개수 안내
     """
     # 표준값 추출
     spec_max = rr_standard_df["SPEC_MAX"].values[0]
     spec_min = rr_standard_df["SPEC_MIN"].values[0]
 
-    # RR 트렌드 산점도
+    # RR 트렌드 산점도 (대용량이면 LTTB 다운샘플링)
+    plot_df = downsample.downsample_trend(rr_raw_df, "SMPL_DATE", "Result_new")
     trace = go.Scatter(
-        x=rr_raw_df["SMPL_DATE"],
-        y=rr_raw_df["Result_new"],
-        text=rr_raw_df["Result_new"],
+        x=plot_df["SMPL_DATE"],
+        y=plot_df["Result_new"],
+        text=plot_df["Result_new"],
         marker=dict(color=config_plotly.ORANGE_CLR, size=10),
         texttemplate="%{text:.2f}",
         mode="markers",
@@ -615,9 +752,11 @@ def draw_rr_trend(rr_raw_df, rr_standard_df):
             line_dash="dot",
             line_color=config_plotly.NEGATIVE_CLR,
         )
+    downsample.add_downsample_note(fig, len(plot_df), len(rr_raw_df))
     return fig
 
 
+@cache_figure
 def draw_rr_distribution(rr_df, rr_standard_df):
     """
     RR (Reliability) 정규분포 차트를 생성합니다.
@@ -694,6 +833,7 @@ def draw_rr_distribution(rr_df, rr_standard_df):
 
 
 # CTL
+@cache_figure
 def draw_ctl_trend(df):
     """
     CTL (Control) 합격률 트렌드 차트를 생성합니다.
@@ -729,6 +869,7 @@ def draw_ctl_trend(df):
     return fig
 
 
+@cache_figure
 def draw_ctl_detail(df):
     """
     CTL (Control) 상세 분석 차트를 생성합니다.
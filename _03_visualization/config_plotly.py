@@ -102,4 +102,22 @@ CHART_TITLES = {
     "ongoing_qi": {"pie": "Opening status by plant", "bar": "Monthly openings"},
     "ongoing_4m": {"pie": "Opening status by plant", "bar": "Monthly openings"},
     "ongoing_audit": {"pie": "Opening status by plant", "bar": "Monthly openings"},
+    "backlog_history": {
+        "line": "Daily on-going backlog",
+        "names": {"qi": "Quality Issue", "4m": "4M Change", "audit": "OE Audit"},
+    },
 }
+
+## Figure Cache Settings
+# 캐시에 보관할 figure JSON 최대 개수 (LRU)
+FIGURE_CACHE_MAX_ENTRIES = 64
+# 이 점 개수를 넘는 Scatter trace 는 WebGL(Scattergl)로 전환
+SCATTERGL_POINT_THRESHOLD = 5_000
+
+## Downsampling Settings
+# 개별 샘플 차트에서 이 개수를 넘으면 서버에서 다운샘플링
+DOWNSAMPLE_POINT_THRESHOLD = 5_000
+# 추이 차트 LTTB 다운샘플링 후 점 개수
+LTTB_TARGET_POINTS = 2_000
+# 사전 집계 히스토그램 최대 구간 수
+HISTOGRAM_MAX_BINS = 100
@@ -0,0 +1,291 @@
+"""
+대용량 개별 샘플 차트 다운샘플링 모듈
+
+M-Code 별 개별 샘플(RR / 중량 / UF)이 수십만 건이면 모든 점이 그대로 브라우저로
+전송되어 웹소켓 페이로드가 커지고 화면이 느려집니다. 이 모듈은 시각화 함수가
+점 개수가 config_plotly.DOWNSAMPLE_POINT_THRESHOLD 를 넘을 때 자동으로 호출하는
+서버측 다운샘플링 함수를 제공합니다. 기준 이하의 데이터는 그대로 사용합니다.
+
+주요 기능:
+- 추이 차트: LTTB(Largest-Triangle-Three-Buckets) 로 모양을 유지하며 점 수 축소
+- 히스토그램: NumPy 로 구간별 건수를 미리 집계하여 막대(Bar)로 전송
+- 박스플롯: 그룹별 사분위수 / 울타리 / 평균을 미리 계산하여 통계값만 전송
+
+원본 전체 데이터는 각 페이지의 CSV 다운로드 버튼으로 그대로 제공합니다.
+
+사용 예시:
+>>> plot_df = downsample.downsample_trend(rr_raw_df, "SMPL_DATE", "Result_new")
+>>> fig.add_trace(downsample.histogram_trace(df_raw["RFV"], name="RFV"))
+>>> fig.add_trace(downsample.box_trace(df["INS_DATE_YM"], df["MRM_WGT"]))
+>>> downsample.add_downsample_note(fig, len(plot_df), len(rr_raw_df))
+"""
+
+import sys
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _03_visualization import config_plotly
+
+
+def _numeric_axis(values: pd.Series) -> np.ndarray:
+    """
+    x 축 값을 LTTB 면적 계산용 float 배열로 변환합니다.
+
+    Args:
+        values (pd.Series): 숫자 / 날짜 / 날짜 문자열 값
+
+    Returns:
+        np.ndarray: float 배열 (변환할 수 없는 값은 NaN)
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    dates = pd.to_datetime(values, errors="coerce")
+    numeric = dates.to_numpy(dtype="datetime64[ns]").astype("int64").astype(float)
+    numeric[dates.isna().to_numpy()] = np.nan
+    return numeric
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    LTTB 알고리즘으로 선택할 점의 위치를 계산합니다.
+
+    첫 점과 마지막 점은 항상 유지하고, 나머지 구간(bucket)마다 이전 선택점과
+    다음 구간 평균점이 이루는 삼각형의 면적이 가장 큰 점 하나를 선택합니다.
+
+    Args:
+        x (np.ndarray): 오름차순 정렬된 x 값 (NaN 없음)
+        y (np.ndarray): y 값 (NaN 없음)
+        n_out (int): 선택할 점 개수
+
+    Returns:
+        np.ndarray: 선택된 점의 위치 (오름차순)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 첫 점 / 마지막 점을 제외한 구간 경계
+    edges = (np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(int) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[prev] - next_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (next_y - y[prev])
+        )
+        prev = start + int(area.argmax())
+        selected[i + 1] = prev
+    return selected
+
+
+def downsample_trend(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    n_out: Optional[int] = None,
+    threshold: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    추이(산점도) 차트용 데이터를 LTTB 로 다운샘플링합니다.
+
+    Args:
+        df (pd.DataFrame): 개별 샘플 데이터프레임
+        x_col (str): x 축 컬럼 (날짜 / 숫자)
+        y_col (str): y 축 컬럼
+        n_out (Optional[int]): 다운샘플링 후 점 개수 (기본값: LTTB_TARGET_POINTS)
+        threshold (Optional[int]): 다운샘플링 기준 행 수
+            (기본값: DOWNSAMPLE_POINT_THRESHOLD)
+
+    Returns:
+        pd.DataFrame: 기준 이하이면 원본, 초과하면 선택된 행만 x 순서로 정렬한 데이터
+    """
+    n_out = n_out or config_plotly.LTTB_TARGET_POINTS
+    threshold = threshold or config_plotly.DOWNSAMPLE_POINT_THRESHOLD
+    if len(df) <= threshold:
+        return df
+
+    x = _numeric_axis(df[x_col])
+    y = pd.to_numeric(df[y_col], errors="coerce").to_numpy(dtype=float)
+    # 그려지지 않는 결측값을 제외하고 x 기준 정렬
+    valid = np.flatnonzero(~np.isnan(x) & ~np.isnan(y))
+    order = valid[np.argsort(x[valid], kind="stable")]
+    picked = lttb_indices(x[order], y[order], n_out)
+    return df.iloc[order[picked]]
+
+
+def histogram_bins(
+    values: pd.Series, max_bins: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    히스토그램 구간별 건수를 계산합니다.
+
+    Args:
+        values (pd.Series): 측정값
+        max_bins (Optional[int]): 최대 구간 수 (기본값: HISTOGRAM_MAX_BINS)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (구간별 건수, 구간 경계)
+    """
+    max_bins = max_bins or config_plotly.HISTOGRAM_MAX_BINS
+    data = pd.to_numeric(values, errors="coerce").dropna().to_numpy(dtype=float)
+    if len(data) == 0:
+        return np.zeros(0, dtype=int), np.zeros(1)
+    edges = np.histogram_bin_edges(data, bins="auto")
+    if len(edges) - 1 > max_bins:
+        edges = np.histogram_bin_edges(data, bins=max_bins)
+    counts, edges = np.histogram(data, bins=edges)
+    return counts, edges
+
+
+def histogram_trace(
+    values: pd.Series,
+    histnorm: Optional[str] = None,
+    threshold: Optional[int] = None,
+    **trace_kwargs,
+):
+    """
+    히스토그램 trace 를 생성합니다. 기준을 넘으면 미리 집계한 막대로 대체합니다.
+
+    Args:
+        values (pd.Series): 측정값
+        histnorm (Optional[str]): None 또는 "probability density"
+        threshold (Optional[int]): 사전 집계 기준 행 수
+            (기본값: DOWNSAMPLE_POINT_THRESHOLD)
+        **trace_kwargs: name / marker 등 trace 공통 속성
+
+    Returns:
+        go.Histogram | go.Bar: 기준 이하이면 go.Histogram, 초과하면 go.Bar
+    """
+    threshold = threshold or config_plotly.DOWNSAMPLE_POINT_THRESHOLD
+    if len(values) <= threshold:
+        return go.Histogram(x=values, histnorm=histnorm, **trace_kwargs)
+
+    counts, edges = histogram_bins(values)
+    widths = np.diff(edges)
+    heights = counts.astype(float)
+    if histnorm == "probability density":
+        heights = heights / max(counts.sum(), 1) / widths
+    # offset 을 지정하면 group 모드에서도 구간 시작점부터 겹쳐 그려짐
+    return go.Bar(
+        x=edges[:-1],
+        y=heights,
+        width=widths,
+        offset=0,
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate="%{customdata[0]:.3g} ~ %{customdata[1]:.3g}: %{y}<extra></extra>",
+        **trace_kwargs,
+    )
+
+
+def box_stats(x: pd.Series, y: pd.Series) -> pd.DataFrame:
+    """
+    그룹(x)별 박스플롯 통계값을 계산합니다.
+
+    울타리(fence)는 plotly 와 같이 사분위 범위(IQR) 1.5배 이내의
+    가장 바깥쪽 샘플값을 사용합니다.
+
+    Args:
+        x (pd.Series): 그룹 값
+        y (pd.Series): 측정값
+
+    Returns:
+        pd.DataFrame: x, q1, median, q3, lowerfence, upperfence, mean 컬럼
+    """
+    data = pd.DataFrame({"x": x.to_numpy(), "y": pd.to_numeric(y, errors="coerce")})
+    data = data.dropna(subset=["y"])
+    grouped = data.groupby("x", sort=True)["y"]
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["q1", "median", "q3"]
+    stats["mean"] = grouped.mean()
+
+    iqr = stats["q3"] - stats["q1"]
+    lower = data["x"].map(stats["q1"] - 1.5 * iqr)
+    upper = data["x"].map(stats["q3"] + 1.5 * iqr)
+    inside = data[(data["y"] >= lower) & (data["y"] <= upper)]
+    stats["lowerfence"] = inside.groupby("x")["y"].min()
+    stats["upperfence"] = inside.groupby("x")["y"].max()
+    return stats.reset_index()
+
+
+def box_trace(
+    x: Optional[pd.Series],
+    y: pd.Series,
+    threshold: Optional[int] = None,
+    **trace_kwargs,
+) -> go.Box:
+    """
+    박스플롯 trace 를 생성합니다. 기준을 넘으면 통계값만 전송합니다.
+
+    Args:
+        x (Optional[pd.Series]): 그룹 값 (None 이면 박스 하나)
+        y (pd.Series): 측정값
+        threshold (Optional[int]): 사전 계산 기준 행 수
+            (기본값: DOWNSAMPLE_POINT_THRESHOLD)
+        **trace_kwargs: name / marker / boxmean 등 trace 공통 속성
+
+    Returns:
+        go.Box: 원본 샘플 또는 q1 / median / q3 시그니처의 박스플롯
+    """
+    threshold = threshold or config_plotly.DOWNSAMPLE_POINT_THRESHOLD
+    if len(y) <= threshold:
+        return go.Box(x=x, y=y, **trace_kwargs)
+
+    if x is None:
+        stats = box_stats(pd.Series(np.zeros(len(y))), y)
+    else:
+        stats = box_stats(x, y)
+        trace_kwargs["x"] = stats["x"]
+    trace_kwargs["boxpoints"] = False
+    return go.Box(
+        q1=stats["q1"],
+        median=stats["median"],
+        q3=stats["q3"],
+        lowerfence=stats["lowerfence"],
+        upperfence=stats["upperfence"],
+        mean=stats["mean"],
+        **trace_kwargs,
+    )
+
+
+def add_downsample_note(fig: go.Figure, shown: int, total: int) -> go.Figure:
+    """
+    다운샘플링된 경우 차트 우측 상단에 표시 점 개수를 안내합니다.
+
+    Args:
+        fig (go.Figure): 대상 figure
+        shown (int): 화면에 표시한 점 개수
+        total (int): 원본 점 개수
+
+    Returns:
+        go.Figure: 안내 문구가 추가된 figure
+    """
+    if shown < total:
+        fig.add_annotation(
+            text=f"Showing {shown:,} of {total:,} points (full data: Download CSV)",
+            xref="paper",
+            yref="paper",
+            x=1,
+            y=1.08,
+            xanchor="right",
+            showarrow=False,
+            font=dict(size=10, color=config_plotly.GRAY_CLR),
+        )
+    return fig
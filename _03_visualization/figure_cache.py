@@ -0,0 +1,229 @@
+"""
+Plotly figure 캐시 모듈
+
+Streamlit 은 위젯을 조작할 때마다 페이지 스크립트를 처음부터 다시 실행하므로,
+입력 데이터가 그대로여도 시각화 함수가 go.Figure 를 매번 새로 구성합니다.
+이 모듈의 cache_figure 데코레이터는 입력 인자(DataFrame 내용 포함)의 해시를
+키로 하여 완성된 figure 를 JSON 문자열로 보관하고, 같은 입력으로 다시 호출되면
+figure 구성 과정을 건너뛰고 JSON 에서 검증 없이(_validate=False) 복원합니다.
+
+주요 기능:
+- 입력 내용 기반 캐시 키 (DataFrame / Series / ndarray / 컨테이너 / 스칼라)
+- 프로세스 공유 LRU 캐시 (config_plotly.FIGURE_CACHE_MAX_ENTRIES)
+- 점 개수가 많은 Scatter trace 의 Scattergl(WebGL) 자동 전환
+
+사용 예시:
+>>> from _03_visualization.figure_cache import cache_figure
+>>> @cache_figure
+... def draw_rr_trend(rr_raw_df, rr_standard_df):
+...     ...
+>>> figure_cache.cache_info()
+{'hits': 3, 'misses': 1, 'entries': 1, 'max_entries': 64}
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import sys
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _03_visualization import config_plotly
+
+# 캐시 키 -> figure JSON 문자열
+_cache: "OrderedDict[str, str]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _hash_pandas(value) -> bytes:
+    """DataFrame / Series 의 행 해시를 바이트로 반환합니다."""
+    try:
+        hashed = pd.util.hash_pandas_object(value, index=True)
+    except TypeError:
+        # list 등 해시 불가능한 셀이 있으면 문자열로 변환 후 해시
+        hashed = pd.util.hash_pandas_object(value.astype(str), index=True)
+    return hashed.values.tobytes()
+
+
+def _update_digest(digest, value: Any) -> None:
+    """
+    값의 내용을 해시 객체에 누적합니다.
+
+    Args:
+        digest: hashlib 해시 객체
+        value (Any): 해시할 값
+    """
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"DataFrame")
+        digest.update(repr(list(value.columns)).encode())
+        digest.update(repr(list(value.dtypes.astype(str))).encode())
+        digest.update(_hash_pandas(value))
+    elif isinstance(value, pd.Series):
+        digest.update(b"Series")
+        digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(_hash_pandas(value))
+    elif isinstance(value, np.ndarray):
+        digest.update(b"ndarray")
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        digest.update(type(value).__name__.encode())
+        items = (
+            sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        )
+        for item in items:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+    # 구분자 (인접한 값의 경계가 섞이지 않도록)
+    digest.update(b"\x00")
+
+
+def make_figure_key(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    시각화 함수와 입력 인자로 캐시 키를 생성합니다.
+
+    Args:
+        func (Callable): 시각화 함수
+        args (tuple): 위치 인자
+        kwargs (Dict[str, Any]): 키워드 인자
+
+    Returns:
+        str: 입력 내용이 같으면 항상 같은 해시 문자열
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    _update_digest(digest, args)
+    _update_digest(digest, kwargs)
+    return digest.hexdigest()
+
+
+def _array_length(value: Any) -> int:
+    """
+    figure JSON 의 배열 길이를 반환합니다.
+
+    plotly 6 은 숫자 배열을 {"dtype", "bdata"(base64)} 형태로 직렬화하므로
+    디코딩된 바이트 수를 dtype 크기로 나누어 계산합니다.
+    """
+    if isinstance(value, dict) and "bdata" in value:
+        return (
+            len(base64.b64decode(value["bdata"])) // np.dtype(value["dtype"]).itemsize
+        )
+    return len(value or ())
+
+
+def _trace_points(trace: Dict[str, Any]) -> int:
+    """trace 의 x / y 중 긴 쪽의 점 개수를 반환합니다."""
+    return max(_array_length(trace.get("x")), _array_length(trace.get("y")))
+
+
+def to_scattergl(spec: Dict[str, Any], threshold: int) -> Dict[str, Any]:
+    """
+    점 개수가 threshold 를 넘는 Scatter trace 를 Scattergl 로 전환합니다.
+
+    Args:
+        spec (Dict[str, Any]): figure 딕셔너리 (data / layout)
+        threshold (int): 전환 기준 점 개수
+
+    Returns:
+        Dict[str, Any]: trace type 이 변경된 figure 딕셔너리 (원본을 직접 수정)
+    """
+    for trace in spec.get("data", []):
+        if trace.get("type") == "scatter" and _trace_points(trace) > threshold:
+            trace["type"] = "scattergl"
+    return spec
+
+
+def _serialize(fig: go.Figure) -> str:
+    """figure 를 Scattergl 전환이 적용된 JSON 문자열로 직렬화합니다."""
+    spec = json.loads(fig.to_json())
+    to_scattergl(spec, config_plotly.SCATTERGL_POINT_THRESHOLD)
+    return json.dumps(spec, separators=(",", ":"))
+
+
+def _deserialize(spec: str) -> go.Figure:
+    """JSON 문자열에서 검증 없이 figure 를 복원합니다."""
+    return go.Figure(json.loads(spec), _validate=False)
+
+
+def cache_figure(func: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    go.Figure 를 반환하는 시각화 함수의 결과를 입력 내용 기준으로 캐시합니다.
+
+    반환되는 figure 는 호출마다 새로 복원한 객체이므로 호출 측에서
+    update_layout 등으로 수정해도 캐시에는 영향이 없습니다.
+    figure 가 아닌 값을 반환하면 캐시하지 않고 그대로 반환합니다.
+
+    Args:
+        func (Callable[..., go.Figure]): 시각화 함수
+
+    Returns:
+        Callable[..., go.Figure]: 캐시가 적용된 함수
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = make_figure_key(func, args, kwargs)
+        with _lock:
+            spec = _cache.get(key)
+            if spec is not None:
+                _cache.move_to_end(key)
+                _stats["hits"] += 1
+        if spec is not None:
+            return _deserialize(spec)
+
+        fig = func(*args, **kwargs)
+        if not isinstance(fig, go.Figure):
+            return fig
+        spec = _serialize(fig)
+        with _lock:
+            _stats["misses"] += 1
+            _cache[key] = spec
+            _cache.move_to_end(key)
+            while len(_cache) > config_plotly.FIGURE_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+        return _deserialize(spec)
+
+    return wrapper
+
+
+def clear_figure_cache() -> None:
+    """figure 캐시와 적중 통계를 초기화합니다."""
+    with _lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    figure 캐시 현황을 반환합니다.
+
+    Returns:
+        Dict[str, int]: 적중 / 미적중 횟수, 현재 / 최대 항목 수
+    """
+    with _lock:
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "entries": len(_cache),
+            "max_entries": config_plotly.FIGURE_CACHE_MAX_ENTRIES,
+        }
@@ -273,7 +273,7 @@ def render_plant_tab(data, selected_year):
         st.subheader("Projects")
         sub_cols = st.columns(2)
 
-        df_plt_projects = data["oeapp"][data["oeapp"]["plant"] == selected_plt]
+        df_plt_projects = df_oeapp.load_oeapp_df_by_plant(selected_plt)
 
         # 데이터가 없는 경우 0으로 처리
         mass_prod_count = (
@@ -169,7 +169,18 @@ with tabs[1]:
             fig = viz_rr_analysis.pdf_rr_individual(df_raw_rr)
             st.plotly_chart(fig)
 
-        st.subheader("Raw Data")
+        raw_title_col = st.columns([8, 1])
+        raw_title_col[0].subheader("Raw Data")
+        # 차트는 다운샘플링될 수 있으므로 전체 원본 데이터는 CSV 로 제공
+        raw_title_col[1].download_button(
+            label="Download CSV",
+            data=df_raw_rr.to_csv().encode("utf-8"),
+            file_name=f"{input_mcode}_rr_detail.csv",
+            type="tertiary",
+            mime="text/csv",
+            icon=":material/download:",
+            use_container_width=True,
+        )
 
         # 전체 컬럼 LIST = [
         #     "PLANT_x",
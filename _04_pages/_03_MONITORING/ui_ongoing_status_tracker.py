@@ -12,6 +12,7 @@
 - 상세 데이터 테이블
 
 사용자는 상단의 멀티셀렉트를 통해 특정 공장을 선택하여 필터링할 수 있습니다.
+데이터는 스케줄 작업(_08_automation/ongoing_status_snapshot.py)이 저장한 스냅샷을 사용합니다.
 """
 
 import sys
@@ -25,7 +26,7 @@ project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file_
 sys.path.append(project_root)
 
 from _05_commons import config
-from _02_preprocessing.CQMS import df_quality_issue, df_4m_change, df_customer_audit
+from _02_preprocessing.CQMS import df_ongoing_snapshot
 from _03_visualization._03_MONITORING import viz_ongoing_status_tracker
 
 
@@ -35,17 +36,13 @@ def reload_modules():
 
     개발 모드(config.DEV_MODE가 True)일 때만 실행되며,
     다음 모듈들을 리로드합니다:
-    - df_quality_issue
-    - df_4m_change
-    - df_customer_audit
-    - bi_202_ongoing_status_tracker
+    - df_ongoing_snapshot
+    - viz_ongoing_status_tracker
     """
     if config.DEV_MODE:
         import importlib
 
-        importlib.reload(df_quality_issue)
-        importlib.reload(df_4m_change)
-        importlib.reload(df_customer_audit)
+        importlib.reload(df_ongoing_snapshot)
         importlib.reload(viz_ongoing_status_tracker)
 
 
@@ -116,7 +113,9 @@ with st.sidebar:
     )
 
 # 품질 이슈 섹션
-qi_df = df_quality_issue.load_ongoing_quality_issues(selected_plant)
+qi_df = df_ongoing_snapshot.load_ongoing_snapshot("qi", selected_plant)
+if not qi_df.empty:
+    st.caption(f"Snapshot : {qi_df['SNAPSHOT_AT'].max():%Y-%m-%d %H:%M}")
 qi_columns = [
     "PLANT",
     "OEM",
@@ -151,9 +150,8 @@ display_section(
 st.divider()
 
 # 4M 변경 섹션
-(filtered_df_plant_na, filtered_df, _, _) = df_4m_change.filtered_4m_ongoing_by_yearly(
-    selected_plant
-)
+filtered_df = df_ongoing_snapshot.load_ongoing_snapshot("4m", selected_plant)
+filtered_df_plant_na = df_ongoing_snapshot.load_unregistered_4m_snapshot()
 m4_columns = [
     "DOC_NO",
     "PLANT",
@@ -206,7 +204,7 @@ with st.expander(
 st.divider()
 
 # 감사 섹션
-(audit_df, _, _) = df_customer_audit.get_audit_ongoing_df(selected_plant)
+audit_df = df_ongoing_snapshot.load_ongoing_snapshot("audit", selected_plant)
 audit_columns = [
     "TYPE",
     "START_DT",
@@ -232,3 +230,13 @@ display_section(
     audit_columns,
     audit_column_config,
 )
+
+st.divider()
+
+# 미결 건수 이력 섹션
+st.subheader("On-going Backlog History")
+try:
+    fig = viz_ongoing_status_tracker.backlog_history_line(selected_plant)
+    st.plotly_chart(fig, use_container_width=True)
+except ValueError as e:
+    st.info(str(e))
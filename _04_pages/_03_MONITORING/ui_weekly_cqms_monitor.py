@@ -27,7 +27,7 @@ if config.DEV_MODE:
     importlib.reload(viz_weekly_cqms_monitor)
 
 # Initialize page layout and tabs
-tabs = st.tabs(["Weekly Work Place"])
+tabs = st.tabs(["Weekly Work Place", "Weekly Trend"])
 
 # Define status options
 all_status = ["Open", "Open & Close", "Close", "On-going"]
@@ -339,3 +339,25 @@ with tabs[0]:
             use_container_width=True,
             hide_index=True,
         )
+
+with tabs[1]:
+    # 선택 연도의 주차별 상태 건수 추이 (연간 일괄 집계)
+    st.markdown(f"**Search Year** :  {start_of_week.year}")
+    selected_trend_status = st.radio(
+        "Selection",
+        all_status,
+        index=3,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="trend",
+    )
+
+    fig = viz_weekly_cqms_monitor.heatmap_qi_yearly_trend(
+        start_of_week.year, selected_trend_status
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    fig = viz_weekly_cqms_monitor.heatmap_4m_yearly_trend(
+        start_of_week.year, selected_trend_status
+    )
+    st.plotly_chart(fig, use_container_width=True)
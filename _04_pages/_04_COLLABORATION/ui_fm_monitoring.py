@@ -40,8 +40,8 @@ if config.DEV_MODE:
     importlib.reload(df_ncf)
     importlib.reload(viz_fm_monitoring)
 
-# 선택 가능한 연도 범위 설정 (2025년부터 2021년까지)
-available_years = list(range(2025, 2020, -1))
+# 선택 가능한 연도 범위 설정 (올해부터 2021년까지, 캐시 워머와 같은 기본 연도)
+available_years = list(range(config.this_year, 2020, -1))
 
 # 사이드바
 with st.sidebar:
@@ -49,16 +49,17 @@ with st.sidebar:
     selected_year = st.selectbox("Select year :", available_years, key="year_select")
     selected_plant = st.selectbox("Select plant :", config.plant_codes[:-1])
 
-# 데이터 로드
-global_ncf_monthly = df_ncf.get_global_ncf_monthly_df(selected_year)
-global_ncf_monthly_prev = df_ncf.get_global_ncf_monthly_df(selected_year - 1)
-yearly_ncf_summary = df_ncf.get_yearly_ncf_ppm_by_plant_df(selected_year)
-yearly_ncf_summary_prev = df_ncf.get_yearly_ncf_ppm_by_plant_df(selected_year - 1)
-monthly_ppm_data = df_ncf.get_monthly_ncf_ppm_by_plant_df(selected_year, selected_plant)
-monthly_ppm_data_prev = df_ncf.get_monthly_ncf_ppm_by_plant_df(
+# 데이터 로드 (선택 연도 + 전년도를 한 번에 조회, 공장 변경 시 추가 쿼리 없음)
+fm_dataset = df_ncf.load_fm_dataset(selected_year)
+global_ncf_monthly = fm_dataset.global_monthly(selected_year)
+global_ncf_monthly_prev = fm_dataset.global_monthly(selected_year - 1)
+yearly_ncf_summary = fm_dataset.yearly_ppm_by_plant(selected_year)
+yearly_ncf_summary_prev = fm_dataset.yearly_ppm_by_plant(selected_year - 1)
+monthly_ppm_data = fm_dataset.monthly_ppm_by_plant(selected_year, selected_plant)
+monthly_ppm_data_prev = fm_dataset.monthly_ppm_by_plant(
     selected_year - 1, selected_plant
 )
-defect_type_data = df_ncf.get_ncf_detail_by_plant(selected_year, selected_plant)
+defect_type_data = fm_dataset.ncf_detail_by_plant(selected_year, selected_plant)
 
 # 전역 FM 부적합 현황 섹션ㅍ
 st.markdown(
@@ -29,6 +29,7 @@ import plotly.graph_objects as go
 from _00_database.db_client import get_client
 
 # GMES Data Processing
+from _02_preprocessing import helper_pandas
 from _02_preprocessing.GMES import df_ctl
 from _02_preprocessing.GMES.df_production import get_daily_production_df
 from _02_preprocessing.GMES.df_ncf import (
@@ -44,7 +45,10 @@ from _02_preprocessing.GMES.df_uf import (
 from _02_preprocessing.GMES.df_rr import get_processed_raw_rr_data, get_rr_oe_list_df
 from _02_preprocessing.GMES.df_weight import (
     get_groupby_weight_ym_df,
+    get_weight_histogram_df,
     get_weight_individual_df,
+    get_weight_summary_df,
+    summarize_weight_by_month,
 )
 
 # Other System Data Processing
@@ -58,7 +62,7 @@ from _02_preprocessing.HOPE.df_oeapp import load_oeapp_df_by_mcode
 from _03_visualization._08_ADMIN import viz_oeassessment_result_viewer as viz
 from _03_visualization import config_plotly
 from _05_commons.css_style_config import load_custom_css
-from _05_commons import config
+from _05_commons import config, render_profiler
 
 if config.DEV_MODE:
     importlib.reload(df_ctl)
@@ -1587,6 +1591,12 @@ def render_weight_section(
         expanded=False,
         icon=":material/weight:",
     ):
+        if config.WEIGHT_SUMMARY_MODE:
+            render_weight_summary_charts(
+                selected_mcode, selected_start_date, selected_end_date
+            )
+            return
+
         wt_individual_df = get_weight_individual_df(
             mcode=selected_mcode,
             start_date=selected_start_date,
@@ -1633,6 +1643,60 @@ def render_weight_section(
         )
 
 
+def render_weight_summary_charts(
+    selected_mcode: str, selected_start_date: str, selected_end_date: str
+) -> None:
+    """
+    서버 집계 중량 통계(로컬 캐시)로 합격률 / 분포 차트를 렌더링
+
+    개별 측정값은 원본 데이터 토글을 켠 경우에만 조회하여 CSV 로 제공합니다.
+
+    Args:
+        selected_mcode: 선택된 모델 코드
+        selected_start_date: 선택된 시작 날짜
+        selected_end_date: 선택된 종료 날짜
+    """
+    summary_df = get_weight_summary_df(
+        mcode=selected_mcode,
+        start_date=selected_start_date,
+        end_date=selected_end_date,
+    )
+    histogram_df = get_weight_histogram_df(
+        mcode=selected_mcode,
+        start_date=selected_start_date,
+        end_date=selected_end_date,
+    )
+
+    wt_download_col = st.columns([7, 2])
+    if wt_download_col[1].toggle("Raw data", key=f"wt_raw_{selected_mcode}"):
+        wt_individual_df = get_weight_individual_df(
+            mcode=selected_mcode,
+            start_date=selected_start_date,
+            end_date=selected_end_date,
+        )
+        wt_download_col[1].download_button(
+            label="Download CSV",
+            data=convert_for_download(wt_individual_df),
+            file_name=f"{selected_mcode}_wt_detail.csv",
+            type="tertiary",
+            mime="text/csv",
+            icon=":material/download:",
+            use_container_width=True,
+        )
+
+    wt_col = st.columns(2)
+    wt_col[0].plotly_chart(
+        viz.draw_weight_distribution(summarize_weight_by_month(summary_df)),
+        use_container_width=True,
+    )
+    wt_col[1].plotly_chart(
+        viz.draw_weight_summary_box(summary_df), use_container_width=True
+    )
+    st.plotly_chart(
+        viz.draw_weight_histogram(histogram_df, summary_df), use_container_width=True
+    )
+
+
 @handle_section_rendering_errors
 def render_rr_section(
     selected_mcode: str,
@@ -1765,15 +1829,8 @@ def render_ctl_section(
             ctl_col[0].plotly_chart(
                 viz.draw_ctl_trend(grouped_ctl_df), use_container_width=True
             )
-            MRM_PASS_RATE = (
-                ctl_raw_data.pivot_table(
-                    index="MRM_ITEM",
-                    columns="JDG",
-                    values="DOC_NO",
-                    aggfunc="count",
-                )
-                .reset_index()
-                .fillna(0)
+            MRM_PASS_RATE = helper_pandas.tally_outcomes(
+                ctl_raw_data, "MRM_ITEM", "JDG", df_ctl.CTL_JDG_OUTCOMES
             )
             MRM_PASS_RATE["PASS_RATE"] = MRM_PASS_RATE["OK"] / (
                 MRM_PASS_RATE["NI"] + MRM_PASS_RATE["OK"]
@@ -1884,6 +1941,12 @@ def render_ctl_section(
 # 메인 페이지 UI 구성
 # =============================================================================
 
+# 렌더링 프로파일 계측 (프로파일 비활성화 시 원본 함수를 그대로 호출)
+render_profiler.profile_functions(
+    globals(), ("render_", "display_", "load_", "calculate_")
+)
+viz = render_profiler.ProfiledModule(viz, ("draw_",))
+
 st.title("OE Mass Production Assessment")
 main_tab = st.tabs(["Overview", "Detail", "Description"])
 
@@ -0,0 +1,150 @@
+"""
+쿼리 성능 분석 페이지
+
+db_client 계측(query_metrics) 기록을 쿼리 지문 단위로 집계하여,
+페이지 로딩 시간을 차지하는 느린 쿼리와 자주 실행되는 쿼리를 순위로 보여주는 관리자 전용 페이지입니다.
+
+주요 기능:
+- 기간 / 백엔드 필터
+- 느린 쿼리 순위 (P95 / 평균 소요시간)
+- 빈번한 쿼리 순위 (호출 수, 누적 소요시간)
+- 캐시 함수별 적중률
+"""
+
+import sys
+from datetime import timedelta
+import plotly.express as px
+import streamlit as st
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database import query_metrics
+from _05_commons import config
+
+TOP_N = 20
+
+# 순위 테이블 표시 컬럼
+RANK_COLUMNS = [
+    "CALLER",
+    "BACKEND",
+    "CALLS",
+    "AVG_MS",
+    "P95_MS",
+    "MAX_MS",
+    "TOTAL_MS",
+    "AVG_EXEC_MS",
+    "AVG_FETCH_MS",
+    "AVG_ROWS",
+    "AVG_MB",
+    "QUERY",
+]
+COLUMN_CONFIG = {
+    "AVG_MS": st.column_config.NumberColumn("Avg (ms)", format="%.0f"),
+    "P95_MS": st.column_config.NumberColumn("P95 (ms)", format="%.0f"),
+    "MAX_MS": st.column_config.NumberColumn("Max (ms)", format="%.0f"),
+    "TOTAL_MS": st.column_config.NumberColumn("Total (ms)", format="%.0f"),
+    "AVG_EXEC_MS": st.column_config.NumberColumn("Exec (ms)", format="%.0f"),
+    "AVG_FETCH_MS": st.column_config.NumberColumn("Fetch (ms)", format="%.0f"),
+    "AVG_ROWS": st.column_config.NumberColumn("Avg Rows", format="%.0f"),
+    "AVG_MB": st.column_config.NumberColumn("Avg MB", format="%.2f"),
+    "CACHE_HIT_RATE": st.column_config.ProgressColumn(
+        "Hit Rate", format="%.0f%%", min_value=0, max_value=100
+    ),
+    "QUERY": st.column_config.TextColumn("Query", width="large"),
+}
+
+st.title("Query Performance")
+
+# 필터
+filter_col = st.columns([2, 3, 5], vertical_alignment="bottom")
+date_range = filter_col[0].date_input(
+    "Period",
+    value=(config.today - timedelta(days=7), config.today),
+    max_value=config.today,
+)
+if not isinstance(date_range, tuple) or len(date_range) != 2:
+    st.info("Select a start and end date.")
+    st.stop()
+
+metrics_df = query_metrics.load_query_metrics(
+    start_date=date_range[0].strftime("%Y-%m-%d"),
+    end_date=date_range[1].strftime("%Y-%m-%d"),
+)
+if metrics_df.empty:
+    st.info("No query metrics recorded for the selected period.")
+    st.stop()
+
+query_df = metrics_df[metrics_df["BACKEND"] != "cache"]
+cache_df = metrics_df[metrics_df["BACKEND"] == "cache"]
+
+backends = sorted(query_df["BACKEND"].unique())
+selected_backends = filter_col[1].multiselect("Backend", backends, default=backends)
+query_df = query_df[query_df["BACKEND"].isin(selected_backends)]
+summary_df = query_metrics.summarize_query_metrics(query_df)
+
+# 요약 지표
+metric_cols = st.columns(4)
+metric_cols[0].metric("Queries", f"{len(query_df):,}")
+metric_cols[1].metric("Distinct Queries", f"{len(summary_df):,}")
+metric_cols[2].metric("Total Time (s)", f"{query_df['WALL_MS'].sum() / 1000:,.1f}")
+metric_cols[3].metric(
+    "Cache Hit Rate",
+    f"{cache_df['CACHE_HIT'].mean():.0%}" if not cache_df.empty else "-",
+)
+
+tab_slow, tab_frequent, tab_cache = st.tabs(
+    ["Slowest Queries", "Most Frequent Queries", "Cache"]
+)
+
+with tab_slow:
+    slowest = summary_df.sort_values("P95_MS", ascending=False).head(TOP_N)
+    fig = px.bar(
+        slowest.iloc[::-1],
+        x="P95_MS",
+        y="FINGERPRINT",
+        orientation="h",
+        hover_data=["CALLER", "CALLS", "AVG_MS"],
+        labels={"P95_MS": "P95 (ms)", "FINGERPRINT": ""},
+    )
+    fig.update_layout(height=max(300, 25 * len(slowest)), margin=dict(t=20))
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(
+        slowest.set_index("FINGERPRINT")[RANK_COLUMNS],
+        column_config=COLUMN_CONFIG,
+        use_container_width=True,
+    )
+
+with tab_frequent:
+    frequent = summary_df.sort_values(["CALLS", "TOTAL_MS"], ascending=False).head(
+        TOP_N
+    )
+    st.dataframe(
+        frequent.set_index("FINGERPRINT")[RANK_COLUMNS],
+        column_config=COLUMN_CONFIG,
+        use_container_width=True,
+    )
+
+with tab_cache:
+    if cache_df.empty:
+        st.info("No cache lookups recorded for the selected period.")
+    else:
+        cache_summary = query_metrics.summarize_query_metrics(cache_df).assign(
+            CACHE_HIT_RATE=lambda df: df["CACHE_HIT_RATE"] * 100
+        )
+        st.dataframe(
+            cache_summary.set_index("CALLER")[
+                ["CALLS", "CACHE_HIT_RATE", "AVG_MS", "P95_MS", "TOTAL_MS"]
+            ],
+            column_config=COLUMN_CONFIG,
+            use_container_width=True,
+        )
+
+with st.expander("Raw Records", icon=":material/table:"):
+    st.dataframe(
+        metrics_df.sort_values("EXECUTED_AT", ascending=False),
+        use_container_width=True,
+        height=400,
+    )
@@ -141,6 +141,12 @@ PAGE_CONFIGS = {
         "category": "Admin",
         "roles": ["Admin"],
     },
+    "Query Performance": {
+        "filename": "_04_pages/_08_ADMIN/ui_query_metrics.py",
+        "icon": ":material/speed:",
+        "category": "Admin",
+        "roles": ["Admin"],
+    },
     # System
     "Navigation": {
         "filename": "_04_pages/_09_SYSTEM/ui_navigation.py",
@@ -0,0 +1,311 @@
+"""
+대시보드 캐시 워머(cache warmer) 모듈
+
+대시보드의 무거운 로더는 st.cache_data(ttl=600) 로 캐시되므로, 만료 직후 처음 접속한
+사용자가 Snowflake 콜드 쿼리 비용을 모두 부담합니다. 이 모듈은 Streamlit 서버 프로세스
+안에서 백그라운드 스레드로 등록된 로더를 주기적으로 다시 호출하여 캐시를 미리 채웁니다.
+
+- st.cache_data 는 만료 전에 다시 호출하면 기존 값을 그대로 반환하므로, 각 작업은
+  직전 실행 완료 시각 + (CACHE_WARMER_TTL_SEC + CACHE_WARMER_MARGIN_SEC) 에 실행되어
+  만료된 캐시를 사용자 대신 다시 계산합니다.
+- 동시에 실행되는 로더 수는 CACHE_WARMER_MAX_WORKERS 로 제한합니다.
+- CACHE_WARMER_HOURS (시작 시, 종료 시) 업무 시간대에만 실행합니다.
+- 로더 인자는 실행 시점마다 args_factory 로 계산하며, 페이지 기본 선택값과 같게 맞춰야
+  같은 캐시 항목이 채워집니다.
+
+사용 예시:
+>>> from _05_commons import cache_warmer
+>>> cache_warmer.start_cache_warmer()  # app.py 에서 1회 호출
+>>> cache_warmer.get_cache_warmer().status()
+"""
+
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pandas as pd
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러 확인 주기 (초)
+POLL_INTERVAL_SEC = 1.0
+
+
+class WarmJob:
+    """
+    캐시 워머 작업 한 건
+
+    - loader: 캐시된 로더 함수
+    - args_factory: 실행 시점의 (args, kwargs) 를 반환하는 함수
+    - interval: 실행 주기(초), 직전 실행 완료 시각 기준
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable,
+        args_factory: Optional[Callable[[], Tuple[tuple, dict]]] = None,
+        interval: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.loader = loader
+        self.args_factory = args_factory or (lambda: ((), {}))
+        self.interval = interval or (
+            config.CACHE_WARMER_TTL_SEC + config.CACHE_WARMER_MARGIN_SEC
+        )
+        self.next_due = 0.0
+        self.running = False
+        self.runs = 0
+        self.last_started: Optional[datetime] = None
+        self.last_duration_sec: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def run(self) -> None:
+        """로더를 호출하고 결과(소요시간 / 오류)를 기록합니다."""
+        self.last_started = datetime.now()
+        started = time.perf_counter()
+        try:
+            args, kwargs = self.args_factory()
+            self.loader(*args, **kwargs)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"캐시 워머 작업 '{self.name}' 실패: {str(e)}")
+        finally:
+            self.last_duration_sec = time.perf_counter() - started
+            self.runs += 1
+
+
+class CacheWarmer:
+    """
+    등록된 로더를 주기적으로 실행하는 백그라운드 캐시 워머
+
+    - 스케줄러 스레드 1개가 실행 시각이 된 작업을 ThreadPoolExecutor 에 넘김
+    - 같은 작업은 이전 실행이 끝나기 전에 다시 실행하지 않음
+    """
+
+    def __init__(
+        self,
+        max_workers: int = config.CACHE_WARMER_MAX_WORKERS,
+        hours: Optional[Tuple[int, int]] = config.CACHE_WARMER_HOURS,
+    ) -> None:
+        self.max_workers = max_workers
+        self.hours = hours
+        self.jobs: Dict[str, WarmJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # * region 작업 등록
+    def register(
+        self,
+        name: str,
+        loader: Callable,
+        args_factory: Optional[Callable[[], Tuple[tuple, dict]]] = None,
+        interval: Optional[float] = None,
+    ) -> WarmJob:
+        """
+        캐시 워머 작업을 등록합니다. (같은 이름이면 교체)
+
+        Args:
+            name: 작업 이름
+            loader: 캐시된 로더 함수
+            args_factory: 실행 시점의 (args, kwargs) 를 반환하는 함수 (기본값: 인자 없음)
+            interval: 실행 주기(초) (기본값: CACHE_WARMER_TTL_SEC + CACHE_WARMER_MARGIN_SEC)
+
+        Returns:
+            WarmJob: 등록된 작업
+        """
+        job = WarmJob(name, loader, args_factory, interval)
+        with self._lock:
+            self.jobs[name] = job
+        return job
+
+    # * region 실행
+    def in_business_hours(self, now: Optional[datetime] = None) -> bool:
+        """현재 시각이 실행 시간대(hours) 안인지 확인합니다."""
+        if self.hours is None:
+            return True
+        start, end = self.hours
+        return start <= (now or datetime.now()).hour < end
+
+    def due_jobs(self, now: Optional[float] = None) -> List[WarmJob]:
+        """실행 시각이 되었고 실행 중이 아닌 작업 목록"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return [
+                job
+                for job in self.jobs.values()
+                if not job.running and job.next_due <= now
+            ]
+
+    def _run_job(self, job: WarmJob) -> None:
+        try:
+            job.run()
+        finally:
+            with self._lock:
+                job.next_due = time.monotonic() + job.interval
+                job.running = False
+
+    def run_pending(self, wait: bool = False) -> List[str]:
+        """
+        실행 시각이 된 작업을 동시 실행 수 제한 안에서 실행합니다.
+
+        Args:
+            wait: True 이면 제출한 작업이 모두 끝날 때까지 대기
+
+        Returns:
+            List[str]: 실행을 시작한 작업 이름 목록
+        """
+        jobs = self.due_jobs()
+        if not jobs:
+            return []
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="cache-warmer"
+            )
+        with self._lock:
+            for job in jobs:
+                job.running = True
+        futures = [self._executor.submit(self._run_job, job) for job in jobs]
+        if wait:
+            for future in futures:
+                future.result()
+        return [job.name for job in jobs]
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self.in_business_hours():
+                self.run_pending()
+            self._stop_event.wait(POLL_INTERVAL_SEC)
+
+    def start(self) -> None:
+        """스케줄러 스레드를 시작합니다. (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="cache-warmer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """스케줄러 스레드를 종료하고 실행 중인 작업이 끝날 때까지 대기합니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # * region 상태 조회
+    def status(self) -> pd.DataFrame:
+        """작업별 실행 횟수 / 마지막 실행 시각 / 소요시간 / 오류"""
+        with self._lock:
+            rows = [
+                {
+                    "name": job.name,
+                    "runs": job.runs,
+                    "running": job.running,
+                    "last_started": job.last_started,
+                    "last_duration_sec": job.last_duration_sec,
+                    "last_error": job.last_error,
+                }
+                for job in self.jobs.values()
+            ]
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "name",
+                "runs",
+                "running",
+                "last_started",
+                "last_duration_sec",
+                "last_error",
+            ],
+        )
+
+
+# * region 기본 작업 (페이지 기본 선택값 기준)
+def _this_week() -> Tuple[datetime, datetime]:
+    """주간 CQMS 모니터 기본 선택 주 (월요일 ~ 일요일)"""
+    today = datetime.strptime(config.today.strftime("%Y-%m-%d"), "%Y-%m-%d")
+    start_of_week = today - timedelta(days=today.weekday())
+    return start_of_week, start_of_week + timedelta(days=6)
+
+
+def register_default_jobs(warmer: CacheWarmer) -> None:
+    """
+    OE Quality Issue Dashboard / FM Monitoring / RR Analysis / Weekly CQMS Monitor
+    페이지의 무거운 로더를 기본 선택값 인자로 등록합니다.
+    """
+    from _02_preprocessing.CQMS import df_4m_change, df_customer_audit
+    from _02_preprocessing.CQMS import df_quality_issue
+    from _02_preprocessing.GMES import df_ncf, df_rr
+
+    warmer.register(
+        "quality_issues_for_3_years",
+        df_quality_issue.load_quality_issues_for_3_years,
+        lambda: ((config.this_year,), {}),
+    )
+    warmer.register("4m", df_4m_change.load_4m)
+    warmer.register("4m_weekly_base", df_4m_change.load_4m_weekly_base)
+    warmer.register(
+        "audit_weekly", df_customer_audit.df_audit_weekly, lambda: (_this_week(), {})
+    )
+    warmer.register(
+        "fm_dataset", df_ncf.load_fm_dataset, lambda: ((config.this_year,), {})
+    )
+    warmer.register(
+        "agg_rr_data",
+        df_rr.get_processed_agg_rr_data,
+        lambda: (
+            (),
+            {
+                "start_date": datetime(config.this_year, 1, 1).date(),
+                "end_date": config.today.date(),
+            },
+        ),
+    )
+
+
+_cache_warmer: Optional[CacheWarmer] = None
+_cache_warmer_lock = threading.Lock()
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """기본 작업이 등록된 프로세스 공용 CacheWarmer"""
+    global _cache_warmer
+    with _cache_warmer_lock:
+        if _cache_warmer is None:
+            _cache_warmer = CacheWarmer()
+            register_default_jobs(_cache_warmer)
+        return _cache_warmer
+
+
+def start_cache_warmer() -> Optional[CacheWarmer]:
+    """
+    CACHE_WARMER_ENABLED 이면 프로세스 공용 캐시 워머를 시작합니다.
+
+    Returns:
+        Optional[CacheWarmer]: 시작한 캐시 워머 (비활성화 시 None)
+    """
+    if not config.CACHE_WARMER_ENABLED:
+        return None
+    warmer = get_cache_warmer()
+    warmer.start()
+    return warmer
@@ -11,6 +11,13 @@
 상세 설명:
 1. 시스템 설정
    - SQLITE_DB_PATH: SQLite 데이터베이스 파일 경로
+   - CTL_STORE_PATH: CTL 측정 데이터 로컬 저장소(Parquet, 월 파티션) 경로
+   - RR_STORE_PATH: RR 샘플 로컬 저장소(Parquet, 월 파티션, 증분 적재) 경로
+   - WEIGHT_SUMMARY_MODE: 중량 분포를 개별 측정값 대신 서버 집계 통계(로컬 캐시)로 표시할지 여부
+   - WAREHOUSE_BACKEND: 원격 DB 쿼리 백엔드 ("remote" 또는 벤치마크용 로컬 웨어하우스 "local")
+   - LOCAL_WAREHOUSE_*: 로컬 웨어하우스 DB 경로 / 주입 지연(쿼리당 ms, 지터 ms, 행당 us)
+   - CACHE_WARMER_*: 대시보드 캐시 워머 사용 여부 / 캐시 TTL / 만료 후 재조회 여유(초) / 동시 실행 수 / 실행 시간대
+   - SHARED_FRAME_STORE_*: 프로세스 간 공유 DataFrame 저장소(Arrow, 기본 /dev/shm) 사용 여부 / 경로
    - DEV_MODE: 개발 모드 활성화 여부
    - PROJECT_ROOT: 프로젝트 루트 디렉토리 경로
 
@@ -47,6 +54,32 @@ import sys
 
 # 시스템 설정
 SQLITE_DB_PATH: str = os.path.expanduser("~/database/goeq_database.db")
+CTL_STORE_PATH: str = os.path.expanduser("~/database/ctl_measurement")
+RR_STORE_PATH: str = os.path.expanduser("~/database/rr_sample")
+WEIGHT_SUMMARY_MODE: bool = os.getenv("WEIGHT_SUMMARY_MODE", "1") == "1"
+WAREHOUSE_BACKEND: str = os.getenv("WAREHOUSE_BACKEND", "remote")
+LOCAL_WAREHOUSE_PATH: str = os.getenv(
+    "LOCAL_WAREHOUSE_PATH", os.path.expanduser("~/database/local_warehouse.db")
+)
+LOCAL_WAREHOUSE_LATENCY_MS: float = float(os.getenv("LOCAL_WAREHOUSE_LATENCY_MS", "0"))
+LOCAL_WAREHOUSE_JITTER_MS: float = float(os.getenv("LOCAL_WAREHOUSE_JITTER_MS", "0"))
+LOCAL_WAREHOUSE_ROW_LATENCY_US: float = float(
+    os.getenv("LOCAL_WAREHOUSE_ROW_LATENCY_US", "0")
+)
+CACHE_WARMER_ENABLED: bool = os.getenv("CACHE_WARMER_ENABLED", "1") == "1"
+CACHE_WARMER_TTL_SEC: int = 600
+CACHE_WARMER_MARGIN_SEC: int = 5
+CACHE_WARMER_MAX_WORKERS: int = int(os.getenv("CACHE_WARMER_MAX_WORKERS", "2"))
+CACHE_WARMER_HOURS: tuple = (7, 20)
+SHARED_FRAME_STORE_ENABLED: bool = os.getenv("SHARED_FRAME_STORE_ENABLED", "1") == "1"
+SHARED_FRAME_STORE_PATH: str = os.getenv(
+    "SHARED_FRAME_STORE_PATH",
+    (
+        "/dev/shm/goeq_bi_frames"
+        if os.path.isdir("/dev/shm")
+        else os.path.expanduser("~/database/shared_frames")
+    ),
+)
 DEV_MODE: bool = True
 
 # 날짜 관련 상수
@@ -0,0 +1,415 @@
+"""
+비동기(버퍼링) 이벤트 로거 모듈
+
+로그인 / 페이지 조회 / 쿼리 소요시간 이벤트를 요청 처리 중에 SQLite에 직접 쓰지 않고,
+메모리 큐에 넣은 뒤 백그라운드 스레드가 모아서 한 번의 트랜잭션으로 저장합니다.
+주요 기능:
+- 이벤트 적재: 큐에 넣기만 하므로 호출 측 비용은 거의 없음 (큐가 가득 차면 버림)
+- 배치 저장: BATCH_SIZE 건 또는 FLUSH_INTERVAL_SEC 마다 executemany 로 저장
+- 종료 시 남은 이벤트 저장 (atexit)
+- 사용 현황 분석용 조회 함수
+
+사용 예시:
+>>> from _05_commons import event_logger
+>>> event_logger.log_login(21300315)
+>>> event_logger.log_page_view(21300315, "RR Analysis")
+>>> event_logger.summarize_events("page_view", by="page")
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import pandas as pd
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config
+
+logger = logging.getLogger(__name__)
+
+# 배치 저장 설정
+BATCH_SIZE = 200
+FLUSH_INTERVAL_SEC = 2.0
+# 배치를 모으는 동안 flush() / stop() 요청을 확인하는 간격
+FLUSH_POLL_SEC = 0.05
+MAX_QUEUE_SIZE = 10_000
+
+# 이벤트 테이블 (logins 는 기존 로그인 기록 테이블 스키마 유지)
+EVENT_TABLE = "app_events"
+EVENT_TABLE_DDL: Dict[str, str] = {
+    "logins": "CREATE TABLE IF NOT EXISTS logins (employee_id INTEGER, login_time TEXT)",
+    EVENT_TABLE: f"""CREATE TABLE IF NOT EXISTS {EVENT_TABLE} (
+        event_time TEXT,
+        event_type TEXT,
+        employee_id INTEGER,
+        page TEXT,
+        name TEXT,
+        value REAL,
+        detail TEXT
+    )""",
+}
+EVENT_TABLE_INDEXES: Dict[str, List[str]] = {
+    EVENT_TABLE: [
+        f"CREATE INDEX IF NOT EXISTS idx_{EVENT_TABLE}_type_time "
+        f"ON {EVENT_TABLE} (event_type, event_time)"
+    ],
+}
+
+
+def register_event_table(table: str, ddl: str, indexes: List[str] = ()) -> None:
+    """
+    다른 모듈의 이벤트 테이블(예: 쿼리 계측)을 로거 저장 대상으로 등록합니다.
+
+    Args:
+        table: 테이블명
+        ddl: CREATE TABLE IF NOT EXISTS 문
+        indexes: CREATE INDEX IF NOT EXISTS 문 목록
+    """
+    EVENT_TABLE_DDL[table] = ddl
+    EVENT_TABLE_INDEXES[table] = list(indexes)
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class EventLogger:
+    """
+    메모리 큐 + 백그라운드 스레드 기반 SQLite 이벤트 로거
+
+    - log(): 큐에 넣기만 하고 즉시 반환 (스레드는 첫 호출 시 시작)
+    - 저장 스레드는 첫 이벤트 이후 batch_size 건이 모이거나 flush_interval 이 지나면 저장
+    - flush(): 모으는 중인 배치를 바로 저장하고 큐에 쌓인 이벤트가 모두 저장될 때까지 대기
+    - stop(): 남은 이벤트를 저장하고 스레드 종료
+    """
+
+    def __init__(
+        self,
+        db_path: str = config.SQLITE_DB_PATH,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SEC,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+    ) -> None:
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._flush_waiters = 0
+        self._created_tables: set = set()
+
+    # * region 적재
+    def start(self) -> None:
+        """백그라운드 저장 스레드를 시작합니다. (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="event-logger", daemon=True
+            )
+            self._thread.start()
+
+    def log(self, table: str, row: Dict[str, Any]) -> None:
+        """
+        이벤트 한 건을 큐에 넣습니다. (요청 처리 경로를 막지 않도록 큐가 가득 차면 버림)
+
+        Args:
+            table: EVENT_TABLE_DDL 에 정의된 테이블명
+            row: {컬럼명: 값}
+        """
+        if table not in EVENT_TABLE_DDL:
+            raise ValueError(f"지원하지 않는 이벤트 테이블입니다: {table}")
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        try:
+            self._queue.put_nowait((table, row))
+        except queue.Full:
+            self.dropped += 1
+
+    # * region 저장
+    def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            self._collect(batch)
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error(f"이벤트 {len(batch)}건 저장 실패: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _collect(self, batch: List[tuple]) -> None:
+        """
+        첫 이벤트 이후 batch_size 건이 모이거나 flush_interval 이 지날 때까지 배치를 채웁니다.
+        (flush() / stop() 요청 시에는 큐에 남은 이벤트만 담고 바로 반환)
+        """
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if self._stop_event.is_set() or self._flush_waiters:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    return
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                batch.append(self._queue.get(timeout=min(remaining, FLUSH_POLL_SEC)))
+            except queue.Empty:
+                continue
+
+    def _write(self, batch: List[tuple]) -> None:
+        """테이블/컬럼 구성별로 묶어 하나의 트랜잭션에서 executemany 로 저장합니다."""
+        groups: Dict[tuple, List[tuple]] = {}
+        for table, row in batch:
+            columns = tuple(row)
+            groups.setdefault((table, columns), []).append(tuple(row.values()))
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            for table in {table for table, _ in groups} - self._created_tables:
+                conn.execute(EVENT_TABLE_DDL[table])
+                for ddl in EVENT_TABLE_INDEXES.get(table, []):
+                    conn.execute(ddl)
+                self._created_tables.add(table)
+            for (table, columns), values in groups.items():
+                placeholders = ", ".join(["?"] * len(columns))
+                conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                    values,
+                )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        큐에 쌓인 이벤트가 모두 저장될 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간(초), None 이면 무제한
+
+        Returns:
+            bool: 제한 시간 내 저장 완료 여부
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.unfinished_tasks == 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._flush_waiters += 1
+        try:
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._queue.all_tasks_done.wait(remaining)
+            return True
+        finally:
+            with self._lock:
+                self._flush_waiters -= 1
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """남은 이벤트를 저장하고 백그라운드 스레드를 종료합니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_event_logger: Optional[EventLogger] = None
+_event_logger_lock = threading.Lock()
+
+
+def get_event_logger() -> EventLogger:
+    """프로세스 공용 EventLogger (종료 시 남은 이벤트 저장)"""
+    global _event_logger
+    with _event_logger_lock:
+        if _event_logger is None:
+            _event_logger = EventLogger()
+            atexit.register(_event_logger.stop)
+        return _event_logger
+
+
+# * region 이벤트 기록
+def log_event(
+    event_type: str,
+    employee_id: Optional[int] = None,
+    page: Optional[str] = None,
+    name: Optional[str] = None,
+    value: Optional[float] = None,
+    detail: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    사용 현황 이벤트를 기록합니다.
+
+    Args:
+        event_type: 이벤트 종류 (예: 'page_view', 'query_latency')
+        employee_id: 사원번호
+        page: 페이지명
+        name: 이벤트 대상 이름 (예: 쿼리 / 함수명)
+        value: 수치 값 (예: 소요시간 ms)
+        detail: 추가 정보 (JSON 문자열로 저장)
+    """
+    get_event_logger().log(
+        EVENT_TABLE,
+        {
+            "event_time": _now(),
+            "event_type": event_type,
+            "employee_id": employee_id,
+            "page": page,
+            "name": name,
+            "value": value,
+            "detail": json.dumps(detail, ensure_ascii=False) if detail else None,
+        },
+    )
+
+
+def log_login(employee_id: int) -> None:
+    """로그인 기록 (기존 logins 테이블)"""
+    get_event_logger().log(
+        "logins", {"employee_id": int(employee_id), "login_time": _now()}
+    )
+
+
+def log_page_view(employee_id: Optional[int], page: str) -> None:
+    """페이지 조회 기록"""
+    log_event("page_view", employee_id=employee_id, page=page)
+
+
+def log_query_latency(
+    name: str, elapsed_ms: float, page: Optional[str] = None, **detail
+) -> None:
+    """쿼리 / 데이터 로딩 소요시간 기록"""
+    log_event("query_latency", page=page, name=name, value=elapsed_ms, detail=detail)
+
+
+# * region 사용 현황 조회
+def load_events(
+    event_type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    이벤트 테이블을 조회합니다. (큐에 남은 이벤트를 먼저 저장)
+
+    Args:
+        event_type: 이벤트 종류 (선택사항)
+        start_date: 시작일자 YYYY-MM-DD (선택사항)
+        end_date: 종료일자 YYYY-MM-DD, 해당 일자 포함 (선택사항)
+        db_path: SQLite DB 파일 경로
+
+    Returns:
+        pd.DataFrame: event_time 이 datetime 으로 변환된 이벤트
+    """
+    get_event_logger().flush(timeout=FLUSH_INTERVAL_SEC)
+
+    conditions, params = [], []
+    if event_type:
+        conditions.append("event_type = ?")
+        params.append(event_type)
+    if start_date:
+        conditions.append("event_time >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append("event_time < date(?, '+1 day')")
+        params.append(end_date)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    try:
+        with sqlite3.connect(db_path) as conn:
+            df = pd.read_sql_query(
+                f"SELECT * FROM {EVENT_TABLE} {where}", conn, params=params
+            )
+    except Exception as e:
+        logger.warning(f"이벤트 테이블 조회 실패: {str(e)}")
+        return pd.DataFrame(columns=["event_time", "event_type", "employee_id", "page"])
+
+    df["event_time"] = pd.to_datetime(df["event_time"])
+    return df
+
+
+def summarize_events(
+    event_type: str,
+    by: str = "page",
+    freq: str = "D",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    기간(freq) x 기준 컬럼(by)별 이벤트 건수, 사용자 수, 평균 값을 집계합니다.
+
+    Args:
+        event_type: 이벤트 종류 (예: 'page_view')
+        by: 기준 컬럼 ('page', 'name', 'employee_id')
+        freq: 집계 주기 ('D', 'W', 'M' 등 pandas 기간 문자열)
+        start_date: 시작일자 (선택사항)
+        end_date: 종료일자 (선택사항)
+        db_path: SQLite DB 파일 경로
+
+    Returns:
+        pd.DataFrame: PERIOD, by, EVENTS, USERS, AVG_VALUE 컬럼의 집계
+    """
+    df = load_events(event_type, start_date, end_date, db_path)
+    if df.empty:
+        return pd.DataFrame(columns=["PERIOD", by, "EVENTS", "USERS", "AVG_VALUE"])
+
+    df["PERIOD"] = df["event_time"].dt.to_period(freq).dt.start_time
+    return (
+        df.groupby(["PERIOD", by], dropna=False)
+        .agg(
+            EVENTS=("event_type", "size"),
+            USERS=("employee_id", "nunique"),
+            AVG_VALUE=("value", "mean"),
+        )
+        .reset_index()
+        .sort_values(["PERIOD", "EVENTS"], ascending=[True, False])
+        .reset_index(drop=True)
+    )
+
+
+def summarize_logins(
+    freq: str = "D", db_path: str = config.SQLITE_DB_PATH
+) -> pd.DataFrame:
+    """
+    기간별 로그인 건수와 로그인 사용자 수를 집계합니다.
+
+    Returns:
+        pd.DataFrame: PERIOD, LOGINS, USERS 컬럼의 집계
+    """
+    get_event_logger().flush(timeout=FLUSH_INTERVAL_SEC)
+    with sqlite3.connect(db_path) as conn:
+        df = pd.read_sql_query("SELECT employee_id, login_time FROM logins", conn)
+
+    df["PERIOD"] = (
+        pd.to_datetime(df["login_time"], errors="coerce")
+        .dt.to_period(freq)
+        .dt.start_time
+    )
+    return (
+        df.groupby("PERIOD")
+        .agg(LOGINS=("employee_id", "size"), USERS=("employee_id", "nunique"))
+        .reset_index()
+    )
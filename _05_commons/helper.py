@@ -11,6 +11,7 @@ SQLite 데이터베이스 유틸리티 모듈
    - 쿼리 실행
 3. 개발 지원
    - 동적 모듈 로딩
+   - 무거운 선택 의존성 지연 로딩 (lazy import)
    - 숫자 포맷팅
 
 사용 예시:
@@ -23,6 +24,7 @@ SQLite 데이터베이스 유틸리티 모듈
 import sqlite3
 import importlib
 import sys
+from types import ModuleType
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
@@ -62,6 +64,54 @@ def dynamic_import_modules(
     return modules
 
 
+class LazyModule(ModuleType):
+    """
+    첫 속성 접근 시점에 실제 모듈을 import 하는 지연 로딩 프록시입니다.
+
+    scipy, IPython, sqlalchemy 처럼 import 비용이 큰 선택 의존성을
+    모듈 최상단에서 선언만 해두고, 실제로 사용하는 함수가 호출될 때까지
+    로딩을 미루기 위해 사용합니다.
+    """
+
+    def __init__(self, module_name: str) -> None:
+        super().__init__(module_name)
+        self._lazy_module_name = module_name
+        self._lazy_module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_module_name)
+        return self._lazy_module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+
+def lazy_import(module_name: str) -> ModuleType:
+    """
+    모듈을 지연 로딩합니다.
+
+    이미 import 된 모듈이면 그대로 반환하고, 그렇지 않으면 첫 속성 접근 시
+    import 하는 LazyModule 프록시를 반환합니다.
+
+    Args:
+        module_name: 불러올 모듈 경로 (예: "scipy.stats")
+
+    Returns:
+        ModuleType: 모듈 객체 또는 지연 로딩 프록시
+
+    Example:
+        >>> scipy_stats = lazy_import("scipy.stats")
+        >>> scipy_stats.norm.cdf(0)  # 이 시점에 scipy.stats 로딩
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    return LazyModule(module_name)
+
+
 def format_number(num: Union[int, float]) -> str:
     """
     숫자를 읽기 쉬운 형식으로 변환합니다.
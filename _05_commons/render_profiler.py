@@ -0,0 +1,399 @@
+"""
+페이지 렌더링 프로파일러 모듈
+
+Streamlit 페이지 한 번의 실행(rerun)에서 섹션별(render_* / display_* / draw_* 등)
+소요시간을 중첩 구간(span)으로 측정하고, 사이드바에 플레임 차트로 표시합니다.
+측정 결과는 SQLite render_profiles 테이블에 저장하여 이전 실행과 비교합니다.
+
+활성화:
+- 환경 변수 RENDER_PROFILE=1 또는 URL 쿼리 파라미터 ?profile=1
+- 비활성화 상태에서는 래퍼가 원본 함수를 바로 호출하므로 추가 비용이 거의 없음
+
+사용 예시:
+>>> # app.py: 모든 페이지의 최상위 구간
+>>> with render_profiler.page_profile(pg.title):
+...     pg.run()
+>>> # 페이지 모듈: 함수 정의 이후 섹션 함수 / 시각화 모듈 계측
+>>> render_profiler.profile_functions(globals(), ("render_", "display_"))
+>>> viz = render_profiler.ProfiledModule(viz, ("draw_",))
+>>> with render_profiler.profile_span("pivot"):
+...     ...
+"""
+
+import inspect
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+import streamlit as st
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.getenv(
+    "PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+sys.path.append(project_root)
+
+from _05_commons import config, event_logger
+from _05_commons.helper import lazy_import
+
+# plotly 는 프로파일 패널을 그릴 때만 로딩
+go = lazy_import("plotly.graph_objects")
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "RENDER_PROFILE"
+PROFILE_QUERY_PARAM = "profile"
+RENDER_PROFILE_TABLE = "render_profiles"
+
+# 이전 실행 비교 시 사용할 최근 실행 수
+HISTORY_RUNS = 10
+
+event_logger.register_event_table(
+    RENDER_PROFILE_TABLE,
+    f"""CREATE TABLE IF NOT EXISTS {RENDER_PROFILE_TABLE} (
+        RUN_ID TEXT,
+        RUN_AT TEXT,
+        PAGE TEXT,
+        SPAN_ID INTEGER,
+        PARENT_ID INTEGER,
+        DEPTH INTEGER,
+        NAME TEXT,
+        START_MS REAL,
+        DURATION_MS REAL,
+        SELF_MS REAL
+    )""",
+    [
+        f"CREATE INDEX IF NOT EXISTS idx_{RENDER_PROFILE_TABLE}_page "
+        f"ON {RENDER_PROFILE_TABLE} (PAGE, RUN_AT)"
+    ],
+)
+
+# 스레드(Streamlit 스크립트 실행)별 진행 중인 프로파일
+_local = threading.local()
+
+
+# * region 프로파일 수집
+class RenderProfile:
+    """
+    한 번의 페이지 실행에서 수집한 중첩 구간 목록
+
+    - spans: [이름, 깊이, 부모 인덱스, 시작(초), 종료(초)] 목록 (시작 순서)
+    """
+
+    def __init__(self, page: str) -> None:
+        self.page = page
+        self.run_id = uuid.uuid4().hex[:12]
+        self.run_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.spans: List[list] = []
+        self._stack: List[int] = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        parent = self._stack[-1] if self._stack else None
+        record = [name, len(self._stack), parent, time.perf_counter(), None]
+        self.spans.append(record)
+        self._stack.append(len(self.spans) - 1)
+        try:
+            yield
+        finally:
+            record[4] = time.perf_counter()
+            self._stack.pop()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        수집한 구간을 DataFrame 으로 변환합니다.
+
+        Returns:
+            pd.DataFrame: RUN_ID, RUN_AT, PAGE, SPAN_ID, PARENT_ID, DEPTH, NAME,
+                START_MS, DURATION_MS, SELF_MS(하위 구간 제외 시간) 컬럼
+        """
+        now = time.perf_counter()
+        rows = []
+        for span_id, (name, depth, parent, start, end) in enumerate(self.spans):
+            rows.append(
+                {
+                    "RUN_ID": self.run_id,
+                    "RUN_AT": self.run_at,
+                    "PAGE": self.page,
+                    "SPAN_ID": span_id,
+                    "PARENT_ID": parent,
+                    "DEPTH": depth,
+                    "NAME": name,
+                    "START_MS": (start - self._origin) * 1000,
+                    "DURATION_MS": ((end or now) - start) * 1000,
+                }
+            )
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df.assign(SELF_MS=pd.Series(dtype="float64"))
+
+        child_ms = df.groupby("PARENT_ID")["DURATION_MS"].sum()
+        df["SELF_MS"] = df["DURATION_MS"] - df["SPAN_ID"].map(child_ms).fillna(0)
+        return df.round({"START_MS": 2, "DURATION_MS": 2, "SELF_MS": 2})
+
+
+def current_profile() -> Optional[RenderProfile]:
+    """현재 스레드에서 진행 중인 프로파일 (비활성화 시 None)"""
+    return getattr(_local, "profile", None)
+
+
+def is_profiling_enabled() -> bool:
+    """환경 변수 또는 URL 쿼리 파라미터로 프로파일링이 켜져 있는지 확인합니다."""
+    if os.getenv(PROFILE_ENV, "0") not in ("", "0"):
+        return True
+    try:
+        value = st.query_params.get(PROFILE_QUERY_PARAM, "")
+    except Exception:
+        return False
+    return value.lower() in ("1", "true", "on")
+
+
+@contextmanager
+def page_profile(page: str, show_panel: bool = True) -> Iterator[None]:
+    """
+    페이지 실행 전체를 최상위 구간으로 측정합니다.
+    정상 종료 시 결과를 저장하고 사이드바 패널을 표시합니다.
+    (이미 진행 중인 프로파일이 있으면 하위 구간으로 동작)
+
+    Args:
+        page: 페이지명
+        show_panel: 사이드바 패널 표시 여부
+    """
+    if current_profile() is not None:
+        with profile_span(page):
+            yield
+        return
+    if not is_profiling_enabled():
+        yield
+        return
+
+    profile = RenderProfile(page)
+    _local.profile = profile
+    try:
+        with profile.span(page):
+            yield
+    except BaseException:
+        # st.stop / st.rerun 등으로 중단된 실행은 저장만 수행
+        _local.profile = None
+        save_profile(profile)
+        raise
+    _local.profile = None
+    save_profile(profile)
+    if show_panel:
+        render_profile_panel(profile)
+
+
+@contextmanager
+def profile_span(name: str) -> Iterator[None]:
+    """프로파일 진행 중일 때만 구간을 측정합니다."""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+    with profile.span(name):
+        yield
+
+
+def profiled(func: Callable, name: Optional[str] = None) -> Callable:
+    """함수 호출을 구간으로 측정하는 래퍼 (프로파일 비활성화 시 원본 함수 바로 호출)"""
+    span_name = name or func.__name__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = current_profile()
+        if profile is None:
+            return func(*args, **kwargs)
+        with profile.span(span_name):
+            return func(*args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def profile_functions(namespace: Dict[str, Any], prefixes: Tuple[str, ...]) -> int:
+    """
+    네임스페이스(페이지 모듈의 globals())에서 접두어가 일치하는 함수를 계측 래퍼로 교체합니다.
+
+    Args:
+        namespace: 함수가 정의된 네임스페이스
+        prefixes: 계측할 함수명 접두어 (예: ("render_", "display_"))
+
+    Returns:
+        int: 교체한 함수 수
+    """
+    count = 0
+    for name, obj in list(namespace.items()):
+        if (
+            name.startswith(prefixes)
+            and inspect.isfunction(obj)
+            and not getattr(obj, "__profiled__", False)
+        ):
+            namespace[name] = profiled(obj, name)
+            count += 1
+    return count
+
+
+class ProfiledModule:
+    """
+    모듈 프록시: 접두어가 일치하는 함수(예: viz.draw_*)를 호출할 때 구간을 측정합니다.
+    원본 모듈은 수정하지 않으므로 다른 페이지에는 영향이 없습니다.
+    """
+
+    def __init__(self, module: ModuleType, prefixes: Tuple[str, ...]) -> None:
+        self._module = module
+        self._prefixes = prefixes
+        self._label = module.__name__.rsplit(".", 1)[-1]
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._module, attr)
+        if attr.startswith(self._prefixes) and callable(value):
+            value = profiled(value, f"{self._label}.{attr}")
+            setattr(self, attr, value)
+        return value
+
+
+# * region 저장 / 조회
+def save_profile(profile: RenderProfile) -> None:
+    """프로파일 구간을 버퍼링 이벤트 로거로 저장합니다."""
+    try:
+        ev_logger = event_logger.get_event_logger()
+        for row in profile.to_frame().to_dict("records"):
+            ev_logger.log(RENDER_PROFILE_TABLE, row)
+    except Exception as e:
+        logger.warning(f"렌더링 프로파일 저장 실패: {str(e)}")
+
+
+def load_render_profiles(
+    page: str,
+    runs: int = HISTORY_RUNS,
+    exclude_run_id: Optional[str] = None,
+    db_path: str = config.SQLITE_DB_PATH,
+) -> pd.DataFrame:
+    """
+    페이지의 최근 실행 프로파일을 조회합니다.
+
+    Args:
+        page: 페이지명
+        runs: 조회할 최근 실행 수
+        exclude_run_id: 제외할 실행 ID (현재 실행)
+        db_path: SQLite DB 파일 경로
+
+    Returns:
+        pd.DataFrame: 최근 실행들의 구간 기록
+    """
+    query = f"""
+        SELECT * FROM {RENDER_PROFILE_TABLE}
+        WHERE PAGE = ? AND RUN_ID IN (
+            SELECT RUN_ID FROM {RENDER_PROFILE_TABLE}
+            WHERE PAGE = ? AND RUN_ID != ?
+            GROUP BY RUN_ID ORDER BY MAX(RUN_AT) DESC LIMIT ?
+        )
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            return pd.read_sql_query(
+                query, conn, params=(page, page, exclude_run_id or "", runs)
+            )
+    except Exception as e:
+        logger.warning(f"렌더링 프로파일 조회 실패: {str(e)}")
+        return pd.DataFrame()
+
+
+def compare_with_history(
+    current: pd.DataFrame, history: pd.DataFrame, max_depth: int = 2
+) -> pd.DataFrame:
+    """
+    현재 실행의 구간별 소요시간을 이전 실행 평균과 비교합니다.
+    (같은 이름의 구간이 여러 번 호출되면 합산)
+
+    Args:
+        current: RenderProfile.to_frame 결과
+        history: load_render_profiles 결과
+        max_depth: 비교할 최대 깊이
+
+    Returns:
+        pd.DataFrame: NAME, CURRENT_MS, CALLS, HISTORY_AVG_MS, DELTA_MS (CURRENT_MS 내림차순)
+    """
+    current = current[current["DEPTH"] <= max_depth]
+    summary = current.groupby("NAME").agg(
+        CURRENT_MS=("DURATION_MS", "sum"), CALLS=("DURATION_MS", "size")
+    )
+    if history.empty:
+        summary["HISTORY_AVG_MS"] = float("nan")
+    else:
+        per_run = history.groupby(["RUN_ID", "NAME"])["DURATION_MS"].sum()
+        summary["HISTORY_AVG_MS"] = per_run.groupby("NAME").mean()
+    summary["DELTA_MS"] = summary["CURRENT_MS"] - summary["HISTORY_AVG_MS"]
+    return summary.sort_values("CURRENT_MS", ascending=False).reset_index()
+
+
+# * region 사이드바 패널
+def build_flame_figure(df: pd.DataFrame) -> "go.Figure":
+    """
+    구간 기록을 깊이별 가로 막대(플레임 차트)로 그립니다.
+    x축은 페이지 시작 기준 경과시간(ms), 아래로 갈수록 하위 구간입니다.
+    """
+    fig = go.Figure(
+        go.Bar(
+            x=df["DURATION_MS"],
+            base=df["START_MS"],
+            y=df["DEPTH"],
+            orientation="h",
+            text=df["NAME"],
+            textposition="inside",
+            insidetextanchor="start",
+            customdata=df[["NAME", "DURATION_MS", "SELF_MS"]],
+            hovertemplate=(
+                "<b>%{customdata[0]}</b><br>"
+                "Total : %{customdata[1]:,.0f} ms<br>"
+                "Self : %{customdata[2]:,.0f} ms<extra></extra>"
+            ),
+            marker=dict(color=df["SELF_MS"], colorscale="OrRd", line=dict(width=1)),
+        )
+    )
+    fig.update_layout(
+        height=80 + 28 * (df["DEPTH"].max() + 1),
+        margin=dict(l=10, r=10, t=10, b=30),
+        bargap=0.05,
+        xaxis=dict(title_text="ms"),
+        yaxis=dict(autorange="reversed", showticklabels=False),
+    )
+    return fig
+
+
+def render_profile_panel(profile: RenderProfile) -> None:
+    """사이드바에 현재 실행의 플레임 차트와 이전 실행 대비 소요시간을 표시합니다."""
+    df = profile.to_frame()
+    if df.empty:
+        return
+
+    history = load_render_profiles(profile.page, exclude_run_id=profile.run_id)
+    comparison = compare_with_history(df, history)
+    total_ms = df.loc[df["DEPTH"] == 0, "DURATION_MS"].sum()
+
+    with st.sidebar.expander(
+        f"Render Profile : {total_ms:,.0f} ms", icon=":material/speed:", expanded=True
+    ):
+        st.plotly_chart(build_flame_figure(df), use_container_width=True)
+        st.dataframe(
+            comparison,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "CURRENT_MS": st.column_config.NumberColumn("ms", format="%.0f"),
+                "HISTORY_AVG_MS": st.column_config.NumberColumn(
+                    f"Avg (last {HISTORY_RUNS})", format="%.0f"
+                ),
+                "DELTA_MS": st.column_config.NumberColumn("Δ ms", format="%+.0f"),
+            },
+        )
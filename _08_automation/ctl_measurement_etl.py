@@ -0,0 +1,137 @@
+"""
+CTL(CTMS) 측정 데이터 로컬 저장소 적재 자동화 스크립트
+- CTMS_RESULT_DATA 를 월 단위로 한 번만 스캔하여 추출
+- TOL/SPEC 문자열을 한 번 파싱하여 LL/UL 숫자 컬럼으로 저장
+- Parquet 데이터셋(MRM_MONTH=YYYY-MM 파티션)으로 저장하며, 파티션 내부는 M_CODE, MRM_DATE
+  순으로 정렬하여 행 그룹 통계(min/max)가 M_CODE 조회 인덱스 역할을 하도록 함
+
+df_ctl.get_ctl_raw_individual_df 및 그룹 집계 함수는 요청 기간이 모두 적재되어 있으면
+이 저장소를 조회합니다. 스케줄러(cron / 작업 스케줄러)에 등록하여 매일 실행합니다.
+
+사용 예시:
+    python _08_automation/ctl_measurement_etl.py           # 전월 ~ 당월 갱신
+
+    # 과거 기간 일괄 적재
+    from _08_automation.ctl_measurement_etl import run_ctl_etl
+    run_ctl_etl("20230101", "20251231")
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database.db_client import get_client
+from _01_query.GMES.q_ctl import get_ctl_extract_query
+from _02_preprocessing.GMES import df_ctl
+from _05_commons import config
+
+# 파티션 내 행 그룹 크기 (M_CODE 조회 시 읽는 최소 단위)
+ROWS_PER_GROUP = 50_000
+
+
+def extract_ctl_month(month: pd.Period) -> pd.DataFrame:
+    """
+    한 달치 CTMS 측정 데이터를 추출하여 LL/UL 이 계산된 long 포맷으로 반환합니다.
+
+    Args:
+        month: 추출할 월
+
+    Returns:
+        pd.DataFrame: CTL_COLUMNS + MRM_MONTH 컬럼의 측정 데이터
+    """
+    query = get_ctl_extract_query(
+        start_date=month.start_time.strftime("%Y%m%d"),
+        end_date=month.end_time.strftime("%Y%m%d"),
+    )
+    df = get_client("snowflake").execute(query)
+    df.columns = df.columns.str.upper()
+
+    df = df_ctl.expand_ctl_sides(df)
+    for col in ["MRM_DATE", "PRDT_DATE"]:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+    for col in ["M_CODE", "DOC_NO", "JDG"]:
+        df[col] = df[col].astype("string")
+    df["ACTUAL"] = pd.to_numeric(df["ACTUAL"], errors="coerce")
+    df[df_ctl.CTL_PARTITION_COL] = month.strftime("%Y-%m")
+    return df
+
+
+def write_ctl_partition(
+    df: pd.DataFrame, store_path: str = config.CTL_STORE_PATH
+) -> None:
+    """
+    측정 데이터를 월 파티션 단위로 교체 저장합니다. (해당 월 기존 파일은 삭제)
+
+    Args:
+        df: extract_ctl_month 결과
+        store_path: 로컬 CTL 저장소 경로
+    """
+    Path(store_path).mkdir(parents=True, exist_ok=True)
+    df = df.sort_values(["M_CODE", "MRM_DATE"], kind="stable").reset_index(drop=True)
+    table = df_ctl.pa.Table.from_pandas(df, preserve_index=False)
+
+    df_ctl.pa_dataset.write_dataset(
+        table,
+        store_path,
+        format="parquet",
+        partitioning=df_ctl._ctl_partitioning(),
+        existing_data_behavior="delete_matching",
+        max_rows_per_group=ROWS_PER_GROUP,
+        min_rows_per_group=min(ROWS_PER_GROUP, max(len(df), 1)),
+        basename_template="part-{i}.parquet",
+    )
+
+
+def run_ctl_etl(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    store_path: str = config.CTL_STORE_PATH,
+) -> tuple[bool, str]:
+    """
+    기간 내 각 월을 추출하여 로컬 CTL 저장소에 적재합니다.
+    (부분 월 적재로 파티션이 덮어써지지 않도록 항상 월 전체 단위로 처리)
+
+    Args:
+        start_date: 시작일자 (기본값: 전월 1일)
+        end_date: 종료일자 (기본값: 오늘)
+        store_path: 로컬 CTL 저장소 경로
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    end = pd.Timestamp(end_date) if end_date else pd.Timestamp(config.today)
+    start = (
+        pd.Timestamp(start_date) if start_date else (end.to_period("M") - 1).start_time
+    )
+    months = pd.period_range(start, end, freq="M")
+    print(f"CTL 측정 데이터 적재 시작 ({months[0]} ~ {months[-1]})")
+
+    for month in months:
+        try:
+            df = extract_ctl_month(month)
+            if df.empty:
+                print(f"[{month}] 조회된 데이터가 없습니다. (기존 파티션 유지)")
+                continue
+            write_ctl_partition(df, store_path)
+            print(f"[{month}] {len(df)}건 적재 완료")
+        except Exception as e:
+            error_msg = f"[{month}] CTL 측정 데이터 적재 중 오류 발생: {str(e)}"
+            print(error_msg)
+            return False, error_msg
+
+    return True, f"CTL 측정 데이터 적재 완료 ({len(months)}개월)"
+
+
+def main():
+    success, message = run_ctl_etl()
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
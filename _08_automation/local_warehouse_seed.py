@@ -0,0 +1,541 @@
+"""
+로컬 웨어하우스 시딩 자동화 스크립트
+- HKT_DW.MES.*, HKT_DW.BI_DWUSER.*, CQMS 원본 테이블과 같은 구조의 합성 데이터를 로컬 SQLite DB에 생성
+- 마스터(공장 / M-Code / SPEC_CD)를 공유하여 _01_query 빌더의 조인이 실제와 같이 연결됨
+- 같은 행 수 / 시드 / 종료일이면 항상 같은 데이터 (벤치마크 재현성)
+
+생성한 DB는 WAREHOUSE_BACKEND=local 설정 시 db_client.get_client 가 사용합니다.
+(_00_database/local_warehouse.py 참조)
+
+사용 예시:
+    python _08_automation/local_warehouse_seed.py --rows 100000 --end-date 2025-12-31
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database import local_warehouse
+from _01_query.CQMS import q_4m_change, q_quality_issue
+from _01_query.GMES import q_ctl, q_rr
+from _02_preprocessing.GMES import df_rr
+from _05_commons import config
+
+SEED = 0
+DEFAULT_ROWS = 10_000
+SEED_YEARS = 3
+PLANTS = ["DP", "KP", "JP", "HP", "CP", "MP", "IP", "TP"]
+OEMS = ["HKMC", "VW", "BMW", "TOYOTA", "GM", "FORD", "TESLA", "NISSAN"]
+# HGWS 반품 쿼리의 WERKS -> 공장 매핑 코드
+WERKS_CODES = ["6220", "1120", "6510", "4310", "1130", "6110", "3A10", "2910"]
+DFT_CODES = [f"D{i:02d}" for i in range(1, 21)]
+RR_METHODS = df_rr.ISO_LST + df_rr.SVP_LST + df_rr.SAE_LST
+
+
+def _date_strings(rng, n: int, start: pd.Timestamp, end: pd.Timestamp, fmt: str):
+    """[start, end] 구간의 임의 날짜 문자열 배열"""
+    days = max((end - start).days, 1)
+    dates = start + pd.to_timedelta(rng.integers(0, days + 1, n), "D")
+    return dates.strftime(fmt).to_numpy()
+
+
+def build_local_warehouse_tables(
+    n_rows: int = DEFAULT_ROWS, end_date: Optional[str] = None, seed: int = SEED
+) -> Dict[str, pd.DataFrame]:
+    """
+    로컬 웨어하우스 원본 테이블별 합성 데이터를 생성합니다.
+
+    Args:
+        n_rows: 사실(fact) 테이블별 행 수 (마스터 / CQMS 테이블은 비례하여 생성)
+        end_date: 데이터 종료일 (YYYY-MM-DD, 기본값: 오늘). 시작일은 SEED_YEARS 년 전 1월 1일
+        seed: 난수 시드
+
+    Returns:
+        Dict[str, pd.DataFrame]: 원본 테이블명("<SCHEMA>.<TABLE>") -> 데이터
+    """
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(end_date or config.today_str)
+    start = pd.Timestamp(year=end.year - SEED_YEARS + 1, month=1, day=1)
+
+    # 마스터: M-Code 별 공장 / KT(완제품) / HX(그린타이어) SPEC_CD
+    n_mcodes = int(np.clip(n_rows // 50, 50, 20_000))
+    mcodes = np.arange(1_000_000, 1_000_000 + n_mcodes).astype(str)
+    m_plant = rng.choice(PLANTS, n_mcodes)
+    m_stxc = rng.choice(["S", "M", "T"], n_mcodes, p=[0.6, 0.3, 0.1])
+    kt_specs = np.char.add("KT", np.arange(n_mcodes).astype(str))
+    hx_specs = np.char.add("HX", np.arange(n_mcodes).astype(str))
+    m_oem = rng.choice(OEMS, n_mcodes)
+    tables: Dict[str, pd.DataFrame] = {}
+
+    tables["MES.MAS_D_LMASTR101"] = pd.DataFrame(
+        {
+            "PLT_CD": np.tile(m_plant, 2),
+            "PRD_CD": np.tile(mcodes, 2),
+            "SPEC_CD": np.concatenate([kt_specs, hx_specs]),
+            "SPEC_FG": np.repeat(["KT", "HX"], n_mcodes),
+            "STXC": np.tile(m_stxc, 2),
+        }
+    )
+
+    def fact_keys(n: int):
+        idx = rng.integers(0, n_mcodes, n)
+        return idx, m_plant[idx]
+
+    # GMES UF
+    idx, plants = fact_keys(n_rows)
+    tables["MES.QLT_F_LQLTTR105"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SPEC_CD": kt_specs[idx],
+            "STXC": m_stxc[idx],
+            "INS_FG": rng.choice(["1", "0"], n_rows, p=[0.9, 0.1]),
+            "INS_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d"),
+            "JDG_GR": rng.choice(
+                np.arange(1, 9),
+                n_rows,
+                p=[0.4, 0.3, 0.14, 0.08, 0.04, 0.02, 0.01, 0.01],
+            ),
+            "RFV": rng.gamma(4, 1.5, n_rows).round(2),
+            "LFV": rng.gamma(3, 1.2, n_rows).round(2),
+            "CON": rng.normal(0, 3, n_rows).round(2),
+            "RFV_1TH_HRM": rng.gamma(3, 1.0, n_rows).round(2),
+        }
+    )
+    tables["MES.QLT_D_LCOMTR201"] = pd.DataFrame(
+        {
+            "PLT_CD": m_plant,
+            "SPEC_CD": kt_specs,
+            "RFV_3GR": 12.0,
+            "RFV_4GR": 10.0,
+            "LFV_3GR": 9.0,
+            "LFV_4GR": 8.0,
+            "CON_3GR": 6.0,
+            "CON_N3GR": -6.0,
+            "CON_4GR": 5.0,
+            "CON_N4GR": -5.0,
+            "RFV_1TH_HRM_3GR": 8.0,
+            "RFV_1TH_HRM_4GR": 7.0,
+        }
+    )
+
+    # GMES 부적합 (공정 / 출하)
+    idx, plants = fact_keys(n_rows)
+    tables["MES.QLT_F_LQLTTR107"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SPEC_CD": kt_specs[idx],
+            "DFT_CD": rng.choice(DFT_CODES, n_rows),
+            "INS_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d"),
+            "DFT_QTY": rng.poisson(1.5, n_rows),
+            "STXC": m_stxc[idx],
+            "INS_TP_CD": rng.choice(list("1235679"), n_rows),
+        }
+    )
+    n_ship = max(n_rows // 5, 1)
+    idx, plants = fact_keys(n_ship)
+    tables["MES.QLT_F_LQLTTR120"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SPEC_CD": kt_specs[idx],
+            "DFT_CD": rng.choice(DFT_CODES, n_ship),
+            "INS_DATE": _date_strings(rng, n_ship, start, end, "%Y%m%d"),
+            "DFT_QTY": rng.poisson(1.2, n_ship),
+            "DFT_OCCR_FG": rng.choice([1, 0], n_ship, p=[0.9, 0.1]),
+        }
+    )
+
+    # GMES 그린타이어 중량 (HX SPEC, INS_DATE 는 검사 일시)
+    idx, plants = fact_keys(n_rows)
+    std_wgt = (8 + (idx % 40) * 0.1).round(2)
+    tables["MES.QLT_F_LQLTTR127"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SPEC_CD": hx_specs[idx],
+            "INS_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d%H%M%S"),
+            "STD_WGT": std_wgt,
+            "MRM_WGT": (std_wgt + rng.normal(0, 0.06, n_rows)).round(3),
+            "UPM_STD_WGT": (std_wgt * 1.01).round(3),
+            "LWM_STD_WGT": (std_wgt * 0.99).round(3),
+        }
+    )
+
+    # GMES 가류 생산
+    idx, plants = fact_keys(n_rows)
+    tables["MES.WRK_F_LWRKTS118"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SPEC_CD": kt_specs[idx],
+            "WRK_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d"),
+            "PRDT_QTY": rng.integers(50, 2_000, n_rows),
+        }
+    )
+
+    # GMES RR: 시료(309) 1건당 시험 결과(316) 1~2건(재첨부), OE 스펙(510)은 M-Code 별 1건
+    n_samples = max(n_rows // 2, 1)
+    idx, plants = fact_keys(n_samples)
+    smpl_dates = _date_strings(rng, n_samples, start, end, "%y%m%d")
+    smpl_ids = np.char.add(
+        smpl_dates.astype(str), np.char.zfill(np.arange(n_samples).astype(str), 6)
+    )
+    tables["MES.QLT_D_LQLTTR309"] = pd.DataFrame(
+        {
+            "PLT_CD": plants,
+            "SMPL_ID": smpl_ids,
+            "MTL_CD": mcodes[idx],
+            "TEST_FG": rng.choice([2, 1], n_samples, p=[0.8, 0.2]),
+            "PGS_STS": rng.choice([80, 40], n_samples, p=[0.95, 0.05]),
+        }
+    )
+    n_attach = rng.integers(1, 3, n_samples)
+    test_idx = np.repeat(np.arange(n_samples), n_attach)
+    n_tests = len(test_idx)
+    positions = q_rr.rr_corr_csv[["PLANT", "POSITION"]].drop_duplicates()
+    plant_positions = {
+        plant: grp["POSITION"].to_numpy() for plant, grp in positions.groupby("PLANT")
+    }
+    test_plants = plants[test_idx]
+    test_positions = np.full(n_tests, "-", dtype=object)
+    for plant, plant_pos in plant_positions.items():
+        mask = test_plants == plant
+        test_positions[mask] = rng.choice(plant_pos, mask.sum())
+    rrc = rng.normal(8.5, 0.6, n_tests).round(3)
+    tables["MES.QLT_F_LQLTTR316"] = pd.DataFrame(
+        {
+            "PLT_CD": test_plants,
+            "SMPL_ID": smpl_ids[test_idx],
+            "ATCH_SEQ": np.concatenate([np.arange(1, k + 1) for k in n_attach]),
+            "WARM_LOAD": rng.uniform(400, 700, n_tests).round(1),
+            "RSLT_RRC_CORR": (rrc * rng.normal(1.0, 0.01, n_tests)).round(3),
+            "RSLT_RRC": rrc,
+            "RSLT_RR": (rrc * 5.5).round(2),
+            "STD_TEST_POS": test_positions,
+            "JDG": rng.choice([10, 20, 30, 40], n_tests, p=[0.9, 0.04, 0.04, 0.02]),
+            "TEST_VAL": rng.normal(8.5, 0.6, n_tests).round(3),
+            "TEST_SEQ": 1,
+        }
+    )
+    rr_index = rng.uniform(6.5, 10.5, n_mcodes).round(1)
+    tables["MES.QLT_D_LQLTTR510"] = pd.DataFrame(
+        {
+            "PLT_CD": m_plant,
+            "MTL_CD": mcodes,
+            "CAR_MAKER_2": m_oem,
+            "V_MODEL": np.char.add("VEH", (np.arange(n_mcodes) % 30).astype(str)),
+            "USE_TROT": rng.choice(["Y", "N"], n_mcodes, p=[0.8, 0.2]),
+            "APV_RRC_MIN": np.where(rng.random(n_mcodes) < 0.3, 0, rr_index - 0.5),
+            "APV_RRC_MAX": rr_index + 0.5,
+            "TEST_FG": rng.integers(1, len(RR_METHODS) + 1, n_mcodes).astype(str),
+            "START_DATE": start.strftime("%Y%m%d"),
+            "END_DATE": None,
+            "SPEC_CHANGE": "N",
+            "APP_DATE": start.strftime("%Y%m%d"),
+            "RR_INDEX": rr_index.astype(str),
+            "SELANT_FLG": "N",
+        }
+    )
+    tables["MES.MST_D_LCOMTR107"] = pd.DataFrame(
+        {
+            "CD_ID": "F570",
+            "CD_ITEM": [str(i + 1) for i in range(len(RR_METHODS))],
+            "CD_ITEM_NM": RR_METHODS,
+        }
+    )
+
+    # CTMS 측정 (MFG_CD 5~11번째 자리가 M-Code)
+    idx, plants = fact_keys(n_rows)
+    spec_val = rng.uniform(5, 30, n_rows).round(1)
+    tol_min = rng.random(n_rows) < 0.2
+    u_avg = (spec_val + rng.normal(0, 0.3, n_rows)).round(2)
+    l_avg = (spec_val + rng.normal(0, 0.3, n_rows)).round(2)
+    tables["BI_DWUSER.CTMS_RESULT_DATA"] = pd.DataFrame(
+        {
+            "MRM_RPT_NO": np.char.add("CTL", np.arange(n_rows).astype(str)),
+            "PLT_CD": plants,
+            "MRM_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d"),
+            "MRM_OBJ_FG": rng.choice(q_ctl.CTMS_PURPOSE, n_rows),
+            "CTL_ITEM_NM": rng.choice(sorted(set(q_ctl.CTMS_MRM_ITEM)), n_rows),
+            "STXC": rng.choice(["S", "M", "V"], n_rows),
+            "MFG_CD": np.char.add(np.char.add("KT01", mcodes[idx]), "A"),
+            "SPEC_SIZE": "225/45R17",
+            "SPEC_PTRN": np.char.add("K", (idx % 50).astype(str)),
+            "U_SPEC_VAL": spec_val.astype(str),
+            "L_SPEC_VAL": spec_val.astype(str),
+            "TOL_VAL": np.where(tol_min, "0.5 min", "±0.8"),
+            "U_MRM_AVG": u_avg,
+            "L_MRM_AVG": l_avg,
+            "U_MRM_RST": np.where(np.abs(u_avg - spec_val) <= 0.8, "OK", "NG"),
+            "L_MRM_RST": np.where(np.abs(l_avg - spec_val) <= 0.8, "OK", "NG"),
+            "PRDT_DATE": _date_strings(rng, n_rows, start, end, "%Y%m%d"),
+        }
+    )
+
+    # SAP(HOPE) OE 적용 / 셀인, HGWS 반품
+    electric = rng.choice(
+        [" ", "EV", "FCEV", "HEV"], n_mcodes, p=[0.6, 0.25, 0.05, 0.1]
+    )
+    projects = np.char.add("PJT", (np.arange(n_mcodes) % 100).astype(str))
+    tables["BI_DWUSER.SAP_ZSTT70041"] = pd.DataFrame(
+        {
+            "MATNR": mcodes,
+            "ZGUBUN": rng.choice(["Active", "Inactive"], n_mcodes, p=[0.9, 0.1]),
+            "ZCARMAKER1": m_oem,
+            "ZCARMAKER2": m_oem,
+            "ZVEHICLE1": np.char.add("VEH", (np.arange(n_mcodes) % 30).astype(str)),
+            "ZVEHICLE2": np.char.add("VEH", (np.arange(n_mcodes) % 30).astype(str)),
+            "ZPROJECT": projects,
+            "ZELECTRIC": electric,
+            "ZSIZE": "225/45R17",
+            "ZLOAD_INDEX": "94W",
+            "ZPLY": "XL",
+            "ZTYPE": np.char.add("K", (np.arange(n_mcodes) % 50).astype(str)),
+            "ZL": "94",
+            "ZW": "W",
+            "ZUSE": "PCR",
+            "ZBR": "HANKOOK",
+            "ZPRODUCT": "VENTUS",
+            "LBTXT": m_plant,
+            "ZOEPLANT": m_oem,
+            "ZSOP": start.strftime("%Y%m"),
+            "ZEOP": None,
+        }
+    )
+    n_sellin = max(n_rows // 2, 1)
+    idx, _ = fact_keys(n_sellin)
+    tables["BI_DWUSER.SAP_ZSDT02068"] = pd.DataFrame(
+        {
+            "MATERIAL": mcodes[idx],
+            "BILMON": _date_strings(rng, n_sellin, start, end, "%Y%m"),
+            "QUANTITY": rng.integers(10, 5_000, n_sellin),
+            "ZOERESEG": rng.choice(["OE", "RE"], n_sellin, p=[0.7, 0.3]),
+        }
+    )
+    n_return = max(n_rows // 10, 1)
+    idx, _ = fact_keys(n_return)
+    tables["BI_DWUSER.SAP_ZSRT10000"] = pd.DataFrame(
+        {
+            "WERKS": rng.choice(WERKS_CODES, n_return),
+            "ZMATNR": mcodes[idx],
+            "ZCLS3T": rng.choice(["Tread", "Sidewall", "Bead"], n_return),
+            "ZCLS4T": rng.choice(["Crack", "Bulge", "Separation"], n_return),
+            "ZNAME": rng.choice(["Irregular wear", "Vibration", "Noise"], n_return),
+            "ZREASON": rng.choice(
+                ["W3SA", "W4SB", "W1SA"], n_return, p=[0.45, 0.45, 0.1]
+            ),
+            "ZRULT": rng.choice(["A", "R"], n_return, p=[0.9, 0.1]),
+            "SPMON": _date_strings(rng, n_return, start, end, "%Y%m"),
+        }
+    )
+    tables["VW_SF_HOPE_SELLIN_SUMMARY"] = pd.DataFrame(
+        {
+            "RE/OE": tables["BI_DWUSER.SAP_ZSDT02068"]["ZOERESEG"],
+            "Prod.": tables["BI_DWUSER.SAP_ZSDT02068"]["MATERIAL"],
+            "Billing YYYYMM": tables["BI_DWUSER.SAP_ZSDT02068"]["BILMON"],
+            "Qty.": tables["BI_DWUSER.SAP_ZSDT02068"]["QUANTITY"],
+            "Data Category": "SELLIN",
+        }
+    )
+
+    # 인사정보
+    n_persons = 100
+    person_ids = np.arange(21_300_000, 21_300_000 + n_persons).astype(str)
+    tables["BI_GERPUSER.ZHRT90041"] = pd.DataFrame(
+        {"PERNR": person_ids, "NACHN": [f"Person {i}" for i in range(n_persons)]}
+    )
+
+    # CQMS 품질 이슈
+    n_issues = max(n_rows // 20, 50)
+    issue_seq = np.arange(1, n_issues + 1)
+    create = pd.Timestamp(start) + pd.to_timedelta(
+        rng.integers(0, (end - start).days + 1, n_issues), "D"
+    )
+    complete = rng.random(n_issues) < 0.7
+    complete_date = create + pd.to_timedelta(rng.integers(1, 120, n_issues), "D")
+    complete_date = complete_date.where(complete & (complete_date <= end))
+    categories: List[str] = ["Appearance", "Uniformity", "Noise", "Vibration", "Etc"]
+    tables["EQMSUSER.CQMS_ISSUE_CATEGORY_DATA"] = pd.DataFrame(
+        {"SEQ": np.arange(1, len(categories) + 1), "DATA_NM": categories}
+    )
+    tables["EQMSUSER.CQMS_QUALITY_ISSUE"] = pd.DataFrame(
+        {
+            "CQMS_QUALITY_ISSUE_SEQ": issue_seq,
+            "CQMS_ISSUE_DOCUMENT_NO": np.char.add("QI", issue_seq.astype(str)),
+            "PLANT": rng.choice(PLANTS, n_issues),
+            "STAGE": rng.choice(["02", "01"], n_issues, p=[0.9, 0.1]),
+            "OEM": rng.choice(OEMS, n_issues),
+            "VEH_MODEL": "VEH",
+            "PROJECT": "PJT",
+            "ISSUE_ETC": None,
+            "DESCRIPTION": "Synthetic issue",
+            "CAUSE_OF_DEFECT": None,
+            "ISSUE_CATEGORY_SEQ_1": rng.integers(1, len(categories) + 1, n_issues),
+            "ISSUE_CATEGORY_SEQ_2": rng.integers(1, len(categories) + 1, n_issues),
+            "ISSUE_CATEGORY_SEQ_3": rng.integers(1, len(categories) + 1, n_issues),
+            "OWNER_NO": rng.choice(person_ids, n_issues),
+            "RESPONSIBLE_PERSON_NO": rng.choice(person_ids, n_issues),
+            "OCCURRENCE_DATE": create.strftime("%Y-%m-%d"),
+            "CREATE_DATE": create.strftime("%Y-%m-%d 09:00:00"),
+            "START_DATE": create.strftime("%Y-%m-%d 09:00:00"),
+            "RETURN_TIRE_YN": rng.choice(["Y", "N"], n_issues),
+            "RETURN_TIRE_RECEIVED_DATE": None,
+            "CQMS_ISSUE_ISSUE_ARENA_APPROVAL_DATE": create.strftime(
+                "%Y-%m-%d 10:00:00"
+            ),
+            "IS_HK_FAULT": rng.choice(["Y", "N", None], n_issues, p=[0.7, 0.2, 0.1]),
+            "ISSUE_COMPLETE_DATE": complete_date.strftime("%Y-%m-%d 18:00:00"),
+            "OE_QUALITY_ISSUE_STATUS": np.where(
+                complete_date.notna(), "ISSUE_PROCESS_COMPLETE", "ISSUE_PROCESS_ING"
+            ),
+            "ISSUE_AREA": rng.choice(sorted(q_quality_issue.ISSUE_AREA_DICT), n_issues),
+            "ISSUE_REGION": rng.choice(sorted(q_quality_issue.MARKET_DICT), n_issues),
+        }
+    )
+    tables["EQMSUSER.CQMS_QUALITY_ISSUE_MATERIAL"] = pd.DataFrame(
+        {
+            "CQMS_QUALITY_ISSUE_SEQ": issue_seq,
+            "MATERIAL_NO": rng.choice(mcodes, n_issues),
+        }
+    )
+
+    # CQMS 4M 변경 / 고객 감사
+    n_docs = max(n_rows // 50, 20)
+    doc_ids = np.arange(1, n_docs + 1)
+    doc_no = np.char.add("4M", doc_ids.astype(str))
+    tables["EQMSUSER.CQMS_CHANGE_M"] = pd.DataFrame(
+        {
+            "ID": doc_ids,
+            "DOCUMENT_NO": doc_no,
+            "DOC_CATEGORY": rng.choice(sorted(q_4m_change.PURPOSE_4M_DICT), n_docs),
+            "DOC_SUBJECT": "Synthetic 4M change",
+            "DOC_STATUS": rng.choice(sorted(q_4m_change.STATUS_4M_DICT), n_docs),
+            "CREATE_USER_ID": rng.choice(person_ids, n_docs),
+            "CREATE_DT": _date_strings(rng, n_docs, start, end, "%Y%m%d"),
+            "DOC_END_ARENA_UPDATE_DT": _date_strings(rng, n_docs, start, end, "%Y%m%d"),
+            "DEL_YN": rng.choice(["N", "Y"], n_docs, p=[0.95, 0.05]),
+        }
+    )
+    tables["EQMSUSER.CQMS_SUB_MCODE_D"] = pd.DataFrame(
+        {
+            "ID": doc_ids,
+            "M_SIZE": "225/45R17",
+            "M_PATTERN": "K127",
+            "DOCUMENT_NO": doc_no,
+            "M_CODE": rng.choice(mcodes, n_docs),
+        }
+    )
+    n_audits = max(n_rows // 200, 10)
+    audit_seq = np.arange(1, n_audits + 1)
+    tables["EQMSUSER.CQMS_CUSTOMER_AUDIT"] = pd.DataFrame(
+        {
+            "CQMS_CUSTOMER_AUDIT_SEQ": audit_seq,
+            "AUDIT_TYPE": rng.choice(["S", "P"], n_audits),
+            "AUDIT_SUBJECT": "Synthetic audit",
+            "AUDIT_START_DATE": _date_strings(rng, n_audits, start, end, "%Y-%m-%d"),
+            "AUDIT_END_DATE": _date_strings(rng, n_audits, start, end, "%Y-%m-%d"),
+            "OWNER_ACC_NO": rng.choice(person_ids, n_audits),
+            "CREATE_DATE": _date_strings(
+                rng, n_audits, start, end, "%Y-%m-%d 09:00:00"
+            ),
+            "UPDATE_DATE": _date_strings(
+                rng, n_audits, start, end, "%Y-%m-%d 18:00:00"
+            ),
+            "AUDIT_STATUS": rng.choice(
+                [
+                    "CUSTOMER_AUDIT_ARENA_REPORT_C",
+                    "CUSTOMER_AUDIT_REG_START",
+                    "CUSTOMER_AUDIT_DELETED",
+                ],
+                n_audits,
+            ),
+        }
+    )
+    tables["EQMSUSER.CQMS_CUSTOMER_AUDIT_MATERIAL"] = pd.DataFrame(
+        {
+            "CQMS_CUSTOMER_AUDIT_SEQ": audit_seq,
+            "PLANT": rng.choice(PLANTS, n_audits),
+            "CAR_MAKER": rng.choice(OEMS, n_audits),
+            "PROJECT": "PJT",
+            "MATERIAL": rng.choice(mcodes, n_audits),
+        }
+    )
+    return tables
+
+
+def seed_local_warehouse(
+    n_rows: int = DEFAULT_ROWS,
+    db_path: Optional[str] = None,
+    end_date: Optional[str] = None,
+    seed: int = SEED,
+) -> tuple[bool, str]:
+    """
+    로컬 웨어하우스 DB를 (기존 테이블을 지우고) 합성 데이터로 새로 생성합니다.
+
+    Args:
+        n_rows: 사실(fact) 테이블별 행 수
+        db_path: 로컬 웨어하우스 DB 경로 (기본값: config.LOCAL_WAREHOUSE_PATH)
+        end_date: 데이터 종료일 (YYYY-MM-DD, 기본값: 오늘)
+        seed: 난수 시드
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    db_path = db_path or config.LOCAL_WAREHOUSE_PATH
+    print(f"로컬 웨어하우스 시딩 시작 (행 수: {n_rows}, 경로: {db_path})")
+
+    try:
+        tables = build_local_warehouse_tables(n_rows, end_date, seed)
+    except Exception as e:
+        error_msg = f"합성 데이터 생성 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    try:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(db_path) as conn:
+            local_warehouse.create_local_warehouse_schema(conn)
+            for source_table, df in tables.items():
+                df.to_sql(
+                    local_warehouse.local_table_name(source_table),
+                    conn,
+                    if_exists="append",
+                    index=False,
+                    chunksize=50_000,
+                )
+            conn.execute("ANALYZE")
+        conn.close()
+    except Exception as e:
+        error_msg = f"SQLite 저장 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    total = sum(len(df) for df in tables.values())
+    return (
+        True,
+        f"로컬 웨어하우스 생성 완료 (테이블 수: {len(tables)}, 레코드 수: {total})",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 웨어하우스 합성 데이터 시딩")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="테이블별 행 수")
+    parser.add_argument("--db-path", default=None, help="로컬 웨어하우스 DB 경로")
+    parser.add_argument("--end-date", default=None, help="데이터 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--seed", type=int, default=SEED, help="난수 시드")
+    args = parser.parse_args()
+
+    success, message = seed_local_warehouse(
+        args.rows, args.db_path, args.end_date, args.seed
+    )
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+HOPE OE 어플리케이션 참조 테이블 갱신 자동화 스크립트
+- Snowflake HOPE OE 어플리케이션(SAP_ZSTT70041) 전체를 SQLite 참조 테이블로 저장
+- M_CODE / PLANT 인덱스 생성
+
+대시보드(df_oeapp)는 이 참조 테이블만 조회하므로, 스케줄러(cron / 작업 스케줄러)에
+등록하여 주기적으로 실행합니다.
+
+사용 예시:
+    python _08_automation/oeapp_reference_cache.py
+"""
+
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.HOPE import df_oeapp
+
+
+def refresh_oeapp_reference() -> tuple[bool, str]:
+    """
+    Snowflake에서 OE 어플리케이션 데이터를 조회하여 SQLite 참조 테이블을 갱신합니다.
+    조회에 실패하면 기존 참조 테이블을 유지합니다.
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    print("HOPE OE 어플리케이션 참조 테이블 갱신 시작")
+
+    try:
+        df = df_oeapp.fetch_oeapp_from_source()
+        if df is None or df.empty:
+            return False, "Snowflake에서 OE 어플리케이션 데이터를 가져오지 못했습니다."
+        print(f"Snowflake에서 {len(df)}건의 데이터 조회 완료")
+    except Exception as e:
+        error_msg = f"Snowflake 연결 또는 쿼리 실행 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    try:
+        df_oeapp.save_oeapp_reference(df)
+    except Exception as e:
+        error_msg = f"SQLite 저장 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    return True, f"테이블 '{df_oeapp.OEAPP_REF_TABLE}' 갱신 완료 (레코드 수: {len(df)})"
+
+
+def main():
+    success, message = refresh_oeapp_reference()
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
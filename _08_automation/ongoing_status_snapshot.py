@@ -0,0 +1,115 @@
+"""
+진행중 현황(On-going) 스냅샷 생성 자동화 스크립트
+- 품질이슈 / 4M 변경 / 고객 감사의 진행중 항목을 SQLite 스냅샷 테이블로 저장
+- 일자별 미결(backlog) 건수를 이력 테이블에 누적 (같은 날 재실행 시 덮어씀)
+
+Ongoing Status Tracker 는 이 스냅샷만 조회하므로, 스케줄러(cron / 작업 스케줄러)에
+등록하여 주기적으로 실행합니다.
+
+사용 예시:
+    python _08_automation/ongoing_status_snapshot.py
+"""
+
+import sys
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import Dict
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.CQMS import df_ongoing_snapshot
+from _05_commons import config
+
+# SQLite DB 파일 경로 설정
+DB_PATH = config.SQLITE_DB_PATH
+
+
+def save_snapshots_to_sqlite(
+    snapshots: Dict[str, pd.DataFrame],
+    history: pd.DataFrame,
+    db_path: str = DB_PATH,
+) -> None:
+    """
+    스냅샷 테이블을 교체하고 미결 이력을 하나의 트랜잭션으로 저장합니다.
+
+    Args:
+        snapshots: {소스: 스냅샷 데이터프레임}
+        history: summarize_backlog 결과 (당일 이력 행)
+        db_path: SQLite DB 파일 경로
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    with sqlite3.connect(db_path) as conn:
+        for source, df in snapshots.items():
+            df.to_sql(
+                df_ongoing_snapshot.SNAPSHOT_TABLES[source],
+                conn,
+                if_exists="replace",
+                index=False,
+            )
+
+        # 같은 날짜 이력은 최신 실행 결과로 교체
+        table = df_ongoing_snapshot.HISTORY_TABLE
+        conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {table} (
+                SNAPSHOT_DATE TEXT, SOURCE TEXT, PLANT TEXT,
+                ELAPSED_BUCKET TEXT, COUNT INTEGER
+            )"""
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_date ON {table} (SNAPSHOT_DATE)"
+        )
+        conn.execute(
+            f"DELETE FROM {table} WHERE SNAPSHOT_DATE IN "
+            f"({','.join('?' * history['SNAPSHOT_DATE'].nunique())})",
+            tuple(history["SNAPSHOT_DATE"].unique()),
+        )
+        history.to_sql(table, conn, if_exists="append", index=False)
+
+
+def generate_ongoing_snapshots(db_path: str = DB_PATH) -> tuple[bool, str]:
+    """
+    CQMS 원본에서 진행중 항목 스냅샷을 생성하여 SQLite DB에 저장합니다.
+    한 소스라도 조회에 실패하면 기존 스냅샷을 유지합니다.
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    snapshot_at = pd.Timestamp.now()
+    print(f"진행중 현황 스냅샷 생성 시작 ({snapshot_at:%Y-%m-%d %H:%M:%S})")
+
+    try:
+        snapshots = {
+            source: df_ongoing_snapshot.build_ongoing_snapshot(source, snapshot_at)
+            for source in df_ongoing_snapshot.SNAPSHOT_TABLES
+        }
+    except Exception as e:
+        error_msg = f"CQMS 데이터 조회 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    for source, df in snapshots.items():
+        print(f"[{source}] 진행중 항목 {len(df)}건")
+
+    try:
+        history = df_ongoing_snapshot.summarize_backlog(snapshots, snapshot_at)
+        save_snapshots_to_sqlite(snapshots, history, db_path)
+    except Exception as e:
+        error_msg = f"SQLite 저장 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    return True, "진행중 현황 스냅샷 저장 완료"
+
+
+def main():
+    success, message = generate_ongoing_snapshots()
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+인사정보 참조 테이블 갱신 자동화 스크립트
+- Snowflake 인사정보(ZHRT90041)와 수동 등록 인원을 SQLite 참조 테이블로 저장
+- PNL_NO 인덱스 생성
+
+로그인(app.py)은 이 참조 테이블만 조회하므로, 스케줄러(cron / 작업 스케줄러)에
+등록하여 주기적으로 실행합니다.
+
+사용 예시:
+    python _08_automation/personnel_directory_cache.py
+"""
+
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.SAP import df_personnel
+
+
+def refresh_personnel_directory() -> tuple[bool, str]:
+    """
+    Snowflake에서 인사정보를 조회하여 SQLite 참조 테이블을 갱신합니다.
+    조회에 실패하면 기존 참조 테이블을 유지합니다.
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    print("인사정보 참조 테이블 갱신 시작")
+
+    try:
+        df = df_personnel.fetch_personnel_from_source()
+        print(f"Snowflake에서 {len(df)}건의 데이터 조회 완료 (수동 등록 인원 포함)")
+    except Exception as e:
+        error_msg = f"Snowflake 연결 또는 쿼리 실행 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    try:
+        df_personnel.save_personnel_reference(df)
+    except Exception as e:
+        error_msg = f"SQLite 저장 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    return (
+        True,
+        f"테이블 '{df_personnel.PERSONNEL_REF_TABLE}' 갱신 완료 (레코드 수: {len(df)})",
+    )
+
+
+def main():
+    success, message = refresh_personnel_directory()
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,6 @@ import streamlit as st
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from scipy.stats import norm
 from dataclasses import dataclass
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
@@ -25,6 +24,10 @@ from _01_query.helper_sql import format_date_to_yyyymmdd
 from _02_preprocessing.GMES.df_rr import get_rr_df, get_rr_oe_list_df
 from _02_preprocessing.GMES.df_uf import calculate_uf_pass_rate
 from _02_preprocessing.GMES.df_ctl import get_groupby_mcode_ctl_df
+from _05_commons.helper import lazy_import
+
+# scipy는 RR 합격률(PDF) 계산 시점에만 로딩
+scipy_stats = lazy_import("scipy.stats")
 
 # 양산 평가 결과 테이블의 스키마 정의
 MASS_ASSESS_RESULT_SCHEMA = [
@@ -71,8 +74,8 @@ def calculate_pass_rate_with_pdf(df: pd.DataFrame) -> pd.DataFrame:
         if std == 0 or pd.isna(std):
             return np.nan
 
-        upper_prob = norm.cdf(row["spec_max"], loc=mean, scale=std)
-        lower_prob = norm.cdf(row["spec_min"], loc=mean, scale=std)
+        upper_prob = scipy_stats.norm.cdf(row["spec_max"], loc=mean, scale=std)
+        lower_prob = scipy_stats.norm.cdf(row["spec_min"], loc=mean, scale=std)
         return upper_prob - lower_prob
 
     return df.assign(rr_pass_rate_pdf=df.apply(get_pass_rate, axis=1))
@@ -0,0 +1,242 @@
+"""
+RR(롤링 저항) OE 샘플 로컬 저장소 증분 적재 자동화 스크립트
+- 저장소에 적재된 최신 SMPL_ID(YYMMDD + 순번)를 워터마크로 사용하여 그 이후 샘플만 조회
+- 늦게 승인/등록되는 샘플을 위해 워터마크 날짜에서 RR_LOOKBACK_DAYS 만큼 겹쳐서 조회하고,
+  이미 적재된 (PLANT, SMPL_ID, TEST_SEQ, ATCH_SEQ) 행은 제외하여 추가만 함
+  (기존 파일은 수정하지 않음)
+  - 적재된 샘플의 새 시험(TEST_SEQ)은 새 행으로 추가
+  - 적재된 시험의 새 첨부(ATCH_SEQ)도 추가하고, 조회 시 시험별 마지막 첨부 행만 사용
+- 새 파일은 저장소 안의 _staging 디렉토리에 쓴 뒤 파티션 경로로 이동하므로,
+  조회 중인 프로세스는 쓰는 중인(불완전한) 파일을 읽지 않음
+- Parquet 데이터셋(SMPL_MONTH=YYYY-MM 파티션)으로 저장하며 보정 전 원본 값을 저장
+  (보정식은 df_rr.load_rr_raw 에서 조회 시 적용하므로 보정 계수 변경 시 재적재 불필요)
+
+df_rr.load_rr_raw 는 요청 기간이 적재 범위 안이고 최근 동기화된 경우 이 저장소를 조회하므로,
+웨어하우스 조회 비용은 조회 기간이 아닌 신규 샘플 수에만 비례합니다.
+스케줄러(cron / 작업 스케줄러)에 등록하여 매시간 실행합니다.
+
+겹쳐서 조회하는 기간보다 오래된 샘플의 변경과 규격(OE_TEST_METHOD, MASS_YN 등) 변경은
+반영되지 않으므로, 필요 시 rebuild=True 로 전체 재적재합니다.
+저장 형식 버전(df_rr.RR_STORE_VERSION)이 다른 저장소는 기존 적재 시작일부터 자동으로 재적재합니다.
+
+사용 예시:
+    python _08_automation/rr_sample_etl.py           # 신규 샘플 증분 적재
+
+    # 최초 적재 (2021년 이후 전체) / 전체 재적재
+    from _08_automation.rr_sample_etl import run_rr_sample_etl
+    run_rr_sample_etl("2021-01-01")
+    run_rr_sample_etl("2021-01-01", rebuild=True)
+"""
+
+import json
+import shutil
+import sys
+import uuid
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database.db_client import get_client
+from _01_query.GMES import q_rr
+from _02_preprocessing.GMES import df_rr
+from _05_commons import config
+
+# 워터마크 이전에서 다시 조회할 기간 (늦게 등록되는 샘플 반영)
+RR_LOOKBACK_DAYS = 14
+# 파티션 내 행 그룹 크기
+ROWS_PER_GROUP = 100_000
+# 적재 중인 파일을 쓰는 임시 디렉토리 (pyarrow dataset 은 "_" 로 시작하는 경로를 읽지 않음)
+RR_STAGING_DIR = "_staging"
+
+
+def get_watermark(store_path: str = config.RR_STORE_PATH) -> Optional[str]:
+    """저장소에 적재된 가장 최신 SMPL_ID (비어 있으면 None)"""
+    table = df_rr.open_rr_store(store_path).to_table(columns=["SMPL_ID"])
+    if table.num_rows == 0:
+        return None
+    return table["SMPL_ID"].to_pandas().max()
+
+
+def extract_rr_samples(min_smpl_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    min_smpl_id 이후 OE RR 샘플을 조회하여 저장소 타입으로 변환합니다.
+
+    Args:
+        min_smpl_id: 조회할 최소 SMPL_ID (None 이면 전체 이력)
+
+    Returns:
+        pd.DataFrame: RR_STORE_TYPES + SMPL_MONTH 컬럼의 보정 전 샘플 데이터
+    """
+    query = q_rr.rr(test_fg="OE", min_smpl_id=min_smpl_id, include_smpl_id=True)
+    df = get_client("snowflake").execute(query)
+    df.columns = df.columns.str.upper()
+
+    for col, kind in df_rr.RR_STORE_TYPES.items():
+        if kind == "timestamp":
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif kind == "int":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+        elif kind == "float":
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        else:
+            df[col] = df[col].astype("string")
+    df[df_rr.RR_PARTITION_COL] = df["SMPL_DATE"].dt.strftime("%Y-%m")
+    return df[list(df_rr.RR_STORE_TYPES) + [df_rr.RR_PARTITION_COL]]
+
+
+def append_rr_samples(
+    df: pd.DataFrame, store_path: str = config.RR_STORE_PATH
+) -> tuple[int, int]:
+    """
+    저장소에 없는 (PLANT, SMPL_ID, TEST_SEQ, ATCH_SEQ) 행만 새 파일로 추가합니다.
+
+    Args:
+        df: extract_rr_samples 결과
+        store_path: 로컬 RR 샘플 저장소 경로
+
+    Returns:
+        tuple[int, int]: (추가한 행 수, 그중 이미 적재된 시험의 새 첨부 행 수)
+    """
+    if df.empty:
+        return 0, 0
+
+    # 겹쳐서 조회한 구간의 기존 키만 읽어 중복 제외
+    field = df_rr.pa_dataset.field
+    row_keys = df_rr.RR_SAMPLE_KEYS + ["ATCH_SEQ"]
+    existing = (
+        df_rr.open_rr_store(store_path)
+        .to_table(
+            columns=row_keys,
+            filter=(field(df_rr.RR_PARTITION_COL) >= df[df_rr.RR_PARTITION_COL].min())
+            & (field("SMPL_ID") >= df["SMPL_ID"].min()),
+        )
+        .to_pandas()
+        .astype(object)
+    )
+    keys = df[row_keys].astype(object)
+    is_new = ~pd.MultiIndex.from_frame(keys).isin(pd.MultiIndex.from_frame(existing))
+    is_superseding = is_new & pd.MultiIndex.from_frame(keys[df_rr.RR_SAMPLE_KEYS]).isin(
+        pd.MultiIndex.from_frame(existing[df_rr.RR_SAMPLE_KEYS])
+    )
+    superseded = int(is_superseding.sum())
+    df = df[is_new].sort_values(row_keys, kind="stable")
+    if df.empty:
+        return 0, 0
+
+    # 파일 이름이 겹치지 않도록 적재 시각 + 임의 값 사용 (기존 파일은 그대로 둠)
+    batch_id = f"{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+    table = df_rr.pa.Table.from_pandas(
+        df, schema=df_rr.rr_store_schema(), preserve_index=False
+    )
+    partitioning = df_rr.open_rr_store(store_path).partitioning
+
+    # 임시 디렉토리에 모두 쓴 뒤 파일별로 파티션 경로에 이동 (같은 파일 시스템에서 원자적)
+    # 이동 중 중단되어 일부 파일만 이동된 경우에도 다음 실행에서 이동된 샘플은 중복 제외됨
+    staging = Path(store_path) / RR_STAGING_DIR / batch_id
+    try:
+        df_rr.pa_dataset.write_dataset(
+            table,
+            str(staging),
+            format="parquet",
+            partitioning=partitioning,
+            max_rows_per_group=ROWS_PER_GROUP,
+            min_rows_per_group=min(ROWS_PER_GROUP, len(df)),
+            basename_template=f"part-{batch_id}-{{i}}.parquet",
+        )
+        for path in sorted(staging.rglob("*.parquet")):
+            target = Path(store_path) / path.relative_to(staging)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return len(df), superseded
+
+
+def write_rr_store_meta(meta: dict, store_path: str = config.RR_STORE_PATH) -> None:
+    """적재 정보를 임시 파일에 쓴 뒤 교체하여 저장합니다."""
+    path = Path(store_path) / df_rr.RR_STORE_META
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def run_rr_sample_etl(
+    start_date: Optional[str] = None,
+    store_path: str = config.RR_STORE_PATH,
+    lookback_days: int = RR_LOOKBACK_DAYS,
+    rebuild: bool = False,
+) -> tuple[bool, str]:
+    """
+    신규 OE RR 샘플을 로컬 RR 샘플 저장소에 증분 적재합니다.
+
+    Args:
+        start_date: 최초 적재 시작일 (기본값: 전체 이력, 이미 적재된 저장소에서는 무시)
+        store_path: 로컬 RR 샘플 저장소 경로
+        lookback_days: 워터마크 이전에서 다시 조회할 일수
+        rebuild: 기존 저장소를 삭제하고 start_date 부터 다시 적재할지 여부
+
+    Returns:
+        tuple[bool, str]: (처리 성공 여부, 결과 메시지)
+    """
+    try:
+        meta = df_rr.read_rr_store_meta(store_path)
+        if meta is not None and meta.get("version") != df_rr.RR_STORE_VERSION:
+            # 저장 형식이 바뀐 저장소는 기존 적재 시작일부터 다시 적재
+            print("RR 샘플 저장소 형식이 변경되어 전체 재적재합니다.")
+            start_date = start_date or meta.get("covered_from")
+            rebuild = True
+        if rebuild:
+            shutil.rmtree(store_path, ignore_errors=True)
+            meta = None
+
+        if meta is None:
+            covered_from = (
+                pd.Timestamp(start_date).strftime("%Y-%m-%d") if start_date else None
+            )
+        else:
+            covered_from = meta.get("covered_from")
+
+        watermark = get_watermark(store_path)
+        if watermark:
+            since = pd.to_datetime(watermark[:6], format="%y%m%d") - pd.Timedelta(
+                days=lookback_days
+            )
+        else:
+            since = pd.Timestamp(covered_from) if covered_from else None
+        min_smpl_id = since.strftime("%y%m%d") if since is not None else None
+        print(f"RR 샘플 적재 시작 (SMPL_ID >= {min_smpl_id or '전체'})")
+
+        synced_at = datetime.now().isoformat(timespec="seconds")
+        df = extract_rr_samples(min_smpl_id)
+        appended, superseded = append_rr_samples(df, store_path)
+        write_rr_store_meta(
+            {
+                "version": df_rr.RR_STORE_VERSION,
+                "covered_from": covered_from,
+                "synced_at": synced_at,
+                "watermark": get_watermark(store_path),
+                "superseded": (meta or {}).get("superseded", 0) + superseded,
+            },
+            store_path,
+        )
+    except Exception as e:
+        error_msg = f"RR 샘플 적재 중 오류 발생: {str(e)}"
+        print(error_msg)
+        return False, error_msg
+
+    return True, f"RR 샘플 적재 완료 (조회 {len(df)}건, 신규 {appended}건)"
+
+
+def main():
+    success, message = run_rr_sample_etl()
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
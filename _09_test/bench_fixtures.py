@@ -0,0 +1,416 @@
+"""
+전처리 벤치마크용 합성 웨어하우스 데이터
+
+_01_query 빌더가 생성하는 쿼리의 결과와 같은 스키마(컬럼명 / 타입 / 값 분포)의
+합성 DataFrame 을 만들고, get_client 대신 쿼리의 원본 테이블명으로 합성 데이터를
+반환하는 FakeWarehouseClient 를 제공합니다. Snowflake 결과는 SQLAlchemy 와 같이
+대문자 컬럼명을 소문자로 반환합니다. 쿼리의 연도 범위 조건(EXTRACT(YEAR FROM ...)
+BETWEEN ...)은 합성 데이터에도 적용합니다.
+
+사용 예시:
+    fixtures = build_fixtures(100_000)
+    with fake_warehouse(fixtures):
+        df_uf.calculate_uf_pass_rate("1024247", "20250101", "20251231")
+"""
+
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from _00_database import db_client
+from _01_query.GMES import q_rr
+from _02_preprocessing.GMES import df_rr
+from _02_preprocessing.HOPE import df_oeapp
+
+FIXTURE_SEED = 0
+# 미완료 건의 기간 계산(CountWorkingDays) 기준일을 고정하기 위한 기준일
+FIXTURE_TODAY = "2025-12-31"
+PLANTS = ["DP", "KP", "JP", "HP", "CP", "MP", "IP", "TP"]
+OEMS = ["HKMC", "VW", "BMW", "TOYOTA", "GM", "FORD", "TESLA", "NISSAN"]
+
+# 쿼리 원본 테이블 -> 합성 데이터 이름 (앞에서부터 먼저 일치하는 항목 사용)
+QUERY_ROUTES: List[tuple] = [
+    ("QLT_F_LQLTTR316", "rr"),
+    ("QLT_D_LQLTTR510", "rr_oe_list"),
+    ("QLT_F_LQLTTR105", "uf"),
+    ("QLT_F_LQLTTR107", "ncf"),
+    ("QLT_F_LQLTTR127", "weight"),
+    ("WRK_F_LWRKTS118", "production"),
+    ("CTMS_RESULT_DATA", "ctl"),
+    ("CQMS_QUALITY_ISSUE", "quality_issue"),
+    ("SELLIN_MONTHLY_AGG", "sellin"),
+    (df_oeapp.OEAPP_REF_TABLE.upper(), "oeapp"),
+]
+
+# 쿼리의 연도 범위 조건 (예: q_quality_issue.query_quality_issue(year) 의
+# "EXTRACT(YEAR FROM QI.REG_DATE) BETWEEN 2025-2 AND 2025")
+YEAR_RANGE_PATTERN = re.compile(
+    r"EXTRACT\(YEAR FROM (?:\w+\.)?(\w+)\)\s+BETWEEN\s+(\d{4})\s*-\s*(\d+)\s+AND\s+(\d{4})",
+    re.IGNORECASE,
+)
+
+
+def _mcodes(n_rows: int) -> np.ndarray:
+    """행 수에 비례하는 M-Code 목록 (제품당 평균 200건)"""
+    n_mcodes = int(np.clip(n_rows // 200, 50, 50_000))
+    return np.arange(1_000_000, 1_000_000 + n_mcodes).astype(str)
+
+
+def _dates(rng: np.random.Generator, n_rows: int, start="2023-01-01", days=1095):
+    return pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days, n_rows), "D")
+
+
+# * region 쿼리 결과 스키마별 합성 데이터
+def make_rr_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_rr.rr 결과 (측정 위치는 보정계수 CSV 의 공장별 위치 사용)"""
+    rng = np.random.default_rng(seed)
+    positions = q_rr.rr_corr_csv[q_rr.rr_corr_csv["PLANT"].isin(PLANTS)][
+        ["PLANT", "POSITION"]
+    ].drop_duplicates()
+    picked = positions.iloc[rng.integers(0, len(positions), n_rows)]
+    methods = np.array(df_rr.ISO_LST + df_rr.SVP_LST + df_rr.SAE_LST)
+    warm_load = rng.uniform(400, 700, n_rows).round(1)
+    rrc = rng.normal(8.5, 0.6, n_rows).round(3)
+    return pd.DataFrame(
+        {
+            "plant": picked["PLANT"].to_numpy(),
+            "smpl_date": _dates(rng, n_rows).date,
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "warm_load": warm_load,
+            "rrc": rrc,
+            "hk_global": (rrc * rng.normal(1.0, 0.01, n_rows)).round(3),
+            "position": picked["POSITION"].to_numpy(),
+            "jdg": rng.choice(
+                ["OK", "재시험", "NG", "N/A"], n_rows, p=[0.9, 0.04, 0.04, 0.02]
+            ),
+            "test_result_old": rng.normal(8.5, 0.6, n_rows).round(3),
+            "oe_test_method": rng.choice(methods, n_rows),
+            "mass_yn": rng.choice(["Y", "N"], n_rows, p=[0.8, 0.2]),
+            "start_dt": pd.Timestamp("2022-01-01").date(),
+            "end_dt": None,
+        }
+    )
+
+
+def make_rr_oe_list_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_rr.rr_oe_list 결과 (공장 x M-Code 별 RR 스펙 1건)"""
+    rng = np.random.default_rng(seed)
+    mcodes = _mcodes(n_rows)
+    n_specs = len(mcodes) * 2
+    rr_index = rng.uniform(6.5, 10.5, n_specs).round(1)
+    usl_only = rng.random(n_specs) < 0.3
+    return pd.DataFrame(
+        {
+            "plant": rng.choice(PLANTS, n_specs),
+            "m_code": np.repeat(mcodes, 2),
+            "oem": rng.choice(OEMS, n_specs),
+            "veh": "VEH",
+            "mass": "Y",
+            "spec_min": np.where(usl_only, 0, rr_index - 0.5),
+            "spec_max": rr_index + 0.5,
+            "test_fg": rng.choice(["01", "02", "03"], n_specs),
+            "mass_yn": "Y",
+            "start_date": "20220101",
+            "end_date": None,
+            "spec_change": "N",
+            "chg_app_date": "20220101",
+            "rr_index": rr_index.astype(str),
+            "selant_flg": "N",
+            "cd_item": "01",
+        }
+    ).drop_duplicates(["plant", "m_code"])
+
+
+def make_uf_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_uf.uf_product_assess 결과 (JDG_1 ~ JDG_8 등급별 수량)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "plant": rng.choice(PLANTS + ["OT"], n_rows),
+            "spec_cd": rng.integers(10_000, 99_999, n_rows).astype(str),
+        }
+    )
+    jdg = rng.poisson(lam=[40, 30, 15, 8, 4, 2, 1, 1], size=(n_rows, 8))
+    for grade in range(8):
+        df[f"jdg_{grade + 1}"] = jdg[:, grade]
+    return df
+
+
+def make_ncf_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_ncf.ncf_monthly 결과"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "plant": rng.choice(PLANTS, n_rows),
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "spec_cd": rng.integers(10_000, 99_999, n_rows).astype(str),
+            "stxc": rng.choice(["S", "M", "T"], n_rows),
+            "yyyy": rng.integers(2023, 2026, n_rows),
+            "mm": rng.integers(1, 13, n_rows),
+            "dft_cd": rng.choice([f"D{code:03d}" for code in range(40)], n_rows),
+            "ncf_qty": rng.poisson(3, n_rows),
+        }
+    )
+
+
+def make_weight_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_weight.gt_wt_individual 결과"""
+    rng = np.random.default_rng(seed)
+    std_wgt = rng.uniform(8, 14, n_rows).round(2)
+    mrm_wgt = (std_wgt * rng.normal(1.0, 0.01, n_rows)).round(3)
+    return pd.DataFrame(
+        {
+            "plant": rng.choice(PLANTS, n_rows),
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "spec_cd_hx": rng.integers(10_000, 99_999, n_rows).astype(str),
+            "ins_date": _dates(rng, n_rows).strftime("%Y%m%d%H%M%S"),
+            "std_wgt": std_wgt,
+            "mrm_wgt": mrm_wgt,
+            "jdg": (np.abs(mrm_wgt / std_wgt - 1) <= 0.02).astype(int),
+        }
+    )
+
+
+def make_production_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_production.curing_prdt_daily 결과"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "plant": rng.choice(PLANTS, n_rows),
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "spec_cd": rng.integers(10_000, 99_999, n_rows).astype(str),
+            "stxc": rng.choice(["S", "M", "T"], n_rows),
+            "wrk_date": _dates(rng, n_rows).strftime("%Y%m%d"),
+            "prdt_qty": rng.integers(50, 2_000, n_rows),
+        }
+    )
+
+
+def make_ctl_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_ctl.get_ctl_extract_query 결과 (상한/하한 원본 컬럼)"""
+    rng = np.random.default_rng(seed)
+    spec = rng.uniform(5, 300, n_rows).round(1)
+    upper = spec + rng.normal(0, 0.5, n_rows)
+    lower = spec + rng.normal(0, 0.5, n_rows)
+    return pd.DataFrame(
+        {
+            "doc_no": "CTL" + rng.integers(0, n_rows // 20 + 1, n_rows).astype(str),
+            "plant": rng.choice(PLANTS, n_rows),
+            "mrm_date": _dates(rng, n_rows).date,
+            "mrm_purpose": rng.choice(["OE", "MASS"], n_rows),
+            "mrm_item": rng.choice(["TREAD", "SIDEWALL", "BEAD", "INNER"], n_rows),
+            "stxc": rng.choice(["S", "M", "V"], n_rows),
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "spec_size": "225/45R17",
+            "spec_ptrn": "K127",
+            "u_spec_val": spec.astype(str),
+            "l_spec_val": spec.astype(str),
+            "tol": "±1.0",
+            "u_mrm_avg": upper.round(2),
+            "l_mrm_avg": lower.round(2),
+            "u_mrm_rst": np.where(np.abs(upper - spec) <= 1.0, "OK", "NO"),
+            "l_mrm_rst": np.where(np.abs(lower - spec) <= 1.0, "OK", "NO"),
+            "prdt_date": _dates(rng, n_rows).date,
+        }
+    )
+
+
+def make_quality_issue_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """q_quality_issue.query_quality_issue 결과 (일부 미완료 / 미반송 건 포함)"""
+    rng = np.random.default_rng(seed)
+    occ = _dates(rng, n_rows)
+    reg = occ + pd.to_timedelta(rng.integers(0, 15, n_rows), "D")
+    ctm = reg + pd.to_timedelta(rng.integers(5, 60, n_rows), "D")
+    comp = ctm + pd.to_timedelta(rng.integers(5, 90, n_rows), "D")
+    return_yn = rng.choice(["Y", "N"], n_rows, p=[0.6, 0.4])
+    rtn = pd.Series(reg + pd.to_timedelta(rng.integers(3, 30, n_rows), "D"))
+    rtn[(return_yn == "N") | (rng.random(n_rows) < 0.1)] = pd.NaT
+    is_open = rng.random(n_rows) < 0.15
+    plants = rng.choice(PLANTS, n_rows)
+    return pd.DataFrame(
+        {
+            "doc_no": [f"QI{idx:08d}" for idx in range(n_rows)],
+            "OEQ Group": pd.Series(plants).map(
+                {
+                    "KP": "G.OE Quality",
+                    "DP": "G.OE Quality",
+                    "IP": "G.OE Quality",
+                    "JP": "China OE Quality",
+                    "HP": "China OE Quality",
+                    "CP": "China OE Quality",
+                    "MP": "Europe OE Quality",
+                    "TP": "NA OE Quality",
+                }
+            ),
+            "plant": plants,
+            "stage": "02",
+            "oem": rng.choice(OEMS, n_rows),
+            "veh": "VEH",
+            "pjt": "PJT",
+            "issue_etc": None,
+            "description": "synthetic issue",
+            "cause_of_defect": None,
+            "type_cd": rng.integers(1, 5, n_rows),
+            "cat_cd": rng.integers(10, 30, n_rows),
+            "sub_cat_cd": rng.integers(100, 200, n_rows),
+            "owner_id": rng.integers(20_000_000, 20_001_000, n_rows),
+            "resp_id": rng.integers(20_000_000, 20_001_000, n_rows),
+            "occ_date": occ.strftime("%Y-%m-%d"),
+            "reg_date": reg.date,
+            "return_yn": return_yn,
+            "rtn_date": rtn.dt.strftime("%Y-%m-%d").to_numpy(),
+            "ctm_date": np.where(is_open, None, ctm.strftime("%Y-%m-%d")),
+            "hk_fault_yn": "Y",
+            "comp_date": np.where(is_open, None, comp.strftime("%Y-%m-%d")),
+            "status": np.where(is_open, "On-going", "Complete"),
+            "location": rng.choice(
+                ["In-Line(OE)", "Field", "Warehouse", "Test", "Internal"],
+                n_rows,
+                p=[0.4, 0.3, 0.1, 0.1, 0.1],
+            ),
+            "kpi": "Include",
+            "market": rng.choice(["Europe", "North America", "ASIA(Korea)"], n_rows),
+            "seq": np.arange(n_rows),
+            "m_code": rng.choice(_mcodes(n_rows), n_rows),
+            "pnl_nm": "NAME",
+            "type": rng.choice(["Appearance", "Performance", "Uniformity"], n_rows),
+            "cat": "CAT",
+            "sub_cat": "SUB_CAT",
+        }
+    )
+
+
+def make_sellin_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """SQLite sellin_monthly_agg (M-Code x 월별 공급수량)"""
+    rng = np.random.default_rng(seed)
+    months = pd.period_range("2023-01", "2025-12", freq="M")
+    mcodes = _mcodes(n_rows)
+    grid = pd.MultiIndex.from_product([mcodes, months], names=["M_CODE", "YM"])
+    df = grid.to_frame(index=False)
+    return pd.DataFrame(
+        {
+            "RE/OE": rng.choice(["OE", "RE"], len(df), p=[0.8, 0.2]),
+            "M_CODE": df["M_CODE"],
+            "YYYY": df["YM"].dt.year.astype(str),
+            "MM": df["YM"].dt.month,
+            "SUPP_QTY": rng.integers(100, 20_000, len(df)),
+        }
+    )
+
+
+def make_oeapp_frame(n_rows: int, seed: int = FIXTURE_SEED) -> pd.DataFrame:
+    """SQLite OE 어플리케이션 참조 테이블 (CTE_HOPE_OE_APP_ALL 컬럼명)"""
+    rng = np.random.default_rng(seed)
+    mcodes = _mcodes(n_rows)
+    return pd.DataFrame(
+        {
+            "m_code": mcodes,
+            "Status": rng.choice(["Supplying", "Development", "EOP"], len(mcodes)),
+            "Car Maker": rng.choice(OEMS, len(mcodes)),
+            "Project": "PJT",
+            "EV": rng.choice(["ICE", "EV"], len(mcodes), p=[0.7, 0.3]),
+            "PLANT": rng.choice(PLANTS, len(mcodes)),
+        }
+    )
+
+
+FIXTURE_BUILDERS: Dict[str, Callable[[int, int], pd.DataFrame]] = {
+    "rr": make_rr_frame,
+    "rr_oe_list": make_rr_oe_list_frame,
+    "uf": make_uf_frame,
+    "ncf": make_ncf_frame,
+    "weight": make_weight_frame,
+    "production": make_production_frame,
+    "ctl": make_ctl_frame,
+    "quality_issue": make_quality_issue_frame,
+    "sellin": make_sellin_frame,
+    "oeapp": make_oeapp_frame,
+}
+
+
+def build_fixtures(
+    n_rows: int, names: Optional[List[str]] = None, seed: int = FIXTURE_SEED
+) -> Dict[str, pd.DataFrame]:
+    """
+    합성 데이터 묶음을 생성합니다.
+
+    Args:
+        n_rows: 기준 행 수 (M-Code 수 등 차원 크기도 이에 비례)
+        names: 생성할 데이터 이름 목록 (기본값: 전체)
+        seed: 난수 시드
+
+    Returns:
+        Dict[str, pd.DataFrame]: {데이터 이름: DataFrame}
+    """
+    names = names or list(FIXTURE_BUILDERS)
+    return {name: FIXTURE_BUILDERS[name](n_rows, seed) for name in names}
+
+
+# * region 가짜 get_client
+class FakeWarehouseClient:
+    """쿼리의 원본 테이블명으로 합성 데이터를 찾아 반환하는 클라이언트"""
+
+    def __init__(self, db_type: str, fixtures: Dict[str, pd.DataFrame]) -> None:
+        self.db_type = db_type
+        self.fixtures = fixtures
+        self.queries: List[str] = []
+
+    def execute(self, query: str) -> pd.DataFrame:
+        self.queries.append(query)
+        upper_query = query.upper()
+        for marker, name in QUERY_ROUTES:
+            if marker in upper_query and name in self.fixtures:
+                # 호출 측의 컬럼 변환이 합성 원본을 바꾸지 않도록 복사본 반환
+                return self._filter_years(self.fixtures[name], query).copy()
+        raise KeyError(f"합성 데이터가 없는 쿼리입니다 ({self.db_type}): {query[:200]}")
+
+    @staticmethod
+    def _filter_years(df: pd.DataFrame, query: str) -> pd.DataFrame:
+        """쿼리의 연도 범위 조건을 합성 데이터에 적용합니다."""
+        for col, year, offset, end_year in YEAR_RANGE_PATTERN.findall(query):
+            years = pd.to_datetime(df[col.lower()]).dt.year
+            df = df[years.between(int(year) - int(offset), int(end_year)).to_numpy()]
+        return df
+
+
+@contextmanager
+def fake_warehouse(
+    fixtures: Dict[str, pd.DataFrame],
+) -> Iterator[Callable[[str], FakeWarehouseClient]]:
+    """
+    이미 로딩된 모든 프로젝트 모듈의 get_client 를 합성 데이터 클라이언트로 교체합니다.
+    (from ... import get_client 로 가져간 모듈별 참조까지 교체하고 종료 시 복원)
+
+    Args:
+        fixtures: build_fixtures 결과
+
+    Yields:
+        Callable[[str], FakeWarehouseClient]: 교체된 get_client
+    """
+    original = db_client.get_client
+
+    def fake_get_client(db_type: str = "snowflake") -> FakeWarehouseClient:
+        return FakeWarehouseClient(db_type.lower(), fixtures)
+
+    patched = [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith(("_0", "__main__"))
+        and getattr(module, "get_client", None) is original
+    ]
+    for module in patched:
+        module.get_client = fake_get_client
+    try:
+        yield fake_get_client
+    finally:
+        for module in patched:
+            module.get_client = original
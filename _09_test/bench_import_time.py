@@ -0,0 +1,139 @@
+"""
+모듈 import 시간 벤치마크
+
+각 모듈을 새 파이썬 프로세스에서 `python -X importtime` 으로 import 하여
+콜드 스타트 기준 import 비용을 측정하고 기록합니다.
+
+측정 항목:
+- TOTAL_MS: 대상 모듈 import 누적 시간 (하위 의존성 포함)
+- HEAVY_*_MS: 무거운 서드파티 의존성별 누적 시간 (로딩되지 않았으면 0)
+
+사용 예시:
+    python _09_test/bench_import_time.py
+
+결과는 `_09_test/bench_results/import_time.csv` 에 실행 시각과 함께 누적 저장되므로
+지연 로딩 적용 전후를 비교할 수 있습니다.
+"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BENCH_RESULT_DIR = PROJECT_ROOT / "_09_test" / "bench_results"
+IMPORT_TIME_CSV = BENCH_RESULT_DIR / "import_time.csv"
+
+# 측정 대상 모듈 (앱 워커 / CLI 배치에서 import 되는 진입 모듈 위주)
+TARGET_MODULES: List[str] = [
+    "_00_database.db_client",
+    "_01_query.helper_sql",
+    "_02_preprocessing.helper_pandas",
+    "_02_preprocessing.GMES.df_rr",
+    "_02_preprocessing.GMES.df_uf",
+    "_02_preprocessing.GMES.df_ctl",
+    "_02_preprocessing.GMES.df_ncf",
+    "_02_preprocessing.CQMS.df_quality_issue",
+    "_02_preprocessing.CQMS.df_4m_change",
+    "_03_visualization._02_ANALYSIS.viz_rr_analysis",
+    "_03_visualization._08_ADMIN.viz_oeassessment_result_viewer",
+]
+
+# 별도로 비용을 추적할 무거운 의존성
+HEAVY_MODULES: List[str] = [
+    "streamlit",
+    "scipy.stats",
+    "plotly.graph_objects",
+    "IPython.display",
+    "sqlalchemy",
+    "pandas",
+]
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    `-X importtime` 출력에서 모듈별 누적(cumulative) import 시간(us)을 추출합니다.
+
+    Args:
+        stderr: importtime 이 기록된 표준에러 문자열
+
+    Returns:
+        Dict[str, int]: {모듈명: 누적 시간(us)}
+    """
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cum_us, name = line.split("|", 2)
+            cumulative[name.strip()] = int(cum_us.strip())
+        except ValueError:
+            continue
+    return cumulative
+
+
+def measure_module(module: str) -> Dict[str, float]:
+    """
+    새 프로세스에서 모듈을 import 하고 import 시간을 측정합니다.
+
+    Args:
+        module: 측정할 모듈 경로
+
+    Returns:
+        Dict[str, float]: 모듈, 성공 여부, 전체/의존성별 import 시간(ms)
+    """
+    env = dict(os.environ, PROJECT_ROOT=str(PROJECT_ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    cumulative = parse_importtime(proc.stderr)
+
+    record = {
+        "MODULE": module,
+        "OK": proc.returncode == 0,
+        "TOTAL_MS": cumulative.get(module, 0) / 1000,
+    }
+    for heavy in HEAVY_MODULES:
+        record[f"HEAVY_{heavy}_MS"] = cumulative.get(heavy, 0) / 1000
+    return record
+
+
+def run_import_benchmark(modules: List[str] = TARGET_MODULES) -> pd.DataFrame:
+    """
+    대상 모듈 전체의 import 시간을 측정하여 DataFrame으로 반환합니다.
+
+    Args:
+        modules: 측정할 모듈 리스트
+
+    Returns:
+        pd.DataFrame: 모듈별 import 시간 측정 결과
+    """
+    df = pd.DataFrame([measure_module(module) for module in modules])
+    df.insert(0, "RUN_AT", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    return df.sort_values(by="TOTAL_MS", ascending=False).reset_index(drop=True)
+
+
+def save_result(df: pd.DataFrame, path: Path = IMPORT_TIME_CSV) -> None:
+    """측정 결과를 CSV에 누적 저장합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def main():
+    df = run_import_benchmark()
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(df.drop(columns="RUN_AT"))
+    save_result(df)
+    print(f"결과 저장: {IMPORT_TIME_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+판정 결과(JDG) 그룹 집계 벤치마크
+
+그룹마다 판정 값별 lambda 를 호출하던 기존 groupby().agg 방식과
+helper_pandas.tally_outcomes (그룹 x 판정 코드 1회 bincount) 방식을
+CTMS 측정 데이터(DOC_NO 단위) 합성 데이터에서 비교합니다.
+
+측정 항목:
+- LEGACY_MS: 기존 방식 (판정 값별 lambda x: (x == 값).sum())
+- TALLY_MS: helper_pandas.tally_outcomes
+- MATCH: 두 방식의 집계 결과 일치 여부
+
+사용 예시:
+    python _09_test/bench_jdg_tally.py
+
+결과는 `_09_test/bench_results/jdg_tally.csv` 에 실행 시각과 함께 누적 저장됩니다.
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from _02_preprocessing import helper_pandas
+from _02_preprocessing.GMES import df_ctl
+
+BENCH_RESULT_DIR = PROJECT_ROOT / "_09_test" / "bench_results"
+JDG_TALLY_CSV = BENCH_RESULT_DIR / "jdg_tally.csv"
+
+# 측정할 행 수 (측정 항목 단위)
+ROW_COUNTS: List[int] = [100_000, 1_000_000, 5_000_000]
+
+
+def make_ctl_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """get_ctl_raw_individual_df 결과와 같은 판정 컬럼 구성의 합성 데이터 (문서당 약 40항목)"""
+    rng = np.random.default_rng(seed)
+    n_docs = max(n_rows // 40, 1)
+    doc_idx = rng.integers(0, n_docs, n_rows)
+    dates = pd.date_range("2021-01-01", "2025-12-31", freq="D")
+    return pd.DataFrame(
+        {
+            "DOC_NO": pd.Series(doc_idx).map("CTL-{:07d}".format),
+            "MRM_DATE": dates[doc_idx % len(dates)],
+            "JDG": rng.choice(
+                ["OK", "NO", "NI", None], n_rows, p=[0.85, 0.05, 0.08, 0.02]
+            ),
+        }
+    )
+
+
+def legacy_ctl_tally(df: pd.DataFrame) -> pd.DataFrame:
+    """기존 get_groupby_doc_ctl_df 의 집계 방식"""
+    return (
+        df.groupby(["DOC_NO", "MRM_DATE"])
+        .agg(
+            COUNT=("JDG", "count"),
+            OK=("JDG", lambda x: (x == "OK").sum()),
+            NO=("JDG", lambda x: (x == "NO").sum()),
+            NI=("JDG", lambda x: (x == "NI").sum()),
+        )
+        .reset_index()
+    )
+
+
+def tally_ctl(df: pd.DataFrame) -> pd.DataFrame:
+    return helper_pandas.tally_outcomes(
+        df, ["DOC_NO", "MRM_DATE"], "JDG", df_ctl.CTL_JDG_OUTCOMES
+    )
+
+
+CASES: Dict[str, tuple[Callable, Callable, Callable]] = {
+    "CTL_DOC": (make_ctl_frame, legacy_ctl_tally, tally_ctl),
+}
+
+
+def measure(case: str, n_rows: int) -> Dict[str, object]:
+    """행 수별로 두 방식의 실행 시간을 측정하고 결과 일치 여부를 확인합니다."""
+    make_frame, legacy_func, tally_func = CASES[case]
+    df = make_frame(n_rows)
+
+    start = time.perf_counter()
+    legacy = legacy_func(df)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    tally = tally_func(df)
+    tally_ms = (time.perf_counter() - start) * 1000
+
+    match = legacy.shape == tally.shape and np.array_equal(
+        legacy.select_dtypes("number").to_numpy(),
+        tally[legacy.select_dtypes("number").columns].to_numpy(),
+    )
+
+    return {
+        "CASE": case,
+        "ROWS": n_rows,
+        "GROUPS": len(tally),
+        "LEGACY_MS": round(legacy_ms, 1),
+        "TALLY_MS": round(tally_ms, 1),
+        "SPEEDUP": round(legacy_ms / tally_ms, 1),
+        "MATCH": match,
+    }
+
+
+def run_tally_benchmark(row_counts: List[int] = ROW_COUNTS) -> pd.DataFrame:
+    """케이스 / 행 수별 벤치마크 결과를 DataFrame으로 반환합니다."""
+    df = pd.DataFrame(
+        [measure(case, n_rows) for case in CASES for n_rows in row_counts]
+    )
+    df.insert(0, "RUN_AT", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    return df
+
+
+def save_result(df: pd.DataFrame, path: Path = JDG_TALLY_CSV) -> None:
+    """측정 결과를 CSV에 누적 저장합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def main():
+    df = run_tally_benchmark()
+    print(df.drop(columns="RUN_AT").to_string(index=False))
+    save_result(df)
+    print(f"결과 저장: {JDG_TALLY_CSV}")
+
+
+if __name__ == "__main__":
+    main()
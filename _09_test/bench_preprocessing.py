@@ -0,0 +1,311 @@
+"""
+전처리 함수 오프라인 벤치마크 (합성 웨어하우스 데이터)
+
+bench_fixtures 의 합성 데이터를 가짜 get_client 로 공급하여 Snowflake 없이
+_02_preprocessing 주요 함수의 실행 시간을 10k ~ 10M 행 규모에서 측정하고,
+커밋된 기준값(bench_baselines/preprocessing.json)과 비교합니다.
+
+비교 항목:
+- MATCH: 결과 shape / 체크섬이 기준값과 같은지 (로직 변경으로 결과가 바뀌면 False)
+- BASELINE_MS / RATIO: 기준 실행 시간과 비율 (RATIO > TIME_TOLERANCE 이면 REGRESSION)
+
+사용 예시:
+    python _09_test/bench_preprocessing.py                          # 10k, 100k
+    python _09_test/bench_preprocessing.py --rows 1000000 10000000 --cases get_rr_df
+    python _09_test/bench_preprocessing.py --update-baseline         # 기준값 갱신
+
+결과는 `_09_test/bench_results/preprocessing.csv` 에 누적 저장되며,
+결과 불일치 또는 성능 저하가 있으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(PROJECT_ROOT / "_09_test"))
+
+from bench_fixtures import FIXTURE_TODAY, build_fixtures, fake_warehouse
+from _02_preprocessing import helper_pandas
+from _02_preprocessing.CQMS import df_quality_issue
+from _02_preprocessing.GMES import df_rr, df_uf
+
+BENCH_RESULT_DIR = PROJECT_ROOT / "_09_test" / "bench_results"
+PREPROCESSING_CSV = BENCH_RESULT_DIR / "preprocessing.csv"
+BASELINE_PATH = PROJECT_ROOT / "_09_test" / "bench_baselines" / "preprocessing.json"
+
+DEFAULT_ROW_COUNTS: List[int] = [10_000, 100_000]
+REPEAT = 3
+# 기준값 대비 이 비율을 넘으면 성능 저하로 판단
+TIME_TOLERANCE = 1.5
+# 1회 실행이 이 시간을 넘으면 반복 측정 생략
+SLOW_RUN_MS = 5_000
+OEQI_YEAR = 2025
+
+
+@dataclass
+class BenchCase:
+    """
+    벤치마크 항목
+
+    - fixtures: 필요한 합성 데이터 이름
+    - setup: (합성 데이터, 행 수) -> 측정 함수 인자 (측정 시간 제외)
+    - run: 측정 대상 호출
+    - max_rows: 행 단위 Python 루프가 있는 함수의 최대 측정 규모
+    """
+
+    name: str
+    fixtures: List[str]
+    run: Callable[..., Any]
+    setup: Optional[Callable[[Dict[str, pd.DataFrame], int], tuple]] = None
+    max_rows: int = 10_000_000
+
+
+# * region 측정 항목
+def _setup_calc_epass(fixtures: Dict[str, pd.DataFrame], n_rows: int) -> tuple:
+    """get_rr_df 집계 결과 형태(PLANT, M_CODE, avg, std, count)와 RR 스펙 목록"""
+    rng = np.random.default_rng(0)
+    oe_list = df_rr.get_rr_oe_list_df()
+    picked = oe_list[["PLANT", "M_CODE"]].iloc[rng.integers(0, len(oe_list), n_rows)]
+    rr_agg = picked.reset_index(drop=True).assign(
+        avg=rng.normal(8.5, 0.5, n_rows),
+        std=np.where(rng.random(n_rows) < 0.05, 0, rng.uniform(0.05, 0.4, n_rows)),
+        count=rng.integers(1, 200, n_rows),
+    )
+    return rr_agg, oe_list
+
+
+def _setup_rr_stats(fixtures: Dict[str, pd.DataFrame], n_rows: int) -> tuple:
+    """get_rr_df 와 같은 기간의 RR 샘플로 만든 월 / 일 부분 통계"""
+    return (
+        df_rr.RRStats.from_samples(df_rr.read_rr_samples("2023-01-01", "2025-12-31")),
+    )
+
+
+def _setup_mttc(fixtures: Dict[str, pd.DataFrame], n_rows: int) -> tuple:
+    return (df_quality_issue.prepare_qi_base(fixtures["quality_issue"].copy()),)
+
+
+def _oeqi_case(func: Callable[[int], pd.DataFrame]) -> BenchCase:
+    # MTTC 기간 계산(행 단위 영업일 계산, 10k 행 약 25초)을 포함하므로 10k 행만 측정
+    return BenchCase(
+        func.__name__,
+        ["quality_issue", "sellin", "oeapp"],
+        lambda: func(OEQI_YEAR),
+        max_rows=10_000,
+    )
+
+
+BENCH_CASES: List[BenchCase] = [
+    BenchCase(
+        "get_rr_df",
+        ["rr"],
+        lambda: df_rr.get_rr_df("2023-01-01", "2025-12-31"),
+    ),
+    BenchCase(
+        "calc_epass",
+        ["rr_oe_list"],
+        lambda rr_agg, oe_list: df_rr.calc_epass(rr_agg, oe_list),
+        setup=_setup_calc_epass,
+    ),
+    BenchCase(
+        "RRStats.window",
+        ["rr"],
+        lambda stats: stats.window("2023-03-15", "2025-11-07"),
+        setup=_setup_rr_stats,
+    ),
+    BenchCase(
+        "calculate_mttc_columns",
+        ["quality_issue"],
+        lambda df: df_quality_issue.calculate_mttc_columns(df.copy()),
+        setup=_setup_mttc,
+        max_rows=10_000,
+    ),
+    BenchCase(
+        "calculate_uf_pass_rate",
+        ["uf"],
+        lambda: df_uf.calculate_uf_pass_rate("1000000", "20250101", "20251231"),
+    ),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_plant_monthly),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_plant_yearly),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_global_monthly),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_global_yearly),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_goeq_monthly),
+    _oeqi_case(df_quality_issue.aggregate_oeqi_by_goeq_yearly),
+]
+
+
+# * region 결과 체크섬
+def result_signature(result: Any) -> Dict[str, Any]:
+    """
+    결과(DataFrame 또는 DataFrame 튜플)의 shape 와 체크섬을 계산합니다.
+    실수는 소수 6자리로 반올림하며, 행 순서와 무관한 행 해시 합계를 사용합니다.
+
+    Args:
+        result: 측정 함수 반환값
+
+    Returns:
+        Dict[str, Any]: {"shape": [...], "checksum": "..."}
+    """
+    frames = result if isinstance(result, tuple) else (result,)
+    shapes, checksums = [], []
+    for df in frames:
+        if df is None:
+            shapes.append(None)
+            checksums.append("none")
+            continue
+        df = df.reset_index()
+        floats = df.select_dtypes("float").columns
+        df[floats] = df[floats].round(6)
+        row_hash = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        col_hash = ",".join(f"{col}:{df[col].dtype}" for col in df.columns)
+        shapes.append(list(df.shape))
+        checksums.append(
+            f"{int(row_hash.sum(dtype='uint64')):016x}-{hash_text(col_hash)}"
+        )
+    return {"shape": shapes, "checksum": "|".join(checksums)}
+
+
+def hash_text(text: str) -> str:
+    return f"{int(pd.util.hash_array(np.array([text], dtype=object))[0]):016x}"
+
+
+# * region 측정
+def measure(
+    case: BenchCase, fixtures: Dict[str, pd.DataFrame], n_rows: int, repeat: int
+) -> Dict[str, Any]:
+    """
+    가짜 get_client 환경에서 측정 함수를 반복 실행하여 최소 실행 시간을 측정합니다.
+    (st.cache_data 가 적용된 함수도 매 반복 캐시를 비워 미적중 비용을 측정,
+    1회 실행이 SLOW_RUN_MS 를 넘으면 반복 생략)
+    """
+    with fake_warehouse(fixtures):
+        args = case.setup(fixtures, n_rows) if case.setup else ()
+        elapsed = []
+        for _ in range(repeat):
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            start = time.perf_counter()
+            result = case.run(*args)
+            elapsed.append((time.perf_counter() - start) * 1000)
+            if elapsed[-1] > SLOW_RUN_MS:
+                break
+
+    return {"ROWS": n_rows, "MS": round(min(elapsed), 1), **result_signature(result)}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(records: List[Dict[str, Any]], path: Path = BASELINE_PATH) -> None:
+    """측정 결과로 기준값을 갱신합니다. (측정하지 않은 항목 / 행 수는 유지)"""
+    baseline = load_baseline(path)
+    for record in records:
+        baseline.setdefault(record["CASE"], {})[str(record["ROWS"])] = {
+            "ms": record["MS"],
+            "shape": record["shape"],
+            "checksum": record["checksum"],
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def compare_with_baseline(
+    records: List[Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> pd.DataFrame:
+    """측정 결과를 기준값과 비교한 표를 반환합니다."""
+    rows = []
+    for record in records:
+        base = baseline.get(record["CASE"], {}).get(str(record["ROWS"]))
+        ratio = record["MS"] / base["ms"] if base and base["ms"] else np.nan
+        rows.append(
+            {
+                "CASE": record["CASE"],
+                "ROWS": record["ROWS"],
+                "MS": record["MS"],
+                "BASELINE_MS": base["ms"] if base else np.nan,
+                "RATIO": round(ratio, 2),
+                "MATCH": (
+                    base is not None
+                    and base["checksum"] == record["checksum"]
+                    and base["shape"] == record["shape"]
+                ),
+                "REGRESSION": bool(ratio > TIME_TOLERANCE),
+                "HAS_BASELINE": base is not None,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def run_preprocessing_benchmark(
+    row_counts: List[int] = DEFAULT_ROW_COUNTS,
+    case_names: Optional[List[str]] = None,
+    repeat: int = REPEAT,
+) -> List[Dict[str, Any]]:
+    """행 수 x 측정 항목별 벤치마크를 실행합니다."""
+    cases = [case for case in BENCH_CASES if not case_names or case.name in case_names]
+    fixture_names = sorted({name for case in cases for name in case.fixtures})
+
+    # 미완료 건의 기간 계산 기준일 고정 (결과 체크섬 재현성)
+    helper_pandas.CountWorkingDays.today_formatted_date = FIXTURE_TODAY
+
+    records = []
+    for n_rows in row_counts:
+        fixtures = build_fixtures(n_rows, fixture_names)
+        for case in cases:
+            if n_rows > case.max_rows:
+                continue
+            record = measure(case, fixtures, n_rows, repeat)
+            records.append({"CASE": case.name, **record})
+            print(f"[{n_rows:>10,}] {case.name}: {record['MS']:,.1f} ms")
+    return records
+
+
+def save_result(df: pd.DataFrame, path: Path = PREPROCESSING_CSV) -> None:
+    """측정 결과를 CSV에 누적 저장합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전처리 함수 오프라인 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROW_COUNTS)
+    parser.add_argument("--cases", nargs="+", help="측정할 함수명 (기본값: 전체)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    records = run_preprocessing_benchmark(args.rows, args.cases, args.repeat)
+    if args.update_baseline:
+        save_baseline(records)
+        print(f"기준값 갱신: {BASELINE_PATH}")
+        return
+
+    df = compare_with_baseline(records, load_baseline())
+    df.insert(0, "RUN_AT", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    print(df.drop(columns="RUN_AT").to_string(index=False))
+    save_result(df)
+    print(f"결과 저장: {PREPROCESSING_CSV}")
+
+    checked = df[df["HAS_BASELINE"]]
+    if not checked["MATCH"].all() or checked["REGRESSION"].any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
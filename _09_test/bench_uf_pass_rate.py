@@ -0,0 +1,137 @@
+"""
+UF 합격수량 계산 벤치마크
+
+공장별 정규식 마스크 + 행 단위 apply 로 계산하던 기존 방식과
+df_uf.compute_uf_pass_qty (공장 x 등급 마스크 행렬 1회 축약) 방식을
+다공장 / 다년도 합성 데이터에서 비교합니다.
+
+측정 항목:
+- LEGACY_MS: 기존 방식 (plant 패턴별 str.contains + apply)
+- VECTORIZED_MS: compute_uf_pass_qty + calculate_pass_rate
+- MATCH: 두 방식의 검사수량/합격수량/합격률 일치 여부
+
+사용 예시:
+    python _09_test/bench_uf_pass_rate.py
+
+결과는 `_09_test/bench_results/uf_pass_rate.csv` 에 실행 시각과 함께 누적 저장됩니다.
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from _02_preprocessing.GMES import df_uf
+
+BENCH_RESULT_DIR = PROJECT_ROOT / "_09_test" / "bench_results"
+UF_PASS_RATE_CSV = BENCH_RESULT_DIR / "uf_pass_rate.csv"
+
+# 측정할 행 수 (M_CODE x PLANT x 월 조합 수)
+ROW_COUNTS: List[int] = [10_000, 100_000, 1_000_000]
+PLANTS = ["KP", "IP", "MP", "TP", "DP", "HP", "JP", "CP", "OT"]
+
+
+def make_uf_monthly_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """uf_product_assess_monthly 결과와 같은 스키마의 합성 데이터를 생성합니다."""
+    rng = np.random.default_rng(seed)
+    months = pd.period_range("2021-01", "2025-12", freq="M").strftime("%Y%m")
+    df = pd.DataFrame(
+        {
+            "M_CODE": rng.integers(1_000_000, 1_005_000, n_rows).astype(str),
+            "PLANT": rng.choice(PLANTS, n_rows),
+            "SPEC_CD": rng.choice(["A", "B", "C"], n_rows),
+            "YYYYMM": rng.choice(months, n_rows),
+        }
+    )
+    jdg = rng.poisson(lam=[40, 30, 15, 8, 4, 2, 1, 1], size=(n_rows, 8))
+    for grade in range(8):
+        df[f"JDG_{grade + 1}"] = jdg[:, grade]
+    return df
+
+
+def legacy_pass_qty(df: pd.DataFrame) -> pd.DataFrame:
+    """기존 calculate_uf_pass_rate_monthly 의 합격수량 / 합격률 계산 방식"""
+    df = df.copy()
+    jdg_cols = [col for col in df.columns if col.startswith("JDG_")]
+    df["UF_INS_QTY"] = df[jdg_cols].sum(axis=1)
+
+    pass_criteria = {
+        "KP|IP|MP|TP|DP": ["JDG_1", "JDG_2", "JDG_3", "JDG_4"],
+        "HP|JP|CP": ["JDG_1", "JDG_2", "JDG_3"],
+    }
+    df["UF_PASS_QTY"] = 0
+    for plant_pattern, cols in pass_criteria.items():
+        mask = df["PLANT"].str.contains(plant_pattern, regex=True)
+        df.loc[mask, "UF_PASS_QTY"] = df.loc[mask, cols].sum(axis=1)
+
+    df["PASS_RATE"] = df.apply(
+        lambda x: (x["UF_PASS_QTY"] / x["UF_INS_QTY"] if x["UF_INS_QTY"] > 0 else 0),
+        axis=1,
+    )
+    return df
+
+
+def vectorized_pass_qty(df: pd.DataFrame) -> pd.DataFrame:
+    """df_uf.compute_uf_pass_qty 를 사용한 계산 방식"""
+    df = df.copy()
+    jdg_cols = [col for col in df.columns if col.startswith("JDG_")]
+    ins_qty, pass_qty = df_uf.compute_uf_pass_qty(df["PLANT"], df[jdg_cols])
+    df["UF_INS_QTY"] = ins_qty
+    df["UF_PASS_QTY"] = pass_qty
+    df["PASS_RATE"] = df_uf.calculate_pass_rate(pass_qty, ins_qty)
+    return df
+
+
+def measure(n_rows: int) -> Dict[str, float]:
+    """행 수별로 두 방식의 실행 시간을 측정하고 결과 일치 여부를 확인합니다."""
+    df = make_uf_monthly_frame(n_rows)
+
+    start = time.perf_counter()
+    legacy = legacy_pass_qty(df)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    vectorized = vectorized_pass_qty(df)
+    vectorized_ms = (time.perf_counter() - start) * 1000
+
+    cols = ["UF_INS_QTY", "UF_PASS_QTY", "PASS_RATE"]
+    match = np.allclose(legacy[cols].to_numpy(float), vectorized[cols].to_numpy(float))
+
+    return {
+        "ROWS": n_rows,
+        "LEGACY_MS": round(legacy_ms, 1),
+        "VECTORIZED_MS": round(vectorized_ms, 1),
+        "SPEEDUP": round(legacy_ms / vectorized_ms, 1),
+        "MATCH": match,
+    }
+
+
+def run_uf_benchmark(row_counts: List[int] = ROW_COUNTS) -> pd.DataFrame:
+    """행 수별 벤치마크 결과를 DataFrame으로 반환합니다."""
+    df = pd.DataFrame([measure(n_rows) for n_rows in row_counts])
+    df.insert(0, "RUN_AT", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    return df
+
+
+def save_result(df: pd.DataFrame, path: Path = UF_PASS_RATE_CSV) -> None:
+    """측정 결과를 CSV에 누적 저장합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def main():
+    df = run_uf_benchmark()
+    print(df.drop(columns="RUN_AT").to_string(index=False))
+    save_result(df)
+    print(f"결과 저장: {UF_PASS_RATE_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+벤치마크 합성 데이터 / 가짜 get_client 테스트 코드
+"""
+
+import unittest
+import sys
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import bench_fixtures
+from bench_preprocessing import result_signature
+from _00_database import db_client
+from _01_query.CQMS import q_quality_issue
+from _01_query.GMES import q_rr, q_uf, q_weight
+from _02_preprocessing.GMES import df_uf
+
+
+class TestBenchFixtures(unittest.TestCase):
+    """벤치마크 합성 데이터 테스트 클래스"""
+
+    def setUp(self):
+        self.fixtures = bench_fixtures.build_fixtures(2_000)
+
+    def test_fake_client_routes_query_builders(self):
+        """_01_query 빌더 쿼리가 원본 테이블에 맞는 합성 데이터로 연결되는지 테스트"""
+        with bench_fixtures.fake_warehouse(self.fixtures) as fake_get_client:
+            client = fake_get_client("snowflake")
+            rr = client.execute(q_rr.rr("2025-01-01", "2025-12-31"))
+            oe_list = client.execute(q_rr.rr_oe_list())
+            weight = client.execute(q_weight.gt_wt_individual("1000000"))
+            uf = client.execute(
+                q_uf.uf_product_assess("1000000", "20250101", "20251231")
+            )
+            with self.assertRaises(KeyError):
+                client.execute("SELECT 1 FROM UNKNOWN_TABLE")
+
+        self.assertEqual(list(rr.columns), list(self.fixtures["rr"].columns))
+        self.assertIn("rr_index", oe_list.columns)
+        self.assertIn("mrm_wgt", weight.columns)
+        self.assertEqual(len(uf), 2_000)
+
+    def test_fake_client_applies_year_range(self):
+        """쿼리의 연도 범위 조건이 합성 데이터에도 적용되는지 테스트"""
+        client = bench_fixtures.FakeWarehouseClient("snowflake", self.fixtures)
+        all_years = client.execute(q_quality_issue.query_quality_issue())
+        three_years = client.execute(q_quality_issue.query_quality_issue(2025))
+
+        reg_year = pd.to_datetime(all_years["reg_date"]).dt.year
+        self.assertGreater(reg_year.max(), 2025)
+        self.assertEqual(len(three_years), reg_year.between(2023, 2025).sum())
+        self.assertTrue(
+            pd.to_datetime(three_years["reg_date"]).dt.year.between(2023, 2025).all()
+        )
+
+    def test_fake_warehouse_patches_and_restores_get_client(self):
+        """모듈별 get_client 참조가 교체되고 종료 후 복원되는지 테스트"""
+        original = db_client.get_client
+        with bench_fixtures.fake_warehouse(self.fixtures) as fake_get_client:
+            self.assertIs(df_uf.get_client, fake_get_client)
+            df = df_uf.calculate_uf_pass_rate("1000000", "20250101", "20251231")
+        self.assertIs(df_uf.get_client, original)
+        self.assertIs(db_client.get_client, original)
+        self.assertEqual(len(df), 2_000)
+        self.assertTrue(df["uf_pass_rate"].between(0, 1).all())
+
+    def test_fixtures_and_signature_are_reproducible(self):
+        """같은 시드의 합성 데이터와 결과 체크섬이 재현되는지 테스트"""
+        again = bench_fixtures.build_fixtures(2_000, ["uf", "quality_issue"])
+        for name in again:
+            self.assertEqual(
+                result_signature(self.fixtures[name]), result_signature(again[name])
+            )
+        changed = again["uf"].assign(jdg_1=again["uf"]["jdg_1"] + 1)
+        self.assertNotEqual(
+            result_signature(self.fixtures["uf"]), result_signature(changed)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
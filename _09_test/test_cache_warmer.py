@@ -0,0 +1,98 @@
+"""
+대시보드 캐시 워머(cache_warmer) 테스트 코드
+"""
+
+import unittest
+import threading
+import time
+import sys
+from datetime import datetime
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import cache_warmer
+
+
+class TestCacheWarmer(unittest.TestCase):
+    """캐시 워머 테스트 클래스"""
+
+    def setUp(self):
+        self.warmer = cache_warmer.CacheWarmer(max_workers=2, hours=None)
+        self.addCleanup(self.warmer.stop)
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _loader(self, name, delay=0.0):
+        def loader(*args, **kwargs):
+            with self.lock:
+                self.calls.append((name, args, kwargs))
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(delay)
+            with self.lock:
+                self.active -= 1
+
+        return loader
+
+    def test_jobs_run_with_factory_args_and_wait_for_interval(self):
+        """등록된 로더를 실행 시점 인자로 호출하고 주기 전에는 다시 실행하지 않는지 테스트"""
+        self.warmer.register(
+            "yearly", self._loader("yearly"), lambda: ((2025,), {"plant": "DP"})
+        )
+        self.warmer.register("short", self._loader("short"), interval=0.01)
+
+        started = self.warmer.run_pending(wait=True)
+        self.assertEqual(sorted(started), ["short", "yearly"])
+        self.assertIn(("yearly", (2025,), {"plant": "DP"}), self.calls)
+
+        time.sleep(0.05)
+        self.assertEqual(self.warmer.run_pending(wait=True), ["short"])
+        status = self.warmer.status().set_index("name")
+        self.assertEqual(status.loc["yearly", "runs"], 1)
+        self.assertEqual(status.loc["short", "runs"], 2)
+
+    def test_concurrency_is_limited(self):
+        """동시에 실행되는 로더 수가 max_workers 를 넘지 않는지 테스트"""
+        for i in range(6):
+            self.warmer.register(f"job{i}", self._loader(f"job{i}", delay=0.05))
+        self.warmer.run_pending(wait=True)
+        self.assertEqual(len(self.calls), 6)
+        self.assertLessEqual(self.max_active, 2)
+
+    def test_failed_job_is_recorded_and_retried(self):
+        """실패한 작업은 오류를 기록하고 다음 주기에 다시 실행되는지 테스트"""
+
+        def failing():
+            raise RuntimeError("warehouse unavailable")
+
+        self.warmer.register("failing", failing, interval=0.01)
+        self.warmer.run_pending(wait=True)
+        status = self.warmer.status().set_index("name")
+        self.assertEqual(status.loc["failing", "last_error"], "warehouse unavailable")
+        time.sleep(0.05)
+        self.assertEqual(self.warmer.run_pending(wait=True), ["failing"])
+
+    def test_business_hours(self):
+        """업무 시간대에만 실행하도록 시간대를 확인하는지 테스트"""
+        warmer = cache_warmer.CacheWarmer(hours=(7, 20))
+        self.assertTrue(warmer.in_business_hours(datetime(2025, 3, 4, 7, 0)))
+        self.assertFalse(warmer.in_business_hours(datetime(2025, 3, 4, 20, 0)))
+        self.assertFalse(warmer.in_business_hours(datetime(2025, 3, 4, 3, 0)))
+
+    def test_background_thread_warms_jobs(self):
+        """백그라운드 스레드가 시작 직후 등록된 작업을 실행하는지 테스트"""
+        self.warmer.register("startup", self._loader("startup"))
+        self.warmer.start()
+        deadline = time.monotonic() + 5
+        while not self.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.calls[0][0], "startup")
+
+
+if __name__ == "__main__":
+    unittest.main()
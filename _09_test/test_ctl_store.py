@@ -0,0 +1,101 @@
+"""
+CTL 측정 데이터 파싱 및 로컬 저장소(df_ctl / ctl_measurement_etl) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.GMES import df_ctl
+from _08_automation import ctl_measurement_etl
+
+
+def make_extract_df() -> pd.DataFrame:
+    """get_ctl_extract_query 결과와 같은 스키마의 데이터를 생성합니다."""
+    return pd.DataFrame(
+        {
+            "DOC_NO": ["D1", "D2", "D3"],
+            "PLANT": ["DP", "DP", "KP"],
+            "MRM_DATE": pd.to_datetime(["2024-01-05", "2024-01-20", "2024-02-03"]),
+            "MRM_PURPOSE": ["P_Lot"] * 3,
+            "MRM_ITEM": ["ILG", "NBD", "BFH"],
+            "STXC": ["S", "V", "M"],
+            "M_CODE": ["1024247", "1024247", "1000001"],
+            "SPEC_SIZE": ["205/55R16"] * 3,
+            "SPEC_PTRN": ["K127"] * 3,
+            "U_SPEC_VAL": ["10.0", "5", "abc"],
+            "L_SPEC_VAL": ["8.0", None, "3"],
+            "TOL": ["±0.5", "2.0 min", None],
+            "U_MRM_AVG": [10.2, 6.0, 1.0],
+            "L_MRM_AVG": [8.1, np.nan, 3.2],
+            "U_MRM_RST": ["OK", "OK", "NI"],
+            "L_MRM_RST": ["OK", None, "NO"],
+            "PRDT_DATE": pd.to_datetime(["2024-01-01", "2024-01-15", "2024-01-30"]),
+        }
+    )
+
+
+class TestCtlStore(unittest.TestCase):
+    """CTL 파싱 및 저장소 테스트 클래스"""
+
+    def test_parse_spec_number(self):
+        """문자열 첫 숫자 추출 테스트 (변환 불가 시 NaN)"""
+        values = pd.Series(["±0.5", "2.0 min", None, "1.2.3"])
+        parsed = df_ctl.parse_spec_number(values)
+        np.testing.assert_array_equal(parsed.to_numpy(), [0.5, 2.0, np.nan, np.nan])
+
+    def test_calculate_spec_limits(self):
+        """min 허용치 / ± 허용치의 LL, UL 계산 테스트"""
+        ll, ul = df_ctl.calculate_spec_limits(
+            pd.Series(["10.0", "5", "abc"]), pd.Series(["±0.5", "2.0 min", None])
+        )
+        np.testing.assert_array_equal(ll.to_numpy(), [9.5, 2.0, np.nan])
+        np.testing.assert_array_equal(ul.to_numpy(), [10.5, np.nan, np.nan])
+
+    def test_expand_ctl_sides(self):
+        """상한/하한 long 포맷 변환 테스트 (하한은 S/M 시방만)"""
+        df = df_ctl.expand_ctl_sides(make_extract_df())
+        self.assertEqual(list(df.columns), df_ctl.CTL_COLUMNS)
+        self.assertEqual((df["SIDE"] == "UPPER").sum(), 3)
+        self.assertEqual(df.loc[df["SIDE"] == "LOWER", "DOC_NO"].tolist(), ["D1", "D3"])
+        lower_d1 = df[(df["SIDE"] == "LOWER") & (df["DOC_NO"] == "D1")].iloc[0]
+        self.assertAlmostEqual(lower_d1["LL"], 7.5)
+        self.assertEqual(lower_d1["JDG"], "OK")
+
+    def test_store_round_trip(self):
+        """월 파티션 저장 후 M-Code / 기간 조회 테스트"""
+        df = df_ctl.expand_ctl_sides(make_extract_df())
+        df["MRM_MONTH"] = df["MRM_DATE"].dt.strftime("%Y-%m")
+
+        with tempfile.TemporaryDirectory() as store_path:
+            for _, df_month in df.groupby("MRM_MONTH"):
+                ctl_measurement_etl.write_ctl_partition(df_month, store_path)
+            # 같은 월 재적재 시 파티션이 교체되는지 확인
+            ctl_measurement_etl.write_ctl_partition(
+                df[df["MRM_MONTH"] == "2024-01"], store_path
+            )
+
+            self.assertEqual(
+                df_ctl.get_store_months(store_path), ["2024-01", "2024-02"]
+            )
+            result = df_ctl.read_ctl_store(
+                "1024247", "20240101", "20240131", store_path
+            )
+            missing = df_ctl.read_ctl_store(
+                "1024247", "20240101", "20240331", store_path
+            )
+
+        self.assertEqual(list(result.columns), df_ctl.CTL_COLUMNS)
+        self.assertEqual(len(result), 3)  # D1 상한/하한 + D2 상한
+        self.assertIsNone(missing)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+개별 샘플 차트 다운샘플링(downsample) 테스트 코드
+"""
+
+import unittest
+import sys
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _03_visualization import config_plotly, downsample, figure_cache
+from _03_visualization._08_ADMIN import viz_oeassessment_result_viewer as viz
+
+
+class TestDownsample(unittest.TestCase):
+    """다운샘플링 테스트 클래스"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.n = config_plotly.DOWNSAMPLE_POINT_THRESHOLD * 4
+        dates = pd.date_range("2024-01-01", periods=self.n, freq="15min")
+        self.rr = pd.DataFrame(
+            {
+                "SMPL_DATE": dates.strftime("%Y-%m-%d %H:%M"),
+                "Result_new": rng.normal(7.0, 0.2, self.n),
+            }
+        )
+        # 뒤섞인 순서 + 결측값 + 튀는 값
+        self.rr = self.rr.sample(frac=1, random_state=0).reset_index(drop=True)
+        self.rr.loc[10, "Result_new"] = np.nan
+        self.rr.loc[20, "Result_new"] = 20.0
+        figure_cache.clear_figure_cache()
+
+    def test_lttb_keeps_endpoints_and_spikes(self):
+        """LTTB 가 지정한 점 개수로 줄이고 양 끝점과 튀는 값을 유지하는지 테스트"""
+        plot_df = downsample.downsample_trend(self.rr, "SMPL_DATE", "Result_new")
+        self.assertEqual(len(plot_df), config_plotly.LTTB_TARGET_POINTS)
+        self.assertIn(20, plot_df.index)
+        self.assertFalse(plot_df["Result_new"].isna().any())
+        self.assertTrue(plot_df["SMPL_DATE"].is_monotonic_increasing)
+        self.assertEqual(plot_df["SMPL_DATE"].iloc[0], self.rr["SMPL_DATE"].min())
+        self.assertEqual(plot_df["SMPL_DATE"].iloc[-1], self.rr["SMPL_DATE"].max())
+
+        small = self.rr.head(100)
+        self.assertIs(
+            downsample.downsample_trend(small, "SMPL_DATE", "Result_new"), small
+        )
+
+    def test_histogram_trace_prebins_large_samples(self):
+        """기준을 넘는 히스토그램이 전체 건수를 보존한 막대로 대체되는지 테스트"""
+        values = self.rr["Result_new"]
+        trace = downsample.histogram_trace(values, name="RR")
+        self.assertIsInstance(trace, go.Bar)
+        self.assertLessEqual(len(trace.y), config_plotly.HISTOGRAM_MAX_BINS)
+        self.assertEqual(sum(trace.y), values.notna().sum())
+
+        density = downsample.histogram_trace(values, histnorm="probability density")
+        self.assertAlmostEqual(float(np.sum(density.y * density.width)), 1.0)
+        self.assertIsInstance(downsample.histogram_trace(values.head(10)), go.Histogram)
+
+    def test_box_stats_match_numpy(self):
+        """사전 계산한 박스플롯 통계값이 NumPy 계산값과 같은지 테스트"""
+        groups = pd.Series(np.where(np.arange(self.n) % 2 == 0, "202401", "202402"))
+        stats = downsample.box_stats(groups, self.rr["Result_new"]).set_index("x")
+        values = self.rr["Result_new"][groups == "202402"].dropna().to_numpy()
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        self.assertAlmostEqual(stats.loc["202402", "q1"], q1)
+        self.assertAlmostEqual(stats.loc["202402", "median"], median)
+        self.assertAlmostEqual(stats.loc["202402", "mean"], values.mean())
+        inside = values[values <= q3 + 1.5 * (q3 - q1)]
+        self.assertAlmostEqual(stats.loc["202402", "upperfence"], inside.max())
+
+    def test_viz_functions_downsample_automatically(self):
+        """시각화 함수가 기준을 넘는 데이터를 자동으로 다운샘플링하는지 테스트"""
+        standard = pd.DataFrame({"SPEC_MAX": [7.5], "SPEC_MIN": [0.0]})
+        fig = viz.draw_rr_trend(self.rr, standard)
+        self.assertEqual(len(fig.data[0].x), config_plotly.LTTB_TARGET_POINTS)
+        self.assertIn(f"{self.n:,}", fig.layout.annotations[0].text)
+
+        weight = pd.DataFrame(
+            {
+                "INS_DATE_YM": np.repeat(["202401", "202402"], self.n // 2),
+                "MRM_WGT": self.rr["Result_new"].to_numpy(),
+            }
+        )
+        box = viz.draw_weight_distribution_individual(weight, 7.0).data[0]
+        self.assertEqual(list(box.x), ["202401", "202402"])
+        self.assertIsNone(box.y)
+
+
+if __name__ == "__main__":
+    unittest.main()
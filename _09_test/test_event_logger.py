@@ -0,0 +1,141 @@
+"""
+버퍼링 이벤트 로거(event_logger.EventLogger) 테스트 코드
+"""
+
+import unittest
+import time
+import sqlite3
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import event_logger
+
+
+class TestEventLogger(unittest.TestCase):
+    """버퍼링 이벤트 로거 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "events.db")
+        self.logger = event_logger.EventLogger(
+            self.db_path, batch_size=50, flush_interval=0.05
+        )
+
+    def tearDown(self):
+        self.logger.stop()
+        self.tmp_dir.cleanup()
+
+    def _read(self, table):
+        with sqlite3.connect(self.db_path) as conn:
+            return pd.read_sql(f"SELECT * FROM {table}", conn)
+
+    def test_flush_writes_all_events_in_batches(self):
+        """여러 테이블 이벤트가 배치로 모두 저장되는지 테스트"""
+        for idx in range(120):
+            self.logger.log(
+                event_logger.EVENT_TABLE,
+                {
+                    "event_time": "2025-06-30 09:00:00",
+                    "event_type": "page_view",
+                    "employee_id": idx % 3,
+                    "page": "RR Analysis",
+                },
+            )
+        self.logger.log(
+            "logins", {"employee_id": 1, "login_time": "2025-06-30 09:00:00"}
+        )
+        self.assertTrue(self.logger.flush(timeout=5))
+
+        self.assertEqual(len(self._read(event_logger.EVENT_TABLE)), 120)
+        self.assertEqual(len(self._read("logins")), 1)
+
+    def test_events_are_batched_until_size_or_interval(self):
+        """batch_size 건이 모이거나 flush_interval 이 지날 때까지 모아서 저장하는지 테스트"""
+        batches = []
+        slow = event_logger.EventLogger(self.db_path, batch_size=5, flush_interval=1)
+        self.addCleanup(slow.stop)
+        slow._write = lambda batch: batches.append(len(batch))
+
+        for idx in range(7):
+            slow.log("logins", {"employee_id": idx, "login_time": "2025-06-30"})
+        deadline = time.monotonic() + 5
+        while not batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # batch_size 5건은 바로 저장, 남은 2건은 flush_interval 동안 대기
+        self.assertEqual(batches, [5])
+        time.sleep(0.2)
+        self.assertEqual(batches, [5])
+
+        # flush() 는 flush_interval 을 기다리지 않고 남은 이벤트를 저장
+        start = time.monotonic()
+        self.assertTrue(slow.flush(timeout=5))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(batches, [5, 2])
+
+    def test_stop_flushes_pending_events(self):
+        """종료 시 남은 이벤트 저장 테스트"""
+        self.logger.log(
+            "logins", {"employee_id": 7, "login_time": "2025-06-30 09:00:00"}
+        )
+        self.logger.stop()
+        self.assertEqual(self._read("logins")["employee_id"].tolist(), [7])
+
+    def test_full_queue_drops_without_blocking(self):
+        """큐가 가득 찬 경우 호출 측을 막지 않고 버리는지 테스트"""
+        small = event_logger.EventLogger(self.db_path, max_queue_size=1)
+        small.start = lambda: None  # 저장 스레드 없이 큐만 채움
+        for _ in range(3):
+            small.log("logins", {"employee_id": 1, "login_time": "2025-06-30"})
+        self.assertEqual(small.dropped, 2)
+
+    def test_unknown_table_rejected(self):
+        """정의되지 않은 테이블 이벤트 거부 테스트"""
+        with self.assertRaises(ValueError):
+            self.logger.log("unknown_table", {"a": 1})
+
+    def test_summarize_events(self):
+        """기간 x 페이지별 이벤트 / 사용자 수 집계 테스트"""
+        rows = [
+            ("2025-06-30 09:00:00", 1, "RR Analysis"),
+            ("2025-06-30 10:00:00", 2, "RR Analysis"),
+            ("2025-06-30 11:00:00", 1, "RR Analysis"),
+            ("2025-07-01 09:00:00", 1, "FM Monitoring"),
+        ]
+        for event_time, employee_id, page in rows:
+            self.logger.log(
+                event_logger.EVENT_TABLE,
+                {
+                    "event_time": event_time,
+                    "event_type": "page_view",
+                    "employee_id": employee_id,
+                    "page": page,
+                },
+            )
+        self.logger.flush(timeout=5)
+
+        summary = event_logger.summarize_events(
+            "page_view", by="page", db_path=self.db_path
+        )
+        first = summary.iloc[0]
+        self.assertEqual(
+            (first["page"], first["EVENTS"], first["USERS"]), ("RR Analysis", 3, 2)
+        )
+        self.assertEqual(len(summary), 2)
+        self.assertEqual(
+            len(
+                event_logger.load_events(
+                    "page_view", "2025-07-01", "2025-07-01", self.db_path
+                )
+            ),
+            1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Plotly figure 캐시(figure_cache) 테스트 코드
+"""
+
+import unittest
+import sys
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _03_visualization import config_plotly, figure_cache
+from _03_visualization.figure_cache import cache_figure
+
+CALLS = []
+
+
+@cache_figure
+def draw_scatter(df, title="Trend"):
+    CALLS.append(title)
+    fig = go.Figure(go.Scatter(x=df["X"], y=df["Y"], mode="markers"))
+    fig.update_layout(title=title)
+    return fig
+
+
+class TestFigureCache(unittest.TestCase):
+    """figure 캐시 테스트 클래스"""
+
+    def setUp(self):
+        figure_cache.clear_figure_cache()
+        CALLS.clear()
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({"X": np.arange(100), "Y": rng.normal(size=100)})
+
+    def test_unchanged_input_skips_figure_construction(self):
+        """같은 내용의 입력은 figure 를 다시 구성하지 않는지 테스트"""
+        first = draw_scatter(self.df)
+        second = draw_scatter(self.df.copy())
+        self.assertEqual(CALLS, ["Trend"])
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual(figure_cache.cache_info()["hits"], 1)
+
+    def test_changed_input_rebuilds_figure(self):
+        """데이터나 파라미터가 바뀌면 figure 를 다시 구성하는지 테스트"""
+        draw_scatter(self.df)
+        changed = self.df.copy()
+        changed.loc[5, "Y"] += 1
+        draw_scatter(changed)
+        draw_scatter(self.df, title="Other")
+        self.assertEqual(len(CALLS), 3)
+        self.assertEqual(figure_cache.cache_info()["entries"], 3)
+
+    def test_returned_figure_is_independent_of_cache(self):
+        """반환된 figure 를 수정해도 캐시된 figure 에 영향이 없는지 테스트"""
+        fig = draw_scatter(self.df)
+        fig.update_layout(title="Modified")
+        self.assertEqual(draw_scatter(self.df).layout.title.text, "Trend")
+
+    def test_large_scatter_switches_to_scattergl(self):
+        """점 개수가 기준을 넘는 Scatter trace 가 Scattergl 로 전환되는지 테스트"""
+        self.assertEqual(draw_scatter(self.df).data[0].type, "scatter")
+        n = config_plotly.SCATTERGL_POINT_THRESHOLD + 1
+        large = pd.DataFrame({"X": np.arange(n), "Y": np.zeros(n)})
+        self.assertEqual(draw_scatter(large).data[0].type, "scattergl")
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 오래된 figure 부터 제거되는지 테스트"""
+        default_max = config_plotly.FIGURE_CACHE_MAX_ENTRIES
+        try:
+            config_plotly.FIGURE_CACHE_MAX_ENTRIES = 2
+            for title in ["A", "B", "C", "A"]:
+                draw_scatter(self.df, title=title)
+        finally:
+            config_plotly.FIGURE_CACHE_MAX_ENTRIES = default_max
+        self.assertEqual(CALLS, ["A", "B", "C", "A"])
+        self.assertEqual(figure_cache.cache_info()["entries"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+연도 범위 FM 데이터셋(df_ncf.FMDataset) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import sys
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database.db_client import get_client
+from _01_query.GMES import q_ncf, q_production
+from _02_preprocessing.GMES import df_ncf
+from _05_commons import config
+from _08_automation import local_warehouse_seed
+
+YYYY = 2025
+# 로컬 웨어하우스 시드 데이터의 불량 코드
+NCF_LIST = tuple(f"D{i:02d}" for i in range(1, 11))
+
+
+class TestFMDataset(unittest.TestCase):
+    """FM 데이터셋 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.warehouse_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            20_000, cls.warehouse_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.defaults = (config.WAREHOUSE_BACKEND, config.LOCAL_WAREHOUSE_PATH)
+        config.WAREHOUSE_BACKEND = "local"
+        config.LOCAL_WAREHOUSE_PATH = self.warehouse_path
+
+        # 원격 조회 횟수 기록
+        self.queries = []
+        original_get_client = df_ncf.get_client
+
+        def counting_get_client(db_type="snowflake"):
+            client = original_get_client(db_type)
+            execute = client.execute
+
+            def counted(query):
+                self.queries.append(query)
+                return execute(query)
+
+            client.execute = counted
+            return client
+
+        df_ncf.get_client = counting_get_client
+        self.addCleanup(setattr, df_ncf, "get_client", original_get_client)
+
+    def tearDown(self):
+        config.WAREHOUSE_BACKEND, config.LOCAL_WAREHOUSE_PATH = self.defaults
+
+    def _query_year(self, yyyy):
+        """기존 방식(연도별 개별 쿼리)으로 조회한 부적합 / 생산 데이터"""
+        ncf = get_client().execute(
+            q_ncf.ncf_monthly(yyyy=yyyy, ncf_list=list(NCF_LIST))
+        )
+        prdt = get_client().execute(q_production.curing_prdt_monthly_by_ym(yyyy=yyyy))
+        ncf.columns = ncf.columns.str.upper()
+        prdt.columns = prdt.columns.str.upper()
+        return ncf, prdt
+
+    def test_two_years_are_loaded_with_two_queries(self):
+        """두 연도를 부적합 / 생산 쿼리 각 1회로 조회하고 공장 변경 시 추가 조회가 없는지 테스트"""
+        dataset = df_ncf.load_fm_dataset(YYYY, NCF_LIST)
+        self.assertEqual(len(self.queries), 2)
+        self.assertEqual(sorted(dataset.ncf["YYYY"].unique()), [YYYY - 1, YYYY])
+
+        for plant in config.plant_codes[:-1]:
+            for yyyy in [YYYY, YYYY - 1]:
+                dataset.global_monthly(yyyy)
+                dataset.yearly_ppm_by_plant(yyyy)
+                dataset.monthly_ppm_by_plant(yyyy, plant)
+                dataset.ncf_detail_by_plant(yyyy, plant)
+        self.assertEqual(len(self.queries), 2)
+
+    def test_views_match_single_year_queries(self):
+        """메모리에서 계산한 집계가 연도별 개별 쿼리 결과와 같은지 테스트"""
+        dataset = df_ncf.load_fm_dataset(YYYY, NCF_LIST)
+        for yyyy in [YYYY, YYYY - 1]:
+            ncf, prdt = self._query_year(yyyy)
+            self.assertFalse(ncf.empty)
+
+            expected = ncf.groupby("MM")["NCF_QTY"].sum().sort_index()
+            actual = dataset.global_monthly(yyyy).set_index("MM")
+            pd.testing.assert_series_equal(
+                actual["NCF_QTY"], expected, check_dtype=False
+            )
+            pd.testing.assert_series_equal(
+                actual["PRDT_QTY"],
+                prdt.groupby("MM")["PRDT_QTY"].sum().reindex(actual.index),
+                check_dtype=False,
+            )
+
+            yearly = dataset.yearly_ppm_by_plant(yyyy).set_index("PLANT")
+            plant = yearly.index[0]
+            self.assertEqual(
+                yearly.loc[plant, "NCF_QTY"],
+                ncf.loc[ncf["PLANT"] == plant, "NCF_QTY"].sum(),
+            )
+            self.assertEqual(
+                yearly.loc[plant, "PRDT_QTY"],
+                prdt.loc[prdt["PLANT"] == plant, "PRDT_QTY"].sum(),
+            )
+
+            detail = dataset.ncf_detail_by_plant(yyyy, plant)
+            self.assertTrue(detail["NCF_QTY"].is_monotonic_decreasing)
+            self.assertEqual(detail["NCF_QTY"].sum(), yearly.loc[plant, "NCF_QTY"])
+            monthly = dataset.monthly_ppm_by_plant(yyyy, plant)
+            self.assertEqual(monthly["NCF_QTY"].sum(), yearly.loc[plant, "NCF_QTY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+판정 결과 그룹 집계(helper_pandas.tally_outcomes) 테스트 코드
+"""
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing import helper_pandas
+from _02_preprocessing.GMES import df_ctl
+
+
+class TestJdgTally(unittest.TestCase):
+    """판정 결과 그룹 집계 테스트 클래스"""
+
+    def setUp(self):
+        self.df_ctl = pd.DataFrame(
+            {
+                "DOC_NO": ["D2", "D1", "D1", "D1", "D2", None, "D1"],
+                "JDG": ["OK", "OK", "NI", None, "NO", "OK", "XX"],
+            }
+        )
+
+    def test_tally_outcomes_matches_lambda_groupby(self):
+        """기존 lambda 집계와 동일한 결과 테스트 (결측 판정 제외, 목록 밖 값은 COUNT 에만 포함)"""
+        expected = (
+            self.df_ctl.groupby("DOC_NO")
+            .agg(
+                COUNT=("JDG", "count"),
+                OK=("JDG", lambda x: (x == "OK").sum()),
+                NO=("JDG", lambda x: (x == "NO").sum()),
+                NI=("JDG", lambda x: (x == "NI").sum()),
+            )
+            .reset_index()
+        )
+        result = helper_pandas.tally_outcomes(
+            self.df_ctl, "DOC_NO", "JDG", df_ctl.CTL_JDG_OUTCOMES
+        )
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        self.assertEqual(result["COUNT"].tolist(), [3, 2])
+
+    def test_tally_outcomes_empty(self):
+        """빈 데이터프레임 집계 테스트"""
+        result = helper_pandas.tally_outcomes(
+            self.df_ctl.iloc[:0], ["DOC_NO"], "JDG", df_ctl.CTL_JDG_OUTCOMES
+        )
+        self.assertTrue(result.empty)
+        self.assertEqual(result.columns.tolist(), ["DOC_NO", "COUNT", "OK", "NO", "NI"])
+
+
+if __name__ == "__main__":
+    unittest.main()
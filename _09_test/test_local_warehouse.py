@@ -0,0 +1,115 @@
+"""
+로컬 웨어하우스 백엔드(local_warehouse) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import time
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database import db_client, local_warehouse
+from _00_database.local_warehouse import LocalWarehouseClient
+from _01_query.CQMS import q_quality_issue
+from _01_query.GMES import q_production, q_rr, q_uf, q_weight
+from _01_query.HOPE import q_sellin
+from _05_commons import config
+from _08_automation import local_warehouse_seed
+
+
+class TestLocalWarehouse(unittest.TestCase):
+    """로컬 웨어하우스 백엔드 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.db_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            2_000, cls.db_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def _client(self, **kwargs) -> LocalWarehouseClient:
+        kwargs.setdefault("latency_ms", 0)
+        kwargs.setdefault("jitter_ms", 0)
+        kwargs.setdefault("row_latency_us", 0)
+        return LocalWarehouseClient("snowflake", db_path=self.db_path, **kwargs)
+
+    def test_translate_query(self):
+        """Snowflake 전용 구문이 SQLite 구문으로 변환되는지 테스트"""
+        query = local_warehouse.translate_query("""
+            WITH A AS ((SELECT * FROM HKT_DW.MES.QLT_F_LQLTTR105)),
+                 B AS (SELECT LISTAGG(X || ')', ', ') WITHIN GROUP(ORDER BY Y) P FROM A)
+            SELECT EXTRACT(YEAR FROM REG_DATE), TRY_CAST(REGEXP_SUBSTR(T, '[0-9]+') AS FLOAT)
+            FROM B WHERE B.YYYY BETWEEN 2023 AND 2025
+            """)
+        self.assertIn("AS (SELECT * FROM MES__QLT_F_LQLTTR105)", query)
+        self.assertIn("group_concat(X || ')', ', ') P", query)
+        self.assertIn("CAST(strftime('%Y', REG_DATE) AS INTEGER)", query)
+        self.assertIn("TRY_TO_NUMBER(REGEXP_SUBSTR(T, '[0-9]+'))", query)
+        self.assertIn("CAST(B.YYYY AS INTEGER) BETWEEN 2023", query)
+        self.assertNotIn("HKT_DW", query)
+
+    def test_query_builders(self):
+        """_01_query 빌더 쿼리가 시딩된 원본 테이블에서 실행되는지 테스트"""
+        client = self._client()
+        rr = client.execute(q_rr.rr("2025-01-01", "2025-12-31"))
+        self.assertFalse(rr.empty)
+        self.assertTrue(rr["smpl_date"].between("2025-01-01", "2025-12-31").all())
+        self.assertTrue(set(rr["jdg"]) <= {"OK", "재시험", "NG", "N/A"})
+
+        weight = client.execute(q_weight.gt_wt_gruopby_ym("1000001"))
+        self.assertTrue(weight["ins_date_ym"].str.fullmatch(r"\d{6}").all())
+
+        self.assertFalse(client.execute(q_uf.uf_standard("1000001")).empty)
+        monthly = client.execute(q_production.curing_prdt_monthly_by_ym(yyyy=2025))
+        self.assertEqual(set(monthly["yyyy"]), {"2025"})
+        sellin = client.execute(q_sellin.sellin_3_years(2025))
+        self.assertEqual(set(sellin["yyyy"]), {"2023", "2024", "2025"})
+
+        issues = client.execute(q_quality_issue.query_quality_issue(2025))
+        self.assertIn("OEQ Group", issues.columns)
+        self.assertIn("doc_no", issues.columns)
+        self.assertTrue((issues["stage"] == "02").all())
+
+    def test_injected_latency(self):
+        """쿼리당 / 행당 지연이 주입되는지 테스트"""
+        query = "SELECT * FROM HKT_DW.MES.MAS_D_LMASTR101"
+        started = time.perf_counter()
+        df = self._client(latency_ms=50).execute(query)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+        started = time.perf_counter()
+        self._client(row_latency_us=100).execute(query)
+        self.assertGreaterEqual(time.perf_counter() - started, len(df) * 100e-6)
+
+    def test_get_client_backend_switch(self):
+        """WAREHOUSE_BACKEND 설정에 따라 원격 DB 클라이언트가 교체되는지 테스트"""
+        default_backend = config.WAREHOUSE_BACKEND
+        try:
+            config.WAREHOUSE_BACKEND = "local"
+            client = db_client.get_client("oracle_mes")
+            self.assertIsInstance(client, LocalWarehouseClient)
+            self.assertEqual(client.db_type, "oracle_mes")
+            self.assertIsInstance(
+                db_client.get_client("sqlite"), db_client.SQLiteClient
+            )
+
+            config.WAREHOUSE_BACKEND = "remote"
+            self.assertIsInstance(
+                db_client.get_client("snowflake"), db_client.SnowflakeClient
+            )
+        finally:
+            config.WAREHOUSE_BACKEND = default_backend
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+HOPE OE 어플리케이션 참조 데이터(df_oeapp.OEAppReference) 테스트 코드
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.HOPE import df_oeapp
+
+
+class TestOEAppReference(unittest.TestCase):
+    """OE 어플리케이션 참조 데이터 테스트 클래스"""
+
+    def setUp(self):
+        # Snowflake 결과와 같은 원본 컬럼명(소문자/혼합)
+        self.df = pd.DataFrame(
+            {
+                "m_code": ["1001", "1001", "1002", "1003"],
+                "Status": ["Supplying", "Supplying", "Developing", "Supplying"],
+                "Car Maker": ["A", "B", "A", "C"],
+                "plant": ["DP", "KP", "DP", "DP"],
+            }
+        )
+        self.ref = df_oeapp.OEAppReference(self.df)
+
+    def test_by_mcode(self):
+        """M-Code 조회 결과가 pandas 필터와 같은지 테스트"""
+        expected = self.df[self.df["m_code"] == "1001"]
+        actual = self.ref.by_mcode("1001")
+        self.assertEqual(
+            list(actual.columns), ["M_CODE", "STATUS", "CAR MAKER", "PLANT"]
+        )
+        self.assertEqual(actual["CAR MAKER"].tolist(), expected["Car Maker"].tolist())
+        self.assertTrue(self.ref.by_mcode("9999").empty)
+
+    def test_by_plant(self):
+        """공장 조회 결과가 원본 컬럼명으로 반환되는지 테스트"""
+        actual = self.ref.by_plant("DP")
+        self.assertEqual(list(actual.columns), list(self.df.columns))
+        self.assertEqual(actual["m_code"].tolist(), ["1001", "1002", "1003"])
+
+    def test_plant_mcode_pairs(self):
+        """공장-M_CODE 매핑 중복 제거 테스트"""
+        pairs = self.ref.plant_mcode
+        self.assertEqual(list(pairs.columns), ["PLANT", "M_CODE"])
+        self.assertEqual(len(pairs), 4)
+
+    def test_save_reference_creates_indexes(self):
+        """SQLite 참조 테이블 저장 및 인덱스 생성 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "ref.db")
+            df_oeapp.save_oeapp_reference(self.df, db_path)
+            df_oeapp.save_oeapp_reference(self.df, db_path)
+            with sqlite3.connect(db_path) as conn:
+                saved = pd.read_sql(f"SELECT * FROM {df_oeapp.OEAPP_REF_TABLE}", conn)
+                indexes = pd.read_sql(
+                    f"PRAGMA index_list({df_oeapp.OEAPP_REF_TABLE})", conn
+                )
+        self.assertEqual(len(saved), len(self.df))
+        self.assertEqual(len(indexes), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+진행중 현황 스냅샷(df_ongoing_snapshot / ongoing_status_snapshot) 테스트 코드
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.CQMS import df_ongoing_snapshot
+from _08_automation import ongoing_status_snapshot
+
+
+class TestOngoingSnapshot(unittest.TestCase):
+    """진행중 현황 스냅샷 테스트 클래스"""
+
+    def setUp(self):
+        self.snapshot_at = pd.Timestamp("2025-06-30 07:00:00")
+        self.df_qi = pd.DataFrame(
+            {
+                "DOC_NO": ["QI-1", "QI-2", "QI-3", "QI-4"],
+                "PLANT": ["DP", "DP", "KP", None],
+                "REG_DATE": pd.to_datetime(
+                    ["2025-06-20", "2025-04-15", "2024-11-02", "2025-06-01"]
+                ),
+            }
+        )
+
+    def test_add_snapshot_columns(self):
+        """경과일, 경과일 구간, 월 컬럼 테스트"""
+        df = df_ongoing_snapshot.add_snapshot_columns(
+            self.df_qi, "REG_DATE", self.snapshot_at
+        )
+        self.assertEqual(df["ELAPSED_DAYS"].tolist(), [10, 76, 240, 29])
+        self.assertEqual(
+            df["ELAPSED_BUCKET"].tolist(), ["~30D", "61~90D", "180D~", "~30D"]
+        )
+        self.assertEqual(
+            df["MONTH"].dt.strftime("%Y-%m-%d").tolist(),
+            ["2025-06-30", "2025-04-30", "2024-11-30", "2025-06-30"],
+        )
+
+    def test_summarize_backlog(self):
+        """일자별 미결 건수 요약 테스트 (공장 미등록은 N/A)"""
+        df = df_ongoing_snapshot.add_snapshot_columns(
+            self.df_qi, "REG_DATE", self.snapshot_at
+        )
+        history = df_ongoing_snapshot.summarize_backlog({"qi": df}, self.snapshot_at)
+        self.assertEqual(history["COUNT"].sum(), len(self.df_qi))
+        self.assertTrue((history["SNAPSHOT_DATE"] == "2025-06-30").all())
+        self.assertIn("N/A", history["PLANT"].tolist())
+
+    def test_save_snapshots_replaces_same_day_history(self):
+        """같은 날 재실행 시 이력이 중복 누적되지 않는지 테스트"""
+        df = df_ongoing_snapshot.add_snapshot_columns(
+            self.df_qi, "REG_DATE", self.snapshot_at
+        )
+        snapshots = {"qi": df}
+        history = df_ongoing_snapshot.summarize_backlog(snapshots, self.snapshot_at)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "snapshot.db")
+            for _ in range(2):
+                ongoing_status_snapshot.save_snapshots_to_sqlite(
+                    snapshots, history, db_path
+                )
+
+            with sqlite3.connect(db_path) as conn:
+                saved = pd.read_sql(
+                    f"SELECT * FROM {df_ongoing_snapshot.SNAPSHOT_TABLES['qi']}", conn
+                )
+                saved_history = pd.read_sql(
+                    f"SELECT * FROM {df_ongoing_snapshot.HISTORY_TABLE}", conn
+                )
+
+        self.assertEqual(len(saved), len(self.df_qi))
+        self.assertEqual(saved_history["COUNT"].sum(), len(self.df_qi))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+인사정보 디렉터리(df_personnel.PersonnelDirectory) 테스트 코드
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.SAP import df_personnel
+
+
+class TestPersonnelDirectory(unittest.TestCase):
+    """인사정보 디렉터리 테스트 클래스"""
+
+    def setUp(self):
+        # Snowflake 결과와 같은 소문자 컬럼명, 문자열 사원번호
+        self.df_source = pd.DataFrame(
+            {
+                "pnl_no": ["20000001", "20000002", "20000002", "ABC"],
+                "pnl_nm": ["HONG GIL DONG", "LEE FIRST", "LEE SECOND", "INVALID"],
+            }
+        )
+
+    def test_prepare_includes_manual_personnel(self):
+        """수동 등록 인원 추가 및 사원번호 정수 변환 테스트"""
+        df = df_personnel.prepare_personnel_df(self.df_source)
+        self.assertEqual(
+            len(df), len(self.df_source) + len(df_personnel.MANUAL_PERSONNEL)
+        )
+        self.assertEqual(df["PNL_NO"].dtype, "int64")
+        self.assertEqual(len(df_personnel.prepare_personnel_df(None)), 5)
+
+    def test_lookup(self):
+        """사원번호 조회 테스트 (중복은 첫 번째 행, 잘못된 형식은 None)"""
+        directory = df_personnel.PersonnelDirectory(
+            df_personnel.prepare_personnel_df(self.df_source)
+        )
+        self.assertEqual(directory.lookup(20000001), "HONG GIL DONG")
+        self.assertEqual(directory.lookup("20000002"), "LEE FIRST")
+        self.assertEqual(directory.lookup(21300315), "KIM JEE WOONG")
+        self.assertIsNone(directory.lookup(99999999))
+        self.assertIsNone(directory.lookup(None))
+        self.assertEqual(directory.duplicates, [20000002])
+
+    def test_save_reference_roundtrip(self):
+        """SQLite 참조 테이블 저장 후 재로드 테스트"""
+        df = df_personnel.prepare_personnel_df(self.df_source)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "ref.db")
+            df_personnel.save_personnel_reference(df, db_path)
+            df_personnel.save_personnel_reference(df, db_path)
+            with sqlite3.connect(db_path) as conn:
+                saved = pd.read_sql(
+                    f"SELECT * FROM {df_personnel.PERSONNEL_REF_TABLE}", conn
+                )
+        directory = df_personnel.PersonnelDirectory(saved)
+        self.assertEqual(len(saved), len(df))
+        self.assertEqual(directory.lookup(20000001), "HONG GIL DONG")
+
+
+if __name__ == "__main__":
+    unittest.main()
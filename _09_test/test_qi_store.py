@@ -0,0 +1,154 @@
+"""
+품질이슈 공통 데이터(df_quality_issue.QualityIssueStore) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import sys
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import config
+from _00_database import db_client
+from _01_query.CQMS import q_quality_issue
+from _02_preprocessing.CQMS import df_quality_issue, df_cqms_unified
+from _08_automation import local_warehouse_seed
+
+
+class TestQualityIssueStore(unittest.TestCase):
+    """품질이슈 공통 데이터 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.warehouse_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            20_000, cls.warehouse_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+        cls._backend = config.WAREHOUSE_BACKEND
+        cls._path = config.LOCAL_WAREHOUSE_PATH
+        config.WAREHOUSE_BACKEND = "local"
+        config.LOCAL_WAREHOUSE_PATH = cls.warehouse_path
+
+        cls.raw = db_client.get_client("snowflake").execute(
+            q_quality_issue.query_quality_issue()
+        )
+        cls.store = df_quality_issue.QualityIssueStore(cls.raw.copy())
+
+    @classmethod
+    def tearDownClass(cls):
+        config.WAREHOUSE_BACKEND = cls._backend
+        config.LOCAL_WAREHOUSE_PATH = cls._path
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        # 소비 함수가 공통 데이터만 사용하는지 확인하기 위해 쿼리 횟수를 기록
+        self.queries = []
+        original_get_client = df_quality_issue.get_client
+
+        def counting_get_client(name):
+            client = original_get_client(name)
+            execute = client.execute
+
+            class CountingClient:
+                def execute(_, query):
+                    self.queries.append(query)
+                    return execute(query)
+
+            return CountingClient()
+
+        self._patches = [
+            (df_quality_issue, "get_client", original_get_client),
+            (df_quality_issue, "load_qi_store", df_quality_issue.load_qi_store),
+        ]
+        df_quality_issue.get_client = counting_get_client
+        df_quality_issue.load_qi_store = lambda: self.store
+
+    def tearDown(self):
+        for module, name, value in self._patches:
+            setattr(module, name, value)
+
+    def _sorted(self, df):
+        return df.reset_index().sort_values("SEQ").reset_index(drop=True)
+
+    def test_3_years_matches_per_query_pipeline(self):
+        """3개년 품질이슈가 기존 (연도 조회 + 전처리) 결과와 같은지 테스트"""
+        result = df_quality_issue.load_quality_issues_for_3_years(2025)
+
+        expected = db_client.get_client("snowflake").execute(
+            q_quality_issue.query_quality_issue(2025)
+        )
+        expected = df_quality_issue.calculate_mttc_columns(
+            df_quality_issue.prepare_qi_base(expected)
+        )
+        expected = expected[
+            ~expected["LOCATION"].isin(["Internal", "Non-official(In-line)"])
+        ]
+        expected = expected.drop(columns=["TYPE_CD", "CAT_CD", "SUB_CAT_CD"])
+        expected["YYYY"] = expected["REG_DATE"].dt.year
+        expected["MM"] = expected["REG_DATE"].dt.month
+
+        pd.testing.assert_frame_equal(
+            self._sorted(result)[expected.reset_index().columns],
+            self._sorted(expected),
+            check_categorical=False,
+        )
+        self.assertEqual(self.queries, [])
+
+    def test_consumers_share_store_without_mutating_it(self):
+        """소비 함수들이 추가 쿼리 없이 공통 데이터를 사용하고 원본을 변경하지 않는지 테스트"""
+        before = self.store.df.copy()
+
+        weekly = df_quality_issue.load_quality_issues_weekly_base()
+        weekly["NEW_COL"] = 1
+        detail = df_quality_issue.get_quality_issue_df_detail()
+        detail["NEW_COL"] = 1
+        ongoing = df_quality_issue.load_ongoing_quality_issues(["DP", "KP"])
+        m_codes = sorted(self.store.df["M_CODE"].dropna().unique())[:3]
+        unified = df_cqms_unified.get_cqms_unified_df(m_codes)
+
+        self.assertEqual(self.queries, [])
+        pd.testing.assert_frame_equal(self.store.df, before)
+        self.assertEqual(len(weekly), len(before))
+        self.assertTrue(weekly["MTTC"].notna().any())
+        self.assertTrue((ongoing["STATUS"] == "On-going").all())
+        self.assertTrue(set(ongoing["PLANT"]) <= {"DP", "KP"})
+        self.assertTrue(ongoing["REG_DATE"].is_monotonic_increasing)
+        self.assertIn("DOC_NO", ongoing.columns)
+        self.assertTrue(set(unified["M_CODE"]) <= set(m_codes) | {None})
+
+    def test_ongoing_keeps_plants_outside_plant_codes(self):
+        """config.plant_codes 에 없는 공장의 진행 중 이슈도 원래 PLANT 값으로 반환하는지 테스트"""
+        raw = self.raw.copy()
+        raw.columns = raw.columns.str.upper()
+        ongoing_rows = raw.index[raw["STATUS"] == "On-going"][:5]
+        raw.loc[ongoing_rows, "PLANT"] = "ZZ"
+        store = df_quality_issue.QualityIssueStore(raw)
+        df_quality_issue.load_qi_store = lambda: store
+
+        self.assertTrue(store.df["PLANT"].isna().sum() >= 5)
+        ongoing = df_quality_issue.load_ongoing_quality_issues()
+        self.assertEqual((ongoing["PLANT"] == "ZZ").sum(), 5)
+        self.assertFalse(ongoing["PLANT"].isna().any())
+        self.assertEqual(
+            len(df_quality_issue.load_ongoing_quality_issues(["ZZ"])), len(ongoing_rows)
+        )
+        by_plant = df_quality_issue.summarize_ongoing_quality_by_plant()
+        self.assertEqual(by_plant.loc["ZZ", "count"], 5)
+        self.assertEqual(by_plant["count"].sum(), len(ongoing))
+
+    def test_mttc_computed_once(self):
+        """MTTC 기간 컬럼은 공통 데이터당 한 번만 계산되는지 테스트"""
+        first = self.store.mttc_columns()
+        self.assertIs(self.store.mttc_columns(), first)
+        self.assertEqual(len(first), len(self.store.df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+쿼리 계측(query_metrics) 테스트 코드
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database import query_metrics
+from _05_commons import event_logger
+
+
+class TestQueryMetrics(unittest.TestCase):
+    """쿼리 계측 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "metrics.db")
+        # 계측 기록이 실제 DB 대신 임시 DB로 저장되도록 공용 로거 교체
+        self._default_logger = event_logger._event_logger
+        event_logger._event_logger = event_logger.EventLogger(
+            self.db_path, flush_interval=0.05
+        )
+        with sqlite3.connect(self.db_path) as conn:
+            pd.DataFrame({"PLANT": ["DP", "KP", "DP"], "QTY": [1, 2, 3]}).to_sql(
+                "sample", conn, index=False
+            )
+
+    def tearDown(self):
+        event_logger._event_logger.stop()
+        event_logger._event_logger = self._default_logger
+        self.tmp_dir.cleanup()
+
+    def test_fingerprint_ignores_literals_and_formatting(self):
+        """리터럴 / 공백 / 주석 / IN 목록 길이가 달라도 같은 지문인지 테스트"""
+        query_a = """--sql
+            SELECT * FROM T WHERE PLANT IN ('DP', 'KP') AND YMD >= '20250101'
+        """
+        query_b = "select * from t where plant in ('HP') and ymd>='20240101' -- x"
+        query_c = "SELECT * FROM T WHERE PLANT = 'DP'"
+        self.assertEqual(
+            query_metrics.fingerprint_query(query_a),
+            query_metrics.fingerprint_query(query_b),
+        )
+        self.assertNotEqual(
+            query_metrics.fingerprint_query(query_a),
+            query_metrics.fingerprint_query(query_c),
+        )
+
+    def test_read_sql_matches_pandas_and_records_metrics(self):
+        """계측 실행 결과가 pd.read_sql 과 같고 계측 기록이 저장되는지 테스트"""
+        query = "SELECT PLANT, SUM(QTY) AS QTY FROM sample GROUP BY PLANT"
+        with sqlite3.connect(self.db_path) as conn:
+            expected = pd.read_sql(query, conn)
+            actual = query_metrics.read_sql("sqlite", query, conn)
+        pd.testing.assert_frame_equal(actual, expected)
+
+        metrics = query_metrics.load_query_metrics(db_path=self.db_path)
+        self.assertEqual(len(metrics), 1)
+        record = metrics.iloc[0]
+        self.assertEqual(record["BACKEND"], "sqlite")
+        self.assertEqual(record["ROWS"], 2)
+        self.assertGreater(record["BYTES"], 0)
+        self.assertIn("test_query_metrics.py", record["CALLER"])
+        self.assertAlmostEqual(
+            record["WALL_MS"], record["EXEC_MS"] + record["FETCH_MS"], delta=0.1
+        )
+
+    def test_summarize_query_metrics(self):
+        """지문별 호출 수 / 캐시 적중률 집계 테스트"""
+        with sqlite3.connect(self.db_path) as conn:
+            for plant in ["DP", "KP", "DP"]:
+                query_metrics.read_sql(
+                    "sqlite", f"SELECT * FROM sample WHERE PLANT = '{plant}'", conn
+                )
+        for hit in [False, True, True, True]:
+            query_metrics.record_cache_lookup("df_rr.get_rr_df", 1.0, None, hit)
+
+        summary = query_metrics.summarize_query_metrics(
+            query_metrics.load_query_metrics(db_path=self.db_path)
+        ).set_index("FINGERPRINT")
+        self.assertEqual(len(summary), 2)
+        self.assertEqual(summary.loc["cache:df_rr.get_rr_df", "CALLS"], 4)
+        self.assertEqual(summary.loc["cache:df_rr.get_rr_df", "CACHE_HIT_RATE"], 0.75)
+        self.assertEqual(summary["CALLS"].sum(), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
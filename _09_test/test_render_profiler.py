@@ -0,0 +1,117 @@
+"""
+페이지 렌더링 프로파일러(render_profiler) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import types
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import event_logger, render_profiler
+
+
+def render_section(log):
+    log.append("section")
+    draw_chart(log)
+
+
+def draw_chart(log):
+    log.append("chart")
+
+
+class TestRenderProfiler(unittest.TestCase):
+    """렌더링 프로파일러 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "profile.db")
+        # 프로파일 기록이 실제 DB 대신 임시 DB로 저장되도록 공용 로거 교체
+        self._default_logger = event_logger._event_logger
+        event_logger._event_logger = event_logger.EventLogger(
+            self.db_path, flush_interval=0.05
+        )
+        self._default_env = os.environ.get(render_profiler.PROFILE_ENV)
+
+    def tearDown(self):
+        event_logger._event_logger.stop()
+        event_logger._event_logger = self._default_logger
+        if self._default_env is None:
+            os.environ.pop(render_profiler.PROFILE_ENV, None)
+        else:
+            os.environ[render_profiler.PROFILE_ENV] = self._default_env
+        self.tmp_dir.cleanup()
+
+    def _run_page(self, page="Page"):
+        namespace = {"render_section": render_section, "helper": len}
+        self.assertEqual(render_profiler.profile_functions(namespace, ("render_",)), 1)
+        module = types.ModuleType("pkg.viz_sample")
+        module.draw_chart = draw_chart
+        proxy = render_profiler.ProfiledModule(module, ("draw_",))
+
+        log = []
+        with render_profiler.page_profile(page, show_panel=False):
+            namespace["render_section"](log)
+            with render_profiler.profile_span("pivot"):
+                proxy.draw_chart(log)
+        return log
+
+    def test_nested_spans(self):
+        """중첩 구간의 깊이 / 부모 / 하위 제외 시간이 기록되는지 테스트"""
+        os.environ[render_profiler.PROFILE_ENV] = "1"
+        profile = render_profiler.RenderProfile("Page")
+        with profile.span("Page"):
+            with profile.span("render_section"):
+                with profile.span("viz.draw_chart"):
+                    pass
+            with profile.span("pivot"):
+                pass
+        df = profile.to_frame()
+
+        self.assertEqual(
+            df["NAME"].tolist(), ["Page", "render_section", "viz.draw_chart", "pivot"]
+        )
+        self.assertEqual(df["DEPTH"].tolist(), [0, 1, 2, 1])
+        self.assertEqual(df["PARENT_ID"].iloc[1:].tolist(), [0, 1, 0])
+        self.assertTrue((df["SELF_MS"] >= 0).all())
+        self.assertTrue((df["SELF_MS"] <= df["DURATION_MS"]).all())
+
+    def test_disabled_profiling_calls_through(self):
+        """비활성화 시 원본 함수가 그대로 실행되고 기록이 남지 않는지 테스트"""
+        os.environ[render_profiler.PROFILE_ENV] = "0"
+        log = self._run_page()
+        self.assertEqual(log, ["section", "chart", "chart"])
+        self.assertIsNone(render_profiler.current_profile())
+
+        event_logger.get_event_logger().flush(timeout=5)
+        history = render_profiler.load_render_profiles("Page", db_path=self.db_path)
+        self.assertTrue(history.empty)
+
+    def test_profile_saved_and_compared(self):
+        """계측 함수 / 모듈 프록시 구간이 저장되고 이전 실행과 비교되는지 테스트"""
+        os.environ[render_profiler.PROFILE_ENV] = "1"
+        self._run_page()
+        self._run_page()
+        event_logger.get_event_logger().flush(timeout=5)
+
+        history = render_profiler.load_render_profiles("Page", db_path=self.db_path)
+        self.assertEqual(history["RUN_ID"].nunique(), 2)
+        names = set(history["NAME"])
+        self.assertTrue(
+            {"Page", "render_section", "viz_sample.draw_chart", "pivot"} <= names
+        )
+
+        current = history[history["RUN_ID"] == history["RUN_ID"].iloc[0]]
+        previous = history[history["RUN_ID"] != history["RUN_ID"].iloc[0]]
+        comparison = render_profiler.compare_with_history(current, previous)
+        draw_row = comparison.set_index("NAME").loc["viz_sample.draw_chart"]
+        self.assertEqual(draw_row["CALLS"], 1)
+        self.assertFalse(comparison["HISTORY_AVG_MS"].isna().any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+RR 보정식 계산기(df_rr.RRCorrection) 테스트 코드
+"""
+
+import unittest
+import sys
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _01_query.GMES import q_rr
+from _02_preprocessing.GMES import df_rr
+
+
+def coefficient(plant, position, method):
+    """보정 계수 CSV 에서 (Slope, Intercept) 한 건을 찾습니다."""
+    csv = q_rr.rr_corr_csv
+    row = csv[
+        (csv["PLANT"] == plant)
+        & (csv["POSITION"] == position)
+        & (csv["OE_RR_TEST_METHOD"] == method)
+    ]
+    assert len(row) == 1
+    return row["Slope"].iloc[0], row["Intercept"].iloc[0]
+
+
+def make_samples():
+    """시험법별 RR 샘플 (컬럼명 대문자)"""
+    return pd.DataFrame(
+        {
+            "PLANT": ["DP", "DP", "KP", "DP", "DP", "DP", "KP"],
+            "M_CODE": ["1000001", "1020898", "1000002", "1000003", "1017808"]
+            + ["1000004", "1000005"],
+            "WARM_LOAD": [500.0, 520.0, 610.0, 480.0, 505.0, 530.0, 450.0],
+            "RRC": [8.1, 8.4, 9.0, 7.9, 8.2, 8.8, 8.6],
+            "HK_GLOBAL": [8.0] * 7,
+            "POSITION": [
+                "PC SRR #01 - A Pos",
+                "PC SRR #01 - B Pos",
+                "PC SRR #99 - A Pos",
+                "pc srr #01 - a pos",
+                "-",
+                "PC SRR #01 - A Pos",
+                "PC SRR #02 - B Pos",
+            ],
+            "TEST_RESULT_OLD": [1.0, 2.0, 3.0, 4.0, 8.7, 6.0, 7.0],
+            "OE_TEST_METHOD": [
+                "ISO 28580 (EU)",
+                "SAE-J2452",
+                "ISO 28580 (EU)",
+                "SVP (HKMC)",
+                "SAE-J2452",
+                "UNKNOWN",
+                "SVP (NISSAN)",
+            ],
+        }
+    )
+
+
+class TestRRCorrection(unittest.TestCase):
+    """RR 보정식 계산기 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.correction = df_rr.RRCorrection(q_rr.rr_corr_csv)
+        cls.result = cls.correction.apply(make_samples())
+
+    def test_rows_are_ordered_by_method_group(self):
+        """ISO / SVP / SAE 순으로 정렬하고 목록에 없는 시험법은 제외하는지 테스트"""
+        self.assertEqual(
+            self.result["M_CODE"].tolist(),
+            ["1000001", "1000002", "1000003", "1000005", "1020898", "1017808"],
+        )
+        self.assertEqual(self.result.index.tolist(), list(range(6)))
+
+    def test_iso_uses_local_and_ref_lab_coefficients(self):
+        """ISO 는 공장/위치별 계수와 시험법별 계수를 모두 적용하는지 테스트"""
+        a, b = coefficient("DP", "PC SRR #01 - A Pos", "-")
+        c, d = coefficient("-", "-", "ISO 28580 (EU)")
+        self.assertEqual(self.result["Result_new"].iloc[0], (8.1 * a + b) * c + d)
+        # 계수가 없는 위치는 NaN
+        self.assertTrue(np.isnan(self.result["Result_new"].iloc[1]))
+
+    def test_svp_uses_upper_position_and_hkmc_formula(self):
+        """SVP 는 대문자 위치로 계수를 찾고 SVP (HKMC) 는 HKMC 변환식을 적용하는지 테스트"""
+        a, b = coefficient("DP", "PC SRR #01 - A Pos", "SVP (HKMC)")
+        corrected = 7.9 * a + b
+        load = 480.0 * df_rr.KGF_TO_N
+        expected = (
+            ((corrected * load / 1000) * df_rr.HKMC_SLOPE + df_rr.HKMC_INTERCEPT)
+            * 1000
+            / load
+        )
+        self.assertAlmostEqual(self.result["Result_new"].iloc[2], expected, places=12)
+        self.assertEqual(self.result["POSITION"].iloc[2], "PC SRR #01 - A POS")
+
+        a, b = coefficient("KP", "PC SRR #02 - B Pos", "SVP (NISSAN)")
+        self.assertEqual(self.result["Result_new"].iloc[3], 8.6 * a + b)
+
+    def test_sae_keeps_result_and_product_factor_applies(self):
+        """SAE 는 기존 결과를 사용하고 제품별 계수를 곱하는지 테스트"""
+        self.assertEqual(
+            self.result["Result_new"].iloc[4], 2.0 * df_rr.PRODUCT_FACTORS["1020898"]
+        )
+        self.assertEqual(
+            self.result["Result_new"].iloc[5], 8.7 * df_rr.PRODUCT_FACTORS["1017808"]
+        )
+
+    def test_duplicate_coefficient_keys_are_rejected(self):
+        """보정 계수 키가 중복되면 ValueError 를 발생시키는지 테스트"""
+        csv = pd.concat([q_rr.rr_corr_csv, q_rr.rr_corr_csv.iloc[[0]]])
+        with self.assertRaises(ValueError):
+            df_rr.RRCorrection(csv)
+
+
+if __name__ == "__main__":
+    unittest.main()
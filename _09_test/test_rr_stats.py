@@ -0,0 +1,156 @@
+"""
+RR 부분 통계(df_rr.RRStats) 테스트 코드
+"""
+
+import unittest
+import sys
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.GMES import df_rr
+
+
+def make_samples(n=20_000, seed=0):
+    """load_rr_raw 결과 형태의 RR 샘플 (결측 / 1건 / 동일 값 그룹 포함)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "PLANT": rng.choice(["DP", "KP", "JP", "HP"], n),
+            "M_CODE": rng.integers(1_000_000, 1_000_300, n).astype(str),
+            "SMPL_DATE": pd.Timestamp("2023-01-01")
+            + pd.to_timedelta(rng.integers(0, 1_000, n), "D"),
+            "Result_new": rng.normal(8.5, 0.4, n),
+        }
+    )
+    df.loc[rng.random(n) < 0.02, "Result_new"] = np.nan
+    identical = pd.DataFrame(
+        {
+            "PLANT": "DP",
+            "M_CODE": "2000000",
+            "SMPL_DATE": pd.to_datetime(["2024-03-05", "2024-03-20", "2024-04-02"]),
+            "Result_new": 8.1,
+        }
+    )
+    single = identical.iloc[[0]].assign(M_CODE="2000001", Result_new=7.7)
+    return pd.concat([df, identical, single], ignore_index=True)
+
+
+def expected_window(df, start_date=None, end_date=None):
+    """get_rr_df 와 같은 방식으로 원본 샘플을 직접 집계"""
+    if start_date and end_date:
+        df = df[df["SMPL_DATE"].between(start_date, end_date)]
+    return df.groupby(["PLANT", "M_CODE"], as_index=False).agg(
+        avg=("Result_new", "mean"),
+        std=("Result_new", "std"),
+        count=("Result_new", "count"),
+    )
+
+
+class TestRRStats(unittest.TestCase):
+    """RR 부분 통계 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.samples = make_samples()
+        cls.stats = df_rr.RRStats.from_samples(cls.samples)
+
+    def assert_window_matches(self, stats, start_date=None, end_date=None):
+        result = stats.window(start_date, end_date)
+        expected = expected_window(self.samples, start_date, end_date)
+        pd.testing.assert_frame_equal(
+            result, expected, check_exact=False, rtol=1e-9, atol=1e-12
+        )
+
+    def test_windows_match_raw_aggregation(self):
+        """월 경계 / 월 중간 / 하루 / 전체 기간이 원본 샘플 집계와 같은지 테스트"""
+        for start_date, end_date in [
+            ("2023-01-01", "2025-09-27"),
+            ("2024-01-01", "2024-12-31"),
+            ("2023-03-15", "2024-11-07"),
+            ("2024-02-10", "2024-03-05"),
+            ("2024-06-01", "2024-06-30"),
+            ("2024-06-17", "2024-06-17"),
+            (None, None),
+        ]:
+            with self.subTest(start_date=start_date, end_date=end_date):
+                self.assert_window_matches(self.stats, start_date, end_date)
+
+    def test_identical_values_have_zero_std(self):
+        """같은 값만 있으면 std 가 0, 1건이면 NaN 인지 테스트 (calc_epass 계산 제외 조건)"""
+        result = self.stats.window("2024-03-01", "2024-04-30").set_index("M_CODE")
+        self.assertEqual(result.loc["2000000", "std"], 0)
+        self.assertEqual(result.loc["2000000", "count"], 3)
+        self.assertTrue(np.isnan(result.loc["2000001", "std"]))
+
+    def test_update_recomputes_only_recent_partials(self):
+        """최근 기간만 다시 집계해도 전체를 다시 만든 것과 같은지 테스트"""
+        since = pd.Timestamp("2025-06-12")
+        old = self.samples[self.samples["SMPL_DATE"] < "2025-06-20"]
+        stats = df_rr.RRStats.from_samples(old)
+
+        recent = self.samples[self.samples["SMPL_DATE"] >= since]
+        updated = stats.update(recent, since)
+        # since 이전 월의 월 통계는 다시 병합하지 않고 그대로 사용
+        self.assertTrue(
+            updated.monthly[updated.monthly["MONTH"] < "2025-06-01"].equals(
+                stats.monthly[stats.monthly["MONTH"] < "2025-06-01"]
+            )
+        )
+        self.assert_window_matches(updated, "2025-02-14", "2025-09-27")
+        self.assert_window_matches(updated)
+
+    def test_epass_from_window(self):
+        """부분 통계로 만든 집계에 calc_epass 를 적용한 결과가 원본 집계와 같은지 테스트"""
+        rr_agg = self.stats.window("2024-02-10", "2025-05-20")
+        keys = rr_agg[["PLANT", "M_CODE"]].drop_duplicates()
+        spec = keys.assign(CL=8.5, e_max=9.0, e_min=8.0)
+
+        result = df_rr.calc_epass.__wrapped__(rr_agg, spec)
+        expected = df_rr.calc_epass.__wrapped__(
+            expected_window(self.samples, "2024-02-10", "2025-05-20"), spec
+        )
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+    def test_get_rr_stats_refreshes_recent_days_only(self):
+        """최초 1회는 전체 이력, 만료 후에는 최근 RR_STATS_REFRESH_DAYS 일만 조회하는지 테스트"""
+        calls = []
+
+        def read_rr_samples(start_date, end_date):
+            calls.append((start_date, end_date))
+            return self.samples[self.samples["SMPL_DATE"].between(start_date, end_date)]
+
+        def load_rr_raw(*args, **kwargs):
+            raise AssertionError(
+                "get_rr_stats 는 캐시되는 load_rr_raw 를 사용하지 않음"
+            )
+
+        for name, func in [
+            ("read_rr_samples", read_rr_samples),
+            ("load_rr_raw", load_rr_raw),
+        ]:
+            self.addCleanup(setattr, df_rr, name, getattr(df_rr, name))
+            setattr(df_rr, name, func)
+        self.addCleanup(setattr, df_rr, "_rr_stats", None)
+        df_rr._rr_stats = None
+
+        stats = df_rr.get_rr_stats()
+        self.assertIs(df_rr.get_rr_stats(), stats)
+        self.assertEqual(calls[0][0], df_rr.RR_HISTORY_START)
+
+        stats.built_at -= df_rr.RR_STATS_TTL_SEC + 1
+        refreshed = df_rr.get_rr_stats()
+        self.assertIsNot(refreshed, stats)
+        since = pd.Timestamp(calls[1][1]) - pd.Timedelta(
+            days=df_rr.RR_STATS_REFRESH_DAYS
+        )
+        self.assertEqual(calls[1][0], since.strftime("%Y-%m-%d"))
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+"""
+RR 샘플 로컬 저장소 증분 적재(rr_sample_etl) 및 df_rr 저장소 조회 테스트 코드
+"""
+
+import unittest
+import tempfile
+import functools
+import json
+import sqlite3
+import sys
+from pathlib import Path
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import config
+from _00_database import db_client
+from _02_preprocessing.GMES import df_rr
+from _08_automation import local_warehouse_seed, rr_sample_etl
+
+# 최초 적재 후 새로 들어온 것으로 간주할 샘플 (SMPL_ID >= 2025-07-01)
+NEW_SAMPLES_FROM = "250701"
+
+
+class TestRRSampleStore(unittest.TestCase):
+    """RR 샘플 로컬 저장소 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.warehouse_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            20_000, cls.warehouse_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+        cls._backend = config.WAREHOUSE_BACKEND
+        cls._path = config.LOCAL_WAREHOUSE_PATH
+        config.WAREHOUSE_BACKEND = "local"
+        config.LOCAL_WAREHOUSE_PATH = cls.warehouse_path
+
+        cls.samples = rr_sample_etl.extract_rr_samples()
+
+    @classmethod
+    def tearDownClass(cls):
+        config.WAREHOUSE_BACKEND = cls._backend
+        config.LOCAL_WAREHOUSE_PATH = cls._path
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.store_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.store_dir.cleanup)
+        self.store_path = self.store_dir.name
+
+        # 웨어하우스 조회 쿼리를 기록
+        self.queries = []
+        original_get_client = db_client.get_client
+
+        def counting_get_client(name):
+            client = original_get_client(name)
+            execute = client.execute
+
+            class CountingClient:
+                def execute(_, query):
+                    self.queries.append(query)
+                    return execute(query)
+
+            return CountingClient()
+
+        for module in [rr_sample_etl, df_rr]:
+            self.addCleanup(setattr, module, "get_client", module.get_client)
+            module.get_client = counting_get_client
+
+    def _load_initial(self, covered_from="2021-01-01"):
+        """NEW_SAMPLES_FROM 이전 샘플만 적재된 저장소를 만듭니다."""
+        old = self.samples[self.samples["SMPL_ID"] < NEW_SAMPLES_FROM]
+        rr_sample_etl.append_rr_samples(old, self.store_path)
+        rr_sample_etl.write_rr_store_meta(
+            {
+                "version": df_rr.RR_STORE_VERSION,
+                "covered_from": covered_from,
+                "synced_at": pd.Timestamp.now().isoformat(timespec="seconds"),
+                "watermark": old["SMPL_ID"].max(),
+                "superseded": 0,
+            },
+            self.store_path,
+        )
+        return old
+
+    def _read_all(self):
+        table = df_rr.open_rr_store(self.store_path).to_table(
+            columns=list(df_rr.RR_STORE_TYPES)
+        )
+        return (
+            table.to_pandas()
+            .sort_values(df_rr.RR_SAMPLE_KEYS + ["ATCH_SEQ"])
+            .reset_index(drop=True)
+        )
+
+    def test_incremental_run_appends_only_new_samples(self):
+        """증분 적재는 워터마크 - 겹침 기간 이후만 조회하고 신규 샘플만 추가하는지 테스트"""
+        old = self._load_initial()
+        success, message = rr_sample_etl.run_rr_sample_etl(store_path=self.store_path)
+        self.assertTrue(success, message)
+
+        # 워터마크(최신 SMPL_ID) 날짜에서 RR_LOOKBACK_DAYS 전부터 조회
+        since = pd.to_datetime(old["SMPL_ID"].max()[:6], format="%y%m%d")
+        since -= pd.Timedelta(days=rr_sample_etl.RR_LOOKBACK_DAYS)
+        self.assertEqual(len(self.queries), 1)
+        self.assertIn(f"SPL.SMPL_ID >= '{since:%y%m%d}'", self.queries[0])
+
+        # 겹쳐서 조회한 기존 샘플은 중복 적재하지 않음
+        types = {"string": object, "int": "int64"}
+        expected = (
+            self.samples.drop(columns=[df_rr.RR_PARTITION_COL])
+            .astype(
+                {
+                    col: types[kind]
+                    for col, kind in df_rr.RR_STORE_TYPES.items()
+                    if kind in types
+                }
+            )
+            .sort_values(df_rr.RR_SAMPLE_KEYS + ["ATCH_SEQ"])
+            .reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(self._read_all(), expected)
+
+        # 신규 샘플이 없으면 파일을 추가하지 않음
+        files = sorted(Path(self.store_path).rglob("*.parquet"))
+        success, message = rr_sample_etl.run_rr_sample_etl(store_path=self.store_path)
+        self.assertTrue(success, message)
+        self.assertEqual(sorted(Path(self.store_path).rglob("*.parquet")), files)
+
+    def test_new_test_and_attachment_of_stored_sample(self):
+        """적재된 샘플의 새 시험(TEST_SEQ)은 추가되고, 새 첨부(ATCH_SEQ)는 이전 행을 대체하는지 테스트"""
+        old = self._load_initial()
+        # 겹쳐서 조회하는 기간(워터마크 - RR_LOOKBACK_DAYS) 안의 적재된 샘플 2건
+        latest = old.sort_values("SMPL_ID").drop_duplicates(["PLANT", "SMPL_ID"])
+        retest, reattach = latest.iloc[-1], latest.iloc[-2]
+
+        # 웨어하우스에 적재된 샘플의 2차 시험 / 1차 시험의 새 첨부를 추가
+        table = "MES__QLT_F_LQLTTR316"
+        with sqlite3.connect(self.warehouse_path) as conn:
+            for sample, test_seq, rrc in [(retest, 2, 9.99), (reattach, 1, 7.77)]:
+                conn.execute(
+                    f"INSERT INTO {table} (PLT_CD, SMPL_ID, ATCH_SEQ, TEST_SEQ, "
+                    "RSLT_RRC, RSLT_RRC_CORR, WARM_LOAD, STD_TEST_POS, JDG, TEST_VAL) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 10, ?)",
+                    (
+                        sample["PLANT"],
+                        sample["SMPL_ID"],
+                        int(sample["ATCH_SEQ"]) + 1,
+                        test_seq,
+                        rrc,
+                        rrc,
+                        float(sample["WARM_LOAD"]),
+                        sample["POSITION"],
+                        rrc,
+                    ),
+                )
+
+        def _delete_added_rows():
+            with sqlite3.connect(self.warehouse_path) as conn:
+                for sample in [retest, reattach]:
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE PLT_CD = ? AND SMPL_ID = ? "
+                        "AND ATCH_SEQ = ?",
+                        (
+                            sample["PLANT"],
+                            sample["SMPL_ID"],
+                            int(sample["ATCH_SEQ"]) + 1,
+                        ),
+                    )
+
+        self.addCleanup(_delete_added_rows)
+
+        success, message = rr_sample_etl.run_rr_sample_etl(store_path=self.store_path)
+        self.assertTrue(success, message)
+        # 신규 샘플 + 적재된 샘플의 2차 시험 / 새 첨부 2건
+        appended = (self.samples["SMPL_ID"] >= NEW_SAMPLES_FROM).sum() + 2
+        self.assertIn(f"신규 {appended}건", message)
+        meta = df_rr.read_rr_store_meta(self.store_path)
+        self.assertEqual(meta["superseded"], 1)
+
+        stored = df_rr.read_rr_store(
+            "2021-01-01", "2025-12-31", store_path=self.store_path
+        )
+        retests = stored[
+            (stored["PLANT"] == retest["PLANT"])
+            & (stored["SMPL_ID"] == retest["SMPL_ID"])
+        ]
+        self.assertEqual(sorted(retests["TEST_SEQ"]), [1, 2])
+        self.assertEqual(retests.loc[retests["TEST_SEQ"] == 2, "RRC"].item(), 9.99)
+
+        reattached = stored[
+            (stored["PLANT"] == reattach["PLANT"])
+            & (stored["SMPL_ID"] == reattach["SMPL_ID"])
+        ]
+        self.assertEqual(len(reattached), 1)
+        self.assertEqual(reattached["RRC"].item(), 7.77)
+        self.assertFalse(stored.duplicated(df_rr.RR_SAMPLE_KEYS).any())
+
+    def test_old_store_version_is_rebuilt(self):
+        """저장 형식 버전이 다른 저장소는 조회하지 않고 기존 적재 시작일부터 재적재하는지 테스트"""
+        self._load_initial(covered_from="2024-01-01")
+        meta = df_rr.read_rr_store_meta(self.store_path)
+        rr_sample_etl.write_rr_store_meta({**meta, "version": 1}, self.store_path)
+        read = functools.partial(df_rr.read_rr_store, store_path=self.store_path)
+        self.assertIsNone(read("2024-01-01", "2025-06-30"))
+
+        success, message = rr_sample_etl.run_rr_sample_etl(store_path=self.store_path)
+        self.assertTrue(success, message)
+        self.assertIn("SPL.SMPL_ID >= '240101'", self.queries[-1])
+        meta = df_rr.read_rr_store_meta(self.store_path)
+        self.assertEqual(meta["version"], df_rr.RR_STORE_VERSION)
+        self.assertEqual(meta["covered_from"], "2024-01-01")
+        self.assertIsNotNone(read("2024-01-01", "2025-06-30"))
+
+    def test_load_rr_raw_reads_store(self):
+        """적재 범위 안의 기간은 웨어하우스 조회 없이 저장소에서 같은 결과를 만드는지 테스트"""
+        self._load_initial()
+        expected = df_rr.load_rr_raw("2024-03-01", "2025-05-31")
+        self.assertEqual(len(self.queries), 1)
+
+        self.queries.clear()
+        self.addCleanup(setattr, df_rr, "read_rr_store", df_rr.read_rr_store)
+        df_rr.read_rr_store = functools.partial(
+            df_rr.read_rr_store, store_path=self.store_path
+        )
+        result = df_rr.load_rr_raw("2024-03-01", "2025-05-31")
+        self.assertEqual(self.queries, [])
+
+        def _sorted(df):
+            keys = ["PLANT", "M_CODE", "SMPL_DATE", "POSITION", "Result_new"]
+            return df.sort_values(keys).reset_index(drop=True)
+
+        pd.testing.assert_frame_equal(_sorted(result), _sorted(expected))
+
+    def test_append_writes_through_staging_dir(self):
+        """파일은 임시 디렉토리를 거쳐 파티션 경로로 이동하고, 임시 디렉토리는 조회되지 않는지 테스트"""
+        self._load_initial()
+        staging = Path(self.store_path) / rr_sample_etl.RR_STAGING_DIR
+        self.assertEqual(list(staging.rglob("*")), [])
+        files = list(Path(self.store_path).rglob("*.parquet"))
+        self.assertTrue(files)
+        self.assertTrue(all(df_rr.RR_PARTITION_COL in f.parent.name for f in files))
+
+        # 중단된 적재가 남긴 임시 파일은 저장소 조회에 포함되지 않음
+        stored = len(self._read_all())
+        leftover = staging / "crashed" / "SMPL_MONTH=2025-01"
+        leftover.mkdir(parents=True)
+        (leftover / "part-crashed-0.parquet").write_bytes(b"partial")
+        self.assertEqual(len(self._read_all()), stored)
+
+    def test_load_rr_raw_falls_back_when_store_read_fails(self):
+        """저장소 파일을 읽지 못하면 웨어하우스에서 조회하는지 테스트"""
+        self._load_initial()
+        broken = Path(self.store_path) / f"{df_rr.RR_PARTITION_COL}=2024-03"
+        (broken / "part-broken-0.parquet").write_bytes(b"not a parquet file")
+
+        self.addCleanup(setattr, df_rr, "read_rr_store", df_rr.read_rr_store)
+        df_rr.read_rr_store = functools.partial(
+            df_rr.read_rr_store, store_path=self.store_path
+        )
+        result = df_rr.load_rr_raw("2024-03-01", "2025-05-31")
+        self.assertEqual(len(self.queries), 1)
+        self.assertFalse(result.empty)
+
+    def test_store_is_skipped_outside_coverage_or_when_stale(self):
+        """적재 시작일 이전 기간 / 동기화가 오래된 최근 기간은 None 을 반환하는지 테스트"""
+        self._load_initial(covered_from="2024-01-01")
+        read = functools.partial(df_rr.read_rr_store, store_path=self.store_path)
+        self.assertIsNotNone(read("2024-01-01", "2025-06-30"))
+        self.assertIsNone(read("2023-12-01", "2025-06-30"))
+        self.assertIsNone(read())
+
+        meta_path = os.path.join(self.store_path, df_rr.RR_STORE_META)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["synced_at"] = "2025-07-01T06:00:00"
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        # 마지막 동기화 이전 기간은 그대로 사용, 이후를 포함하면 웨어하우스 조회
+        self.assertIsNotNone(read("2024-01-01", "2025-06-30"))
+        self.assertIsNone(read("2024-01-01", "2025-07-01"))
+        self.assertIsNone(
+            df_rr.read_rr_store(store_path=os.path.join(self.store_path, "empty"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+프로세스 간 공유 DataFrame 저장소(shared_frame_store) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import threading
+import time
+import sys
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _05_commons import config
+from _02_preprocessing import shared_frame_store
+
+
+def make_frame(n=1_000, seed=0):
+    """품질이슈 데이터와 같은 타입 구성(카테고리 / Int64 / NaT / 문자열 인덱스)의 샘플 데이터"""
+    rng = np.random.default_rng(seed)
+    reg_date = pd.Timestamp("2025-01-01") + pd.to_timedelta(
+        rng.integers(0, 365, n), "D"
+    )
+    df = pd.DataFrame(
+        {
+            "PLANT": pd.Categorical(
+                rng.choice(["DP", "KP", "JP"], n),
+                categories=config.plant_codes,
+                ordered=True,
+            ),
+            "REG_DATE": reg_date,
+            "COMP_DATE": reg_date.where(rng.random(n) < 0.7),
+            "MTTC": pd.array(rng.integers(0, 50, n), dtype="Int64"),
+            "VALUE": rng.normal(size=n),
+            "DESCRIPTION": [f"issue {i}" if i % 5 else None for i in range(n)],
+        },
+        index=pd.Index([f"DOC-{i}" for i in range(n)], name="DOC_NO"),
+    )
+    df.loc[df.index[:3], "MTTC"] = pd.NA
+    return df
+
+
+class TestSharedFrameStore(unittest.TestCase):
+    """공유 DataFrame 저장소 테스트 클래스"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self._path = config.SHARED_FRAME_STORE_PATH
+        config.SHARED_FRAME_STORE_PATH = self.tmp_dir.name
+        self.addCleanup(setattr, config, "SHARED_FRAME_STORE_PATH", self._path)
+
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = False
+
+        def load(year, plant="DP"):
+            self.calls += 1
+            self.release.wait(5)
+            if self.fail:
+                raise RuntimeError("warehouse unavailable")
+            return make_frame(seed=year).assign(N=self.calls)
+
+        self.load = load
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_round_trip_returns_read_only_views(self):
+        """저장 / 조회 시 타입과 인덱스가 유지되고 숫자 컬럼은 복사 없이 참조되는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(ttl=60)(self.load)
+        first = cached(2025)
+        second = cached(year=2025, plant="DP")
+        self.assertEqual(self.calls, 1)
+        pd.testing.assert_frame_equal(first, make_frame(seed=2025).assign(N=1))
+        pd.testing.assert_frame_equal(first, second)
+
+        # 메모리 매핑된 버퍼를 참조하므로 읽기 전용이고, 세션 간에 같은 버퍼를 공유
+        self.assertFalse(first["VALUE"].to_numpy().flags.writeable)
+        self.assertTrue(
+            np.shares_memory(first["VALUE"].to_numpy(), second["VALUE"].to_numpy())
+        )
+
+        # 컬럼 추가는 다른 view 에 영향 없음
+        first["NEW_COL"] = 1
+        self.assertNotIn("NEW_COL", cached(2025).columns)
+
+    def test_string_columns_are_read_only(self):
+        """한 view 의 문자열 값을 수정하면 오류가 나고 다른 view 에는 영향이 없는지 테스트"""
+        store = shared_frame_store.SharedFrameStore(self.tmp_dir.name)
+        path = store.path("loader", "key=0")
+        store.write(path, make_frame(n=10))
+
+        view = store.read(path)
+        with self.assertRaises(ValueError):
+            view.loc["DOC-1", "DESCRIPTION"] = "MUTATED"
+        with self.assertRaises(ValueError):
+            view["DESCRIPTION"].to_numpy()[1] = "MUTATED"
+        pd.testing.assert_frame_equal(store.read(path), make_frame(n=10))
+
+        # 복사본은 자유롭게 수정 가능
+        copied = store.read(path).copy()
+        copied.loc["DOC-1", "DESCRIPTION"] = "MUTATED"
+        self.assertEqual(store.read(path).loc["DOC-1", "DESCRIPTION"], "issue 1")
+
+    def test_other_process_reads_shared_file(self):
+        """다른 프로세스(별도 저장소 / 데코레이터)는 다시 계산하지 않고 같은 파일을 읽는지 테스트"""
+        shared_frame_store.shared_frame_cache(ttl=60)(self.load)(2025)
+
+        shared_frame_store._stores.clear()
+        other = shared_frame_store.shared_frame_cache(ttl=60)(self.load)
+        df = other(2025)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(df["N"].iloc[0], 1)
+        self.assertEqual(shared_frame_store.get_shared_frame_store().stats["maps"], 1)
+
+    def test_expired_file_is_recomputed(self):
+        """만료된 키는 다시 계산하여 파일을 교체하는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(ttl=0.05)(self.load)
+        cached(2025)
+        time.sleep(0.06)
+        self.assertEqual(cached(2025)["N"].iloc[0], 2)
+        self.assertEqual(cached(2024)["N"].iloc[0], 3)
+
+    def test_stale_value_is_returned_while_refreshing(self):
+        """stale_while_revalidate 이면 만료된 값을 즉시 반환하고 1회만 갱신하는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(
+            ttl=0.05, stale_while_revalidate=True
+        )(self.load)
+        cached(2025)
+        time.sleep(0.06)
+        self.release.clear()
+
+        results = [cached(2025) for _ in range(5)]
+        self.assertTrue(all(df["N"].iloc[0] == 1 for df in results))
+        self._wait_for(lambda: self.calls == 2)
+        cached(2025)
+        self.assertEqual(self.calls, 2)
+
+        self.release.set()
+        self._wait_for(lambda: cached(2025)["N"].iloc[0] == 2)
+
+    def test_refresh_error_keeps_stale_file(self):
+        """갱신 중 오류가 나면 기존 파일을 계속 반환하는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(
+            ttl=0.05, stale_while_revalidate=True
+        )(self.load)
+        cached(2025)
+        time.sleep(0.06)
+        self.fail = True
+        self.assertEqual(cached(2025)["N"].iloc[0], 1)
+        self._wait_for(lambda: self.calls == 2)
+        time.sleep(0.05)
+        # 재시도 간격 전에는 다시 갱신하지 않음
+        self.assertEqual(cached(2025)["N"].iloc[0], 1)
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_cold_calls_compute_once(self):
+        """캐시가 없을 때 같은 키의 동시 조회는 1회만 계산하는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(ttl=60)(self.load)
+        self.release.clear()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cached(2025)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        self._wait_for(lambda: self.calls == 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 4)
+
+    def test_clear_removes_files(self):
+        """clear() 후에는 다시 계산하는지 테스트"""
+        cached = shared_frame_store.shared_frame_cache(ttl=60)(self.load)
+        cached(2025)
+        cached.clear()
+        cached(2025)
+        self.assertEqual(self.calls, 2)
+
+    def test_write_evicts_old_and_least_recently_read_files(self):
+        """파일을 쓸 때 max_age 가 지난 파일과 max_files 를 넘는 오래 조회하지 않은 파일을 삭제하는지 테스트"""
+        store = shared_frame_store.SharedFrameStore(
+            self.tmp_dir.name, max_files=3, max_age=3600
+        )
+        paths = [store.path("loader", f"key={i}") for i in range(4)]
+        now = time.time()
+        for i, path in enumerate(paths[:3]):
+            store.write(path, make_frame(n=10, seed=i))
+            os.utime(path, (now - 300 + i, now - 300 + i))
+        store.read(paths[0])  # 가장 먼저 쓴 파일을 최근에 조회
+
+        # max_files=3 을 넘었으므로 가장 오래 조회하지 않은 paths[1] 삭제
+        store.write(paths[3], make_frame(n=10, seed=3))
+        self.assertEqual([p.exists() for p in paths], [True, False, True, True])
+        self.assertEqual(store.stats["evictions"], 1)
+        self.assertFalse(paths[1].with_name(f"{paths[1].name}.lock").exists())
+        pd.testing.assert_frame_equal(store.read(paths[0]), make_frame(n=10, seed=0))
+
+        # 마지막으로 쓴 뒤 max_age 가 지난 파일은 최근에 조회했어도 삭제
+        os.utime(paths[0], (time.time(), now - 7200))
+        store.write(paths[1], make_frame(n=10, seed=1))
+        self.assertEqual([p.exists() for p in paths], [False, True, True, True])
+
+        # 다른 네임스페이스는 영향 없음
+        other = store.path("other", "key=0")
+        store.write(other, make_frame(n=10))
+        self.assertTrue(paths[3].exists())
+        self.assertTrue(other.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+동일 쿼리 동시 실행 병합(single_flight) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import threading
+import time
+import sys
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database import single_flight
+from _00_database.local_warehouse import LocalWarehouseClient
+from _01_query.GMES import q_production
+from _08_automation import local_warehouse_seed
+
+
+def run_concurrently(funcs):
+    """함수들을 동시에 실행하고 (결과 또는 예외) 목록을 반환합니다."""
+    results = [None] * len(funcs)
+    barrier = threading.Barrier(len(funcs))
+
+    def target(i, func):
+        barrier.wait()
+        try:
+            results[i] = func()
+        except Exception as e:
+            results[i] = e
+
+    threads = [
+        threading.Thread(target=target, args=(i, func)) for i, func in enumerate(funcs)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    """single-flight 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.warehouse_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            5_000, cls.warehouse_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def test_normalize_keeps_literals(self):
+        """리터럴 밖의 공백 차이만 무시하고 리터럴 값은 구분하는지 테스트"""
+        normalize = single_flight.normalize_query_text
+        self.assertEqual(
+            normalize("SELECT *\n  FROM T\tWHERE A = 'x'"),
+            normalize("SELECT * FROM T WHERE A = 'x'  "),
+        )
+        self.assertNotEqual(
+            normalize("SELECT * FROM T WHERE A = 'a  b'"),
+            normalize("SELECT * FROM T WHERE A = 'a b'"),
+        )
+
+    def test_concurrent_identical_queries_execute_once(self):
+        """같은 쿼리의 동시 호출은 한 번만 실행하고 결과 복사본을 공유하는지 테스트"""
+        client = LocalWarehouseClient(db_path=self.warehouse_path, latency_ms=300)
+        query = q_production.curing_prdt_monthly_by_ym(yyyy=2025)
+        before = single_flight.single_flight_stats()
+
+        results = run_concurrently(
+            [lambda: client.execute(query)] * 3
+            + [lambda: client.execute(query.replace("\n", "\n    "))] * 2
+        )
+        after = single_flight.single_flight_stats()
+        self.assertEqual(after["executions"] - before["executions"], 1)
+        self.assertEqual(after["shared"] - before["shared"], 4)
+        self.assertEqual(after["in_flight"], 0)
+        for df in results[1:]:
+            pd.testing.assert_frame_equal(df, results[0])
+        self.assertEqual(len({id(df) for df in results}), len(results))
+
+        # 다른 리터럴의 쿼리는 각각 실행
+        before = after
+        run_concurrently(
+            [
+                lambda: client.execute(
+                    q_production.curing_prdt_monthly_by_ym(yyyy=2024)
+                ),
+                lambda: client.execute(
+                    q_production.curing_prdt_monthly_by_ym(yyyy=2025)
+                ),
+            ]
+        )
+        after = single_flight.single_flight_stats()
+        self.assertEqual(after["executions"] - before["executions"], 2)
+
+    def test_error_is_shared_and_not_cached(self):
+        """실행 중 오류는 기다리던 호출에도 전달되고 다음 호출은 다시 실행하는지 테스트"""
+        flight = single_flight.SingleFlight()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            time.sleep(0.2)
+            raise RuntimeError("warehouse unavailable")
+
+        results = run_concurrently(
+            [lambda: flight.do("snowflake", "SELECT 1", failing)] * 3
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(len(calls), 1)
+
+        df = flight.do("snowflake", "SELECT 1", lambda: pd.DataFrame({"A": [1]}))
+        self.assertEqual(df["A"].tolist(), [1])
+        self.assertEqual(flight.stats["executions"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Stale-While-Revalidate 캐시(helper_pandas.stale_while_revalidate_cache) 테스트 코드
+"""
+
+import unittest
+import importlib
+import tempfile
+import textwrap
+import threading
+import types
+import time
+import sys
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing import helper_pandas
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Stale-While-Revalidate 캐시 테스트 클래스"""
+
+    def setUp(self):
+        self.calls = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+        @helper_pandas.stale_while_revalidate_cache(ttl=0.05)
+        def load(year, plant="DP"):
+            self.calls += 1
+            self.release.wait(5)
+            if self.fail:
+                raise RuntimeError("warehouse unavailable")
+            return pd.DataFrame({"YEAR": [year], "PLANT": [plant], "N": [self.calls]})
+
+        self.load = load
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_fresh_value_is_served_from_cache(self):
+        """만료 전에는 위치 / 키워드 호출 모두 같은 캐시 항목을 반환하는지 테스트"""
+        first = self.load(2025)
+        second = self.load(year=2025, plant="DP")
+        self.assertEqual(self.calls, 1)
+        pd.testing.assert_frame_equal(first, second)
+
+        first.loc[0, "N"] = 99
+        self.assertEqual(self.load(2025).loc[0, "N"], 1)
+
+    def test_stale_value_is_returned_while_one_refresh_runs(self):
+        """만료 후 기존 값을 즉시 반환하고 갱신은 백그라운드에서 1회만 실행되는지 테스트"""
+        self.load(2025)
+        time.sleep(0.06)
+        self.release.clear()
+
+        started = time.perf_counter()
+        results = [self.load(2025) for _ in range(5)]
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertTrue(all(df.loc[0, "N"] == 1 for df in results))
+        self.assertEqual(self.calls, 2)
+
+        self.release.set()
+        self._wait_for(lambda: self.load.cache_info()["refreshes"] == 1)
+        self.assertEqual(self.load(2025).loc[0, "N"], 2)
+
+    def test_refresh_error_keeps_stale_value(self):
+        """갱신 중 오류가 나면 기존 값을 계속 반환하는지 테스트"""
+        self.load(2025)
+        time.sleep(0.06)
+        self.fail = True
+        self.assertEqual(self.load(2025).loc[0, "N"], 1)
+        self._wait_for(lambda: self.load.cache_info()["errors"] == 1)
+        self.assertEqual(self.load(2025).loc[0, "N"], 1)
+
+    def test_concurrent_cold_calls_compute_once(self):
+        """캐시가 없을 때 같은 키의 동시 조회는 1회만 계산하는지 테스트"""
+        self.release.clear()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.load(2024)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        self._wait_for(lambda: self.calls == 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 4)
+
+    def test_cache_survives_module_reload(self):
+        """DEV_MODE 처럼 모듈을 reload 해도 기존 캐시 항목을 그대로 사용하는지 테스트"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        module_name = "swr_reload_page"
+        with open(os.path.join(tmp_dir.name, f"{module_name}.py"), "w") as f:
+            f.write(textwrap.dedent("""
+                    import pandas as pd
+                    import swr_reload_counter as counter
+                    from _02_preprocessing import helper_pandas
+
+                    @helper_pandas.stale_while_revalidate_cache(ttl=60)
+                    def load(year):
+                        counter.calls += 1
+                        return pd.DataFrame({"YEAR": [year]})
+                    """))
+
+        counter = types.ModuleType("swr_reload_counter")
+        counter.calls = 0
+        sys.modules[counter.__name__] = counter
+        sys.path.insert(0, tmp_dir.name)
+        self.addCleanup(sys.modules.pop, counter.__name__, None)
+        self.addCleanup(sys.modules.pop, module_name, None)
+        self.addCleanup(sys.path.remove, tmp_dir.name)
+
+        page = importlib.import_module(module_name)
+        self.addCleanup(lambda: page.load.clear())
+        first = page.load(2025)
+
+        page = importlib.reload(page)
+        pd.testing.assert_frame_equal(page.load(2025), first)
+        self.assertEqual(counter.calls, 1)
+        self.assertEqual(page.load.cache_info()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
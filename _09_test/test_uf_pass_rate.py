@@ -0,0 +1,50 @@
+"""
+UF 합격수량 계산(df_uf.compute_uf_pass_qty) 테스트 코드
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing.GMES import df_uf
+
+
+class TestUfPassQty(unittest.TestCase):
+    """UF 합격수량 계산 테스트 클래스"""
+
+    def setUp(self):
+        self.plants = pd.Series(["DP", "HP", "OT", "KP"])
+        # 등급별 수량 JDG_1 ~ JDG_8 (행마다 등급당 1개씩, 마지막 행은 검사수량 0)
+        qty = np.ones((4, 8))
+        qty[3] = 0
+        self.df_jdg = pd.DataFrame(qty, columns=[f"jdg_{i}" for i in range(1, 9)])
+
+    def test_pass_qty_by_plant_criteria(self):
+        """공장별 합격 등급 기준 적용 테스트 (기준에 없는 공장은 0)"""
+        ins_qty, pass_qty = df_uf.compute_uf_pass_qty(self.plants, self.df_jdg)
+        np.testing.assert_array_equal(ins_qty, [8, 8, 8, 0])
+        np.testing.assert_array_equal(pass_qty, [4, 3, 0, 0])
+
+    def test_missing_grade_counts_as_zero(self):
+        """결측 등급 수량은 0으로 처리되는지 테스트"""
+        df_jdg = self.df_jdg.copy()
+        df_jdg.loc[0, "jdg_2"] = np.nan
+        ins_qty, pass_qty = df_uf.compute_uf_pass_qty(self.plants, df_jdg)
+        self.assertEqual(ins_qty[0], 7)
+        self.assertEqual(pass_qty[0], 3)
+
+    def test_pass_rate_zero_when_no_inspection(self):
+        """검사수량 0인 경우 합격률 0 테스트"""
+        ins_qty, pass_qty = df_uf.compute_uf_pass_qty(self.plants, self.df_jdg)
+        rate = df_uf.calculate_pass_rate(pass_qty, ins_qty)
+        np.testing.assert_allclose(rate, [0.5, 0.375, 0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
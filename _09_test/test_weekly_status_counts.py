@@ -0,0 +1,115 @@
+"""
+주간 상태 일괄 집계(count_weekly_status) 테스트 코드
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _02_preprocessing import helper_pandas
+
+
+def make_interval_df(n_rows: int = 500, seed: int = 0) -> pd.DataFrame:
+    """REG_DATE/COMP_DATE 구간을 갖는 임의의 이슈 데이터를 생성합니다."""
+    rng = np.random.default_rng(seed)
+    reg = pd.Timestamp("2023-10-01") + pd.to_timedelta(
+        rng.integers(0, 500, n_rows), unit="D"
+    )
+    comp = reg + pd.to_timedelta(rng.integers(0, 120, n_rows), unit="D")
+    comp = comp.where(rng.random(n_rows) > 0.3)  # 30%는 미완료
+    reg = reg.where(rng.random(n_rows) > 0.02)  # 일부 등록일 결측
+    plants = pd.Categorical(
+        rng.choice(["DP", "KP", "JP", None], n_rows), categories=["DP", "KP", "JP"]
+    )
+    return pd.DataFrame({"PLANT": plants, "REG_DATE": reg, "COMP_DATE": comp})
+
+
+def brute_force_counts(df: pd.DataFrame, week_start: pd.Timestamp) -> pd.DataFrame:
+    """기존 방식(주마다 get_weekly_conditions + np.select)으로 집계합니다."""
+    week_end = week_start + pd.Timedelta(days=6)
+    bool_open, bool_close, bool_ongoing1, bool_ongoing2 = (
+        helper_pandas.get_weekly_conditions(df, week_start, week_end)
+    )
+    conditions = [
+        bool_open & ~bool_close,
+        bool_open & bool_close,
+        ~bool_open & bool_close,
+        bool_ongoing1 | bool_ongoing2,
+    ]
+    status = pd.Categorical(
+        np.select(conditions, helper_pandas.WEEKLY_STATUS, default=None),
+        categories=helper_pandas.WEEKLY_STATUS,
+    )
+    return pd.crosstab(df["PLANT"], status, dropna=False).reindex(
+        index=df["PLANT"].cat.categories,
+        columns=helper_pandas.WEEKLY_STATUS,
+        fill_value=0,
+    )
+
+
+class TestCountWeeklyStatus(unittest.TestCase):
+    """주간 상태 일괄 집계 테스트 클래스"""
+
+    def setUp(self):
+        self.df = make_interval_df()
+        self.week_starts = helper_pandas.get_year_week_starts(2024)
+
+    def test_week_starts_are_mondays(self):
+        """연간 주 시작일 테스트"""
+        self.assertTrue((self.week_starts.weekday == 0).all())
+        self.assertLessEqual(self.week_starts[0], pd.Timestamp("2024-01-01"))
+        self.assertGreater(
+            self.week_starts[-1] + pd.Timedelta(days=7), pd.Timestamp("2024-12-31")
+        )
+
+    def test_matches_weekly_scan(self):
+        """주별 전체 스캔 결과와 일치하는지 테스트"""
+        df_counts = helper_pandas.count_weekly_status(self.df, self.week_starts)
+        for week_start in self.week_starts:
+            expected = brute_force_counts(self.df, week_start)
+            actual = (
+                df_counts[df_counts["WEEK_START"] == week_start]
+                .pivot_table(
+                    index="PLANT",
+                    columns="STATUS",
+                    values="COUNT",
+                    aggfunc="sum",
+                    observed=False,
+                )
+                .reindex(index=expected.index, columns=expected.columns)
+            )
+            np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+
+    def test_pivot_has_global_row(self):
+        """단일 주 피벗의 Global 합계 테스트"""
+        df_counts = helper_pandas.count_weekly_status(self.df, self.week_starts)
+        pivot_df = helper_pandas.pivot_weekly_status_counts(
+            df_counts, self.week_starts[10]
+        )
+        self.assertEqual(
+            list(pivot_df.columns), ["PLANT"] + helper_pandas.WEEKLY_STATUS
+        )
+        global_row = pivot_df[pivot_df["PLANT"] == "Global"].iloc[0]
+        plant_rows = pivot_df[pivot_df["PLANT"] != "Global"]
+        for status in helper_pandas.WEEKLY_STATUS:
+            self.assertEqual(global_row[status], plant_rows[status].sum())
+
+    def test_is_calendar_week(self):
+        """주 단위 기간 판별 테스트"""
+        monday = pd.Timestamp("2024-03-11")
+        self.assertTrue(
+            helper_pandas.is_calendar_week(monday, monday + pd.Timedelta(days=6))
+        )
+        self.assertFalse(
+            helper_pandas.is_calendar_week(monday, monday + pd.Timedelta(days=3))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+중량 서버 집계 통계 / 로컬 캐시(df_weight) 테스트 코드
+"""
+
+import unittest
+import tempfile
+import shutil
+import sqlite3
+import sys
+import numpy as np
+import pandas as pd
+import os
+
+# 시스템 환경 변수에서 프로젝트 루트 경로를 가져옵니다
+project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from _00_database.local_warehouse import local_table_name
+from _02_preprocessing.GMES import df_weight
+from _05_commons import config
+from _08_automation import local_warehouse_seed
+
+MCODE = "1000001"
+START_DATE, END_DATE = "20250101", "20251231"
+
+
+class TestWeightSummary(unittest.TestCase):
+    """중량 통계 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.warehouse_path = os.path.join(cls.tmp_dir.name, "local_warehouse.db")
+        success, message = local_warehouse_seed.seed_local_warehouse(
+            40_000, cls.warehouse_path, end_date="2025-12-31"
+        )
+        assert success, message
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.defaults = (config.WAREHOUSE_BACKEND, config.LOCAL_WAREHOUSE_PATH)
+        config.WAREHOUSE_BACKEND = "local"
+        config.LOCAL_WAREHOUSE_PATH = self.warehouse_path
+        self.cache_path = os.path.join(self.tmp_dir.name, f"{self.id()}.db")
+
+        # 원격 조회 횟수 기록
+        self.queries = []
+        original_get_client = df_weight.get_client
+
+        def counting_get_client(db_type="snowflake"):
+            client = original_get_client(db_type)
+            execute = client.execute
+
+            def counted(query):
+                self.queries.append(query)
+                return execute(query)
+
+            client.execute = counted
+            return client
+
+        df_weight.get_client = counting_get_client
+        self.addCleanup(setattr, df_weight, "get_client", original_get_client)
+
+    def tearDown(self):
+        config.WAREHOUSE_BACKEND, config.LOCAL_WAREHOUSE_PATH = self.defaults
+
+    def test_split_cacheable_months(self):
+        """마감된 전체 월만 캐시하고 양 끝 일부 월과 이번 달은 매번 조회하는지 테스트"""
+        months, live = df_weight.split_cacheable_months(
+            "20250115", "20250610", today=pd.Timestamp("2025-05-20")
+        )
+        self.assertEqual(months, ["202502", "202503", "202504"])
+        self.assertEqual(
+            live,
+            [("20250115", None, "20250201"), ("20250501", "20250610", None)],
+        )
+        months, live = df_weight.split_cacheable_months(
+            "20250101", "20250131", today=pd.Timestamp("2025-12-01")
+        )
+        self.assertEqual(months, [])
+        self.assertEqual(live, [("20250101", "20250131", None)])
+
+    def test_summary_matches_individual_rows(self):
+        """서버 집계 통계가 개별 측정값으로 계산한 값과 같은지 테스트"""
+        summary = df_weight.get_weight_summary_df(
+            MCODE, START_DATE, END_DATE, db_path=self.cache_path
+        )
+        raw = df_weight.get_weight_individual_df(MCODE, START_DATE, END_DATE)
+        self.assertFalse(summary.empty)
+        grouped = raw.groupby(["PLANT", "INS_DATE_YM"])["MRM_WGT"]
+        expected = pd.DataFrame(
+            {
+                "WT_INS_QTY": grouped.count(),
+                "WT_PASS_QTY": raw.groupby(["PLANT", "INS_DATE_YM"])["JDG"].sum(),
+                "WT_MEAN": grouped.mean(),
+                "WT_MEDIAN": grouped.median(),
+                "WT_Q3": grouped.quantile(0.75),
+            }
+        )
+        actual = summary.set_index(["PLANT", "INS_DATE_YM"])[expected.columns]
+        pd.testing.assert_frame_equal(
+            actual.sort_index(), expected.sort_index(), check_dtype=False
+        )
+
+        histogram = df_weight.get_weight_histogram_df(
+            MCODE, START_DATE, END_DATE, db_path=self.cache_path
+        )
+        self.assertEqual(histogram["WT_QTY"].sum(), len(raw))
+        deviation = (raw["MRM_WGT"] / raw["STD_WGT"] - 1) * 100
+        inside = histogram["BIN_IDX"].between(-14, 13)
+        self.assertEqual(
+            histogram.loc[inside, "WT_QTY"].sum(),
+            deviation.between(-14 * 0.2, 14 * 0.2, inclusive="left").sum(),
+        )
+
+    def test_box_stats_exclude_outliers(self):
+        """박스플롯 통계(BOX_*)가 그룹별 IQR 아웃라이어를 제외하고 계산되는지 테스트"""
+        # 시딩 데이터 복사본의 행을 16배로 늘리고 (공장, 규격, 월)별 1건을 1.5배로 바꿔 아웃라이어 생성
+        warehouse_path = os.path.join(self.tmp_dir.name, "outlier_warehouse.db")
+        shutil.copy(self.warehouse_path, warehouse_path)
+        config.LOCAL_WAREHOUSE_PATH = warehouse_path
+        table = local_table_name("MES.QLT_F_LQLTTR127")
+        with sqlite3.connect(warehouse_path) as conn:
+            for _ in range(4):
+                conn.execute(f"INSERT INTO {table} SELECT * FROM {table}")
+            conn.execute(f"""UPDATE {table} SET MRM_WGT = MRM_WGT * 1.5
+                WHERE rowid IN (
+                    SELECT MIN(rowid) FROM {table}
+                    GROUP BY PLT_CD, SPEC_CD, SUBSTR(INS_DATE, 1, 6)
+                )""")
+
+        summary = df_weight.get_weight_summary_df(
+            MCODE, START_DATE, END_DATE, db_path=self.cache_path
+        )
+        raw = df_weight.get_weight_individual_df(MCODE, START_DATE, END_DATE)
+        grouped = raw.groupby(["PLANT", "INS_DATE_YM"])["MRM_WGT"]
+        q1, q3 = grouped.transform("quantile", 0.25), grouped.transform(
+            "quantile", 0.75
+        )
+        inside = raw["MRM_WGT"].between(q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+        self.assertFalse(inside.all())
+        filtered = raw[inside].groupby(["PLANT", "INS_DATE_YM"])["MRM_WGT"]
+        expected = pd.DataFrame(
+            {
+                "BOX_MEAN": filtered.mean(),
+                "BOX_MIN": filtered.min(),
+                "BOX_Q1": filtered.quantile(0.25),
+                "BOX_MEDIAN": filtered.median(),
+                "BOX_Q3": filtered.quantile(0.75),
+                "BOX_MAX": filtered.max(),
+            }
+        )
+        actual = summary.set_index(["PLANT", "INS_DATE_YM"])[expected.columns]
+        pd.testing.assert_frame_equal(
+            actual.sort_index(), expected.sort_index(), check_dtype=False
+        )
+
+    def test_closed_months_are_served_from_cache(self):
+        """두 번째 조회에서 마감된 월은 로컬 캐시에서 읽는지 테스트"""
+        first = df_weight.get_weight_summary_df(
+            MCODE, START_DATE, END_DATE, db_path=self.cache_path
+        )
+        # 캐시 누락 월 1회 + 12월(일부 월) 1회
+        self.assertEqual(len(self.queries), 2)
+
+        self.queries.clear()
+        second = df_weight.get_weight_summary_df(
+            MCODE, START_DATE, END_DATE, db_path=self.cache_path
+        )
+        self.assertEqual(len(self.queries), 1)
+        self.assertIn("'20251201'", self.queries[0])
+        pd.testing.assert_frame_equal(first, second)
+
+        monthly = df_weight.summarize_weight_by_month(second)
+        self.assertEqual(monthly["WT_INS_QTY"].sum(), second["WT_INS_QTY"].sum())
+        self.assertTrue(np.all(monthly["PASS_PCT"].between(0, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,8 +14,6 @@ import os
 from typing import Dict, Optional
 from dotenv import load_dotenv
 import logging
-import cx_Oracle
-import pandas as pd
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 project_root = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.abspath(__file__)))
@@ -41,16 +39,16 @@ ROLES = ["Viewer", "Contributor", "Admin"]
 # 고정 비밀번호 설정
 FIXED_PASSWORDS = {"Contributor": "December", "Admin": "131209"}
 
-from _00_database.db_client import get_client
-from _01_query.SAP.q_hk_personnel import CTE_HR_PERSONAL
+from _02_preprocessing.SAP.df_personnel import load_personnel_directory
 from _04_pages.config_pages import PAGE_CONFIGS
-from _05_commons.helper import SQLiteDML
-from _05_commons import config, helper
+from _05_commons import config, helper, event_logger, render_profiler, cache_warmer
 
 # 기본 설정
 st.set_page_config(layout="wide")
 DB_PATH = config.SQLITE_DB_PATH
-db_dml = SQLiteDML()
+
+# 대시보드 캐시 워머 (프로세스당 1회 시작, 이후 호출은 무시)
+cache_warmer.start_cache_warmer()
 
 # pg 변수 초기화
 pg = None
@@ -69,44 +67,6 @@ def verify_password(role: str, provided_password: str) -> bool:
     return FIXED_PASSWORDS.get(role) == provided_password
 
 
-def load_personnel_df():
-    """인사 데이터를 로드하고 전처리합니다.
-
-    Returns:
-        DataFrame: 전처리된 인사 데이터프레임
-    """
-    client = get_client("snowflake")
-    if client is None:
-        logger.error("Failed to get Snowflake client")
-        return None
-
-    df = client.execute(CTE_HR_PERSONAL)
-    if df is None or df.empty:
-        logger.error("No data returned from Snowflake query")
-        return None
-
-    # 컬럼명을 대문자로 변환
-    df.columns = df.columns.str.upper()
-
-    # 수동 데이터 추가
-    manual_df = pd.DataFrame(
-        [
-            {"PNL_NO": 21300315, "PNL_NM": "KIM JEE WOONG"},
-            {"PNL_NO": 21000075, "PNL_NM": "SOUNG HYUN JUN"},
-            {"PNL_NO": 21100293, "PNL_NM": "KIM SEUNG JAE"},
-            {"PNL_NO": 21200424, "PNL_NM": "OH JIN TAEK"},
-            {"PNL_NO": 21604756, "PNL_NM": "RYU JE WOOK"},
-        ]
-    )
-
-    # 데이터프레임 결합 후 인덱스 재설정
-    df = pd.concat([df, manual_df], ignore_index=True)
-
-    df["PNL_NO"] = pd.to_numeric(df["PNL_NO"], errors="coerce").fillna(0).astype(int)
-
-    return df
-
-
 def init_session_state():
     """세션 상태를 초기화합니다."""
     defaults = {
@@ -114,6 +74,7 @@ def init_session_state():
         "personel_id": None,
         "password_verified": False,
         "login_recorded": False,
+        "last_page_viewed": None,
         "login_attempts": 0,
         "last_activity": datetime.now(),
         "is_locked": False,
@@ -222,13 +183,7 @@ def login():
 
             # 로그인 기록 저장
             if not st.session_state.login_recorded:
-                db_dml.execute_query(
-                    "INSERT INTO logins (employee_id, login_time) VALUES (?, ?)",
-                    (
-                        int(personel_id_local),
-                        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    ),
-                )
+                event_logger.log_login(int(personel_id_local))
                 st.session_state.login_recorded = True
                 logger.info(f"User {personel_id_local} logged in successfully")
 
@@ -278,7 +233,13 @@ def login():
 def logout():
     """사용자 로그아웃을 처리합니다."""
     try:
-        for key in ["role", "personel_id", "password_verified", "login_recorded"]:
+        for key in [
+            "role",
+            "personel_id",
+            "password_verified",
+            "login_recorded",
+            "last_page_viewed",
+        ]:
             st.session_state[key] = None
         logger.info("User logged out successfully")
         st.rerun()
@@ -292,45 +253,12 @@ init_session_state()
 st.logo(image="_06_assets/logo.png", icon_image="_06_assets/logo_only.png")
 
 if st.session_state.password_verified:
-    df_personnel = load_personnel_df()
-    if df_personnel is not None:
-        # 디버깅을 위한 데이터 정보 출력 (개발 환경에서만)
-        logger.info(f"Personnel data shape: {df_personnel.shape}")
-        logger.info(f"Personnel data columns: {df_personnel.columns.tolist()}")
-        logger.info(f"Personnel data types: {df_personnel.dtypes.to_dict()}")
-
-        # 중복된 PNL_NO 확인
-        duplicates = df_personnel[
-            df_personnel.duplicated(subset=["PNL_NO"], keep=False)
-        ]
-        if not duplicates.empty:
-            logger.warning(
-                f"Found duplicate PNL_NO entries: {duplicates['PNL_NO'].tolist()}"
-            )
-
-        # 사용자 ID 매칭 (더 안전한 방식)
-        try:
-            user_id = int(st.session_state.personel_id)
-            df_matched = df_personnel[df_personnel["PNL_NO"] == user_id]
-
-            if df_matched.empty:
-                st.warning("No matching personnel ID record found.")
-                st.stop()
-
-            # 중복된 사용자 ID가 있는 경우 첫 번째 결과만 사용
-            if len(df_matched) > 1:
-                logger.warning(
-                    f"Multiple records found for user ID {user_id}, using first match"
-                )
-                df_matched = df_matched.iloc[:1]
-
-            personel_nm = df_matched["PNL_NM"].values[0]
-
-        except (ValueError, TypeError) as e:
-            logger.error(
-                f"Error processing user ID {st.session_state.personel_id}: {str(e)}"
-            )
-            st.error("Invalid user ID format. Please contact administrator.")
+    personnel_directory = load_personnel_directory()
+    if len(personnel_directory) > 0:
+        # 사용자 ID 매칭 (사원번호 딕셔너리 조회)
+        personel_nm = personnel_directory.lookup(st.session_state.personel_id)
+        if personel_nm is None:
+            st.warning("No matching personnel ID record found.")
             st.stop()
 
         menu_col = st.columns([9, 1, 1], vertical_alignment="center")
@@ -383,6 +311,12 @@ else:
     pg = st.navigation([st.Page(login)])
 
 if pg is not None:
-    pg.run()
+    # 페이지 조회 기록 (같은 페이지의 rerun 은 제외, 버퍼링 후 백그라운드 저장)
+    if st.session_state.personel_id and st.session_state.last_page_viewed != pg.title:
+        event_logger.log_page_view(st.session_state.personel_id, pg.title)
+        st.session_state.last_page_viewed = pg.title
+    # 렌더링 프로파일 (RENDER_PROFILE=1 또는 ?profile=1 일 때만 측정)
+    with render_profiler.page_profile(pg.title):
+        pg.run()
 else:
     st.error("Navigation initialization failed. Please refresh the page.")